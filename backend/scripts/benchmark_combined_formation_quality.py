@@ -51,6 +51,7 @@ benchmark_memory_grounded_judge.py — the on-demand entry, like the real-Azure
 Created: 2026-07-01 (Sprint 57.154)
 
 Modification History (newest-first):
+    - 2026-10-16: _CapturingSummaryStore.upsert_summary accepts last_summarized_seq (watermark)
     - 2026-07-01: Initial creation (Sprint 57.154) — combined-vs-separate formation quality A/B
 
 Related:
@@ -378,6 +379,7 @@ class _CapturingSummaryStore:
         summary: str,
         key_decisions: list[str],
         unresolved_issues: list[str],
+        last_summarized_seq: int | None = None,
     ) -> Any:
         self.stored = {
             "summary": summary,
@@ -0,0 +1,225 @@
+"""
+File: backend/scripts/benchmark_sse_serialization.py
+Purpose: Micro-benchmark — SSE frames/sec, table-driven + orjson serializer vs the
+         previous isinstance-chain + `_jsonable` + stdlib json path.
+Category: api/v1/chat — perf tooling
+Scope: Phase 57 / SSE hot path
+
+Description:
+    Every LoopEvent the chat stream yields goes through serialize_loop_event +
+    format_sse_message. A busy turn emits hundreds of frames (span_started /
+    span_ended pairs, subagent_child wrappers, verification, tool results), so
+    the per-frame Python overhead is on the stream's critical path. This harness
+    replays a representative busy-turn mix through both paths and reports
+    frames/sec:
+      - baseline — dispatch by walking `_SERIALIZERS` in declaration order with
+                   isinstance() (the cost the removed isinstance chain paid; the
+                   table is declared in the old chain's order), then the removed
+                   recursive `_jsonable` pre-pass + `json.dumps`.
+      - current  — serialize_loop_event (one dict lookup) + format_sse_message.
+    Both paths must produce the SAME JSON (build_report re-parses every frame of
+    one pass and records `parity`).
+
+    The reusable logic lives here (importable as `scripts.benchmark_sse_serialization`):
+      - busy_turn_events(n_spans, n_children)  — the representative event mix
+      - baseline_frame(event) / current_frame(event) — the two encode paths
+      - measure(frame_fn, events, repeat)      — frames/sec over `repeat` passes
+      - build_report(events, repeat)           — both rates + speedup + parity
+      - main()                                 — CLI: print the report as JSON
+    CI-safe unit coverage: tests/unit/scripts/test_benchmark_sse_serialization.py.
+
+    Run on demand:
+      python scripts/benchmark_sse_serialization.py --repeat 200
+
+Created: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — baseline vs table-driven/orjson frames/sec
+
+Related:
+    - backend/src/api/v1/chat/sse.py (the serializer under test)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+from dataclasses import asdict, is_dataclass
+from typing import Any
+from uuid import UUID, uuid4
+
+from agent_harness._contracts import (
+    LLMRequested,
+    LLMResponded,
+    LoopCompleted,
+    LoopEvent,
+    LoopStarted,
+    SpanEnded,
+    SpanStarted,
+    SubagentChildEvent,
+    ToolCallExecuted,
+    ToolCallRequested,
+    TraceContext,
+    TurnStarted,
+    VerificationPassed,
+)
+from api.v1.chat import sse
+
+
+def busy_turn_events(n_spans: int = 40, n_children: int = 40) -> list[LoopEvent]:
+    """One busy turn: span pairs, tool round trips, subagent child frames, verification."""
+    trace = TraceContext(tenant_id=uuid4(), session_id=uuid4(), user_id=uuid4())
+    sub_id = uuid4()
+    events: list[LoopEvent] = [
+        LoopStarted(session_id=trace.session_id, trace_context=trace),
+        TurnStarted(turn_num=1, trace_context=trace),
+        LLMRequested(model="gpt-4o", tokens_in=1200, trace_context=trace),
+    ]
+    for i in range(n_spans):
+        span_id = f"span-{i}"
+        events.append(
+            SpanStarted(
+                span_name="tool_exec",
+                span_id=span_id,
+                parent_span_id="root",
+                span_type="TOOL_EXEC",
+                trace_context=trace,
+            )
+        )
+        events.append(
+            ToolCallRequested(
+                tool_call_id=f"call-{i}",
+                tool_name="knowledge_search",
+                arguments={"query": f"q{i}", "top_k": 5},
+                trace_context=trace,
+            )
+        )
+        events.append(
+            ToolCallExecuted(
+                tool_call_id=f"call-{i}",
+                tool_name="knowledge_search",
+                duration_ms=12.5,
+                result_content="result " * 20,
+                trace_context=trace,
+            )
+        )
+        events.append(
+            SpanEnded(
+                span_name="tool_exec",
+                span_id=span_id,
+                span_type="TOOL_EXEC",
+                duration_ms=12.5,
+                trace_context=trace,
+            )
+        )
+    for i in range(n_children):
+        inner = TurnStarted(turn_num=i + 1, trace_context=trace)
+        events.append(SubagentChildEvent(subagent_id=sub_id, inner=inner, trace_context=trace))
+    events.append(LLMResponded(content="done " * 50, trace_context=trace))
+    events.append(
+        VerificationPassed(
+            verifier="output_quality", verifier_type="llm_judge", score=0.9, trace_context=trace
+        )
+    )
+    events.append(
+        LoopCompleted(
+            stop_reason="end_turn", total_turns=1, cache_hit_rate=0.5, trace_context=trace
+        )
+    )
+    return events
+
+
+def _linear_dispatch(event: LoopEvent) -> dict[str, Any] | None:
+    for cls, serializer in sse._SERIALIZERS.items():
+        if isinstance(event, cls):
+            return serializer(event)
+    raise NotImplementedError(type(event).__name__)
+
+
+def _jsonable(value: Any) -> Any:
+    """The removed recursive pre-pass (verbatim semantics)."""
+    if is_dataclass(value) and not isinstance(value, type):
+        return _jsonable(asdict(value))
+    if isinstance(value, dict):
+        return {k: _jsonable(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_jsonable(v) for v in value]
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def baseline_frame(event: LoopEvent) -> bytes | None:
+    """isinstance walk + `_jsonable` + stdlib json (the pre-table path)."""
+    payload = _linear_dispatch(event)
+    if payload is None:
+        return None
+    trace_ctx = getattr(event, "trace_context", None)
+    payload["data"]["trace_id"] = trace_ctx.trace_id if trace_ctx else None
+    body = json.dumps(_jsonable(payload["data"]), ensure_ascii=False, separators=(",", ":"))
+    return f"event: {payload['type']}\ndata: {body}\n\n".encode("utf-8")
+
+
+def current_frame(event: LoopEvent) -> bytes | None:
+    """serialize_loop_event + format_sse_message (the shipped path)."""
+    payload = sse.serialize_loop_event(event)
+    if payload is None:
+        return None
+    return sse.format_sse_message(payload["type"], payload["data"])
+
+
+def measure(
+    frame_fn: Callable[[LoopEvent], bytes | None], events: list[LoopEvent], repeat: int
+) -> float:
+    """Frames/sec over `repeat` passes of `events`."""
+    frames = 0
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for event in events:
+            if frame_fn(event) is not None:
+                frames += 1
+    elapsed = time.perf_counter() - start
+    return frames / elapsed if elapsed > 0 else float("inf")
+
+
+def _data(frame: bytes | None) -> Any:
+    if frame is None:
+        return None
+    head, _, body = frame.partition(b"\ndata: ")
+    return head, json.loads(body)
+
+
+def build_report(events: list[LoopEvent], repeat: int) -> dict[str, Any]:
+    """Both rates, the speedup, and whether the two paths emit identical frames."""
+    parity = all(_data(baseline_frame(ev)) == _data(current_frame(ev)) for ev in events)
+    baseline = measure(baseline_frame, events, repeat)
+    current = measure(current_frame, events, repeat)
+    return {
+        "events_per_pass": len(events),
+        "repeat": repeat,
+        "encoder": "orjson" if sse.orjson is not None else "json",
+        "baseline_frames_per_sec": round(baseline, 1),
+        "current_frames_per_sec": round(current, 1),
+        "speedup": round(current / baseline, 2) if baseline > 0 else None,
+        "parity": parity,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="SSE serialization frames/sec.")
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--spans", type=int, default=40)
+    parser.add_argument("--children", type=int, default=40)
+    args = parser.parse_args()
+    events = busy_turn_events(args.spans, args.children)
+    print(json.dumps(build_report(events, args.repeat), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -15,6 +15,7 @@ from adapters._base.embedding_client import EmbeddingClient
 from adapters._base.errors import AdapterException, ProviderError
 from adapters._base.model_profile import ModelProfile
 from adapters._base.pricing import PricingInfo
+from adapters._base.response_cache_wrapper import ResponseCacheWrapper
 from adapters._base.types import ModelInfo, StopReason, StreamEvent
 
 __all__ = [
@@ -26,6 +27,7 @@ __all__ = [
     "ModelProfile",
     "PricingInfo",
     "ProviderError",
+    "ResponseCacheWrapper",
     "StopReason",
     "StreamEvent",
 ]
@@ -0,0 +1,396 @@
+"""
+File: backend/src/adapters/_base/coalescing_embedding_client.py
+Purpose: CoalescingEmbeddingClient — micro-batching + content-addressed vector cache.
+Category: Adapters (LLM provider boundary; provider-neutral decorator)
+Scope: Phase 57 / embedding cost + latency
+
+Description:
+    MemoryVectorIndex.search / KnowledgeVectorIndex.search embed ONE query per
+    call on every memory read and knowledge_search, and the ingest paths embed
+    fixed 16-section chunks strictly one after another. This decorator sits
+    between those callers and a concrete EmbeddingClient and does three things:
+
+    1. Cache — vectors are content-addressed by sha256(model, text). A bounded
+       in-memory LRU is always consulted first; an optional second tier
+       (EmbeddingCacheStore: Redis or an on-disk directory) survives restarts and
+       is shared across workers. A repeated question or the re-ingest of an
+       unchanged section costs zero API calls.
+    2. Coalesce — cache misses from concurrent embed() calls (different requests,
+       different indexes) are queued for `window_ms` and sent as ONE provider
+       call (up to `max_batch` texts per call). Identical in-flight texts are
+       embedded once and the vector fanned out to every waiter.
+    3. Pace — flushed batches run concurrently (bounded by `max_concurrency`)
+       under a sliding-window tokens-per-minute limiter, so a whole-corpus ingest
+       no longer needs the caller's sequential 16-at-a-time loop to dodge 429s
+       (the wrapper sets `self_batching`, which embed_in_batches() checks).
+
+    Every tier fails open: a broken Redis / disk tier just means a miss.
+    A provider error fails only the callers whose texts were in that batch.
+
+Key Components:
+    - CoalescingEmbeddingClient: the EmbeddingClient decorator (+ stats)
+    - EmbeddingCacheStore: Protocol for the optional shared tier
+    - RedisEmbeddingCacheStore / DiskEmbeddingCacheStore: shared-tier backends
+    - TokenRateLimiter: sliding 60s window TPM limiter
+    - embedding_cache_key(): sha256(model, text)
+    - embed_in_batches(): the vector indexes' ingest embed (whole list to a
+      self_batching client, sequential fixed-size chunks otherwise)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: add embed_in_batches() (shared by the memory + knowledge vector indexes)
+    - 2026-10-16: add drain() (await background batches + their shared-tier cache writes)
+    - 2026-10-16: Initial creation — embedding coalescer + two-tier vector cache
+
+Related:
+    - embedding_client.py — the wrapped ABC (`self_batching` flag)
+    - response_cache_wrapper.py — sibling ChatClient cache decorator
+    - api/v1/chat/embedding_client.py — process-wide composition (EMBEDDING_CACHE)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from array import array
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Protocol
+
+from adapters._base.embedding_client import EmbeddingClient
+
+logger = logging.getLogger(__name__)
+
+_WINDOW_SECONDS = 60.0
+# Rough chars-per-token for TPM accounting (GenericApproxCounter uses the same ratio).
+_CHARS_PER_TOKEN = 4
+
+
+def embedding_cache_key(model: str, text: str) -> str:
+    """Content address of one embedding: sha256 over the model and the exact text."""
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(text.encode("utf-8"))
+    return digest.hexdigest()
+
+
+async def embed_in_batches(
+    embedder: EmbeddingClient, texts: list[str], *, batch_size: int
+) -> list[list[float]]:
+    """Embed every text, order-preserving, within the deployment's TPM quota.
+
+    A `self_batching` embedder (CoalescingEmbeddingClient) splits + rate-limits
+    internally and runs its batches concurrently, so it gets the whole list at
+    once; any other embedder is paced in sequential `batch_size` chunks.
+    """
+    if getattr(embedder, "self_batching", False):
+        return await embedder.embed(texts)
+    vectors: list[list[float]] = []
+    for start in range(0, len(texts), batch_size):
+        vectors.extend(await embedder.embed(texts[start : start + batch_size]))
+    return vectors
+
+
+def _pack(vector: list[float]) -> bytes:
+    # float64 keeps cached vectors bit-identical to the provider's response.
+    return array("d", vector).tobytes()
+
+
+def _unpack(raw: bytes) -> list[float]:
+    values = array("d")
+    values.frombytes(raw)
+    return values.tolist()
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // _CHARS_PER_TOKEN + 1
+
+
+class EmbeddingCacheStore(Protocol):
+    """Optional shared tier behind the in-memory LRU. Keys are embedding_cache_key()."""
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]: ...
+
+    async def set_many(self, items: dict[str, list[float]]) -> None: ...
+
+
+class RedisEmbeddingCacheStore:
+    """Redis tier (MGET / pipelined SET EX); vectors stored as packed float64."""
+
+    def __init__(self, client: Any, *, ttl_seconds: int = 7 * 86400, prefix: str = "emb:") -> None:
+        self._client = client
+        self._ttl_seconds = ttl_seconds
+        self._prefix = prefix
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        if not keys:
+            return {}
+        raws = await self._client.mget([self._prefix + key for key in keys])
+        return {key: _unpack(raw) for key, raw in zip(keys, raws) if raw is not None}
+
+    async def set_many(self, items: dict[str, list[float]]) -> None:
+        if not items:
+            return
+        pipe = self._client.pipeline(transaction=False)
+        for key, vector in items.items():
+            pipe.set(self._prefix + key, _pack(vector), ex=self._ttl_seconds)
+        await pipe.execute()
+
+
+class DiskEmbeddingCacheStore:
+    """On-disk tier: one file per vector under <root>/<key[:2]>/<key> (no expiry)."""
+
+    def __init__(self, root: Path | str) -> None:
+        self._root = Path(root)
+
+    def _path(self, key: str) -> Path:
+        return self._root / key[:2] / key
+
+    def _read_many(self, keys: list[str]) -> dict[str, list[float]]:
+        found: dict[str, list[float]] = {}
+        for key in keys:
+            try:
+                found[key] = _unpack(self._path(key).read_bytes())
+            except FileNotFoundError:
+                continue
+        return found
+
+    def _write_many(self, items: dict[str, list[float]]) -> None:
+        for key, vector in items.items():
+            path = self._path(key)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # Write-then-rename so a concurrent reader never sees a torn vector.
+            tmp = path.with_name(f"{key}.{os.getpid()}.tmp")
+            tmp.write_bytes(_pack(vector))
+            tmp.replace(path)
+
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        return await asyncio.to_thread(self._read_many, keys)
+
+    async def set_many(self, items: dict[str, list[float]]) -> None:
+        await asyncio.to_thread(self._write_many, items)
+
+
+class TokenRateLimiter:
+    """Sliding 60-second tokens-per-minute budget shared by every flushed batch.
+
+    acquire(n) waits until n more tokens fit in the trailing window. A single
+    request larger than the whole budget is admitted alone (clipped) rather
+    than blocking forever. tokens_per_minute <= 0 disables the limiter.
+    """
+
+    def __init__(self, tokens_per_minute: int) -> None:
+        self._tpm = tokens_per_minute
+        self._spent: deque[tuple[float, int]] = deque()
+        self._used = 0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, tokens: int) -> None:
+        if self._tpm <= 0:
+            return
+        tokens = min(tokens, self._tpm)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                while self._spent and now - self._spent[0][0] >= _WINDOW_SECONDS:
+                    self._used -= self._spent.popleft()[1]
+                if self._used + tokens <= self._tpm:
+                    self._spent.append((now, tokens))
+                    self._used += tokens
+                    return
+                await asyncio.sleep(_WINDOW_SECONDS - (now - self._spent[0][0]))
+
+
+class _LRUVectorCache:
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, list[float]] = OrderedDict()
+
+    def get(self, key: str) -> list[float] | None:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def put(self, key: str, vector: list[float]) -> None:
+        if self._max_entries <= 0:
+            return
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+@dataclass
+class EmbeddingCacheStats:
+    """Counters since construction (per-text, except api_calls)."""
+
+    memory_hits: int = 0
+    store_hits: int = 0
+    misses: int = 0
+    api_calls: int = 0
+    store_errors: int = 0
+
+
+class CoalescingEmbeddingClient(EmbeddingClient):
+    """EmbeddingClient decorator: two-tier vector cache + cross-request micro-batching."""
+
+    self_batching = True
+
+    def __init__(
+        self,
+        *,
+        inner: EmbeddingClient,
+        store: EmbeddingCacheStore | None = None,
+        max_cached_entries: int = 10_000,
+        window_ms: float = 5.0,
+        max_batch: int = 16,
+        max_concurrency: int = 4,
+        tokens_per_minute: int = 0,
+    ) -> None:
+        if max_batch <= 0:
+            raise ValueError("CoalescingEmbeddingClient: max_batch must be positive")
+        self._inner = inner
+        self._store = store
+        self._memory = _LRUVectorCache(max_cached_entries)
+        self._window_seconds = max(window_ms, 0.0) / 1000.0
+        self._max_batch = max_batch
+        self._concurrency = asyncio.Semaphore(max(max_concurrency, 1))
+        self._limiter = TokenRateLimiter(tokens_per_minute)
+        self._pending: list[tuple[str, str]] = []
+        self._inflight: dict[str, asyncio.Future[list[float]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+        self.stats = EmbeddingCacheStats()
+
+    def model_name(self) -> str:
+        return self._inner.model_name()
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        if not texts:
+            return []
+        model = self._inner.model_name()
+        keys = [embedding_cache_key(model, text) for text in texts]
+        unique = dict(zip(keys, texts))
+        found: dict[str, list[float]] = {}
+        for key in unique:
+            vector = self._memory.get(key)
+            if vector is not None:
+                found[key] = vector
+        self.stats.memory_hits += len(found)
+
+        missing = [key for key in unique if key not in found]
+        if missing and self._store is not None:
+            try:
+                stored = await self._store.get_many(missing)
+            except Exception:  # noqa: BLE001 — a broken shared tier is just a miss
+                self.stats.store_errors += 1
+                logger.warning("embedding cache store read failed; embedding", exc_info=True)
+                stored = {}
+            for key, vector in stored.items():
+                self._memory.put(key, vector)
+            found.update(stored)
+            self.stats.store_hits += len(stored)
+            missing = [key for key in missing if key not in found]
+
+        if missing:
+            self.stats.misses += len(missing)
+            futures = [self._enqueue(key, unique[key]) for key in missing]
+            # shield: one caller's cancellation must not cancel a vector others await.
+            vectors = await asyncio.gather(*(asyncio.shield(f) for f in futures))
+            found.update(zip(missing, vectors))
+        return [list(found[key]) for key in keys]
+
+    def _enqueue(self, key: str, text: str) -> asyncio.Future[list[float]]:
+        future = self._inflight.get(key)
+        if future is not None:
+            return future  # identical text already queued / in flight
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._inflight[key] = future
+        self._pending.append((key, text))
+        if len(self._pending) >= self._max_batch or self._window_seconds == 0.0:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self._window_seconds, self._flush)
+        return future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        while self._pending:
+            batch = self._pending[: self._max_batch]
+            del self._pending[: self._max_batch]
+            task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[tuple[str, str]]) -> None:
+        texts = [text for _, text in batch]
+        try:
+            async with self._concurrency:
+                await self._limiter.acquire(sum(_estimate_tokens(t) for t in texts))
+                self.stats.api_calls += 1
+                vectors = await self._inner.embed(texts)
+            if len(vectors) != len(texts):
+                raise ValueError(
+                    f"embedding provider returned {len(vectors)} vectors for {len(texts)} texts"
+                )
+        except BaseException as exc:  # noqa: BLE001 — fan the failure out, then drop
+            for key, _ in batch:
+                future = self._inflight.pop(key, None)
+                if future is not None and not future.done():
+                    future.set_exception(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+            return
+
+        fresh = {key: vector for (key, _), vector in zip(batch, vectors)}
+        for key, vector in fresh.items():
+            self._memory.put(key, vector)
+            future = self._inflight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_result(vector)
+        if self._store is not None:
+            try:
+                await self._store.set_many(fresh)
+            except Exception:  # noqa: BLE001 — cache write is best-effort
+                self.stats.store_errors += 1
+                logger.warning("embedding cache store write failed", exc_info=True)
+
+    async def drain(self) -> None:
+        """Wait for in-flight batches, including their shared-tier cache writes.
+
+        embed() resolves as soon as the vectors arrive; the store write finishes in
+        the background. Call before shutdown, or when another process must see the
+        cached vectors.
+        """
+        while self._tasks:
+            await asyncio.gather(*list(self._tasks), return_exceptions=True)
+
+    @property
+    def cached_entries(self) -> int:
+        return len(self._memory)
+
+
+__all__ = [
+    "CoalescingEmbeddingClient",
+    "DiskEmbeddingCacheStore",
+    "EmbeddingCacheStats",
+    "EmbeddingCacheStore",
+    "RedisEmbeddingCacheStore",
+    "TokenRateLimiter",
+    "embed_in_batches",
+    "embedding_cache_key",
+]
@@ -19,9 +19,11 @@ Key Components:
     - EmbeddingClient: ABC with embed() + model_name()
 
 Created: 2026-06-27 (Sprint 57.146)
-Last Modified: 2026-06-27
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: add the `self_batching` class flag (CoalescingEmbeddingClient paces
+      its own batches; callers may hand it a whole corpus in one embed())
     - 2026-06-27: Initial creation (Sprint 57.146) — first embedding ABC
       (AD-Knowledge-Connector-First-Real-Source Slice 2)
 
@@ -40,6 +42,11 @@ from abc import ABC, abstractmethod
 class EmbeddingClient(ABC):
     """LLM-neutral embedding client. THE only embedding interface for non-adapter code."""
 
+    # True when the client bounds its own batch size + request rate (e.g. the
+    # coalescing wrapper's TPM limiter). Ingest callers then pass every text in one
+    # embed() call instead of pacing fixed-size batches sequentially themselves.
+    self_batching: bool = False
+
     @abstractmethod
     async def embed(self, texts: list[str]) -> list[list[float]]:
         """Embed a batch of texts → one vector per text, order-preserving.
@@ -0,0 +1,398 @@
+"""
+File: backend/src/adapters/_base/response_cache_wrapper.py
+Purpose: ChatClient wrapper that serves repeated deterministic requests from a response cache.
+Category: Adapters / cheap-tier cost control
+Scope: Phase 57 / LLM response cache
+
+Description:
+    Transparent middleware (sibling of circuit_breaker_wrapper.py) that wraps a
+    ChatClient — in practice the cheap tier (ModelProfile.cheap) — and caches
+    chat() responses for requests the CALLER marks as cacheable:
+
+        ChatRequest(..., temperature=0.0,
+                    extra_options={RESPONSE_CACHEABLE_OPTION: True})
+
+    Cat 4 SemanticCompactor, Cat 3 SessionSummarizer / MemoryExtractor /
+    MemoryFormationWorker (and LLMJudgeVerifier when run at temperature 0)
+    mark their requests; identical inputs recur constantly (retries,
+    re-summaries of an unchanged ledger, re-compaction of the same prefix).
+    Unmarked requests — the user-facing action turn — always pass through.
+
+    Key: sha256 of a canonical JSON of (deployment, messages, tools,
+    tool_choice, temperature, max_tokens), namespaced by tenant:
+
+        llm_resp:{tenant_id}:{digest}
+
+    Message.metadata is local bookkeeping (never sent to the provider), so it
+    is not part of the key. A request without a tenant_id in its
+    trace_context is never cached (no cross-tenant namespace exists).
+
+    A hit returns the stored response with zeroed usage — no provider tokens
+    were spent, so cost-ledger / quota accounting must not charge them again.
+
+    Backends (ResponseCacheStore Protocol, TTL per entry):
+      - InMemoryResponseCacheStore — bounded LRU, per process
+      - RedisResponseCacheStore    — SET EX, shared across instances
+    Store failures are fail-open: a broken cache degrades to a provider call.
+
+    Metrics: `stats` (hits / misses / bypassed / store_errors) plus an
+    `llm_response_cache_total` counter (label result=hit|miss) through the
+    optional Tracer.
+
+Key Components:
+    - ResponseCacheWrapper: ChatClient decorator (chat() cached; rest delegated)
+    - ResponseCacheStore / InMemoryResponseCacheStore / RedisResponseCacheStore
+    - response_cache_key(): canonical request hash
+
+Owner: Adapter layer
+Created: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — tenant-scoped cheap-tier response cache
+
+Related:
+    - adapters/_base/circuit_breaker_wrapper.py — sibling ChatClient decorator
+    - agent_harness/_contracts/chat.py — RESPONSE_CACHEABLE_OPTION marker
+    - api/v1/chat/handler.py — wraps profile.cheap when LLM_RESPONSE_CACHE is on
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal, Protocol
+
+from adapters._base.chat_client import ChatClient
+from adapters._base.pricing import PricingInfo
+from adapters._base.types import ModelInfo, StreamEvent
+from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
+    CacheBreakpoint,
+    ChatRequest,
+    ChatResponse,
+    ContentBlock,
+    Message,
+    MetricEvent,
+    SpanCategory,
+    StopReason,
+    TokenUsage,
+    ToolCall,
+    ToolSpec,
+    TraceContext,
+)
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
+    from agent_harness.observability import Tracer
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "llm_resp"
+_DEFAULT_TTL_SECONDS = 3600
+_DEFAULT_MAX_ENTRIES = 1024
+
+
+# === canonical key ==========================================================
+
+
+def _canonical_message(msg: Message) -> dict[str, Any]:
+    content: Any = msg.content
+    if isinstance(content, list):
+        content = [asdict(block) for block in content]
+    return {
+        "role": msg.role,
+        "content": content,
+        "tool_calls": (
+            [{"id": tc.id, "name": tc.name, "arguments": tc.arguments} for tc in msg.tool_calls]
+            if msg.tool_calls
+            else None
+        ),
+        "tool_call_id": msg.tool_call_id,
+        "name": msg.name,
+    }
+
+
+def _canonical_tool(tool: Any) -> Any:
+    if isinstance(tool, ToolSpec):
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "input_schema": tool.input_schema,
+        }
+    return tool
+
+
+def response_cache_key(request: ChatRequest, *, deployment: str, tenant_id: str) -> str:
+    """Tenant-namespaced sha256 of everything that shapes the provider's answer."""
+    canonical = {
+        "deployment": deployment,
+        "messages": [_canonical_message(m) for m in request.messages],
+        "tools": [_canonical_tool(t) for t in request.tools],
+        "tool_choice": request.tool_choice,
+        "temperature": request.temperature,
+        "max_tokens": request.max_tokens,
+    }
+    blob = json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+    digest = hashlib.sha256(blob.encode("utf-8")).hexdigest()
+    return f"{_KEY_PREFIX}:{tenant_id}:{digest}"
+
+
+# === (de)serialisation ======================================================
+
+
+def _dump_response(response: ChatResponse) -> bytes:
+    content: Any = response.content
+    if isinstance(content, list):
+        content = [asdict(block) for block in content]
+    payload = {
+        "model": response.model,
+        "content": content,
+        "tool_calls": (
+            [asdict(tc) for tc in response.tool_calls] if response.tool_calls is not None else None
+        ),
+        "stop_reason": response.stop_reason.value,
+    }
+    return json.dumps(payload, default=str).encode("utf-8")
+
+
+def _load_response(raw: bytes) -> ChatResponse:
+    payload = json.loads(raw)
+    content = payload["content"]
+    if isinstance(content, list):
+        content = [ContentBlock(**block) for block in content]
+    tool_calls = payload.get("tool_calls")
+    return ChatResponse(
+        model=payload["model"],
+        content=content,
+        tool_calls=[ToolCall(**tc) for tc in tool_calls] if tool_calls is not None else None,
+        stop_reason=StopReason(payload["stop_reason"]),
+        # Served from cache → no provider tokens spent on this call.
+        usage=TokenUsage(prompt_tokens=0, completion_tokens=0),
+    )
+
+
+# === stores =================================================================
+
+
+class ResponseCacheStore(Protocol):
+    """Byte-value cache with per-entry TTL."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: int) -> None: ...
+
+
+class InMemoryResponseCacheStore:
+    """Per-process LRU store; expired entries are dropped on read."""
+
+    def __init__(self, *, max_entries: int = _DEFAULT_MAX_ENTRIES) -> None:
+        self._max_entries = max_entries
+        self._data: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: int) -> None:
+        self._data[key] = (time.monotonic() + ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class RedisResponseCacheStore:
+    """Redis store (SET EX). Caller owns the client (URL / auth / pool / TLS)."""
+
+    def __init__(
+        self,
+        client: "Redis[bytes]",  # type: ignore[type-arg, unused-ignore]
+    ) -> None:
+        self._client = client
+
+    async def get(self, key: str) -> bytes | None:
+        raw = await self._client.get(key)
+        if raw is None:
+            return None
+        return raw if isinstance(raw, bytes) else str(raw).encode("utf-8")
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: int) -> None:
+        await self._client.set(key, value, ex=ttl_seconds)
+
+
+# === wrapper ================================================================
+
+
+@dataclass
+class ResponseCacheStats:
+    hits: int = 0
+    misses: int = 0
+    bypassed: int = 0
+    store_errors: int = 0
+
+
+class ResponseCacheWrapper(ChatClient):
+    """ChatClient decorator serving caller-marked deterministic requests from a cache.
+
+    Args:
+        inner: the concrete (cheap-tier) adapter.
+        store: ResponseCacheStore backend.
+        ttl_seconds: lifetime of a cached response.
+        deployment: key component naming the model behind `inner`; defaults to
+            inner.model_info().model_name.
+        tracer: optional Tracer for the llm_response_cache_total counter.
+    """
+
+    def __init__(
+        self,
+        *,
+        inner: ChatClient,
+        store: ResponseCacheStore,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        deployment: str | None = None,
+        tracer: "Tracer | None" = None,
+    ) -> None:
+        self._inner = inner
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._deployment = deployment
+        self._tracer = tracer
+        self.stats = ResponseCacheStats()
+
+    @property
+    def inner(self) -> ChatClient:
+        return self._inner
+
+    def _deployment_name(self) -> str:
+        if self._deployment is None:
+            self._deployment = self._inner.model_info().model_name
+        return self._deployment
+
+    @staticmethod
+    def _is_cacheable(request: ChatRequest) -> bool:
+        return bool(request.extra_options and request.extra_options.get(RESPONSE_CACHEABLE_OPTION))
+
+    def _record(self, result: Literal["hit", "miss"], trace_context: TraceContext) -> None:
+        if self._tracer is None:
+            return
+        self._tracer.record_metric(
+            MetricEvent(
+                metric_name="llm_response_cache_total",
+                metric_type="counter",
+                value=1.0,
+                timestamp=datetime.now(timezone.utc),
+                category=SpanCategory.OBSERVABILITY,
+                labels={"result": result, "deployment": self._deployment_name()},
+                trace_context=trace_context,
+            )
+        )
+
+    # === core (cached) ======================================================
+
+    async def chat(
+        self,
+        request: ChatRequest,
+        *,
+        cache_breakpoints: list[CacheBreakpoint] | None = None,
+        trace_context: TraceContext | None = None,
+    ) -> ChatResponse:
+        tenant_id = trace_context.tenant_id if trace_context is not None else None
+        if trace_context is None or tenant_id is None or not self._is_cacheable(request):
+            self.stats.bypassed += 1
+            return await self._inner.chat(
+                request, cache_breakpoints=cache_breakpoints, trace_context=trace_context
+            )
+
+        key = response_cache_key(
+            request, deployment=self._deployment_name(), tenant_id=str(tenant_id)
+        )
+        try:
+            raw = await self._store.get(key)
+            cached = _load_response(raw) if raw is not None else None
+        except Exception:  # noqa: BLE001 — fail-open: a broken cache is a miss
+            self.stats.store_errors += 1
+            logger.warning("llm response cache: get failed; calling provider", exc_info=True)
+            cached = None
+        if cached is not None:
+            self.stats.hits += 1
+            self._record("hit", trace_context)
+            return cached
+
+        self.stats.misses += 1
+        self._record("miss", trace_context)
+        response = await self._inner.chat(
+            request, cache_breakpoints=cache_breakpoints, trace_context=trace_context
+        )
+        try:
+            await self._store.set(key, _dump_response(response), ttl_seconds=self._ttl_seconds)
+        except Exception:  # noqa: BLE001 — fail-open: the response is still returned
+            self.stats.store_errors += 1
+            logger.warning("llm response cache: set failed", exc_info=True)
+        return response
+
+    def stream(
+        self,
+        request: ChatRequest,
+        *,
+        cache_breakpoints: list[CacheBreakpoint] | None = None,
+        trace_context: TraceContext | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        # Streaming consumers want incremental output; never cached.
+        return self._inner.stream(
+            request, cache_breakpoints=cache_breakpoints, trace_context=trace_context
+        )
+
+    # === delegate ===========================================================
+
+    async def count_tokens(
+        self,
+        *,
+        messages: list[Message],
+        tools: list[ToolSpec] | None = None,
+    ) -> int:
+        return await self._inner.count_tokens(messages=messages, tools=tools)
+
+    def get_pricing(self) -> PricingInfo:
+        return self._inner.get_pricing()
+
+    def supports_feature(
+        self,
+        feature: Literal[
+            "thinking",
+            "caching",
+            "vision",
+            "audio",
+            "computer_use",
+            "structured_output",
+            "parallel_tool_calls",
+        ],
+    ) -> bool:
+        return self._inner.supports_feature(feature)
+
+    def model_info(self) -> ModelInfo:
+        return self._inner.model_info()
+
+
+__all__ = [
+    "InMemoryResponseCacheStore",
+    "RedisResponseCacheStore",
+    "ResponseCacheStats",
+    "ResponseCacheStore",
+    "ResponseCacheWrapper",
+    "response_cache_key",
+]
@@ -19,9 +19,14 @@ Description:
     provided; full OTel hookup happens in Day 3 setup.py.
 
 Created: 2026-04-29 (Sprint 49.4)
-Last Modified: 2026-05-01
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: count_tokens() uses a process-wide TiktokenCounter per (model, overheads)
+      so its memo outlives the per-request adapter
+    - 2026-10-16: stream() requests stream_options.include_usage (final usage chunk)
+    - 2026-10-16: Optional client_pool — borrow a shared keep-alive client (aclose keeps it open)
+    - 2026-10-16: stream() tool_call_delta +index; emit usage event when a chunk carries usage
     - 2026-06-04: Sprint 57.79 — gpt-5.x max_completion_tokens param branch (C-11 billing gap 2)
     - 2026-05-01: Compute deterministic prompt_cache_key from CacheBreakpoint
         section_ids (Sprint 52.2 Day 3.5) and forward via extra_body to Azure
@@ -42,9 +47,11 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+from functools import lru_cache
 from typing import TYPE_CHECKING, AsyncIterator, Literal
 
 if TYPE_CHECKING:
+    from adapters.azure_openai.client_pool import AzureClientPool
     from agent_harness.context_mgmt.token_counter.tiktoken_counter import TiktokenCounter
     from agent_harness.observability import Tracer
 
@@ -104,6 +111,25 @@ def _compute_prompt_cache_key(
     return hashlib.sha256(":".join(section_ids).encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=None)
+def _shared_token_counter(
+    model_name: str, per_message_overhead: int, per_request_overhead: int
+) -> "TiktokenCounter":
+    """Process-wide TiktokenCounter per (model, overheads).
+
+    Adapters are built per request; a counter owned by the adapter would take
+    its per-message memo down with it. Pure tokenizer state — no tenant data is
+    retained beyond content hashes → token counts.
+    """
+    from agent_harness.context_mgmt.token_counter.tiktoken_counter import TiktokenCounter
+
+    return TiktokenCounter(
+        model=model_name,
+        per_message_overhead=per_message_overhead,
+        per_request_overhead=per_request_overhead,
+    )
+
+
 def _max_tokens_param_name(model_name: str) -> str:
     """Return the token-cap kwarg name for an Azure model (C-11 billing gap 2).
 
@@ -123,12 +149,15 @@ class AzureOpenAIAdapter(ChatClient):
         config: AzureOpenAIConfig | None = None,
         *,
         tracer: "Tracer | None" = None,
+        client_pool: "AzureClientPool | None" = None,
     ) -> None:
         self.config = config or AzureOpenAIConfig()
         self._client: AsyncAzureOpenAI | None = None
+        # When set, _get_client borrows the pool's shared keep-alive client (one
+        # per deployment per process) instead of building a private one; the
+        # pool owns its lifecycle, so aclose() only drops the reference.
+        self._client_pool = client_pool
         self._tokenizer: tiktoken.Encoding | None = None
-        # 52.1 Day 3.10: lazy Cat 4 token counter (replaces inline tiktoken loop)
-        self._token_counter: "TiktokenCounter | None" = None
         # Sprint 52.5 P0 #16: tracer injection for the LLM-call span.
         # NoOpTracer is the lazy default used when no tracer is wired in
         # (unit tests + dev paths). Production wiring goes through
@@ -149,6 +178,9 @@ class AzureOpenAIAdapter(ChatClient):
                     "AZURE_OPENAI_API_KEY / AZURE_OPENAI_ENDPOINT / "
                     "AZURE_OPENAI_DEPLOYMENT_NAME"
                 )
+            if self._client_pool is not None:
+                self._client = self._client_pool.get(self.config)
+                return self._client
             self._client = AsyncAzureOpenAI(
                 api_key=self.config.api_key,
                 api_version=self.config.api_version,
@@ -288,6 +320,10 @@ class AzureOpenAIAdapter(ChatClient):
                     "messages": azure_messages,
                     "temperature": request.temperature,
                     "stream": True,
+                    # Without include_usage Azure sends no final usage chunk, so
+                    # the loop would fall back to a count_tokens() estimate and
+                    # lose cached_input_tokens.
+                    "stream_options": {"include_usage": True},
                 }
                 if azure_tools:
                     kwargs["tools"] = azure_tools
@@ -306,6 +342,26 @@ class AzureOpenAIAdapter(ChatClient):
 
             try:
                 async for chunk in stream:
+                    # Usage-bearing chunk (requested via include_usage) arrives
+                    # with empty choices at the end.
+                    usage_obj = getattr(chunk, "usage", None)
+                    if usage_obj is not None:
+                        prompt_details = getattr(usage_obj, "prompt_tokens_details", None)
+                        yield StreamEvent(
+                            event_type="usage",
+                            payload={
+                                "prompt_tokens": getattr(usage_obj, "prompt_tokens", 0) or 0,
+                                "completion_tokens": (
+                                    getattr(usage_obj, "completion_tokens", 0) or 0
+                                ),
+                                "cached_input_tokens": (
+                                    getattr(prompt_details, "cached_tokens", 0) or 0
+                                    if prompt_details is not None
+                                    else 0
+                                ),
+                                "total_tokens": getattr(usage_obj, "total_tokens", 0) or 0,
+                            },
+                        )
                     if not chunk.choices:
                         continue
                     choice = chunk.choices[0]
@@ -321,6 +377,9 @@ class AzureOpenAIAdapter(ChatClient):
                             yield StreamEvent(
                                 event_type="tool_call_delta",
                                 payload={
+                                    # Parallel tool calls interleave by index; only
+                                    # the first delta of each call carries its id.
+                                    "index": getattr(tc_delta, "index", None),
                                     "id": getattr(tc_delta, "id", None),
                                     "name": (
                                         getattr(tc_delta.function, "name", None)
@@ -368,21 +427,16 @@ class AzureOpenAIAdapter(ChatClient):
         return counter.count(messages=messages, tools=tools)
 
     def _get_token_counter(self) -> "TiktokenCounter":
-        if self._token_counter is None:
-            from agent_harness.context_mgmt.token_counter.tiktoken_counter import TiktokenCounter
-
-            self._token_counter = TiktokenCounter(
-                model=self.config.model_name,
-                # Preserve 51.1 adapter contract:
-                # - count_tokens([]) == 0 (no per_request overhead on empty input;
-                #   TiktokenCounter already short-circuits empty, but we also keep
-                #   per_request_overhead at 0 for any future code path consistency)
-                # - per_message overhead = 4 (matches the OpenAI cookbook value
-                #   used by 51.1 adapter; tests in test_token_counting.py assume this)
-                per_message_overhead=4,
-                per_request_overhead=0,
-            )
-        return self._token_counter
+        # 52.1 Day 3.10: Cat 4 token counter (replaces inline tiktoken loop), shared
+        # per model across adapter instances. Preserve 51.1 adapter contract:
+        # - count_tokens([]) == 0 (no per_request overhead on empty input;
+        #   TiktokenCounter already short-circuits empty, but we also keep
+        #   per_request_overhead at 0 for any future code path consistency)
+        # - per_message overhead = 4 (matches the OpenAI cookbook value
+        #   used by 51.1 adapter; tests in test_token_counting.py assume this)
+        return _shared_token_counter(
+            self.config.model_name, per_message_overhead=4, per_request_overhead=0
+        )
 
     def get_pricing(self) -> PricingInfo:
         return PricingInfo(
@@ -467,7 +521,12 @@ class AzureOpenAIAdapter(ChatClient):
     # -- lifecycle ---------------------------------------------------------
 
     async def aclose(self) -> None:
-        """Release the underlying httpx pool. Idempotent."""
+        """Release the underlying httpx pool. Idempotent.
+
+        A pooled client is shared with other adapters — only the reference is
+        dropped; the pool closes it on shutdown.
+        """
         if self._client is not None:
-            await self._client.close()
+            if self._client_pool is None:
+                await self._client.close()
             self._client = None
@@ -0,0 +1,175 @@
+"""
+File: backend/src/adapters/azure_openai/client_pool.py
+Purpose: AzureClientPool — process-wide registry of shared keep-alive AsyncAzureOpenAI clients.
+Category: Adapters / Azure OpenAI
+Scope: Phase 57 / LLM client pooling
+
+Description:
+    build_azure_model_profile() builds fresh AzureOpenAIAdapter instances on
+    every chat request (action + cheap tier; the judge / compaction summarize /
+    memory formation / child loops all run on those). Each adapter lazily
+    created its own AsyncAzureOpenAI — its own httpx connection pool — so every
+    chat send paid fresh TCP + TLS handshakes and concurrent sessions never
+    shared a connection.
+
+    AzureClientPool hands out ONE AsyncAzureOpenAI per
+    (endpoint, api_version, deployment) — plus the api_key digest / timeout /
+    max_retries that change the client's behavior — each backed by an
+    httpx.AsyncClient with bounded connection + keep-alive limits. Adapters
+    built with `client_pool=` borrow the shared client and never close it;
+    the pool owner closes every client once (api/main.py lifespan shutdown
+    via close_azure_client_pool()).
+
+    The process-wide instance is created on first use with the limits the
+    caller passes (api/v1/chat/handler.py reads the llm_client_pool_* Settings);
+    it is only consulted when llm_client_pool is enabled, so the default
+    per-adapter client path is unchanged.
+
+Key Components:
+    - AzureClientPool: get(config) / close() / size
+    - get_azure_client_pool(): lazy process-wide instance
+    - close_azure_client_pool(): lifespan shutdown hook (idempotent)
+
+Created: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — shared keep-alive Azure clients keyed per deployment
+
+Related:
+    - adapters/azure_openai/adapter.py — `client_pool=` borrower
+    - adapters/azure_openai/profile.py — threads the pool into both tiers
+    - api/main.py — _lifespan shutdown closes the pool
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+
+import httpx
+from openai import AsyncAzureOpenAI
+
+from adapters.azure_openai.config import AzureOpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 20
+_DEFAULT_KEEPALIVE_EXPIRY_SEC = 30.0
+
+# (endpoint, api_version, deployment, api_key digest, timeout_sec, max_retries)
+_PoolKey = tuple[str, str, str, str, float, int]
+
+
+class AzureClientPool:
+    """Registry of shared AsyncAzureOpenAI clients, one per deployment target."""
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry_sec: float = _DEFAULT_KEEPALIVE_EXPIRY_SEC,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry_sec,
+        )
+        self._clients: dict[_PoolKey, AsyncAzureOpenAI] = {}
+        # get() is sync and may race across threads (sync FastAPI deps run in the
+        # threadpool); the lock keeps one client per key.
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(config: AzureOpenAIConfig, deployment: str) -> _PoolKey:
+        # The api_key is part of the identity (two keys → two clients) but is
+        # never held in the key itself.
+        key_digest = hashlib.sha256(config.api_key.encode("utf-8")).hexdigest()
+        return (
+            config.endpoint,
+            config.api_version,
+            deployment,
+            key_digest,
+            config.timeout_sec,
+            config.max_retries,
+        )
+
+    def get(self, config: AzureOpenAIConfig) -> AsyncAzureOpenAI:
+        """Return the shared client for `config` (built on first request)."""
+        key = self._key(config, config.deployment_name)
+        client = self._clients.get(key)
+        if client is not None:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = AsyncAzureOpenAI(
+                    api_key=config.api_key,
+                    api_version=config.api_version,
+                    azure_endpoint=config.endpoint,
+                    timeout=config.timeout_sec,
+                    max_retries=config.max_retries,
+                    http_client=httpx.AsyncClient(
+                        limits=self._limits,
+                        timeout=config.timeout_sec,
+                    ),
+                )
+                self._clients[key] = client
+                logger.info(
+                    "azure client pool: new client endpoint=%s deployment=%s (pool size=%d)",
+                    config.endpoint,
+                    key[2],
+                    len(self._clients),
+                )
+        return client
+
+    @property
+    def size(self) -> int:
+        return len(self._clients)
+
+    async def close(self) -> None:
+        """Close every pooled client. Idempotent; the pool is reusable afterwards."""
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                await client.close()
+            except Exception:  # noqa: BLE001 — shutdown must close the rest
+                logger.warning("azure client pool: client close failed", exc_info=True)
+
+
+_POOL: AzureClientPool | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def get_azure_client_pool(
+    *,
+    max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+    max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+    keepalive_expiry_sec: float = _DEFAULT_KEEPALIVE_EXPIRY_SEC,
+) -> AzureClientPool:
+    """The process-wide pool. The limits apply when it is first built (first call wins)."""
+    global _POOL
+    if _POOL is None:
+        with _POOL_LOCK:
+            if _POOL is None:
+                _POOL = AzureClientPool(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_keepalive_connections,
+                    keepalive_expiry_sec=keepalive_expiry_sec,
+                )
+    return _POOL
+
+
+async def close_azure_client_pool() -> None:
+    """Lifespan shutdown hook: close + drop the process-wide pool (no-op if never built)."""
+    global _POOL
+    pool, _POOL = _POOL, None
+    if pool is not None:
+        await pool.close()
+
+
+__all__ = ["AzureClientPool", "close_azure_client_pool", "get_azure_client_pool"]
@@ -26,13 +26,14 @@ Description:
     the strong model must be priced in config/llm_pricing.yml.
 
 Key Components:
-    - build_azure_model_profile(policy=None) -> ModelProfile
+    - build_azure_model_profile(policy=None, *, client_pool=None) -> ModelProfile
     - _azure_config(deployment, model) -> AzureOpenAIConfig (override only the set fields)
 
 Created: 2026-06-09 (Sprint 57.97)
-Last Modified: 2026-06-11
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: Optional client_pool threaded into the action + cheap adapters
     - 2026-06-11: Sprint 57.104 C1 — take a ModelPolicy; build action+cheap from policy ∪ env
     - 2026-06-09: Initial creation (Sprint 57.97) — Azure cheap-tier ModelProfile builder
 
@@ -51,10 +52,15 @@ from adapters._base.chat_client import ChatClient
 from adapters._base.model_policy import ModelPolicy
 from adapters._base.model_profile import ModelProfile
 from adapters.azure_openai.adapter import AzureOpenAIAdapter
+from adapters.azure_openai.client_pool import AzureClientPool
 from adapters.azure_openai.config import AzureOpenAIConfig
 
 
-def build_azure_model_profile(policy: ModelPolicy | None = None) -> ModelProfile:
+def build_azure_model_profile(
+    policy: ModelPolicy | None = None,
+    *,
+    client_pool: AzureClientPool | None = None,
+) -> ModelProfile:
     """Build the {action, cheap} ModelProfile for Azure from an optional tenant policy.
 
     The action client is built on the tenant's `action_deployment` / `action_model`
@@ -64,6 +70,10 @@ def build_azure_model_profile(policy: ModelPolicy | None = None) -> ModelProfile
     (the SAME instance → byte-identical behavior + cost). A None / all-None policy is
     byte-identical to the Sprint 57.97 env-only path.
 
+    `client_pool` (when given) is threaded into both tiers so their adapters borrow
+    the process-wide keep-alive clients instead of opening a private httpx pool per
+    request; None keeps the per-adapter client.
+
     Cost attribution: the per-tier saving is visible in the cost ledger purely
     because each deployment returns its OWN model name (the ledger keys sub_type by
     model, not by the adapter config) — see the module docstring.
@@ -73,7 +83,7 @@ def build_azure_model_profile(policy: ModelPolicy | None = None) -> ModelProfile
     # Action tier: the tenant override OR the AZURE_OPENAI_* env default. The shared
     # endpoint / api_key / api_version always load from env (never passed here).
     action_client: ChatClient = AzureOpenAIAdapter(
-        _azure_config(pol.action_deployment, pol.action_model)
+        _azure_config(pol.action_deployment, pol.action_model), client_pool=client_pool
     )
 
     # Cheap tier: the tenant override OR the AZURE_OPENAI_CHEAP_* env. When neither
@@ -89,7 +99,9 @@ def build_azure_model_profile(policy: ModelPolicy | None = None) -> ModelProfile
         or os.environ.get("AZURE_OPENAI_CHEAP_MODEL_NAME", "").strip()
         or cheap_deployment
     )
-    cheap_client: ChatClient = AzureOpenAIAdapter(_azure_config(cheap_deployment, cheap_model))
+    cheap_client: ChatClient = AzureOpenAIAdapter(
+        _azure_config(cheap_deployment, cheap_model), client_pool=client_pool
+    )
     return ModelProfile(action=action_client, cheap=cheap_client)
 
 
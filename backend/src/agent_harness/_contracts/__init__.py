@@ -26,6 +26,7 @@ Created: 2026-04-29 (Sprint 49.1)
 
 from agent_harness._contracts.cache import CachePolicy
 from agent_harness._contracts.chat import (
+    RESPONSE_CACHEABLE_OPTION,
     CacheBreakpoint,
     ChatRequest,
     ChatResponse,
@@ -54,6 +55,7 @@ from agent_harness._contracts.events import (
     GuardrailTriggered,
     LLMRequested,
     LLMResponded,
+    LLMTextDelta,
     LoopCompleted,
     LoopEvent,
     LoopStarted,
@@ -130,6 +132,7 @@ __all__ = [
     "ToolCall",
     "TokenUsage",
     "CacheBreakpoint",
+    "RESPONSE_CACHEABLE_OPTION",
     # compaction (Cat 4)
     "CompactionStrategy",
     "CompactionResult",
@@ -158,6 +161,7 @@ __all__ = [
     "TurnStarted",
     "LLMRequested",
     "LLMResponded",
+    "LLMTextDelta",
     "Thinking",
     "LoopCompleted",
     "ToolCallRequested",
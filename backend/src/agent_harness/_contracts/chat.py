@@ -20,9 +20,10 @@ Owner: 10-server-side-philosophy.md §原則 2 §ChatClient ABC
 Single-source: 17.md §1.1
 
 Created: 2026-04-29 (Sprint 49.1)
-Last Modified: 2026-04-29
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: RESPONSE_CACHEABLE_OPTION — ChatRequest.extra_options response-cache opt-in
     - 2026-04-29: Initial creation (Sprint 49.1) — stub types
 
 Related:
@@ -105,6 +106,13 @@ class TokenUsage:
     total_tokens: int = 0
 
 
+# ChatRequest.extra_options key: the caller declares the request deterministic
+# (temperature 0, output a pure function of the input) so a response-cache
+# wrapper (adapters/_base/response_cache_wrapper.py) may serve a repeat from
+# cache. Adapters ignore it; absent / False → never cached.
+RESPONSE_CACHEABLE_OPTION = "response_cacheable"
+
+
 @dataclass(frozen=True)
 class ChatRequest:
     """ChatClient.chat() input. LLM-neutral."""
@@ -20,9 +20,10 @@ Owner: 01-eleven-categories-spec.md §範疇 1
 Single-source: 17.md §4.1
 
 Created: 2026-04-29 (Sprint 49.1)
-Last Modified: 2026-06-12
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: add LLMTextDelta (Cat 1 token streaming; stream_llm mode)
     - 2026-06-12: Sprint 57.109 C2 — ContextCompacted +usage/model (server-side ledger attribution)
     - 2026-06-12: Sprint 57.108 — ApprovalRequested +tool_name/reason (HITL card wire)
     - 2026-06-11: Sprint 57.101 — add MessageInjected (Cat 1 between-turns injection wire event)
@@ -124,6 +125,18 @@ class LLMResponded(LoopEvent):
     cached_input_tokens: int = 0
 
 
+@dataclass(frozen=True)
+class LLMTextDelta(LoopEvent):
+    """Emitted by Cat 1 per streamed text chunk when the loop runs in stream_llm mode.
+
+    Purely incremental UI feed: the same turn still ends with one LLMResponded
+    carrying the assembled content, which stays the canonical (persisted) record.
+    Tool-call argument deltas are NOT surfaced (they are assembled in the loop).
+    """
+
+    text: str = ""
+
+
 @dataclass(frozen=True)
 class Thinking(LoopEvent):
     text: str = ""
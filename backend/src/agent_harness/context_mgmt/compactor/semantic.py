@@ -31,6 +31,7 @@ Related:
 Created: 2026-05-01 (Sprint 52.1 Day 2.3)
 
 Modification History:
+    - 2026-10-16: summary request marked RESPONSE_CACHEABLE_OPTION (cheap-tier response cache)
     - 2026-06-12: Sprint 57.109 C2 — _summarise returns usage/model; result carries attribution
     - 2026-05-01: Initial creation (Sprint 52.1 Day 2.3) — LLM-driven summarisation
 """
@@ -42,6 +43,7 @@ from dataclasses import replace
 
 from adapters._base.chat_client import ChatClient
 from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
     ChatRequest,
     CompactionResult,
     CompactionStrategy,
@@ -129,6 +131,9 @@ class SemanticCompactor(Compactor):
             tools=[],
             max_tokens=self.summary_max_tokens,
             temperature=0.0,
+            # Deterministic summary of a fixed prefix → a response cache may serve
+            # a re-compaction of the same history.
+            extra_options={RESPONSE_CACHEABLE_OPTION: True},
         )
 
         last_err: Exception | None = None
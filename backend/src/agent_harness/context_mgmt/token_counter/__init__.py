@@ -1,5 +1,6 @@
-"""Cat 4 TokenCounter subpackage. Re-exports the abstract base."""
+"""Cat 4 TokenCounter subpackage. Re-exports the abstract base + memoized layer."""
 
 from agent_harness.context_mgmt.token_counter._abc import TokenCounter
+from agent_harness.context_mgmt.token_counter.memoized import MemoizedTokenCounter
 
-__all__ = ["TokenCounter"]
+__all__ = ["MemoizedTokenCounter", "TokenCounter"]
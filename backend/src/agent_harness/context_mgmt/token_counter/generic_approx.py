@@ -17,6 +17,7 @@ Description:
     accuracy() = "approximate"
 
     This counter is provider-agnostic and never imports any LLM SDK.
+    Per-message / per-tool counts are memoized by content hash (memoized.py).
 
 Owner: 01-eleven-categories-spec.md §範疇 4
 Single-source: 17-cross-category-interfaces.md §2.1 (TokenCounter row)
@@ -26,19 +27,25 @@ Related:
     - token_counter/claude_counter.py — reuses the same fallback formula
 
 Created: 2026-05-01 (Sprint 52.1 Day 3.9)
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: Subclass MemoizedTokenCounter — per-message / per-tool counts cached
     - 2026-05-01: Initial creation (Sprint 52.1 Day 3.9) — generic approx counter
 """
 
 from __future__ import annotations
 
-import json
 import math
-from typing import Any, Literal
+from typing import Literal
 
 from agent_harness._contracts import Message, ToolSpec
-from agent_harness.context_mgmt.token_counter._abc import TokenCounter
+from agent_harness.context_mgmt.token_counter.memoized import (
+    MemoizedTokenCounter,
+    message_text_parts,
+    tool_call_arguments_repr,
+    tool_schema_repr,
+)
 
 _PER_MESSAGE_OVERHEAD: int = 3
 _PER_TOOL_BUFFER_FACTOR: float = 1.3
@@ -51,54 +58,38 @@ def _approx(text: str) -> int:
     return max(1, math.ceil(len(text) / _APPROX_CHARS_PER_TOKEN))
 
 
-class GenericApproxCounter(TokenCounter):
+class GenericApproxCounter(MemoizedTokenCounter):
     """Provider-agnostic last-resort tokenizer (4 chars/token)."""
 
-    def count(
+    def _message_tokens(self, msg: Message) -> int:
+        total = _PER_MESSAGE_OVERHEAD
+        total += _approx(str(msg.role))
+        for text in message_text_parts(msg):
+            total += _approx(text)
+        if msg.name:
+            total += _approx(msg.name)
+        if msg.tool_call_id:
+            total += _approx(msg.tool_call_id)
+        if msg.tool_calls:
+            for tc in msg.tool_calls:
+                total += _approx(tc.name)
+                total += _approx(tool_call_arguments_repr(tc.arguments))
+        return total
+
+    def _tool_tokens(self, tool: ToolSpec) -> int:
+        return _approx(tool_schema_repr(tool))
+
+    def _combine(
         self,
         *,
-        messages: list[Message],
-        tools: list[ToolSpec] | None = None,
+        message_tokens: int,
+        tool_tokens: list[int],
+        has_messages: bool,
     ) -> int:
-        total = 0
-
-        for msg in messages:
-            total += _PER_MESSAGE_OVERHEAD
-            total += _approx(str(msg.role))
-
-            content = msg.content
-            if isinstance(content, str):
-                total += _approx(content)
-            elif isinstance(content, list):
-                for block in content:
-                    text_attr = getattr(block, "text", None)
-                    if isinstance(text_attr, str):
-                        total += _approx(text_attr)
-
-            if msg.name:
-                total += _approx(msg.name)
-            if msg.tool_call_id:
-                total += _approx(msg.tool_call_id)
-            if msg.tool_calls:
-                for tc in msg.tool_calls:
-                    total += _approx(tc.name)
-                    try:
-                        args_repr = json.dumps(tc.arguments, sort_keys=True, default=str)
-                    except (TypeError, ValueError):
-                        args_repr = str(tc.arguments)
-                    total += _approx(args_repr)
-
-        if tools:
-            tools_text_tokens = 0
-            for tool in tools:
-                schema_obj: dict[str, Any] = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.input_schema,
-                }
-                tools_text_tokens += _approx(json.dumps(schema_obj, sort_keys=True, default=str))
-            total += math.ceil(tools_text_tokens * _PER_TOOL_BUFFER_FACTOR)
-
+        total = message_tokens
+        if tool_tokens:
+            # The 30 % buffer applies to the summed schema text, not per tool.
+            total += math.ceil(sum(tool_tokens) * _PER_TOOL_BUFFER_FACTOR)
         return total
 
     def accuracy(self) -> Literal["exact", "approximate"]:
@@ -0,0 +1,230 @@
+"""
+File: backend/src/agent_harness/context_mgmt/token_counter/memoized.py
+Purpose: MemoizedTokenCounter base — per-message / per-tool token memo.
+Category: 範疇 4 (Context Management)
+Scope: Phase 52 / token accounting
+
+Description:
+    A TokenCounter's count() is a pure function of (messages, tools), yet the
+    chat flow calls it over and over on mostly-identical input:
+    StructuralCompactor / PreClearCompactor count the full and the masked
+    history back-to-back, PromptBuilder._apply_memory_budget re-counts the
+    memory layers per trimmed hint, and the adapter's count_tokens() re-counts
+    the whole conversation. Every call re-encodes every message, every tool-call
+    argument JSON and every tool schema — O(history) tokenizer work per call,
+    O(history²) over a session.
+
+    MemoizedTokenCounter splits count() into per-message and per-tool pieces
+    and caches each piece in a bounded LRU keyed by a content hash:
+
+      - message key = blake2b(role, text content, name, tool_call_id,
+        tool-call names + argument JSON)  — Message.metadata is NOT part of
+        the key (adapters never send it, so it never costs tokens);
+      - tool key    = blake2b(name, description, input_schema JSON).
+
+    Hashing is a single C-level pass over the text; tokenizing is the cost
+    being avoided. Subclasses implement three hooks:
+
+      - _message_tokens(msg)  — uncached token count of ONE message
+      - _tool_tokens(tool)    — uncached token count of ONE tool schema
+      - _combine(...)         — request-level overheads / buffers
+
+Owner: 01-eleven-categories-spec.md §範疇 4
+Single-source: 17-cross-category-interfaces.md §2.1 (TokenCounter row)
+
+Related:
+    - token_counter/_abc.py TokenCounter ABC
+    - token_counter/tiktoken_counter.py / generic_approx.py — memoized subclasses
+
+Created: 2026-10-16
+
+Modification History:
+    - 2026-10-16: Remove RunningTokenTotal (no production caller; reached into _combine)
+    - 2026-10-16: Initial creation — bounded per-message / per-tool memo + running total
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from abc import abstractmethod
+from collections import OrderedDict
+from typing import Any
+
+from agent_harness._contracts import Message, ToolSpec
+from agent_harness.context_mgmt.token_counter._abc import TokenCounter
+
+DEFAULT_MAX_CACHED_ENTRIES: int = 4096
+
+_FIELD_SEP = b"\x1f"
+
+
+def tool_call_arguments_repr(arguments: Any) -> str:
+    """Canonical JSON text of tool-call arguments (the text every counter encodes)."""
+    try:
+        return json.dumps(arguments, sort_keys=True, default=str)
+    except (TypeError, ValueError):
+        return str(arguments)
+
+
+def tool_schema_repr(tool: ToolSpec) -> str:
+    """Canonical JSON text of a tool schema as sent to the provider."""
+    schema_obj: dict[str, Any] = {
+        "name": tool.name,
+        "description": tool.description,
+        "parameters": tool.input_schema,
+    }
+    return json.dumps(schema_obj, sort_keys=True, default=str)
+
+
+def message_text_parts(msg: Message) -> list[str]:
+    """The text content of a message (str content or text-bearing ContentBlocks)."""
+    content = msg.content
+    if isinstance(content, str):
+        return [content]
+    parts: list[str] = []
+    if isinstance(content, list):
+        for block in content:
+            text_attr = getattr(block, "text", None)
+            if isinstance(text_attr, str):
+                parts.append(text_attr)
+    return parts
+
+
+def _digest(parts: list[str]) -> bytes:
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8", "surrogatepass"))
+        h.update(_FIELD_SEP)
+    return h.digest()
+
+
+def message_cache_key(msg: Message) -> bytes:
+    """Content hash of every token-bearing field of a message."""
+    parts = [str(msg.role), msg.name or "", msg.tool_call_id or ""]
+    # A sentinel per text part keeps ("ab",) and ("a", "b") block lists distinct.
+    for text in message_text_parts(msg):
+        parts.extend(("t", text))
+    for tc in msg.tool_calls or ():
+        parts.extend(("c", tc.name, tool_call_arguments_repr(tc.arguments)))
+    return _digest(parts)
+
+
+def tool_cache_key(tool: ToolSpec) -> bytes:
+    """Content hash of the provider-visible tool schema."""
+    return _digest([tool_schema_repr(tool)])
+
+
+class _LRUTokenCache:
+    """Bounded key → token-count map; least-recently-used entries evicted first."""
+
+    def __init__(self, max_entries: int) -> None:
+        self._max_entries = max_entries
+        self._data: OrderedDict[bytes, int] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: bytes) -> int | None:
+        value = self._data.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: bytes, value: int) -> None:
+        if self._max_entries <= 0:
+            return
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+class MemoizedTokenCounter(TokenCounter):
+    """TokenCounter whose per-message / per-tool counts are memoized by content hash.
+
+    `max_cached_entries` bounds each of the two caches (messages, tools);
+    0 disables memoization (every count() re-encodes, the pre-memo behavior).
+    """
+
+    def __init__(self, *, max_cached_entries: int = DEFAULT_MAX_CACHED_ENTRIES) -> None:
+        self._message_cache = _LRUTokenCache(max_cached_entries)
+        self._tool_cache = _LRUTokenCache(max_cached_entries)
+
+    @abstractmethod
+    def _message_tokens(self, msg: Message) -> int:
+        """Uncached token count of one message, including its per-message overhead."""
+        ...
+
+    @abstractmethod
+    def _tool_tokens(self, tool: ToolSpec) -> int:
+        """Uncached token count of one tool schema."""
+        ...
+
+    @abstractmethod
+    def _combine(
+        self,
+        *,
+        message_tokens: int,
+        tool_tokens: list[int],
+        has_messages: bool,
+    ) -> int:
+        """Fold per-message and per-tool counts into the request total."""
+        ...
+
+    def message_tokens(self, msg: Message) -> int:
+        """Memoized token count of one message."""
+        key = message_cache_key(msg)
+        cached = self._message_cache.get(key)
+        if cached is not None:
+            return cached
+        value = self._message_tokens(msg)
+        self._message_cache.put(key, value)
+        return value
+
+    def tool_tokens(self, tool: ToolSpec) -> int:
+        """Memoized token count of one tool schema."""
+        key = tool_cache_key(tool)
+        cached = self._tool_cache.get(key)
+        if cached is not None:
+            return cached
+        value = self._tool_tokens(tool)
+        self._tool_cache.put(key, value)
+        return value
+
+    def count(
+        self,
+        *,
+        messages: list[Message],
+        tools: list[ToolSpec] | None = None,
+    ) -> int:
+        return self._combine(
+            message_tokens=sum(self.message_tokens(msg) for msg in messages),
+            tool_tokens=[self.tool_tokens(tool) for tool in tools or ()],
+            has_messages=bool(messages),
+        )
+
+    def cache_stats(self) -> dict[str, int]:
+        """Hit / miss / size counters of the message and tool caches."""
+        return {
+            "message_hits": self._message_cache.hits,
+            "message_misses": self._message_cache.misses,
+            "message_entries": len(self._message_cache),
+            "tool_hits": self._tool_cache.hits,
+            "tool_misses": self._tool_cache.misses,
+            "tool_entries": len(self._tool_cache),
+        }
+
+    def clear_cache(self) -> None:
+        self._message_cache.clear()
+        self._tool_cache.clear()
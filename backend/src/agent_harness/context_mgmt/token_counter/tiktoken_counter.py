@@ -21,6 +21,10 @@ Description:
     Tools schema is serialised to JSON and counted with the same encoding
     plus a small per-tool overhead.
 
+    Per-message and per-tool counts are memoized by content hash
+    (memoized.py), so re-counting an unchanged history costs one hash per
+    message instead of one tokenizer pass.
+
 LLM neutrality (per 10-server-side-philosophy.md §原則 2):
     `tiktoken` is OpenAI's tokenizer but it is NOT an LLM SDK; it ships
     no provider client. Importing it inside the agent_harness layer is
@@ -36,15 +40,17 @@ Related:
     - sprint-52-1-plan.md §1 Story 3 (TokenCounter ABC + 3 concrete impls)
 
 Created: 2026-05-01 (Sprint 52.1 Day 3.6)
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: Subclass MemoizedTokenCounter — per-message / per-tool
+      counts cached by content hash (count() no longer re-encodes the history)
     - 2026-05-01: Initial creation (Sprint 52.1 Day 3.6) — exact tiktoken impl
 """
 
 from __future__ import annotations
 
-import json
-from typing import Any, Literal
+from typing import Literal
 
 try:
     import tiktoken
@@ -55,7 +61,13 @@ except ImportError as err:  # pragma: no cover - installation path
     ) from err
 
 from agent_harness._contracts import Message, ToolSpec
-from agent_harness.context_mgmt.token_counter._abc import TokenCounter
+from agent_harness.context_mgmt.token_counter.memoized import (
+    DEFAULT_MAX_CACHED_ENTRIES,
+    MemoizedTokenCounter,
+    message_text_parts,
+    tool_call_arguments_repr,
+    tool_schema_repr,
+)
 
 _DEFAULT_PER_MESSAGE_OVERHEAD: int = 3
 _DEFAULT_PER_REQUEST_OVERHEAD: int = 3
@@ -73,7 +85,7 @@ def _select_encoding_name(model: str) -> str:
     return "cl100k_base"
 
 
-class TiktokenCounter(TokenCounter):
+class TiktokenCounter(MemoizedTokenCounter):
     """Exact tokenizer for OpenAI/Azure models via the tiktoken library."""
 
     def __init__(
@@ -84,7 +96,9 @@ class TiktokenCounter(TokenCounter):
         per_message_overhead: int = _DEFAULT_PER_MESSAGE_OVERHEAD,
         per_request_overhead: int = _DEFAULT_PER_REQUEST_OVERHEAD,
         per_tool_overhead: int = _DEFAULT_PER_TOOL_OVERHEAD,
+        max_cached_entries: int = DEFAULT_MAX_CACHED_ENTRIES,
     ) -> None:
+        super().__init__(max_cached_entries=max_cached_entries)
         self.model = model
         self._encoding_name: str = encoding_name or _select_encoding_name(model)
         # Configurable overheads let adapters pass per_request_overhead=0 when
@@ -99,60 +113,41 @@ class TiktokenCounter(TokenCounter):
             self._encoding_name = "cl100k_base"
             self._encoding = tiktoken.get_encoding(self._encoding_name)
 
-    def count(
+    def _encoded_len(self, text: str) -> int:
+        return len(self._encoding.encode(text))
+
+    def _message_tokens(self, msg: Message) -> int:
+        total = self._per_message_overhead
+        total += self._encoded_len(str(msg.role))
+        # ContentBlock list — flatten text fields conservatively
+        for text in message_text_parts(msg):
+            total += self._encoded_len(text)
+        if msg.name:
+            total += self._encoded_len(msg.name)
+        if msg.tool_call_id:
+            total += self._encoded_len(msg.tool_call_id)
+        if msg.tool_calls:
+            for tc in msg.tool_calls:
+                total += self._encoded_len(tc.name)
+                total += self._encoded_len(tool_call_arguments_repr(tc.arguments))
+        return total
+
+    def _tool_tokens(self, tool: ToolSpec) -> int:
+        return self._per_tool_overhead + self._encoded_len(tool_schema_repr(tool))
+
+    def _combine(
         self,
         *,
-        messages: list[Message],
-        tools: list[ToolSpec] | None = None,
+        message_tokens: int,
+        tool_tokens: list[int],
+        has_messages: bool,
     ) -> int:
         # Per OpenAI cookbook: per_request overhead only applies when the call
         # actually has messages. Empty input → 0 tokens (avoids surprise for
         # adapters whose callers expect count([]) == 0).
-        if not messages and not tools:
+        if not has_messages and not tool_tokens:
             return 0
-
-        total = self._per_request_overhead
-
-        for msg in messages:
-            total += self._per_message_overhead
-            total += len(self._encoding.encode(str(msg.role)))
-
-            content = msg.content
-            if isinstance(content, str):
-                total += len(self._encoding.encode(content))
-            elif isinstance(content, list):
-                # ContentBlock list — flatten text fields conservatively
-                for block in content:
-                    text_attr = getattr(block, "text", None)
-                    if isinstance(text_attr, str):
-                        total += len(self._encoding.encode(text_attr))
-
-            if msg.name:
-                total += len(self._encoding.encode(msg.name))
-            if msg.tool_call_id:
-                total += len(self._encoding.encode(msg.tool_call_id))
-            if msg.tool_calls:
-                for tc in msg.tool_calls:
-                    total += len(self._encoding.encode(tc.name))
-                    try:
-                        args_repr = json.dumps(tc.arguments, sort_keys=True, default=str)
-                    except (TypeError, ValueError):
-                        args_repr = str(tc.arguments)
-                    total += len(self._encoding.encode(args_repr))
-
-        if tools:
-            for tool in tools:
-                total += self._per_tool_overhead
-                schema_obj: dict[str, Any] = {
-                    "name": tool.name,
-                    "description": tool.description,
-                    "parameters": tool.input_schema,
-                }
-                total += len(
-                    self._encoding.encode(json.dumps(schema_obj, sort_keys=True, default=str))
-                )
-
-        return total
+        return self._per_request_overhead + message_tokens + sum(tool_tokens)
 
     def accuracy(self) -> Literal["exact", "approximate"]:
         return "exact"
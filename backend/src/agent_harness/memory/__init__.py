@@ -5,6 +5,7 @@ from agent_harness.memory.formation import MemoryFormationWorker
 from agent_harness.memory.retrieval import MemoryRetrieval, SessionSummaryReader
 from agent_harness.memory.session_summarizer import SessionSummarizer
 from agent_harness.memory.session_summary_store import DBSessionSummaryStore
+from agent_harness.memory.snapshot import MemorySnapshot
 
 __all__ = [
     "DBSessionSummaryStore",
@@ -12,6 +13,7 @@ __all__ = [
     "MemoryLayer",
     "MemoryRetrieval",
     "MemoryScope",
+    "MemorySnapshot",
     "SessionSummarizer",
     "SessionSummaryReader",
 ]
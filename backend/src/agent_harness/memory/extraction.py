@@ -31,9 +31,10 @@ Description:
 Owner: 01-eleven-categories-spec.md §範疇 3 (Memory) extraction worker
 
 Created: 2026-04-30 (Sprint 51.2 Day 3.3)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: request marked RESPONSE_CACHEABLE_OPTION (cheap-tier response cache)
     - 2026-06-30: Sprint 57.152 — extract write_facts() dispatch half (combined-formation reuse)
     - 2026-06-28: Sprint 57.149 — known_facts dedup + source tag (Option-B main-flow wiring)
     - 2026-04-30: Initial creation (Sprint 51.2 Day 3.3)
@@ -47,7 +48,12 @@ from typing import Any
 from uuid import UUID
 
 from adapters._base.chat_client import ChatClient
-from agent_harness._contracts import ChatRequest, Message, TraceContext
+from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
+    ChatRequest,
+    Message,
+    TraceContext,
+)
 from agent_harness.memory.layers.user_layer import UserLayer
 
 logger = logging.getLogger(__name__)
@@ -99,6 +105,7 @@ class MemoryExtractor:
         request = ChatRequest(
             messages=[Message(role="user", content=prompt)],
             temperature=0.0,  # extraction is deterministic-ish
+            extra_options={RESPONSE_CACHEABLE_OPTION: True},
         )
         response = await self._chat_client.chat(
             request,
@@ -29,9 +29,11 @@ Key Components:
     - MemoryFormationWorker: form() — combined (1 call) or separate (2 calls) path
 
 Created: 2026-06-30 (Sprint 57.152)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: form(previous_summary=, last_summarized_seq=) — incremental session summary
+    - 2026-10-16: request marked RESPONSE_CACHEABLE_OPTION (cheap-tier response cache)
     - 2026-06-30: Initial creation (Sprint 57.152) — combined extract + summarize worker
 
 Related:
@@ -50,9 +52,15 @@ from typing import Any
 from uuid import UUID
 
 from adapters._base.chat_client import ChatClient
-from agent_harness._contracts import ChatRequest, Message, TraceContext
+from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
+    ChatRequest,
+    Message,
+    TraceContext,
+)
 from agent_harness.memory.extraction import MemoryExtractor
 from agent_harness.memory.session_summarizer import SessionSummarizer
+from agent_harness.memory.session_summary_store import SummaryState
 
 logger = logging.getLogger(__name__)
 
@@ -74,6 +82,12 @@ _PROMPT_HEADER = (
     "You are a memory formation assistant. Read the conversation messages and "
     "return a STRICT JSON object (no prose outside it) with these fields:\n"
 )
+# Incremental summary: the stored summary the new messages are folded into.
+_PREVIOUS_SUMMARY_BLOCK = (
+    "\nCURRENT SUMMARY (the conversation below is only the NEW messages since it; "
+    "return the updated summary — keep still-relevant decisions, drop resolved "
+    "issues):\n{previous}\n"
+)
 _PROMPT_TAIL = "\n\nReturn only the JSON object.\n{known_block}\nConversation:\n{conversation}\n"
 
 
@@ -121,10 +135,16 @@ class MemoryFormationWorker:
         user_id: UUID | None = None,
         known_facts: list[str] | None = None,
         trace_context: TraceContext | None = None,
+        previous_summary: SummaryState | None = None,
+        last_summarized_seq: int | None = None,
     ) -> None:
         """Form memory from the session ledger. No-op on an empty ledger or when
         no collaborator is wired. Combined (default) = ONE LLM call covering both
-        sections; separate = the proven two-call path (env fallback)."""
+        sections; separate = the proven two-call path (env fallback).
+
+        Incremental summary: `messages` is only the ledger tail after the stored
+        summary's watermark, `previous_summary` is that summary (folded in by the
+        prompt), and `last_summarized_seq` is the watermark to record."""
         if not messages:
             return
         if self._extractor is None and self._summarizer is None:
@@ -137,6 +157,8 @@ class MemoryFormationWorker:
                 user_id=user_id,
                 known_facts=known_facts,
                 trace_context=trace_context,
+                previous_summary=previous_summary,
+                last_summarized_seq=last_summarized_seq,
             )
         else:
             await self._form_separate(
@@ -146,6 +168,8 @@ class MemoryFormationWorker:
                 user_id=user_id,
                 known_facts=known_facts,
                 trace_context=trace_context,
+                previous_summary=previous_summary,
+                last_summarized_seq=last_summarized_seq,
             )
 
     async def _form_combined(
@@ -157,6 +181,8 @@ class MemoryFormationWorker:
         user_id: UUID | None,
         known_facts: list[str] | None,
         trace_context: TraceContext | None,
+        previous_summary: SummaryState | None,
+        last_summarized_seq: int | None,
     ) -> None:
         want_facts = self._extractor is not None and user_id is not None
         want_summary = self._summarizer is not None
@@ -168,10 +194,12 @@ class MemoryFormationWorker:
             want_facts=want_facts,
             want_summary=want_summary,
             known_facts=known_facts,
+            previous_summary=previous_summary,
         )
         request = ChatRequest(
             messages=[Message(role="user", content=prompt)],
             temperature=0.0,  # formation is deterministic-ish
+            extra_options={RESPONSE_CACHEABLE_OPTION: True},
         )
         response = await self._chat_client.chat(request, trace_context=trace_context)
 
@@ -188,7 +216,9 @@ class MemoryFormationWorker:
                 trace_context=trace_context,
             )
         if want_summary and summary is not None and self._summarizer is not None:
-            await self._summarizer.store_summary(summary, session_id=session_id)
+            await self._summarizer.store_summary(
+                summary, session_id=session_id, last_summarized_seq=last_summarized_seq
+            )
 
     async def _form_separate(
         self,
@@ -199,6 +229,8 @@ class MemoryFormationWorker:
         user_id: UUID | None,
         known_facts: list[str] | None,
         trace_context: TraceContext | None,
+        previous_summary: SummaryState | None,
+        last_summarized_seq: int | None,
     ) -> None:
         """The proven two-call path (env fallback) — delegate to each worker's
         full single-call method. Keeps both methods live on the chat path."""
@@ -211,11 +243,20 @@ class MemoryFormationWorker:
                 known_facts=known_facts,
                 trace_context=trace_context,
             )
-        if self._summarizer is not None:
+        if self._summarizer is not None and previous_summary is not None:
+            await self._summarizer.summarize_incremental(
+                previous=previous_summary,
+                new_messages=messages,
+                session_id=session_id,
+                last_summarized_seq=last_summarized_seq or 0,
+                trace_context=trace_context,
+            )
+        elif self._summarizer is not None:
             await self._summarizer.summarize_and_store(
                 messages=messages,
                 session_id=session_id,
                 trace_context=trace_context,
+                last_summarized_seq=last_summarized_seq,
             )
 
     def _build_prompt(
@@ -225,6 +266,7 @@ class MemoryFormationWorker:
         want_facts: bool,
         want_summary: bool,
         known_facts: list[str] | None,
+        previous_summary: SummaryState | None = None,
     ) -> str:
         fields: list[str] = []
         if want_facts:
@@ -232,6 +274,10 @@ class MemoryFormationWorker:
         if want_summary:
             fields.append(_SUMMARY_FIELDS)
         known_block = self._build_known_block(known_facts) if want_facts else ""
+        if want_summary and previous_summary is not None:
+            known_block += _PREVIOUS_SUMMARY_BLOCK.format(
+                previous=SessionSummarizer.render_previous(previous_summary)
+            )
         return (
             _PROMPT_HEADER
             + "\n".join(fields)
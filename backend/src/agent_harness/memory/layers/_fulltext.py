@@ -0,0 +1,75 @@
+"""
+File: backend/src/agent_harness/memory/layers/_fulltext.py
+Purpose: Ranked full-text + trigram match shared by UserLayer / TenantLayer reads.
+Category: 範疇 3 (Memory) / layer helpers (internal)
+Scope: Cat 3 memory full-text search
+
+Description:
+    Builds the WHERE predicate + relevance expression for an index-served memory
+    read against the `search_tsv` generated column (migration 0034):
+
+        search_tsv @@ websearch_to_tsquery('simple', :q)     -- GIN (tsvector)
+        OR content ILIKE '%' || escape(:q) || '%'            -- GIN (pg_trgm)
+
+    The substring arm keeps the old ILIKE semantics for CJK text and partial words
+    (the 'simple' parser splits on whitespace only); both arms are index-backed,
+    so PG plans a BitmapOr instead of a sequential scan. LIKE wildcards in the
+    query are escaped (a literal "%" in a query no longer matches every row).
+
+    relevance = greatest(ts_rank_cd(search_tsv, q, 32), word_similarity(:q, content))
+    — both in [0, 1] (normalization 32 = rank / (rank + 1)), so MemoryRetrieval's
+    relevance_score * confidence sort gets a real score instead of a fixed boost.
+
+Key Components:
+    - ranked_match(search_tsv, content, query) -> (predicate, relevance)
+    - escape_like(query)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — ranked full-text memory reads
+
+Related:
+    - infrastructure/db/migrations/versions/0034_memory_fulltext_search.py
+    - user_layer.py / tenant_layer.py — fulltext=True read path
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ColumnClause, ColumnElement, Float, func, literal_column, or_
+from sqlalchemy.orm import InstrumentedAttribute
+
+# Text search config — MUST match the generated column expression (migration 0034).
+FTS_CONFIG: ColumnClause[Any] = literal_column("'simple'::regconfig")
+# ts_rank_cd normalization 32: rank / (rank + 1) → bounded to [0, 1).
+_RANK_NORMALIZATION = 32
+
+
+def escape_like(query: str) -> str:
+    """Escape LIKE metacharacters (backslash is the ESCAPE char)."""
+    return query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def ranked_match(
+    search_tsv: InstrumentedAttribute[Any],
+    content: InstrumentedAttribute[str],
+    query: str,
+) -> tuple[ColumnElement[bool], ColumnElement[float]]:
+    """(predicate, relevance) for a non-empty query — see module docstring."""
+    tsquery = func.websearch_to_tsquery(FTS_CONFIG, query)
+    predicate = or_(
+        search_tsv.op("@@")(tsquery),
+        content.ilike(f"%{escape_like(query)}%", escape="\\"),
+    )
+    relevance = func.greatest(
+        func.ts_rank_cd(search_tsv, tsquery, _RANK_NORMALIZATION),
+        func.word_similarity(query, content),
+        type_=Float,
+    )
+    return predicate, relevance
+
+
+__all__ = ["FTS_CONFIG", "escape_like", "ranked_match"]
@@ -11,17 +11,26 @@ Description:
     - Substring match (ILIKE) for query
     - Tenant-scoped queries enforced at DB level
 
+    fulltext=True (migration 0034): a non-empty query is matched by the GIN-indexed
+    search_tsv / pg_trgm predicate (_fulltext.ranked_match, key + category + content)
+    and ordered by its relevance score, which becomes the hint's relevance_score
+    instead of the fixed 0.7/0.3 substring boost.
+
 Owner: 01-eleven-categories-spec.md §範疇 3 Layer 2 Tenant
 Single-source: 17.md §2.1
 
 Created: 2026-04-30 (Sprint 51.2 Day 2)
 
+Last Modified: 2026-10-16
+
 Modification History:
+    - 2026-10-16: fulltext=True — ranked, index-served read (migration 0034)
     - 2026-06-04: Sprint 57.76 — emit memory_ops on write/evict (same txn, Risk C)
 """
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime
 from typing import Any, Literal
 from uuid import UUID, uuid4
@@ -32,6 +41,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from agent_harness._contracts import MemoryHint, TraceContext
 from agent_harness.memory._abc import MemoryLayer, MemoryScope
 from agent_harness.memory._ops_recorder import _record_memory_op
+from agent_harness.memory.layers._fulltext import ranked_match
 from infrastructure.db.models.memory import MemoryTenant
 
 _TimeScale = Literal["short_term", "long_term", "semantic"]
@@ -42,8 +52,15 @@ class TenantLayer(MemoryLayer):
 
     scope = MemoryScope.TENANT
 
-    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        *,
+        fulltext: bool = False,
+    ) -> None:
         self._session_factory = session_factory
+        # fulltext=True requires migration 0034 (search_tsv + GIN indexes).
+        self._fulltext = fulltext
 
     async def read(
         self,
@@ -62,6 +79,23 @@ class TenantLayer(MemoryLayer):
         if time_scales == ("semantic",):
             return []
 
+        if self._fulltext and query.strip():
+            predicate, relevance = ranked_match(
+                MemoryTenant.search_tsv, MemoryTenant.content, query
+            )
+            ranked = (
+                select(MemoryTenant, relevance.label("relevance"))
+                .where(MemoryTenant.tenant_id == tenant_id, predicate)
+                .order_by(relevance.desc(), MemoryTenant.updated_at.desc())
+                .limit(max_hints)
+            )
+            async with self._session_factory() as session:
+                scored = (await session.execute(ranked)).all()
+            return [
+                replace(self._row_to_hint(row, query=query), relevance_score=min(float(score), 1.0))
+                for row, score in scored
+            ]
+
         async with self._session_factory() as session:
             stmt = (
                 select(MemoryTenant)
@@ -19,6 +19,15 @@ Description:
       Slice 1): when a MemoryVectorIndex is injected (MEMORY_VECTOR_ENABLED),
       read() embeds + cosine-searches the user's rows and merges the vector hits;
       with no index it stays byte-identical (semantic-only → [], mixed → keyword).
+    - fulltext=True (migration 0034): the keyword axis is served by the GIN-indexed
+      search_tsv / pg_trgm match (_fulltext.ranked_match) and ordered by its
+      relevance score, which becomes the hint's relevance_score (instead of the
+      fixed 0.4/0.8 substring boost). An empty query (profile reads) keeps the
+      confidence-ordered path.
+    - A write-through MemoryVectorIndex (MEMORY_VECTOR_WRITE_THROUGH) is maintained
+      from write() / evict() (enqueued point upsert / delete after commit), and the
+      semantic read becomes index.recall() + a top-k keyed row fetch (no full user
+      row load, no count), with a background reconcile for drift.
     - 4 spec fields with no PG column live in metadata JSONB:
         verify_before_use, last_verified_at, source_tool_call_id, time_scale
     - short_term writes set expires_at = now() + 24h
@@ -28,9 +37,12 @@ Owner: 01-eleven-categories-spec.md §範疇 3 Layer 4 User
 Single-source: 17.md §2.1
 
 Created: 2026-04-30 (Sprint 51.2 Day 2)
-Last Modified: 2026-07-01
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: read MemoryVectorIndex.write_through directly (declared attribute)
+    - 2026-10-16: write-through vector index — write/evict enqueue point ops; count-free recall
+    - 2026-10-16: fulltext=True — ranked, index-served keyword read (migration 0034)
     - 2026-07-01: Sprint 57.155 — read() semantic branch via MemoryVectorIndex (CARRY-026 L4)
     - 2026-06-30: Sprint 57.150 — write() → idempotent upsert on dedup_key
     - 2026-06-28: Sprint 57.149 — write() additive source param → memory_user.source column
@@ -61,6 +73,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from agent_harness._contracts import MemoryHint, TraceContext
 from agent_harness.memory._abc import MemoryLayer, MemoryScope
 from agent_harness.memory._ops_recorder import _record_memory_op
+from agent_harness.memory.layers._fulltext import ranked_match
 from agent_harness.memory.vector_index import MemoryRow, MemoryVectorIndex
 from infrastructure.db.models.memory import MemoryUser
 
@@ -91,8 +104,12 @@ class UserLayer(MemoryLayer):
         self,
         session_factory: async_sessionmaker[AsyncSession],
         vector_index: MemoryVectorIndex | None = None,
+        *,
+        fulltext: bool = False,
     ) -> None:
         self._session_factory = session_factory
+        # fulltext=True requires migration 0034 (search_tsv + GIN indexes).
+        self._fulltext = fulltext
         # Sprint 57.155 (CARRY-026 Slice 1): when injected (MEMORY_VECTOR_ENABLED on),
         # the "semantic" time_scale returns cosine-ranked hits instead of the 51.2 []
         # stub. None → byte-identical to 57.150 (semantic-only → [], mixed → keyword only).
@@ -124,7 +141,15 @@ class UserLayer(MemoryLayer):
         )
 
         keyword_hints: list[MemoryHint] = []
-        if want_keyword:
+        if want_keyword and self._fulltext and query.strip():
+            keyword_hints = await self._fulltext_hints(
+                query=query,
+                tenant_id=tenant_id,
+                user_id=user_id,
+                time_scales=time_scales,
+                max_hints=max_hints,
+            )
+        elif want_keyword:
             async with self._session_factory() as session:
                 stmt = select(MemoryUser).where(
                     MemoryUser.tenant_id == tenant_id,
@@ -165,6 +190,34 @@ class UserLayer(MemoryLayer):
         merged = sorted(by_id.values(), key=lambda h: h.relevance_score, reverse=True)
         return merged[:max_hints]
 
+    async def _fulltext_hints(
+        self,
+        *,
+        query: str,
+        tenant_id: UUID,
+        user_id: UUID,
+        time_scales: tuple[_TimeScale, ...],
+        max_hints: int,
+    ) -> list[MemoryHint]:
+        """Index-served keyword read, relevance-ranked (relevance_score = the match score)."""
+        predicate, relevance = ranked_match(MemoryUser.search_tsv, MemoryUser.content, query)
+        stmt = select(MemoryUser, relevance.label("relevance")).where(
+            MemoryUser.tenant_id == tenant_id,
+            MemoryUser.user_id == user_id,
+            predicate,
+        )
+        if "short_term" in time_scales and "long_term" not in time_scales:
+            stmt = stmt.where(MemoryUser.expires_at.is_not(None))
+        stmt = stmt.order_by(relevance.desc(), MemoryUser.confidence.desc().nulls_last()).limit(
+            max_hints
+        )
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+        return [
+            replace(self._row_to_hint(row, query=query), relevance_score=min(float(score), 1.0))
+            for row, score in rows
+        ]
+
     async def _semantic_hints(
         self, *, query: str, tenant_id: UUID, user_id: UUID, max_hints: int
     ) -> list[MemoryHint]:
@@ -178,6 +231,10 @@ class UserLayer(MemoryLayer):
         index = self._vector_index
         if index is None:
             return []
+        if index.write_through:
+            return await self._recalled_hints(
+                index, query=query, tenant_id=tenant_id, user_id=user_id, max_hints=max_hints
+            )
         async with self._session_factory() as session:
             stmt = select(MemoryUser).where(
                 MemoryUser.tenant_id == tenant_id,
@@ -211,6 +268,80 @@ class UserLayer(MemoryLayer):
             out.append(replace(self._row_to_hint(row, query=query), relevance_score=hit.score))
         return out
 
+    async def _load_memory_rows(self, tenant_id: UUID, user_id: UUID) -> list[MemoryRow]:
+        async with self._session_factory() as session:
+            rows = (
+                (
+                    await session.execute(
+                        select(MemoryUser).where(
+                            MemoryUser.tenant_id == tenant_id, MemoryUser.user_id == user_id
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            return [
+                MemoryRow(
+                    dedup_key=r.dedup_key,
+                    content=r.content or "",
+                    confidence=float(r.confidence) if r.confidence is not None else 0.5,
+                )
+                for r in rows
+                if r.dedup_key
+            ]
+
+    async def _recalled_hints(
+        self,
+        index: MemoryVectorIndex,
+        *,
+        query: str,
+        tenant_id: UUID,
+        user_id: UUID,
+        max_hints: int,
+    ) -> list[MemoryHint]:
+        """Write-through semantic read: recall() + fetch only the hit rows (by dedup key).
+
+        The keyed fetch rides the uq_memory_user_dedup index and drops hits whose row
+        is already gone (a delete not yet applied to Qdrant). Fail-soft like the lazy path.
+        """
+        index.schedule_reconcile(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            load_rows=lambda: self._load_memory_rows(tenant_id, user_id),
+        )
+        try:
+            hits = await index.recall(
+                tenant_id=tenant_id, user_id=user_id, query=query, top_k=max_hints
+            )
+        except Exception:  # noqa: BLE001 — fail-soft: any embed/Qdrant error → no semantic hits
+            logger.warning("memory semantic recall failed; keyword path preserved", exc_info=True)
+            return []
+        if not hits:
+            return []
+        async with self._session_factory() as session:
+            rows = (
+                (
+                    await session.execute(
+                        select(MemoryUser).where(
+                            MemoryUser.tenant_id == tenant_id,
+                            MemoryUser.user_id == user_id,
+                            MemoryUser.dedup_key.in_([hit.dedup_key for hit in hits]),
+                        )
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            by_dedup = {r.dedup_key: r for r in rows}
+        return [
+            replace(
+                self._row_to_hint(by_dedup[hit.dedup_key], query=query), relevance_score=hit.score
+            )
+            for hit in hits
+            if hit.dedup_key in by_dedup
+        ]
+
     async def write(
         self,
         *,
@@ -301,6 +432,14 @@ class UserLayer(MemoryLayer):
             )
             await session.commit()
 
+        index = self._vector_index
+        if index is not None and index.write_through:
+            # After commit: the index must never hold a fact the DB rolled back.
+            index.enqueue_upsert(
+                tenant_id=tenant_id,
+                user_id=user_id,
+                row=MemoryRow(dedup_key=key, content=content, confidence=float(confidence_dec)),
+            )
         return row_id
 
     async def evict(
@@ -350,6 +489,13 @@ class UserLayer(MemoryLayer):
                 )
             await session.commit()
 
+        index = self._vector_index
+        if old is not None and index is not None and index.write_through:
+            # Point id = (user_id, dedup_key); the key is a pure function of the content.
+            index.enqueue_delete(
+                tenant_id=tenant_id, user_id=old_user_id, dedup_key=_dedup_key(old_content)
+            )
+
     async def resolve(
         self,
         hint: MemoryHint,
@@ -24,13 +24,20 @@ Description:
     unresolved_issues} (the designed memory_session_summary columns) rather than a
     list of user facts, and writes via DBSessionSummaryStore rather than UserLayer.
 
+    Incremental mode (CHAT_SESSION_SUMMARY_INCREMENTAL): summarize_incremental()
+    feeds only the stored summary + the ledger messages after its watermark
+    (last_summarized_seq) and records the new watermark, so a send costs tokens
+    proportional to the new messages rather than the whole conversation.
+
 Key Components:
-    - SessionSummarizer: summarize_and_store()
+    - SessionSummarizer: summarize_and_store() / summarize_incremental()
 
 Created: 2026-06-30 (Sprint 57.151)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: summarize_incremental() + last_summarized_seq watermark on store
+    - 2026-10-16: request marked RESPONSE_CACHEABLE_OPTION (cheap-tier response cache)
     - 2026-06-30: Sprint 57.152 — extract store_summary() dispatch half (combined-formation reuse)
     - 2026-06-30: Initial creation (Sprint 57.151) — rolling session summarizer
 
@@ -50,8 +57,13 @@ from typing import Any
 from uuid import UUID
 
 from adapters._base.chat_client import ChatClient
-from agent_harness._contracts import ChatRequest, Message, TraceContext
-from agent_harness.memory.session_summary_store import DBSessionSummaryStore
+from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
+    ChatRequest,
+    Message,
+    TraceContext,
+)
+from agent_harness.memory.session_summary_store import DBSessionSummaryStore, SummaryState
 
 logger = logging.getLogger(__name__)
 
@@ -69,6 +81,25 @@ Conversation:
 {conversation}
 """
 
+_ROLLING_PROMPT = """You are a session memory assistant. Below is the CURRENT summary \
+of a conversation followed by the NEW messages since it was written. Update the \
+summary so a future session could recall what was worked on. Return a STRICT JSON \
+object (no prose outside it) with these fields:
+  - "summary": 1-3 sentences capturing the topic and where the conversation left off
+  - "key_decisions": array of short strings (keep still-relevant earlier decisions, \
+add new ones; [] if none)
+  - "unresolved_issues": array of short strings (drop issues the new messages \
+resolved, add new open questions / next steps; [] if none)
+
+Return only the JSON object.
+
+Current summary:
+{previous}
+
+New messages:
+{conversation}
+"""
+
 
 # === SessionSummarizer: rolling per-session conversation summary ===
 # Why: the 5-layer memory recalls discrete user facts (57.148/149/150) but never
@@ -93,32 +124,68 @@ class SessionSummarizer:
         messages: list[Message],
         session_id: UUID,
         trace_context: TraceContext | None = None,
+        last_summarized_seq: int | None = None,
     ) -> None:
         """Render the ledger, summarize via the cheap tier, upsert the one row.
 
         No-op on an empty ledger or a blank/unparseable summary. Best-effort: the
-        caller (the post-send BackgroundTask) swallows + logs.
+        caller (the post-send BackgroundTask) swallows + logs. last_summarized_seq
+        (incremental mode's periodic full pass) records the watermark it covers.
         """
         if not messages:
             return
-
         prompt = _SUMMARY_PROMPT.format(conversation=self._render_messages(messages))
+        await self._summarize(prompt, session_id, trace_context, last_summarized_seq)
+
+    async def summarize_incremental(
+        self,
+        *,
+        previous: SummaryState,
+        new_messages: list[Message],
+        session_id: UUID,
+        last_summarized_seq: int,
+        trace_context: TraceContext | None = None,
+    ) -> None:
+        """Fold the messages after the watermark into the stored summary.
+
+        Prompt = the previous summary object + ONLY the new messages; the upsert
+        advances last_summarized_seq. No-op when nothing is new.
+        """
+        if not new_messages:
+            return
+        prompt = _ROLLING_PROMPT.format(
+            previous=self.render_previous(previous),
+            conversation=self._render_messages(new_messages),
+        )
+        await self._summarize(prompt, session_id, trace_context, last_summarized_seq)
+
+    async def _summarize(
+        self,
+        prompt: str,
+        session_id: UUID,
+        trace_context: TraceContext | None,
+        last_summarized_seq: int | None,
+    ) -> None:
         request = ChatRequest(
             messages=[Message(role="user", content=prompt)],
             temperature=0.0,  # summarization is deterministic-ish
+            extra_options={RESPONSE_CACHEABLE_OPTION: True},
         )
         response = await self._chat_client.chat(request, trace_context=trace_context)
 
         parsed = self._parse_summary(self._content_text(response.content))
         if parsed is None:
             return
-        await self.store_summary(parsed, session_id=session_id)
+        await self.store_summary(
+            parsed, session_id=session_id, last_summarized_seq=last_summarized_seq
+        )
 
     async def store_summary(
         self,
         parsed: dict[str, Any],
         *,
         session_id: UUID,
+        last_summarized_seq: int | None = None,
     ) -> None:
         """Upsert an already-parsed {summary, key_decisions, unresolved_issues}.
 
@@ -136,6 +203,19 @@ class SessionSummarizer:
             summary=summary.strip(),
             key_decisions=parsed["key_decisions"],
             unresolved_issues=parsed["unresolved_issues"],
+            last_summarized_seq=last_summarized_seq,
+        )
+
+    @staticmethod
+    def render_previous(previous: SummaryState) -> str:
+        """The stored summary as the JSON object the prompts ask for (prompt input)."""
+        return json.dumps(
+            {
+                "summary": previous.summary,
+                "key_decisions": previous.key_decisions,
+                "unresolved_issues": previous.unresolved_issues,
+            },
+            ensure_ascii=False,
         )
 
     @staticmethod
@@ -16,6 +16,9 @@ Description:
       — a second write for the same session UPDATEs the one row (mirrors the
       57.150 UserLayer.write upsert), so the summary stays current as the
       conversation grows (the SessionSummarizer calls it after every send).
+    - load_state(): the session's current summary + its ledger watermark
+      (last_summarized_seq, migration 0035) — the incremental summarizer folds
+      only the messages after it into the prior summary.
     - recent_for_user(): the cross-session recall read — JOINs `sessions` to scope
       by tenant + user, excludes the current session, orders by updated_at DESC.
 
@@ -31,13 +34,16 @@ Description:
     summary formation must never surface to the user.
 
 Key Components:
-    - DBSessionSummaryStore: upsert_summary + recent_for_user
+    - DBSessionSummaryStore: upsert_summary + load_state + recent_for_user
     - _SummaryRow: frozen recall row (avoids detached-ORM-instance)
+    - SummaryState: frozen current-summary + watermark row
 
 Created: 2026-06-30 (Sprint 57.151)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: upsert_summary only advances the watermark (ON CONFLICT ... WHERE guard)
+    - 2026-10-16: load_state() + upsert_summary(last_summarized_seq=) — rolling-summary watermark
     - 2026-06-30: Initial creation (Sprint 57.151) — session-summary store (upsert + recall read)
 
 Related:
@@ -56,9 +62,10 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import func, select, text
+from sqlalchemy import func, or_, select, text
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
@@ -78,6 +85,16 @@ class _SummaryRow:
     updated_at: datetime
 
 
+@dataclass(frozen=True)
+class SummaryState:
+    """A session's current summary + the ledger sequence_num it covers (watermark)."""
+
+    summary: str
+    key_decisions: list[str]
+    unresolved_issues: list[str]
+    last_summarized_seq: int
+
+
 # === DBSessionSummaryStore: per-session rolling summary persistence ===
 # Why: the 5-layer memory recalls discrete user facts but not the conversation
 # arc of a prior session. The designed memory_session_summary table (0007) was
@@ -121,6 +138,7 @@ class DBSessionSummaryStore:
         summary: str,
         key_decisions: list[str],
         unresolved_issues: list[str],
+        last_summarized_seq: int | None = None,
     ) -> UUID:
         """Insert-or-update the one summary row for a session; return its id.
 
@@ -129,32 +147,73 @@ class DBSessionSummaryStore:
         — summary / key_decisions / unresolved_issues refresh, updated_at bumps,
         created_at stays. Mirrors the 57.150 UserLayer.write upsert. No set_config:
         memory_session_summary is junction (no RLS) and session_id is authoritative.
+
+        last_summarized_seq (incremental summaries): the ledger sequence_num the new
+        summary covers; None leaves the stored watermark untouched. The watermark only
+        advances: a write older than the stored one (a slower concurrent send) is
+        dropped and the newer row's id returned.
         """
+        values: dict[str, Any] = {
+            "summary": summary,
+            "key_decisions": key_decisions,
+            "unresolved_issues": unresolved_issues,
+        }
+        guard = None
+        if last_summarized_seq is not None:
+            values["last_summarized_seq"] = last_summarized_seq
+            stored = MemorySessionSummary.last_summarized_seq
+            guard = or_(stored.is_(None), stored <= last_summarized_seq)
         async with self._factory() as db:
             stmt = (
                 pg_insert(MemorySessionSummary)
-                .values(
-                    id=uuid4(),
-                    session_id=session_id,
-                    summary=summary,
-                    key_decisions=key_decisions,
-                    unresolved_issues=unresolved_issues,
-                )
+                .values(id=uuid4(), session_id=session_id, **values)
                 .on_conflict_do_update(
                     index_elements=[MemorySessionSummary.session_id],
-                    set_={
-                        "summary": summary,
-                        "key_decisions": key_decisions,
-                        "unresolved_issues": unresolved_issues,
-                        "updated_at": func.now(),
-                    },
+                    set_={**values, "updated_at": func.now()},
+                    where=guard,
                 )
                 .returning(MemorySessionSummary.id)
             )
-            row_id: UUID = (await db.execute(stmt)).scalar_one()
+            row_id: UUID | None = (await db.execute(stmt)).scalar_one_or_none()
+            if row_id is None:  # guard skipped the update — a newer summary is stored
+                row_id = (
+                    await db.execute(
+                        select(MemorySessionSummary.id).where(
+                            MemorySessionSummary.session_id == session_id
+                        )
+                    )
+                ).scalar_one()
             await db.commit()
         return row_id
 
+    async def load_state(self, session_id: UUID) -> SummaryState | None:
+        """The session's current summary + watermark; None when absent (best-effort).
+
+        No set_config: a keyed read of the non-RLS junction table by the
+        authoritative session_id (same reasoning as upsert_summary). A read
+        failure returns None, so the caller falls back to a full re-summary.
+        """
+        try:
+            async with self._factory() as db:
+                stmt = select(
+                    MemorySessionSummary.summary,
+                    MemorySessionSummary.key_decisions,
+                    MemorySessionSummary.unresolved_issues,
+                    MemorySessionSummary.last_summarized_seq,
+                ).where(MemorySessionSummary.session_id == session_id)
+                row = (await db.execute(stmt)).first()
+        except Exception:  # noqa: BLE001 — degrade to a full re-summary
+            logger.exception("DBSessionSummaryStore.load_state failed (best-effort)")
+            return None
+        if row is None:
+            return None
+        return SummaryState(
+            summary=row.summary,
+            key_decisions=[str(item) for item in row.key_decisions or []],
+            unresolved_issues=[str(item) for item in row.unresolved_issues or []],
+            last_summarized_seq=int(row.last_summarized_seq or 0),
+        )
+
     async def recent_for_user(
         self,
         *,
@@ -208,4 +267,4 @@ class DBSessionSummaryStore:
             return []
 
 
-__all__ = ["DBSessionSummaryStore"]
+__all__ = ["DBSessionSummaryStore", "SummaryState"]
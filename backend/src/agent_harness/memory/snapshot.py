@@ -0,0 +1,251 @@
+"""
+File: backend/src/agent_harness/memory/snapshot.py
+Purpose: Run-scoped memory snapshot — memoizes MemoryRetrieval reads for one agent run.
+Category: 範疇 3 (Memory) / Retrieval
+Scope: Phase 57 / per-run memory snapshot
+
+Description:
+    DefaultPromptBuilder.build() calls MemoryRetrieval.search(), profile() and
+    recent_sessions() on EVERY turn. Each call opens DB sessions and ILIKE-scans
+    memory_user / memory_tenant (and may embed the query + hit Qdrant). A 15-turn
+    tool-using run pays 45+ memory round trips, and the results almost never
+    change within the run.
+
+    MemorySnapshot is a read-through memo over one MemoryRetrieval, built once
+    per run (chat request):
+    - profile() / recent_sessions() are cached per argument set for the run;
+    - search() is cached per (query, tenant, user, session, scopes, time_scales,
+      top_k), so a tool turn that re-builds with the same user message is free.
+
+    Invalidation is write-driven and per scope. watch(layers) wraps the layer map
+    handed to the memory tools. A successful write() / evict() on a layer drops
+    every cached search that read that scope, plus the profile() entries when the
+    scope is "user". recent_sessions() reads the session-summary store, which the
+    memory tools never write, so a layer write leaves it cached.
+
+    Failures are never cached: an exception propagates (the builder degrades
+    as before) and the next call retries.
+
+Key Components:
+    - MemorySnapshot: search / profile / recent_sessions / invalidate / watch
+    - MemorySnapshotStats: hits / misses / invalidations
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — run-scoped memory read memo + write invalidation
+
+Related:
+    - retrieval.py — the wrapped MemoryRetrieval
+    - prompt_builder/builder.py — reads through the snapshot (memory_snapshot=)
+    - tools/memory_tools.py — memory_write mutates the watched layers
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Literal
+from uuid import UUID
+
+from agent_harness._contracts import MemoryHint, TraceContext
+from agent_harness.memory._abc import MemoryLayer
+from agent_harness.memory.retrieval import MemoryRetrieval
+
+_TimeScale = Literal["short_term", "long_term", "semantic"]
+_Scope = Literal["system", "tenant", "role", "user", "session"]
+
+# (kind, scopes read, argument tuple) — scopes drive per-layer invalidation.
+_EntryKey = tuple[str, frozenset[str], tuple[Any, ...]]
+
+
+@dataclass
+class MemorySnapshotStats:
+    """Cumulative counters for one snapshot (one run)."""
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+
+class MemorySnapshot:
+    """Read-through memo over a MemoryRetrieval for the lifetime of one run."""
+
+    def __init__(self, retrieval: MemoryRetrieval) -> None:
+        self._retrieval = retrieval
+        self._entries: dict[_EntryKey, list[MemoryHint]] = {}
+        self.stats = MemorySnapshotStats()
+
+    async def search(
+        self,
+        *,
+        query: str,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        session_id: UUID | None = None,
+        scopes: tuple[_Scope, ...] = ("session", "user", "tenant"),
+        time_scales: tuple[_TimeScale, ...] = ("long_term",),
+        top_k: int = 5,
+        trace_context: TraceContext | None = None,
+    ) -> list[MemoryHint]:
+        key: _EntryKey = (
+            "search",
+            frozenset(scopes),
+            (query, tenant_id, user_id, session_id, scopes, time_scales, top_k),
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        hints = await self._retrieval.search(
+            query=query,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            session_id=session_id,
+            scopes=scopes,
+            time_scales=time_scales,
+            top_k=top_k,
+            trace_context=trace_context,
+        )
+        return self._store(key, hints)
+
+    async def profile(
+        self,
+        *,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        top_k: int = 5,
+        trace_context: TraceContext | None = None,
+    ) -> list[MemoryHint]:
+        key: _EntryKey = ("profile", frozenset({"user"}), (tenant_id, user_id, top_k))
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        hints = await self._retrieval.profile(
+            tenant_id=tenant_id, user_id=user_id, top_k=top_k, trace_context=trace_context
+        )
+        return self._store(key, hints)
+
+    async def recent_sessions(
+        self,
+        *,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        exclude_session_id: UUID | None = None,
+        top_k: int = 3,
+        trace_context: TraceContext | None = None,
+    ) -> list[MemoryHint]:
+        key: _EntryKey = (
+            "recent_sessions",
+            frozenset(),  # session-summary store — no MemoryLayer writes it
+            (tenant_id, user_id, exclude_session_id, top_k),
+        )
+        cached = self._lookup(key)
+        if cached is not None:
+            return cached
+        hints = await self._retrieval.recent_sessions(
+            tenant_id=tenant_id,
+            user_id=user_id,
+            exclude_session_id=exclude_session_id,
+            top_k=top_k,
+            trace_context=trace_context,
+        )
+        return self._store(key, hints)
+
+    def invalidate(self, scope: str | None = None) -> None:
+        """Drop cached reads that touched `scope` (every entry when scope is None)."""
+        stale = [key for key in self._entries if scope is None or scope in key[1]]
+        for key in stale:
+            del self._entries[key]
+        self.stats.invalidations += 1
+
+    def watch(self, layers: dict[str, MemoryLayer]) -> dict[str, MemoryLayer]:
+        """Wrap a scope → layer map so every write / evict invalidates this snapshot."""
+        return {scope: _InvalidatingLayer(layer, scope, self) for scope, layer in layers.items()}
+
+    def _lookup(self, key: _EntryKey) -> list[MemoryHint] | None:
+        cached = self._entries.get(key)
+        if cached is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return list(cached)
+
+    def _store(self, key: _EntryKey, hints: list[MemoryHint]) -> list[MemoryHint]:
+        self._entries[key] = list(hints)
+        return hints
+
+
+class _InvalidatingLayer(MemoryLayer):
+    """Delegating MemoryLayer that invalidates its snapshot after a mutation."""
+
+    def __init__(self, inner: MemoryLayer, scope_key: str, snapshot: MemorySnapshot) -> None:
+        self._inner = inner
+        self._scope_key = scope_key
+        self._snapshot = snapshot
+        if hasattr(inner, "scope"):
+            self.scope = inner.scope
+
+    def __getattr__(self, name: str) -> Any:
+        # Layer-specific extras (e.g. UserLayer helpers) stay reachable.
+        return getattr(self._inner, name)
+
+    async def read(
+        self,
+        *,
+        query: str,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        time_scales: tuple[_TimeScale, ...] = ("long_term",),
+        max_hints: int = 10,
+        trace_context: TraceContext | None = None,
+    ) -> list[MemoryHint]:
+        return await self._inner.read(
+            query=query,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            time_scales=time_scales,
+            max_hints=max_hints,
+            trace_context=trace_context,
+        )
+
+    async def write(
+        self,
+        *,
+        content: str,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        time_scale: _TimeScale = "long_term",
+        confidence: float = 0.5,
+        trace_context: TraceContext | None = None,
+    ) -> UUID:
+        entry_id = await self._inner.write(
+            content=content,
+            tenant_id=tenant_id,
+            user_id=user_id,
+            time_scale=time_scale,
+            confidence=confidence,
+            trace_context=trace_context,
+        )
+        self._snapshot.invalidate(self._scope_key)
+        return entry_id
+
+    async def evict(
+        self,
+        *,
+        entry_id: UUID,
+        tenant_id: UUID | None = None,
+        trace_context: TraceContext | None = None,
+    ) -> None:
+        await self._inner.evict(entry_id=entry_id, tenant_id=tenant_id, trace_context=trace_context)
+        self._snapshot.invalidate(self._scope_key)
+
+    async def resolve(
+        self,
+        hint: MemoryHint,
+        *,
+        trace_context: TraceContext | None = None,
+    ) -> str:
+        return await self._inner.resolve(hint, trace_context=trace_context)
+
+
+__all__ = ["MemorySnapshot", "MemorySnapshotStats"]
@@ -26,15 +26,39 @@ Description:
     user-memory delete path today, so count(Qdrant, user) == len(rows) in steady
     state; an incremental embed-on-write + orphan cleanup is a noted follow-on).
 
+    Write-through mode (write_through=True) — that follow-on. The count guard costs
+    every recall a Qdrant count round trip plus an O(rows) DB load, never re-embeds a
+    fact edited in place, and takes a delete-plus-add for "already ingested". Instead:
+    - UserLayer.write / evict enqueue_upsert() / enqueue_delete() the affected point
+      (same _point_id(user_id, dedup_key)); the payload carries a content_hash. A
+      per-process background worker coalesces pending ops per point (last op wins),
+      embeds the upserts in one batch, then upserts / deletes per collection.
+      Failures are logged and dropped — the reconciler repairs them.
+    - recall() is one query embed + one filtered Qdrant query (no rows, no count).
+    - reconcile() diffs the user's points (payload-only scroll) against the DB rows
+      by content_hash: re-embeds missing / edited facts, deletes orphans. UserLayer
+      schedules it in the background at most once per user per
+      `reconcile_interval_sec` (this also backfills rows written before the flag).
+
 Key Components:
     - MemoryRow: one user fact to embed (dedup_key + content + confidence)
     - MemoryVectorHit: one semantic recall result (dedup_key + content + confidence + cosine)
     - MemoryVectorIndex: search(tenant_id, user_id, rows, query, top_k) — lazy ingest + cosine query
+      + write-through enqueue_upsert / enqueue_delete / flush / recall / reconcile / close
 
 Created: 2026-07-01 (Sprint 57.155)
-Last Modified: 2026-07-01
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: write_through is a declared attribute; close() flushes the write-through
+      queue and cancels background reconciles (app lifespan shutdown)
+    - 2026-10-16: store typed as the VectorStore protocol (Qdrant or local NumPy backend)
+    - 2026-10-16: write_through=True — write-path upsert/delete queue, count-free recall(),
+      content-hash reconcile() scheduled in the background
+    - 2026-10-16: ingest embeds through adapters' embed_in_batches() (was a private
+      _embed_bodies copy shared with the other vector index)
+    - 2026-10-16: _embed_bodies — a self_batching embedder gets the whole corpus in
+      one embed() (it paces concurrent batches itself); plain embedders keep the loop
     - 2026-07-01: Initial creation (Sprint 57.155) — CARRY-026 Slice 1 (L4 user semantic axis)
 
 Related:
@@ -47,14 +71,18 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import logging
+import time
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
 
+from adapters._base.coalescing_embedding_client import embed_in_batches
 from adapters._base.embedding_client import EmbeddingClient
-from infrastructure.vector.qdrant_client import QdrantVectorStore
+from infrastructure.vector.base import VectorStore
 from infrastructure.vector.qdrant_namespace import MemoryLayer, QdrantNamespaceStrategy
 
 logger = logging.getLogger(__name__)
@@ -65,6 +93,11 @@ logger = logging.getLogger(__name__)
 _EMBED_BATCH = 16
 # The QdrantNamespaceStrategy layer this slice writes to (49.3 reserved it for exactly this).
 _LAYER: MemoryLayer = "user_memory"
+_DEFAULT_RECONCILE_INTERVAL_SEC = 3600.0
+
+
+def _content_hash(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:32]
 
 
 @dataclass(frozen=True)
@@ -86,6 +119,16 @@ class MemoryVectorHit:
     score: float
 
 
+@dataclass(frozen=True)
+class _PendingOp:
+    """One queued write-through op; row=None means delete the point."""
+
+    tenant_id: UUID
+    user_id: UUID
+    point_id: int
+    row: MemoryRow | None
+
+
 class MemoryVectorIndex:
     """Embeds a user's memory rows into a per-tenant Qdrant collection + answers semantic queries.
 
@@ -94,9 +137,26 @@ class MemoryVectorIndex:
     EmbeddingClient ABC, QdrantVectorStore, and the "user_memory" namespace unchanged.
     """
 
-    def __init__(self, embedder: EmbeddingClient, store: QdrantVectorStore) -> None:
+    # True → the write path maintains the index (enqueue_upsert / enqueue_delete)
+    # and reads go through recall(); False → lazy count-guarded search().
+    write_through: bool = False
+
+    def __init__(
+        self,
+        embedder: EmbeddingClient,
+        store: VectorStore,
+        *,
+        write_through: bool = False,
+        reconcile_interval_sec: float = _DEFAULT_RECONCILE_INTERVAL_SEC,
+    ) -> None:
         self._embedder = embedder
         self._store = store
+        self.write_through = write_through
+        self._reconcile_interval_sec = reconcile_interval_sec
+        self._pending: dict[tuple[str, int], _PendingOp] = {}
+        self._worker: asyncio.Task[None] | None = None
+        self._reconciled_at: dict[tuple[UUID, UUID], float] = {}
+        self._tasks: set[asyncio.Task[Any]] = set()
 
     @staticmethod
     def _point_id(user_id: UUID, dedup_key: str) -> int:
@@ -137,9 +197,7 @@ class MemoryVectorIndex:
         if await self._store.count(collection, payload_filter=user_filter) == expected:
             return  # already ingested for this user — idempotent no-op (no embed)
         bodies = [row.content for row in rows]
-        vectors: list[list[float]] = []
-        for start in range(0, len(bodies), _EMBED_BATCH):
-            vectors.extend(await self._embedder.embed(bodies[start : start + _EMBED_BATCH]))
+        vectors = await embed_in_batches(self._embedder, bodies, batch_size=_EMBED_BATCH)
         if not vectors:
             return
         dim = len(vectors[0])
@@ -166,6 +224,186 @@ class MemoryVectorIndex:
             user_id,
         )
 
+    def _payload(self, tenant_id: UUID, user_id: UUID, row: MemoryRow) -> dict[str, Any]:
+        return {
+            "tenant_id": str(tenant_id),
+            "user_id": str(user_id),
+            "content": row.content,
+            "confidence": float(row.confidence),
+            "dedup_key": row.dedup_key,
+            "content_hash": _content_hash(row.content),
+        }
+
+    # --- write-through queue ---------------------------------------------------
+    def enqueue_upsert(self, *, tenant_id: UUID, user_id: UUID, row: MemoryRow) -> None:
+        """Queue (re-)embedding one written fact; coalesces with any pending op for the point."""
+        self._enqueue(_PendingOp(tenant_id, user_id, self._point_id(user_id, row.dedup_key), row))
+
+    def enqueue_delete(self, *, tenant_id: UUID, user_id: UUID, dedup_key: str) -> None:
+        """Queue removal of one evicted fact's point."""
+        self._enqueue(_PendingOp(tenant_id, user_id, self._point_id(user_id, dedup_key), None))
+
+    def _enqueue(self, op: _PendingOp) -> None:
+        collection = QdrantNamespaceStrategy.collection_name(op.tenant_id, _LAYER)
+        self._pending[(collection, op.point_id)] = op
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def _drain(self) -> None:
+        while self._pending:
+            batch, self._pending = self._pending, {}
+            try:
+                await self._apply(batch)
+            except Exception:  # noqa: BLE001 — drift is repaired by reconcile()
+                logger.warning(
+                    "memory vector write-through failed for %d op(s); left to the reconciler",
+                    len(batch),
+                    exc_info=True,
+                )
+
+    async def _apply(self, batch: dict[tuple[str, int], _PendingOp]) -> None:
+        upserts = [(collection, op) for (collection, _), op in batch.items() if op.row is not None]
+        deletes: dict[str, list[int]] = {}
+        for (collection, point_id), op in batch.items():
+            if op.row is None:
+                deletes.setdefault(collection, []).append(point_id)
+        if upserts:
+            vectors = await embed_in_batches(
+                self._embedder,
+                [op.row.content for _, op in upserts if op.row],
+                batch_size=_EMBED_BATCH,
+            )
+            by_collection: dict[str, list[tuple[int, list[float], dict[str, Any]]]] = {}
+            for (collection, op), vector in zip(upserts, vectors):
+                assert op.row is not None
+                by_collection.setdefault(collection, []).append(
+                    (op.point_id, vector, self._payload(op.tenant_id, op.user_id, op.row))
+                )
+            for collection, points in by_collection.items():
+                await self._store.ensure_collection(collection, len(points[0][1]))
+                await self._store.upsert(collection, points)
+        for collection, point_ids in deletes.items():
+            await self._store.delete_points(collection, point_ids)
+
+    async def flush(self) -> None:
+        """Wait until every queued write-through op has been applied (tests / shutdown)."""
+        while self._worker is not None and not self._worker.done():
+            await asyncio.shield(self._worker)
+
+    async def close(self) -> None:
+        """Shutdown: apply queued write-through ops, then cancel in-flight reconciles.
+
+        A cancelled reconcile loses nothing — the next process re-runs it on recall.
+        """
+        await self.flush()
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    # --- write-through read + repair -------------------------------------------
+    async def recall(
+        self, *, tenant_id: UUID, user_id: UUID, query: str, top_k: int = 5
+    ) -> list[MemoryVectorHit]:
+        """Count-free semantic recall: one query embed + one filtered Qdrant query."""
+        if not query.strip():
+            return []
+        qvecs = await self._embedder.embed([query])
+        if not qvecs:
+            return []
+        hits = await self._store.search(
+            QdrantNamespaceStrategy.collection_name(tenant_id, _LAYER),
+            qvecs[0],
+            top_k=top_k,
+            payload_filter=self._user_filter(tenant_id, user_id),
+        )
+        return [self._to_hit(hit.payload, hit.score) for hit in hits]
+
+    async def reconcile(
+        self, *, tenant_id: UUID, user_id: UUID, rows: list[MemoryRow]
+    ) -> tuple[int, int]:
+        """Repair drift for one user: re-embed missing / edited rows, delete orphan points.
+
+        Diffs the user's points (payload-only scroll, content_hash) against `rows` (the
+        DB truth). Returns (upserted, deleted).
+        """
+        collection = QdrantNamespaceStrategy.collection_name(tenant_id, _LAYER)
+        existing = await self._store.scroll_payloads(
+            collection,
+            ["content_hash"],
+            payload_filter=self._user_filter(tenant_id, user_id),
+        )
+        have = {point_id: payload.get("content_hash") for point_id, payload in existing}
+        wanted = {self._point_id(user_id, row.dedup_key): row for row in rows}
+        stale = [
+            (point_id, row)
+            for point_id, row in wanted.items()
+            if have.get(point_id) != _content_hash(row.content)
+        ]
+        orphans = [point_id for point_id in have if point_id not in wanted]
+        if stale:
+            vectors = await embed_in_batches(
+                self._embedder, [row.content for _, row in stale], batch_size=_EMBED_BATCH
+            )
+            await self._store.ensure_collection(collection, len(vectors[0]))
+            await self._store.upsert(
+                collection,
+                [
+                    (point_id, vector, self._payload(tenant_id, user_id, row))
+                    for (point_id, row), vector in zip(stale, vectors)
+                ],
+            )
+        if orphans:
+            await self._store.delete_points(collection, orphans)
+        if stale or orphans:
+            logger.info(
+                "memory vector index reconciled tenant=%s user=%s upserted=%d deleted=%d",
+                tenant_id,
+                user_id,
+                len(stale),
+                len(orphans),
+            )
+        return len(stale), len(orphans)
+
+    def schedule_reconcile(
+        self,
+        *,
+        tenant_id: UUID,
+        user_id: UUID,
+        load_rows: Callable[[], Awaitable[list[MemoryRow]]],
+    ) -> bool:
+        """Start a background reconcile for the user unless one ran within the interval.
+
+        Returns True when a reconcile was scheduled. Errors are logged, never raised.
+        """
+        key = (tenant_id, user_id)
+        last = self._reconciled_at.get(key)
+        now = time.monotonic()
+        if last is not None and now - last < self._reconcile_interval_sec:
+            return False
+        self._reconciled_at[key] = now
+
+        async def _run() -> None:
+            try:
+                await self.reconcile(tenant_id=tenant_id, user_id=user_id, rows=await load_rows())
+            except Exception:  # noqa: BLE001 — background repair is best-effort
+                self._reconciled_at.pop(key, None)  # retry on the next recall
+                logger.warning("memory vector reconcile failed", exc_info=True)
+
+        task = asyncio.get_running_loop().create_task(_run())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return True
+
+    @staticmethod
+    def _to_hit(payload: dict[str, Any], score: float) -> MemoryVectorHit:
+        return MemoryVectorHit(
+            dedup_key=str(payload.get("dedup_key", "")),
+            content=str(payload.get("content", "")),
+            confidence=float(payload.get("confidence", 0.0)),
+            score=round(float(score), 3),
+        )
+
     async def search(
         self,
         *,
@@ -194,15 +432,7 @@ class MemoryVectorIndex:
             top_k=top_k,
             payload_filter=self._user_filter(tenant_id, user_id),
         )
-        return [
-            MemoryVectorHit(
-                dedup_key=str(hit.payload.get("dedup_key", "")),
-                content=str(hit.payload.get("content", "")),
-                confidence=float(hit.payload.get("confidence", 0.0)),
-                score=round(float(hit.score), 3),
-            )
-            for hit in hits
-        ]
+        return [self._to_hit(hit.payload, hit.score) for hit in hits]
 
 
 __all__ = ["MemoryRow", "MemoryVectorHit", "MemoryVectorIndex"]
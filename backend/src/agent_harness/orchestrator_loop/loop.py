@@ -14,6 +14,8 @@ Description:
         1. Check 3 pre-LLM terminators (max_turns / token_budget / cancellation)
         2. Build ChatRequest from current messages + registered tools
         3. await chat_client.chat(request) — provider-neutral via adapter
+           (stream_llm=True: consume chat_client.stream(request), yield one
+           LLMTextDelta per text chunk, assemble the same ChatResponse)
         4. Update tokens_used from response.usage
         5. parser.parse(response) → ParsedOutput
         6. yield Thinking(text=parsed.text)
@@ -21,7 +23,8 @@ Description:
         8. classify_output(response) → branch:
              - FINAL    → yield LoopCompleted(end_turn) + return
              - HANDOFF  → yield LoopCompleted(handoff, handoff_target/reason) + return  [Cat 11]
-             - TOOL_USE → for each tool_call:
+             - TOOL_USE → for each tool_call (parallel-safe runs concurrently
+                          when parallel_tool_calls=True; emitted in call order):
                               yield ToolCallRequested
                               await tool_executor.execute(tc)
                               append Message(role="tool", tool_call_id=tc.id, content=...)
@@ -42,9 +45,16 @@ Description:
     revisit if per-run override is needed.
 
 Created: 2026-04-30 (Sprint 50.1 Day 2.2)
-Last Modified: 2026-06-25
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: stream() opened beside chat() in the PromptBuilder scope (AP-8 lint)
+    - 2026-10-16: Semantic compaction records a MessageStore checkpoint (windowed ledger load)
+    - 2026-10-16: PROMPT_BUILD span carries the build's memory snapshot hit / miss counts
+    - 2026-10-16: Speculative tool calls — READ_ONLY_PARALLEL calls dispatched mid-stream
+    - 2026-10-16: Token streaming — stream_llm consumes ChatClient.stream(), yields LLMTextDelta
+    - 2026-10-16: Parallel tool calls — per-call pipeline extracted to _execute_tool_call;
+        parallel-safe groups (ConcurrencyPolicy) run concurrently behind parallel_tool_calls
     - 2026-06-25: Sprint 57.144 — rare tool-error path routes via Cat 2 taxonomy (research #7 B2)
     - 2026-06-25: Sprint 57.142 — llm_call span +finish_reason → gen_ai.response.finish_reasons
     - 2026-07-01: Sprint 57.153 — verify gate threads this turn's injected memory to the judge
@@ -121,6 +131,7 @@ Related:
 from __future__ import annotations
 
 import asyncio
+import json
 import time
 from dataclasses import dataclass
 
@@ -131,12 +142,14 @@ from uuid import UUID, uuid4
 
 # Need imports from sibling adapter / tools / output_parser modules:
 from adapters._base.chat_client import ChatClient
+from adapters._base.types import StreamEvent
 from agent_harness._contracts import (
     ApprovalReceived,
     ApprovalRequested,
     CacheBreakpoint,
     ChatRequest,
     ChatResponse,
+    ConcurrencyPolicy,
     ContentBlock,
     ContextCompacted,
     DurableState,
@@ -145,6 +158,7 @@ from agent_harness._contracts import (
     GuardrailTriggered,
     LLMRequested,
     LLMResponded,
+    LLMTextDelta,
     LoopCompleted,
     LoopEvent,
     LoopStarted,
@@ -159,12 +173,14 @@ from agent_harness._contracts import (
     SpanStarted,
     StateCheckpointed,
     StateVersion,
+    StopReason,
     Thinking,
     TodosUpdated,
     ToolCall,
     ToolCallExecuted,
     ToolCallFailed,
     ToolCallRequested,
+    TokenUsage,
     ToolResult,
     TraceContext,
     TransientState,
@@ -201,6 +217,7 @@ from agent_harness.guardrails import (
     CapabilityMatrix,
     GuardrailAction,
     GuardrailEngine,
+    GuardrailResult,
     Tripwire,
     WORMAuditLog,
 )
@@ -213,7 +230,13 @@ from agent_harness.output_parser import (
     classify_output,
 )
 from agent_harness.prompt_builder import PromptBuilder
-from agent_harness.state_mgmt import Checkpointer, MessageStore, Reducer, TodoStore
+from agent_harness.state_mgmt import (
+    LEDGER_SEQ_KEY,
+    Checkpointer,
+    MessageStore,
+    Reducer,
+    TodoStore,
+)
 from agent_harness.tools import (  # public path per category-boundaries.md
     ToolExecutor,
     ToolRegistry,
@@ -282,6 +305,45 @@ def messages_from_metadata(metadata: dict[str, Any]) -> list[Message]:
     return out
 
 
+def _ledger_checkpoint(
+    before: list[Message], after: list[Message]
+) -> tuple[Message, int] | None:
+    """(summary, ledger sequence_num it covers) for a compaction, else None.
+
+    `before` / `after` are the loop's messages around a triggered compaction. Only
+    a semantic compaction (an output message tagged metadata["compacted_summary"])
+    yields a checkpoint: the summary covers every ledger message the compaction
+    dropped, up to — not including — the oldest ledger message it kept verbatim.
+    Ledger positions come from the metadata[LEDGER_SEQ_KEY] tags the MessageStore
+    stamps on load / append; untagged messages (system, inbox injections, resumed
+    buffers) are ignored. None when nothing ledger-backed was dropped.
+    """
+    before_ids = {id(m) for m in before}
+    summary = next(
+        (
+            m
+            for m in after
+            if m.metadata.get("compacted_summary") is True and id(m) not in before_ids
+        ),
+        None,
+    )
+    if summary is None:
+        return None
+    # Compactors rebuild kept messages with dataclasses.replace(), which shares the
+    # metadata dict — so "kept" is decided by ledger tag, not object identity.
+    kept = {int(m.metadata[LEDGER_SEQ_KEY]) for m in after if LEDGER_SEQ_KEY in m.metadata}
+    dropped = [
+        int(m.metadata[LEDGER_SEQ_KEY])
+        for m in before
+        if LEDGER_SEQ_KEY in m.metadata and int(m.metadata[LEDGER_SEQ_KEY]) not in kept
+    ]
+    if kept:
+        dropped = [seq for seq in dropped if seq < min(kept)]
+    if not dropped:
+        return None
+    return summary, max(dropped)
+
+
 @dataclass
 class _VerifyVerdict:
     """Outcome of the in-loop Cat 10 verification gate (Sprint 57.98 A1).
@@ -304,6 +366,39 @@ class _VerifyVerdict:
     verif_model: str | None
 
 
+def _stream_int(value: object) -> int:
+    """StreamEvent payloads are dict[str, object]; coerce a token count (absent → 0)."""
+    return value if isinstance(value, int) else 0
+
+
+@dataclass
+class _ToolCallOutcome:
+    """Result slot of one `_execute_tool_call` pipeline (parallel tool calls).
+
+    `message` is the role="tool" Message the caller appends in call order (None when
+    the call ended the run first); `terminated` is True once the pipeline yielded a
+    run-ending event (LoopCompleted / LoopTerminated) — the turn stops there.
+    """
+
+    message: Message | None = None
+    terminated: bool = False
+
+
+@dataclass
+class _SpeculativeToolCall:
+    """A tool call dispatched while its LLM completion was still streaming.
+
+    `call` is the ToolCall as it stood when its arguments JSON closed; the turn's
+    final parse must produce an equal ToolCall for `task`'s result to be adopted.
+    `guardrail_result` is the Cat 9 verdict the dispatch was gated on (reused by
+    `_cat9_tool_check`, so the chain is not evaluated twice).
+    """
+
+    call: ToolCall
+    guardrail_result: GuardrailResult | None
+    task: asyncio.Task[ToolResult]
+
+
 def _build_correction_block(failures: list[VerificationResult]) -> str:
     """Build the correction-feedback block appended as a user Message in-loop.
 
@@ -410,6 +505,27 @@ class AgentLoopImpl(AgentLoop):
         # QueueMessageInbox over the module InjectionRegistry; B2 will back it with
         # the TEAMMATE mailbox — same ABC).
         message_inbox: "MessageInbox | None" = None,
+        # Parallel tool calls: when True, consecutive tool_calls of one turn whose
+        # ToolSpec.concurrency_policy is READ_ONLY_PARALLEL / ALL_PARALLEL run their
+        # Cat 9 check + execution concurrently (events + tool messages still land in
+        # call order; a SEQUENTIAL tool is a barrier). Default False keeps the
+        # one-after-another baseline for every existing caller / test.
+        parallel_tool_calls: bool = False,
+        # Token streaming: when True, each LLM call consumes chat_client.stream()
+        # instead of chat(), yielding an LLMTextDelta per streamed text chunk (so the
+        # SSE client sees the first token immediately) and assembling the streamed
+        # text + tool_call deltas into the SAME ChatResponse the rest of the turn
+        # consumes (parser / Cat 9 / Cat 10 / ledger unchanged). Default False keeps
+        # the single chat() call baseline.
+        stream_llm: bool = False,
+        # Speculative tool calls (effective only with stream_llm): a streamed tool
+        # call whose arguments JSON has closed and whose ToolSpec is
+        # READ_ONLY_PARALLEL is Cat 9-checked and dispatched to the executor while
+        # the completion is still streaming; its result is adopted when the final
+        # parse yields the same call, and discarded (task cancelled) otherwise.
+        # Calls that need HITL or trip the tripwire are never speculated. Default
+        # False → tools run only after the completion is finalized.
+        speculative_tool_calls: bool = False,
     ) -> None:
         self._chat_client = chat_client
         self._output_parser = output_parser
@@ -477,6 +593,12 @@ class AgentLoopImpl(AgentLoop):
         self._verification_memory_grounding = verification_memory_grounding
         # 57.101 B1 §between-turns injection (see ctor docstring above).
         self._message_inbox = message_inbox
+        # Parallel tool calls (see ctor docstring above).
+        self._parallel_tool_calls = parallel_tool_calls
+        # Token streaming (see ctor docstring above).
+        self._stream_llm = stream_llm
+        # Speculative tool calls (see ctor docstring above).
+        self._speculative_tool_calls = speculative_tool_calls
         # 57.122 §HITL policy read-side (AD-HITL-Policy-ReadSide-Potemkin-Phase58):
         # the per-tenant HITLPolicy resolved ONCE per run (tenant_id is stable) +
         # cached, so the tool-call HITL decision reads the tenant's risk thresholds
@@ -886,6 +1008,7 @@ class AgentLoopImpl(AgentLoop):
         session_id: UUID,
         messages: list[Message],
         verification_attempts: int = 0,
+        guardrail_result: GuardrailResult | None = None,
     ) -> AsyncIterator[LoopEvent]:
         """Cat 9 per-tool_call gating. Yields:
         GuardrailTriggered (action=BLOCK/ESCALATE/SANITIZE/REROLL) when
@@ -896,9 +1019,14 @@ class AgentLoopImpl(AgentLoop):
         57.88 US-1: `session_id` + `messages` are threaded through so the
         deferred-HITL ESCALATE branch can build + persist a resumable
         checkpoint before terminating with ``awaiting_approval``.
+
+        `guardrail_result` is the verdict already computed for this call by a
+        parallel group's `batch_check_tool_calls` (None → evaluate the chain here).
         """
         if self._guardrail_engine is not None:
-            g_result = await self._guardrail_engine.check_tool_call(tc, trace_context=ctx)
+            g_result = guardrail_result
+            if g_result is None:
+                g_result = await self._guardrail_engine.check_tool_call(tc, trace_context=ctx)
             action = g_result.action
             if action in (
                 GuardrailAction.BLOCK,
@@ -1958,6 +2086,723 @@ class AgentLoopImpl(AgentLoop):
         ):
             yield ev
 
+    # === Tool-call dispatch (parallel tool calls) ==========================
+
+    def _tool_call_groups(self, tool_calls: list[ToolCall]) -> list[list[ToolCall]]:
+        """Partition one turn's tool_calls into execution groups by ConcurrencyPolicy.
+
+        Consecutive calls whose ToolSpec is READ_ONLY_PARALLEL / ALL_PARALLEL form a
+        single group; a SEQUENTIAL (or unregistered) tool is a singleton group AND a
+        barrier — calls never reorder across it. Per-call mirror of
+        ToolExecutorImpl._batch_can_parallelize. With `parallel_tool_calls` off every
+        call is a singleton (the one-after-another baseline).
+        """
+        groups: list[list[ToolCall]] = []
+        current: list[ToolCall] = []
+        for tc in tool_calls:
+            spec = self._tool_registry.get(tc.name) if self._parallel_tool_calls else None
+            if spec is not None and spec.concurrency_policy is not ConcurrencyPolicy.SEQUENTIAL:
+                current.append(tc)
+                continue
+            if current:
+                groups.append(current)
+                current = []
+            groups.append([tc])
+        if current:
+            groups.append(current)
+        return groups
+
+    async def _tool_group_needs_hitl(
+        self,
+        group: list[ToolCall],
+        guardrail_results: list[GuardrailResult | None],
+        ctx: TraceContext,
+    ) -> bool:
+        """True when any call of a parallel group would enter `_cat9_hitl_branch`.
+
+        Replays `_cat9_tool_check`'s routing decision on the pre-computed guardrail
+        verdicts (PASS/ESCALATE + tenant HITLPolicy). Such a group runs one call at a
+        time so a deferred pause checkpoints exactly the buffer the sequential path
+        would (earlier results appended) and no later call raises a second approval.
+        """
+        if self._hitl_manager is None or self._guardrail_engine is None:
+            return False
+        for tc, g_result in zip(group, guardrail_results):
+            action = g_result.action if g_result is not None else GuardrailAction.PASS
+            if action not in (GuardrailAction.PASS, GuardrailAction.ESCALATE):
+                continue
+            flagged = action == GuardrailAction.ESCALATE
+            risk = self._resolve_tool_call_risk(tc.name, flagged=flagged)
+            policy = await self._resolve_hitl_policy(ctx)
+            if decide_tool_hitl(risk, policy, rule_requires_approval=flagged):
+                return True
+        return False
+
+    async def _execute_tool_calls(
+        self,
+        *,
+        tool_calls: list[ToolCall],
+        outcomes: list[_ToolCallOutcome],
+        ctx: TraceContext,
+        turn_ctx: TraceContext,
+        turn_count: int,
+        session_id: UUID,
+        messages: list[Message],
+        verification_attempts: int = 0,
+        speculative: dict[str, _SpeculativeToolCall] | None = None,
+    ) -> AsyncIterator[LoopEvent]:
+        """Run one turn's tool_calls, honoring each ToolSpec's ConcurrencyPolicy.
+
+        Singleton groups run through `_execute_tool_call` exactly as before. A
+        parallel group first evaluates the Cat 9 tool chain for all calls at once
+        (`GuardrailEngine.batch_check_tool_calls`); unless a call needs HITL (see
+        `_tool_group_needs_hitl`), the group's pipelines then run as concurrent
+        tasks, each buffering its events. Buffers are yielded and tool messages
+        appended strictly in call order, so the event stream and the `messages`
+        buffer are identical to the sequential run — only the wall-clock differs
+        (the turn costs the slowest call, not the sum).
+
+        One `_ToolCallOutcome` per dispatched call is appended to `outcomes`; the
+        generator stops after the first call whose outcome is `terminated` (the
+        caller returns). Still-running later calls of that group are cancelled and
+        their events discarded — the sequential path would never have run them.
+
+        `speculative` holds calls already dispatched mid-stream (speculative tool
+        calls). A call whose final ToolCall equals the speculated one adopts that
+        run's Cat 9 verdict + in-flight task; a mismatch is discarded here and the
+        call runs normally.
+        """
+        adopted: dict[str, _SpeculativeToolCall] = {}
+        for tc in tool_calls:
+            entry = speculative.get(tc.id) if speculative else None
+            if entry is None:
+                continue
+            if entry.call == tc:
+                adopted[tc.id] = entry
+            else:
+                self._discard_speculative([entry])
+        for group in self._tool_call_groups(tool_calls):
+            guardrail_results: list[GuardrailResult | None] = [None] * len(group)
+            if len(group) > 1 and self._guardrail_engine is not None:
+                guardrail_results = list(
+                    await self._guardrail_engine.batch_check_tool_calls(group, trace_context=ctx)
+                )
+            for gi, tc in enumerate(group):
+                if tc.id in adopted:
+                    guardrail_results[gi] = adopted[tc.id].guardrail_result
+            if len(group) == 1 or await self._tool_group_needs_hitl(group, guardrail_results, ctx):
+                for tc, g_result in zip(group, guardrail_results):
+                    outcome = _ToolCallOutcome()
+                    outcomes.append(outcome)
+                    async for ev in self._execute_tool_call(
+                        tc=tc,
+                        outcome=outcome,
+                        ctx=ctx,
+                        turn_ctx=turn_ctx,
+                        turn_count=turn_count,
+                        session_id=session_id,
+                        messages=messages,
+                        verification_attempts=verification_attempts,
+                        guardrail_result=g_result,
+                        speculative_task=(adopted[tc.id].task if tc.id in adopted else None),
+                    ):
+                        yield ev
+                    if outcome.message is not None:
+                        messages.append(outcome.message)
+                    if outcome.terminated:
+                        return
+                continue
+
+            group_outcomes = [_ToolCallOutcome() for _ in group]
+            buffers: list[list[LoopEvent]] = [[] for _ in group]
+
+            async def _drain(idx: int) -> None:
+                async for ev in self._execute_tool_call(
+                    tc=group[idx],
+                    outcome=group_outcomes[idx],
+                    ctx=ctx,
+                    turn_ctx=turn_ctx,
+                    turn_count=turn_count,
+                    session_id=session_id,
+                    messages=messages,
+                    verification_attempts=verification_attempts,
+                    guardrail_result=guardrail_results[idx],
+                    speculative_task=(
+                        adopted[group[idx].id].task if group[idx].id in adopted else None
+                    ),
+                ):
+                    buffers[idx].append(ev)
+
+            tasks = [asyncio.create_task(_drain(idx)) for idx in range(len(group))]
+            try:
+                for idx, task in enumerate(tasks):
+                    # asyncio.wait never raises the task's own exception — the
+                    # buffered events are yielded first, then result() re-raises it
+                    # (same order as the sequential path: events, then the raise).
+                    try:
+                        await asyncio.wait({task})
+                    except asyncio.CancelledError:
+                        yield LoopCompleted(
+                            stop_reason=TerminationReason.CANCELLED.value,
+                            total_turns=turn_count,
+                            trace_context=ctx,
+                        )
+                        raise
+                    for ev in buffers[idx]:
+                        yield ev
+                    task.result()
+                    outcome = group_outcomes[idx]
+                    outcomes.append(outcome)
+                    if outcome.message is not None:
+                        messages.append(outcome.message)
+                    if outcome.terminated:
+                        return
+            finally:
+                for task in tasks:
+                    if not task.done():
+                        task.cancel()
+
+    async def _execute_tool_call(
+        self,
+        *,
+        tc: ToolCall,
+        outcome: _ToolCallOutcome,
+        ctx: TraceContext,
+        turn_ctx: TraceContext,
+        turn_count: int,
+        session_id: UUID,
+        messages: list[Message],
+        verification_attempts: int = 0,
+        guardrail_result: GuardrailResult | None = None,
+        speculative_task: asyncio.Task[ToolResult] | None = None,
+    ) -> AsyncIterator[LoopEvent]:
+        """One tool_call's pipeline: request → Cat 9 check → execute (Cat 8 retry) → result.
+
+        The former per-call body of the _run_turns TOOL_USE branch, unchanged except
+        that the tool message is recorded on `outcome.message` (the caller appends it
+        in call order) and a run-ending exit (Cat 9 tripwire / deferred pause, Cat 8
+        terminate) sets `outcome.terminated` after its terminal event is yielded.
+        `guardrail_result` is the call's pre-computed Cat 9 tool verdict when the
+        group was batch-checked (None → `_cat9_tool_check` runs the engine itself).
+        `speculative_task` is the call's mid-stream run (speculative tool calls); its
+        result stands in for the first execute() attempt (Cat 8 retries re-execute).
+        """
+        yield ToolCallRequested(
+            tool_call_id=tc.id,
+            tool_name=tc.name,
+            arguments=tc.arguments,
+            trace_context=ctx,
+        )
+
+        # === Cat 9 per tool_call check (53.3 Day 4 US-7) ====
+        # tool guardrail BLOCK/ESCALATE → inject error ToolResult
+        #   so LLM sees failure + can self-correct (no loop terminate).
+        # tripwire trigger → emit TripwireTriggered + LoopCompleted.
+        cat9_blocked: ToolResult | None = None
+        cat9_terminated = False
+        async for ev in self._cat9_tool_check(
+            tc=tc,
+            ctx=ctx,
+            turn_count=turn_count,
+            session_id=session_id,
+            messages=messages,
+            verification_attempts=verification_attempts,
+            guardrail_result=guardrail_result,
+        ):
+            yield ev
+            if isinstance(ev, LoopCompleted):
+                cat9_terminated = True
+            elif isinstance(ev, GuardrailTriggered):
+                cat9_blocked = ToolResult(
+                    tool_call_id=tc.id,
+                    tool_name=tc.name,
+                    content=(f"tool blocked by guardrail: {ev.reason}"),
+                    success=False,
+                    error=ev.reason,
+                    duration_ms=0.0,
+                )
+        if cat9_terminated:
+            outcome.terminated = True
+            return
+        if cat9_blocked is not None:
+            result = cat9_blocked
+            result_text = self._tool_result_to_text(result.content)
+            # Record the result message and skip tool execution.
+            outcome.message = Message(
+                role="tool",
+                content=result_text,
+                tool_call_id=tc.id,
+            )
+            yield ToolCallExecuted(
+                tool_call_id=tc.id,
+                tool_name=tc.name,
+                duration_ms=0.0,
+                result_content=result_text,
+                trace_context=ctx,
+            )
+            return
+
+        # Sprint 55.6 — AD-Cat8-2 retry loop wrap (Option H).
+        # `attempt_num` starts at 1 (1-indexed per 53.2 docstring).
+        # On retry: yield ErrorRetried + asyncio.sleep(backoff) +
+        # increment + `continue`. `break` exits to post-execute
+        # path (tool_content / yield ToolCallExecuted-or-Failed /
+        # outcome.message) which stays at original indent level.
+        # When Cat 8 deps None → _should_retry_tool_error returns
+        # (False, 0.0) → break on first iteration → 53.1 baseline.
+        attempt_num = 1
+        while True:
+            try:
+                # Sprint 52.5 P0 #18: build ExecutionContext from
+                # trace_context so memory_tools (and future scoped
+                # tools) get server-authoritative tenant_id /
+                # user_id / session_id instead of trusting LLM args.
+                exec_ctx = ExecutionContext(
+                    tenant_id=ctx.tenant_id,
+                    user_id=ctx.user_id,
+                    session_id=ctx.session_id or session_id,
+                )
+                # Sprint 57.71 (A-4 Tier 1): TOOL_EXEC span per
+                # execute() call, nested under turn_ctx. Latency
+                # comes from span timing; on a raised exception
+                # the tracer sets ERROR status + record_exception
+                # automatically as it propagates through the
+                # `async with` body (caught by the surrounding
+                # except clauses afterwards). Parallel / multiple
+                # tool calls in one turn are sibling TOOL_EXEC
+                # spans under the same TURN. The span is the loop's
+                # own (the executor's internal tracer stays NoOp —
+                # loop is the single trace-tree owner, D8 no double
+                # spans).
+                async with self._tracer.start_span(
+                    name=f"agent_loop.tool.{tc.name}",
+                    category=SpanCategory.TOOLS,
+                    trace_context=turn_ctx,
+                    attributes={"span_type": "TOOL_EXEC", "tool": tc.name},
+                ) as tool_ctx:
+                    _tool_ctx_t0 = time.monotonic()
+                    yield SpanStarted(
+                        span_name=f"agent_loop.tool.{tc.name}",
+                        span_id=tool_ctx.span_id,
+                        parent_span_id=tool_ctx.parent_span_id or "",
+                        span_type="TOOL_EXEC",
+                        trace_context=tool_ctx,
+                    )
+                    try:
+                        if speculative_task is not None:
+                            # Adopt the mid-stream run as attempt 1 (it already
+                            # passed the same Cat 9 gate); retries execute anew.
+                            pending, speculative_task = speculative_task, None
+                            result = await pending
+                        else:
+                            result = await self._tool_executor.execute(
+                                tc, trace_context=ctx, context=exec_ctx
+                            )
+                    finally:
+                        yield SpanEnded(
+                            span_name=f"agent_loop.tool.{tc.name}",
+                            span_id=tool_ctx.span_id,
+                            span_type="TOOL_EXEC",
+                            duration_ms=(time.monotonic() - _tool_ctx_t0) * 1000.0,
+                            trace_context=tool_ctx,
+                        )
+            except asyncio.CancelledError:
+                yield LoopCompleted(
+                    stop_reason=TerminationReason.CANCELLED.value,
+                    total_turns=turn_count,
+                    trace_context=ctx,
+                )
+                raise
+            except Exception as exc:
+                # 53.2 Day 4 Cat 8 chain: classify → record budget →
+                # check terminator. When Cat 8 deps None → re-raise
+                # (preserves 53.1 baseline).
+                # Sprint 55.6 D7 fix: pass real attempt_num (was hardcoded
+                # =1).
+                terminate, err_class, term_reason, term_detail = await self._handle_tool_error(
+                    error=exc,
+                    tool_name=tc.name,
+                    attempt_num=attempt_num,
+                    state_version=None,
+                    trace_context=ctx,
+                )
+                if self._error_policy is None:
+                    # Opt-out path: no Cat 8 deps → preserve 53.1 raise
+                    # behavior
+                    raise
+                if terminate:
+                    # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): mirror the
+                    # dominant-path emit — surface the raised tool error's typed
+                    # taxonomy on the wire BEFORE terminating (classify from the
+                    # exception here; the synthetic ToolResult is built later, at
+                    # the LLM-recoverable synthesis, which this FATAL path skips).
+                    yield ToolCallFailed(
+                        tool_call_id=tc.id,
+                        tool_name=tc.name,
+                        error=repr(exc),
+                        error_taxonomy=classify_tool_error(
+                            error_class=(f"{type(exc).__module__}.{type(exc).__name__}"),
+                            error_msg=repr(exc),
+                        ).value,
+                        trace_context=ctx,
+                    )
+                    yield LoopTerminated(
+                        reason=(term_reason.value if term_reason is not None else ""),
+                        detail=term_detail,
+                        last_state_version=None,
+                        trace_context=ctx,
+                    )
+                    outcome.terminated = True
+                    return
+
+                # Sprint 55.6 — AD-Cat8-2 (Option H) retry consultation
+                # on hard-exception path.
+                should_retry, backoff_s = await self._should_retry_tool_error(
+                    error=exc,
+                    error_class=err_class,
+                    tool_name=tc.name,
+                    attempt=attempt_num,
+                )
+                if should_retry:
+                    yield ErrorRetried(
+                        attempt=attempt_num,
+                        error_class=err_class.value if err_class else "",
+                        backoff_ms=backoff_s * 1000.0,
+                        trace_context=ctx,
+                    )
+                    await asyncio.sleep(backoff_s)
+                    attempt_num += 1
+                    continue  # retry tool execution
+
+                # No retry → fall through to LLM-recoverable synthesis.
+                # Synthesize LLM-recoverable error ToolResult so the
+                # LLM sees the failure on next turn and can self-correct
+                # (Cat 8 §LLM-recoverable; Anthropic / LangGraph pattern).
+                # Sprint 57.144 US-3 (research #7 Half B, B2 full coverage):
+                # this is the RARE path where the executor ITSELF raised
+                # (the dominant handler-exception path is enriched inside
+                # ToolExecutorImpl._build_failure). Route it through the SAME
+                # Cat 2 taxonomy so both paths agree.
+                # Sprint 57.164 (Option B decouple): classify ALWAYS (display
+                # taxonomy, mirrors _build_failure); the lever gates only the
+                # LLM content ("Error: …" byte-identical default when off).
+                _tax = classify_tool_error(
+                    error_class=f"{type(exc).__module__}.{type(exc).__name__}",
+                    error_msg=repr(exc),
+                )
+                if tool_error_reflection_enabled():
+                    _err_content = render_reflection(_tax, repr(exc))
+                else:
+                    _err_content = f"Error: {exc!r}. Please adjust your approach."
+                _err_taxonomy: str | None = _tax.value
+                result = ToolResult(
+                    tool_call_id=tc.id,
+                    tool_name=tc.name,
+                    content=_err_content,
+                    success=False,
+                    error=repr(exc),
+                    error_taxonomy=_err_taxonomy,
+                    duration_ms=0.0,
+                )
+
+            # 53.2 Day 4 Cat 8 chain on soft failure: ToolExecutorImpl
+            # catches handler exceptions internally → ToolResult(success=
+            # False). Reconstruct a synthetic exception so the Cat 8
+            # chain can classify + check terminator. When deps None →
+            # fall through to existing 53.1 baseline (LLM-recoverable
+            # via tool message).
+            # Sprint 55.4 (AD-Cat8-3 narrow Option C): pass
+            # `result.error_class` (FQ class name set by ToolExecutorImpl
+            # per 53.3 US-9) so classification flows through
+            # classify_by_string() instead of MRO walk on the generic
+            # synthetic Exception (which would always return FATAL).
+            # Sprint 55.6 D7 fix: pass real attempt_num (was hardcoded =1).
+            if not result.success and self._error_policy is not None:
+                synthetic = Exception(result.error or "tool soft failure")
+                terminate, err_class, term_reason, term_detail = await self._handle_tool_error(
+                    error=synthetic,
+                    tool_name=tc.name,
+                    attempt_num=attempt_num,
+                    state_version=None,
+                    trace_context=ctx,
+                    error_class_str=result.error_class,
+                )
+                if terminate:
+                    # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): surface the
+                    # failed tool's typed taxonomy on the wire BEFORE the loop
+                    # terminates, so the chat-v2 ToolBlock shows the diagnosis
+                    # chip (a Cat-8 FATAL tool failure otherwise only yields
+                    # loop_terminated → the 57.130 "terminated" flip, hiding the
+                    # taxonomy that _build_failure already computed).
+                    yield ToolCallFailed(
+                        tool_call_id=tc.id,
+                        tool_name=tc.name,
+                        error=result.error or "unknown tool error",
+                        error_taxonomy=result.error_taxonomy,
+                        trace_context=ctx,
+                    )
+                    yield LoopTerminated(
+                        reason=(term_reason.value if term_reason is not None else ""),
+                        detail=term_detail,
+                        last_state_version=None,
+                        trace_context=ctx,
+                    )
+                    outcome.terminated = True
+                    return
+
+                # Sprint 55.6 — AD-Cat8-2 (Option H) retry consultation
+                # on soft-failure path.
+                should_retry, backoff_s = await self._should_retry_tool_error(
+                    error=synthetic,
+                    error_class=err_class,
+                    tool_name=tc.name,
+                    attempt=attempt_num,
+                )
+                if should_retry:
+                    yield ErrorRetried(
+                        attempt=attempt_num,
+                        error_class=err_class.value if err_class else "",
+                        backoff_ms=backoff_s * 1000.0,
+                        trace_context=ctx,
+                    )
+                    await asyncio.sleep(backoff_s)
+                    attempt_num += 1
+                    continue  # retry tool execution
+
+            # Success or no-retry path → exit retry loop. Post-execute
+            # code (tool_content / yield ToolCallExecuted-or-Failed /
+            # outcome.message) follows at original indent level.
+            break
+
+        # Feed back as tool message — KEY V2 cure for AP-1.
+        tool_content = self._tool_result_to_text(result.content)
+
+        # 50.2: emit Cat 2-owned completion event so SSE / frontend
+        # see tool result text + success/failure.
+        if result.success:
+            yield ToolCallExecuted(
+                tool_call_id=tc.id,
+                tool_name=tc.name,
+                duration_ms=result.duration_ms or 0.0,
+                result_content=tool_content,
+                trace_context=ctx,
+            )
+            # Sprint 57.140 (research #1): after a successful
+            # write_todos call, re-read the durable list + emit
+            # TodosUpdated so the chat-v2 Todos panel re-renders the
+            # plan as the agent maintains it. Name-coupled to the
+            # builtin tool (the only writer of the todo store).
+            if tc.name == "write_todos" and self._todo_store is not None:
+                yield TodosUpdated(
+                    todos=tuple(await self._todo_store.load()),
+                    trace_context=ctx,
+                )
+        else:
+            yield ToolCallFailed(
+                tool_call_id=tc.id,
+                tool_name=tc.name,
+                error=result.error or "unknown tool error",
+                # Sprint 57.164: carry the typed taxonomy to the wire.
+                error_taxonomy=result.error_taxonomy,
+                trace_context=ctx,
+            )
+
+        outcome.message = Message(
+            role="tool",
+            content=tool_content,
+            tool_call_id=tc.id,
+        )
+
+    async def _fold_chat_stream(
+        self,
+        events: AsyncIterator[StreamEvent],
+        request: ChatRequest,
+        *,
+        ctx: TraceContext,
+        chat_messages: list[Message],
+        sink: list[ChatResponse],
+        session_id: UUID | None = None,
+        speculative: dict[str, _SpeculativeToolCall] | None = None,
+    ) -> AsyncIterator[LoopEvent]:
+        """Consume a chat_client.stream(); yield LLMTextDelta; append the assembled response.
+
+        The caller opens `events` itself, next to its chat() call, so both paths
+        send the PromptBuilder-built `chat_messages` from the same scope (AP-8).
+
+        Folds the neutral StreamEvent kinds back into one ChatResponse so the rest
+        of the turn is identical to the chat() path:
+            content_delta   → LLMTextDelta + accumulated content
+            tool_call_delta → grouped by payload "index" (falls back to a new call
+                              on each fresh "id"; id-less deltas continue the last
+                              call); arguments JSON-decoded once the stream ends
+            stop            → stop_reason (tool calls present → TOOL_USE)
+            usage           → TokenUsage
+            thinking_delta  → ignored (LLMResponded.thinking stays None as today)
+        A provider that streams no usage gets a count_tokens() estimate instead,
+        so token_budget / cost accounting never silently drops a streamed turn.
+
+        With `speculative` given, each tool call is offered to
+        `_speculate_tool_call` once its id + name are known and its argument
+        fragments parse as a JSON object (dispatched calls land in the dict).
+        """
+        text_parts: list[str] = []
+        # index → [id, name, argument fragments]; insertion order == call order.
+        calls: dict[int, list[Any]] = {}
+        speculated: set[int] = set()
+        stop_reason = StopReason.END_TURN
+        usage: TokenUsage | None = None
+        async for event in events:
+            payload = event.payload
+            if event.event_type == "content_delta":
+                text = str(payload.get("text") or "")
+                if text:
+                    text_parts.append(text)
+                    yield LLMTextDelta(text=text, trace_context=ctx)
+            elif event.event_type == "tool_call_delta":
+                raw_index = payload.get("index")
+                tc_id = payload.get("id")
+                if isinstance(raw_index, int):
+                    index = raw_index
+                elif tc_id or not calls:
+                    index = len(calls)
+                else:
+                    index = next(reversed(calls))
+                entry = calls.setdefault(index, ["", "", []])
+                if tc_id:
+                    entry[0] = str(tc_id)
+                if payload.get("name"):
+                    entry[1] = str(payload["name"])
+                if payload.get("arguments_delta"):
+                    entry[2].append(str(payload["arguments_delta"]))
+                if (
+                    speculative is not None
+                    and index not in speculated
+                    and entry[0]
+                    and entry[1]
+                    and entry[2]
+                    and entry[2][-1].rstrip().endswith("}")
+                ):
+                    try:
+                        arguments = json.loads("".join(entry[2]))
+                    except json.JSONDecodeError:
+                        arguments = None  # still open — retry on the next fragment
+                    if isinstance(arguments, dict):
+                        speculated.add(index)
+                        await self._speculate_tool_call(
+                            ToolCall(id=entry[0], name=entry[1], arguments=arguments),
+                            ctx=ctx,
+                            session_id=session_id,
+                            speculative=speculative,
+                        )
+            elif event.event_type == "stop":
+                try:
+                    stop_reason = StopReason(str(payload.get("stop_reason")))
+                except ValueError:
+                    stop_reason = StopReason.PROVIDER_ERROR
+            elif event.event_type == "usage":
+                usage = TokenUsage(
+                    prompt_tokens=_stream_int(payload.get("prompt_tokens")),
+                    completion_tokens=_stream_int(payload.get("completion_tokens")),
+                    cached_input_tokens=_stream_int(payload.get("cached_input_tokens")),
+                    total_tokens=_stream_int(payload.get("total_tokens")),
+                )
+
+        tool_calls: list[ToolCall] | None = None
+        if calls:
+            tool_calls = []
+            for tc_id, name, fragments in calls.values():
+                args_raw = "".join(fragments)
+                try:
+                    arguments = json.loads(args_raw) if args_raw else {}
+                except json.JSONDecodeError:
+                    # Same fallback as the adapter's non-stream tool_call parse.
+                    arguments = {"_raw": args_raw}
+                tool_calls.append(ToolCall(id=tc_id, name=name, arguments=arguments))
+            stop_reason = StopReason.TOOL_USE
+
+        content = "".join(text_parts)
+        if usage is None:
+            prompt_tokens = await self._chat_client.count_tokens(
+                messages=chat_messages, tools=list(request.tools) or None
+            )
+            completion_tokens = (
+                await self._chat_client.count_tokens(
+                    messages=[Message(role="assistant", content=content, tool_calls=tool_calls)]
+                )
+                if content or tool_calls
+                else 0
+            )
+            usage = TokenUsage(
+                prompt_tokens=prompt_tokens,
+                completion_tokens=completion_tokens,
+                total_tokens=prompt_tokens + completion_tokens,
+            )
+        sink.append(
+            ChatResponse(
+                model=self._chat_client.model_info().model_name,
+                content=content,
+                tool_calls=tool_calls,
+                stop_reason=stop_reason,
+                usage=usage,
+            )
+        )
+
+    async def _speculate_tool_call(
+        self,
+        tc: ToolCall,
+        *,
+        ctx: TraceContext,
+        session_id: UUID | None,
+        speculative: dict[str, _SpeculativeToolCall],
+    ) -> None:
+        """Dispatch a closed, read-only tool call before its completion finishes.
+
+        Gated so the speculative run is one the finalized turn would make anyway:
+        the tool must be READ_ONLY_PARALLEL, the Cat 9 tool chain must PASS, the
+        call must not route to HITL, and the tripwire must not fire. Otherwise
+        nothing is dispatched and the call runs on the normal post-parse path.
+        """
+        spec = self._tool_registry.get(tc.name)
+        if spec is None or spec.concurrency_policy is not ConcurrencyPolicy.READ_ONLY_PARALLEL:
+            return
+        g_result: GuardrailResult | None = None
+        if self._guardrail_engine is not None:
+            g_result = await self._guardrail_engine.check_tool_call(tc, trace_context=ctx)
+            if g_result.action is not GuardrailAction.PASS:
+                return
+        if await self._tool_group_needs_hitl([tc], [g_result], ctx):
+            return
+        if self._tripwire is not None and await self._tripwire.trigger_check(
+            content=tc, trace_context=ctx
+        ):
+            return
+        exec_ctx = ExecutionContext(
+            tenant_id=ctx.tenant_id,
+            user_id=ctx.user_id,
+            session_id=ctx.session_id or session_id,
+        )
+        speculative[tc.id] = _SpeculativeToolCall(
+            call=tc,
+            guardrail_result=g_result,
+            task=asyncio.create_task(
+                self._tool_executor.execute(tc, trace_context=ctx, context=exec_ctx)
+            ),
+        )
+
+    @staticmethod
+    def _discard_speculative(entries: list[_SpeculativeToolCall]) -> None:
+        """Cancel unfinished speculative runs; retrieve finished ones' exceptions.
+
+        Called for calls the final parse disagreed with and, at turn end, for every
+        entry (a no-op for results already adopted). Retrieving a finished task's
+        exception keeps asyncio from logging "exception was never retrieved".
+        """
+        for entry in entries:
+            if not entry.task.done():
+                entry.task.cancel()
+            elif not entry.task.cancelled():
+                entry.task.exception()
+
     async def _persist_to_ledger(self, msgs: list[Message], *, turn_num: int) -> None:
         """Append NEW messages to the durable per-session ledger (best-effort,
         no-op without a store). Used for the user prompt at send start (57.127),
@@ -2278,7 +3123,16 @@ class AgentLoopImpl(AgentLoop):
                             trace_context=compaction_ctx,
                         )
                 if compaction_result.triggered and compaction_result.compacted_state is not None:
-                    messages = list(compaction_result.compacted_state.transient.messages)
+                    compacted = list(compaction_result.compacted_state.transient.messages)
+                    # A semantic summary that replaced a ledger prefix becomes the
+                    # store's checkpoint, so the next send loads the summary + the
+                    # tail instead of every row (no-op for a non-checkpointing store).
+                    checkpoint = _ledger_checkpoint(messages, compacted)
+                    if checkpoint is not None and self._message_store is not None:
+                        await self._message_store.save_checkpoint(
+                            checkpoint[0], through_sequence_num=checkpoint[1]
+                        )
+                    messages = compacted
                     tokens_used = compaction_result.tokens_after
                     strategy_label = (
                         compaction_result.strategy_used.value
@@ -2320,6 +3174,9 @@ class AgentLoopImpl(AgentLoop):
                     span_type="TURN",
                     trace_context=turn_ctx,
                 )
+                # Speculative tool calls dispatched during this turn's streamed LLM
+                # call; whatever the turn did not adopt is cancelled in `finally`.
+                speculative: dict[str, _SpeculativeToolCall] = {}
                 try:
                     yield TurnStarted(turn_num=turn_count, trace_context=ctx)
 
@@ -2368,11 +3225,15 @@ class AgentLoopImpl(AgentLoop):
                         # loop level this sprint — deferred (plan §9 carryover).
                         # The builder's own internal tracer stays NoOp (loop is the
                         # single trace-tree owner, D8).
+                        # Mutated after build() (like the LLM_CALL usage attrs): the
+                        # tracer re-reads it at span close, so the per-build memory
+                        # snapshot hit counts land on the PROMPT_BUILD span.
+                        prompt_attrs: dict[str, Any] = {"span_type": "PROMPT_BUILD"}
                         async with self._tracer.start_span(
                             name="agent_loop.prompt_build",
                             category=SpanCategory.PROMPT_BUILDER,
                             trace_context=turn_ctx,
-                            attributes={"span_type": "PROMPT_BUILD"},
+                            attributes=prompt_attrs,
                         ) as prompt_ctx:
                             _prompt_ctx_t0 = time.monotonic()
                             yield SpanStarted(
@@ -2393,6 +3254,9 @@ class AgentLoopImpl(AgentLoop):
                                     tools=self._tool_registry.list(),
                                     trace_context=ctx,
                                 )
+                                snapshot_attrs = artifact.layer_metadata.get("memory_snapshot")
+                                if isinstance(snapshot_attrs, dict):
+                                    prompt_attrs.update(snapshot_attrs)
                             finally:
                                 yield SpanEnded(
                                     span_name="agent_loop.prompt_build",
@@ -2491,12 +3355,36 @@ class AgentLoopImpl(AgentLoop):
                                 request = ChatRequest(
                                     messages=chat_messages,
                                     tools=self._tool_registry.list(),
+                                    stream=self._stream_llm,
                                 )
-                                response: ChatResponse = await self._chat_client.chat(
-                                    request,
-                                    cache_breakpoints=cache_breakpoints,
-                                    trace_context=ctx,
-                                )
+                                if self._stream_llm:
+                                    # Token streaming: deltas yield as they arrive
+                                    # (inside the LLM_CALL span); the assembled
+                                    # response lands in the sink.
+                                    streamed: list[ChatResponse] = []
+                                    async for ev in self._fold_chat_stream(
+                                        self._chat_client.stream(
+                                            request,
+                                            cache_breakpoints=cache_breakpoints,
+                                            trace_context=ctx,
+                                        ),
+                                        request,
+                                        ctx=ctx,
+                                        chat_messages=chat_messages,
+                                        sink=streamed,
+                                        session_id=session_id,
+                                        speculative=(
+                                            speculative if self._speculative_tool_calls else None
+                                        ),
+                                    ):
+                                        yield ev
+                                    response: ChatResponse = streamed[0]
+                                else:
+                                    response = await self._chat_client.chat(
+                                        request,
+                                        cache_breakpoints=cache_breakpoints,
+                                        trace_context=ctx,
+                                    )
                             except asyncio.CancelledError:
                                 yield LoopCompleted(
                                     stop_reason=TerminationReason.CANCELLED.value,
@@ -2884,337 +3772,26 @@ class AgentLoopImpl(AgentLoop):
                         )
                     )
 
-                    for tc in parsed.tool_calls:
-                        yield ToolCallRequested(
-                            tool_call_id=tc.id,
-                            tool_name=tc.name,
-                            arguments=tc.arguments,
-                            trace_context=ctx,
-                        )
-
-                        # === Cat 9 per tool_call check (53.3 Day 4 US-7) ====
-                        # tool guardrail BLOCK/ESCALATE → inject error ToolResult
-                        #   so LLM sees failure + can self-correct (no loop terminate).
-                        # tripwire trigger → emit TripwireTriggered + LoopCompleted.
-                        cat9_blocked: ToolResult | None = None
-                        cat9_terminated = False
-                        async for ev in self._cat9_tool_check(
-                            tc=tc,
-                            ctx=ctx,
-                            turn_count=turn_count,
-                            session_id=session_id,
-                            messages=messages,
-                            verification_attempts=verification_attempts,
-                        ):
-                            yield ev
-                            if isinstance(ev, LoopCompleted):
-                                cat9_terminated = True
-                            elif isinstance(ev, GuardrailTriggered):
-                                cat9_blocked = ToolResult(
-                                    tool_call_id=tc.id,
-                                    tool_name=tc.name,
-                                    content=(f"tool blocked by guardrail: {ev.reason}"),
-                                    success=False,
-                                    error=ev.reason,
-                                    duration_ms=0.0,
-                                )
-                        if cat9_terminated:
-                            return
-                        if cat9_blocked is not None:
-                            result = cat9_blocked
-                            result_text = self._tool_result_to_text(result.content)
-                            # Append result to messages and skip tool execution.
-                            # (Falls through to the result-append code below.)
-                            messages.append(
-                                Message(
-                                    role="tool",
-                                    content=result_text,
-                                    tool_call_id=tc.id,
-                                )
-                            )
-                            yield ToolCallExecuted(
-                                tool_call_id=tc.id,
-                                tool_name=tc.name,
-                                duration_ms=0.0,
-                                result_content=result_text,
-                                trace_context=ctx,
-                            )
-                            continue
-
-                        # Sprint 55.6 — AD-Cat8-2 retry loop wrap (Option H).
-                        # `attempt_num` starts at 1 (1-indexed per 53.2 docstring).
-                        # On retry: yield ErrorRetried + asyncio.sleep(backoff) +
-                        # increment + `continue`. `break` exits to post-execute
-                        # path (tool_content / yield ToolCallExecuted-or-Failed /
-                        # messages.append) which stays at original indent level.
-                        # When Cat 8 deps None → _should_retry_tool_error returns
-                        # (False, 0.0) → break on first iteration → 53.1 baseline.
-                        attempt_num = 1
-                        while True:
-                            try:
-                                # Sprint 52.5 P0 #18: build ExecutionContext from
-                                # trace_context so memory_tools (and future scoped
-                                # tools) get server-authoritative tenant_id /
-                                # user_id / session_id instead of trusting LLM args.
-                                exec_ctx = ExecutionContext(
-                                    tenant_id=ctx.tenant_id,
-                                    user_id=ctx.user_id,
-                                    session_id=ctx.session_id or session_id,
-                                )
-                                # Sprint 57.71 (A-4 Tier 1): TOOL_EXEC span per
-                                # execute() call, nested under turn_ctx. Latency
-                                # comes from span timing; on a raised exception
-                                # the tracer sets ERROR status + record_exception
-                                # automatically as it propagates through the
-                                # `async with` body (caught by the surrounding
-                                # except clauses afterwards). Parallel / multiple
-                                # tool calls in one turn are sibling TOOL_EXEC
-                                # spans under the same TURN. The span is the loop's
-                                # own (the executor's internal tracer stays NoOp —
-                                # loop is the single trace-tree owner, D8 no double
-                                # spans).
-                                async with self._tracer.start_span(
-                                    name=f"agent_loop.tool.{tc.name}",
-                                    category=SpanCategory.TOOLS,
-                                    trace_context=turn_ctx,
-                                    attributes={"span_type": "TOOL_EXEC", "tool": tc.name},
-                                ) as tool_ctx:
-                                    _tool_ctx_t0 = time.monotonic()
-                                    yield SpanStarted(
-                                        span_name=f"agent_loop.tool.{tc.name}",
-                                        span_id=tool_ctx.span_id,
-                                        parent_span_id=tool_ctx.parent_span_id or "",
-                                        span_type="TOOL_EXEC",
-                                        trace_context=tool_ctx,
-                                    )
-                                    try:
-                                        result = await self._tool_executor.execute(
-                                            tc, trace_context=ctx, context=exec_ctx
-                                        )
-                                    finally:
-                                        yield SpanEnded(
-                                            span_name=f"agent_loop.tool.{tc.name}",
-                                            span_id=tool_ctx.span_id,
-                                            span_type="TOOL_EXEC",
-                                            duration_ms=(time.monotonic() - _tool_ctx_t0) * 1000.0,
-                                            trace_context=tool_ctx,
-                                        )
-                            except asyncio.CancelledError:
-                                yield LoopCompleted(
-                                    stop_reason=TerminationReason.CANCELLED.value,
-                                    total_turns=turn_count,
-                                    trace_context=ctx,
-                                )
-                                raise
-                            except Exception as exc:
-                                # 53.2 Day 4 Cat 8 chain: classify → record budget →
-                                # check terminator. When Cat 8 deps None → re-raise
-                                # (preserves 53.1 baseline).
-                                # Sprint 55.6 D7 fix: pass real attempt_num (was hardcoded
-                                # =1).
-                                terminate, err_class, term_reason, term_detail = (
-                                    await self._handle_tool_error(
-                                        error=exc,
-                                        tool_name=tc.name,
-                                        attempt_num=attempt_num,
-                                        state_version=None,
-                                        trace_context=ctx,
-                                    )
-                                )
-                                if self._error_policy is None:
-                                    # Opt-out path: no Cat 8 deps → preserve 53.1 raise
-                                    # behavior
-                                    raise
-                                if terminate:
-                                    # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): mirror the
-                                    # dominant-path emit — surface the raised tool error's typed
-                                    # taxonomy on the wire BEFORE terminating (classify from the
-                                    # exception here; the synthetic ToolResult is built later, at
-                                    # the LLM-recoverable synthesis, which this FATAL path skips).
-                                    yield ToolCallFailed(
-                                        tool_call_id=tc.id,
-                                        tool_name=tc.name,
-                                        error=repr(exc),
-                                        error_taxonomy=classify_tool_error(
-                                            error_class=(
-                                                f"{type(exc).__module__}.{type(exc).__name__}"
-                                            ),
-                                            error_msg=repr(exc),
-                                        ).value,
-                                        trace_context=ctx,
-                                    )
-                                    yield LoopTerminated(
-                                        reason=(
-                                            term_reason.value if term_reason is not None else ""
-                                        ),
-                                        detail=term_detail,
-                                        last_state_version=None,
-                                        trace_context=ctx,
-                                    )
-                                    return
-
-                                # Sprint 55.6 — AD-Cat8-2 (Option H) retry consultation
-                                # on hard-exception path.
-                                should_retry, backoff_s = await self._should_retry_tool_error(
-                                    error=exc,
-                                    error_class=err_class,
-                                    tool_name=tc.name,
-                                    attempt=attempt_num,
-                                )
-                                if should_retry:
-                                    yield ErrorRetried(
-                                        attempt=attempt_num,
-                                        error_class=err_class.value if err_class else "",
-                                        backoff_ms=backoff_s * 1000.0,
-                                        trace_context=ctx,
-                                    )
-                                    await asyncio.sleep(backoff_s)
-                                    attempt_num += 1
-                                    continue  # retry tool execution
-
-                                # No retry → fall through to LLM-recoverable synthesis.
-                                # Synthesize LLM-recoverable error ToolResult so the
-                                # LLM sees the failure on next turn and can self-correct
-                                # (Cat 8 §LLM-recoverable; Anthropic / LangGraph pattern).
-                                # Sprint 57.144 US-3 (research #7 Half B, B2 full coverage):
-                                # this is the RARE path where the executor ITSELF raised
-                                # (the dominant handler-exception path is enriched inside
-                                # ToolExecutorImpl._build_failure). Route it through the SAME
-                                # Cat 2 taxonomy so both paths agree.
-                                # Sprint 57.164 (Option B decouple): classify ALWAYS (display
-                                # taxonomy, mirrors _build_failure); the lever gates only the
-                                # LLM content ("Error: …" byte-identical default when off).
-                                _tax = classify_tool_error(
-                                    error_class=f"{type(exc).__module__}.{type(exc).__name__}",
-                                    error_msg=repr(exc),
-                                )
-                                if tool_error_reflection_enabled():
-                                    _err_content = render_reflection(_tax, repr(exc))
-                                else:
-                                    _err_content = f"Error: {exc!r}. Please adjust your approach."
-                                _err_taxonomy: str | None = _tax.value
-                                result = ToolResult(
-                                    tool_call_id=tc.id,
-                                    tool_name=tc.name,
-                                    content=_err_content,
-                                    success=False,
-                                    error=repr(exc),
-                                    error_taxonomy=_err_taxonomy,
-                                    duration_ms=0.0,
-                                )
-
-                            # 53.2 Day 4 Cat 8 chain on soft failure: ToolExecutorImpl
-                            # catches handler exceptions internally → ToolResult(success=
-                            # False). Reconstruct a synthetic exception so the Cat 8
-                            # chain can classify + check terminator. When deps None →
-                            # fall through to existing 53.1 baseline (LLM-recoverable
-                            # via tool message).
-                            # Sprint 55.4 (AD-Cat8-3 narrow Option C): pass
-                            # `result.error_class` (FQ class name set by ToolExecutorImpl
-                            # per 53.3 US-9) so classification flows through
-                            # classify_by_string() instead of MRO walk on the generic
-                            # synthetic Exception (which would always return FATAL).
-                            # Sprint 55.6 D7 fix: pass real attempt_num (was hardcoded =1).
-                            if not result.success and self._error_policy is not None:
-                                synthetic = Exception(result.error or "tool soft failure")
-                                terminate, err_class, term_reason, term_detail = (
-                                    await self._handle_tool_error(
-                                        error=synthetic,
-                                        tool_name=tc.name,
-                                        attempt_num=attempt_num,
-                                        state_version=None,
-                                        trace_context=ctx,
-                                        error_class_str=result.error_class,
-                                    )
-                                )
-                                if terminate:
-                                    # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): surface the
-                                    # failed tool's typed taxonomy on the wire BEFORE the loop
-                                    # terminates, so the chat-v2 ToolBlock shows the diagnosis
-                                    # chip (a Cat-8 FATAL tool failure otherwise only yields
-                                    # loop_terminated → the 57.130 "terminated" flip, hiding the
-                                    # taxonomy that _build_failure already computed).
-                                    yield ToolCallFailed(
-                                        tool_call_id=tc.id,
-                                        tool_name=tc.name,
-                                        error=result.error or "unknown tool error",
-                                        error_taxonomy=result.error_taxonomy,
-                                        trace_context=ctx,
-                                    )
-                                    yield LoopTerminated(
-                                        reason=(
-                                            term_reason.value if term_reason is not None else ""
-                                        ),
-                                        detail=term_detail,
-                                        last_state_version=None,
-                                        trace_context=ctx,
-                                    )
-                                    return
-
-                                # Sprint 55.6 — AD-Cat8-2 (Option H) retry consultation
-                                # on soft-failure path.
-                                should_retry, backoff_s = await self._should_retry_tool_error(
-                                    error=synthetic,
-                                    error_class=err_class,
-                                    tool_name=tc.name,
-                                    attempt=attempt_num,
-                                )
-                                if should_retry:
-                                    yield ErrorRetried(
-                                        attempt=attempt_num,
-                                        error_class=err_class.value if err_class else "",
-                                        backoff_ms=backoff_s * 1000.0,
-                                        trace_context=ctx,
-                                    )
-                                    await asyncio.sleep(backoff_s)
-                                    attempt_num += 1
-                                    continue  # retry tool execution
-
-                            # Success or no-retry path → exit retry loop. Post-execute
-                            # code (tool_content / yield ToolCallExecuted-or-Failed /
-                            # messages.append) follows at original indent level.
-                            break
-
-                        # Feed back as tool message — KEY V2 cure for AP-1.
-                        tool_content = self._tool_result_to_text(result.content)
-
-                        # 50.2: emit Cat 2-owned completion event so SSE / frontend
-                        # see tool result text + success/failure.
-                        if result.success:
-                            yield ToolCallExecuted(
-                                tool_call_id=tc.id,
-                                tool_name=tc.name,
-                                duration_ms=result.duration_ms or 0.0,
-                                result_content=tool_content,
-                                trace_context=ctx,
-                            )
-                            # Sprint 57.140 (research #1): after a successful
-                            # write_todos call, re-read the durable list + emit
-                            # TodosUpdated so the chat-v2 Todos panel re-renders the
-                            # plan as the agent maintains it. Name-coupled to the
-                            # builtin tool (the only writer of the todo store).
-                            if tc.name == "write_todos" and self._todo_store is not None:
-                                yield TodosUpdated(
-                                    todos=tuple(await self._todo_store.load()),
-                                    trace_context=ctx,
-                                )
-                        else:
-                            yield ToolCallFailed(
-                                tool_call_id=tc.id,
-                                tool_name=tc.name,
-                                error=result.error or "unknown tool error",
-                                # Sprint 57.164: carry the typed taxonomy to the wire.
-                                error_taxonomy=result.error_taxonomy,
-                                trace_context=ctx,
-                            )
-
-                        messages.append(
-                            Message(
-                                role="tool",
-                                content=tool_content,
-                                tool_call_id=tc.id,
-                            )
-                        )
+                    # Parallel tool calls: the per-call pipeline lives in
+                    # _execute_tool_call; _execute_tool_calls groups the calls by
+                    # ConcurrencyPolicy (parallel-safe runs execute concurrently when
+                    # `parallel_tool_calls` is on) and appends each tool message in
+                    # call order. Events are yielded in call order either way.
+                    tool_outcomes: list[_ToolCallOutcome] = []
+                    async for ev in self._execute_tool_calls(
+                        tool_calls=list(parsed.tool_calls),
+                        outcomes=tool_outcomes,
+                        ctx=ctx,
+                        turn_ctx=turn_ctx,
+                        turn_count=turn_count,
+                        session_id=session_id,
+                        messages=messages,
+                        verification_attempts=verification_attempts,
+                        speculative=speculative,
+                    ):
+                        yield ev
+                    if tool_outcomes and tool_outcomes[-1].terminated:
+                        return
 
                     # === Cat 7 post-tool checkpoint (53.1 Day 3) ================
                     # After all tool results are appended for this turn, persist
@@ -3245,6 +3822,7 @@ class AgentLoopImpl(AgentLoop):
                     # before here) are intentionally excluded.
                     await self._persist_to_ledger(messages[_tool_batch_start:], turn_num=turn_count)
                 finally:
+                    self._discard_speculative(list(speculative.values()))
                     yield SpanEnded(
                         span_name="agent_loop.turn",
                         span_id=turn_ctx.span_id,
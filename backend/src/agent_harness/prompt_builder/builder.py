@@ -36,9 +36,11 @@ Description:
 Owner: 01-eleven-categories-spec.md §範疇 5
 
 Created: 2026-05-01 (Sprint 52.2 Day 1.6)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: optional run-scoped MemorySnapshot (memoized search / profile /
+      recent_sessions across turns) + per-build hit counts in layer_metadata
     - 2026-06-30: Sprint 57.151 — always-on cross-session recall via recent_sessions() (缺口 2)
     - 2026-06-27: Sprint 57.148 — always-on user-identity inject via profile() (memory-formation S1)
     - 2026-06-04: Sprint 57.80 — pending-tool-turn skips user re-anchor (tool-chat convergence)
@@ -73,7 +75,7 @@ from agent_harness._contracts import (
     TraceContext,
 )
 from agent_harness.context_mgmt import PromptCacheManager, TokenCounter
-from agent_harness.memory import MemoryRetrieval
+from agent_harness.memory import MemoryRetrieval, MemorySnapshot
 from agent_harness.prompt_builder._abc import PromptBuilder
 from agent_harness.prompt_builder.strategies import (
     LostInMiddleStrategy,
@@ -182,6 +184,10 @@ class DefaultPromptBuilder(PromptBuilder):
       - max_memory_tokens: budget cap for the rendered memory block (Sprint 57.65;
         default 2000). When the retrieved hints exceed this, the builder drops the
         lowest-confidence (then oldest) hints until the block fits.
+      - memory_snapshot: optional run-scoped MemorySnapshot over memory_retrieval.
+        When set, every memory read goes through it, so turns 2..N of a run reuse
+        turn 1's results until a memory write invalidates them. None (the
+        default) reads memory_retrieval directly on every build.
     """
 
     def __init__(
@@ -197,8 +203,13 @@ class DefaultPromptBuilder(PromptBuilder):
         max_memory_tokens: int = 2000,
         profile_top_k: int = 5,
         recent_sessions_top_k: int = 3,
+        memory_snapshot: MemorySnapshot | None = None,
     ) -> None:
         self._memory_retrieval = memory_retrieval
+        self._memory_snapshot = memory_snapshot
+        self._memory_reader: MemoryRetrieval | MemorySnapshot = (
+            memory_snapshot if memory_snapshot is not None else memory_retrieval
+        )
         self._cache_manager = cache_manager
         self._token_counter = token_counter
         self._tracer: Tracer = tracer if tracer is not None else _NoOpTracer()
@@ -248,6 +259,11 @@ class DefaultPromptBuilder(PromptBuilder):
             tools_list: list[ToolSpec] = tools if tools is not None else []
             user_msg = self._extract_last_user_message(state)
             query_text = self._message_to_query(user_msg) if user_msg else ""
+            snapshot_before = (
+                (self._memory_snapshot.stats.hits, self._memory_snapshot.stats.misses)
+                if self._memory_snapshot is not None
+                else None
+            )
 
             memory_layers = await self._inject_memory_layers(
                 tenant_id=tenant_id,
@@ -267,7 +283,7 @@ class DefaultPromptBuilder(PromptBuilder):
             # Degrade per the W3-2 theme: a profile() failure never crashes build.
             if user_id is not None:
                 try:
-                    profile_hints = await self._memory_retrieval.profile(
+                    profile_hints = await self._memory_reader.profile(
                         tenant_id=tenant_id,
                         user_id=user_id,
                         top_k=self._profile_top_k,
@@ -298,7 +314,7 @@ class DefaultPromptBuilder(PromptBuilder):
             # degrade as profile(): a failure never crashes build.
             if user_id is not None:
                 try:
-                    recent_hints = await self._memory_retrieval.recent_sessions(
+                    recent_hints = await self._memory_reader.recent_sessions(
                         tenant_id=tenant_id,
                         user_id=user_id,
                         exclude_session_id=state.durable.session_id,
@@ -404,17 +420,26 @@ class DefaultPromptBuilder(PromptBuilder):
                 for layer, hints in memory_layers.items()
                 for hint in hints
             ]
+            layer_metadata: dict[str, object] = {
+                "memory_layers_used": list(memory_layers.keys()),
+                "memory_accesses": memory_accesses,
+                "position_strategy": strategy.__class__.__name__,
+                "cache_sections": [bp.section_id for bp in cache_breakpoints if bp.section_id],
+                "trace_id": child_ctx.trace_id,
+            }
+            # This build's snapshot hits / misses — the loop copies them onto the
+            # PROMPT_BUILD span attributes. Absent when no snapshot is wired.
+            if self._memory_snapshot is not None and snapshot_before is not None:
+                layer_metadata["memory_snapshot"] = {
+                    "memory_snapshot_hits": self._memory_snapshot.stats.hits - snapshot_before[0],
+                    "memory_snapshot_misses": self._memory_snapshot.stats.misses
+                    - snapshot_before[1],
+                }
             return PromptArtifact(
                 messages=messages,
                 cache_breakpoints=cache_breakpoints,
                 estimated_input_tokens=estimated_tokens,
-                layer_metadata={
-                    "memory_layers_used": list(memory_layers.keys()),
-                    "memory_accesses": memory_accesses,
-                    "position_strategy": strategy.__class__.__name__,
-                    "cache_sections": [bp.section_id for bp in cache_breakpoints if bp.section_id],
-                    "trace_id": child_ctx.trace_id,
-                },
+                layer_metadata=layer_metadata,
             )
         finally:
             span.end()
@@ -651,7 +676,7 @@ class DefaultPromptBuilder(PromptBuilder):
             return {}
 
         try:
-            hints = await self._memory_retrieval.search(
+            hints = await self._memory_reader.search(
                 query=query,
                 tenant_id=tenant_id,
                 user_id=user_id,
@@ -1,6 +1,12 @@
 """Category 7: State Mgmt (checkpointer + reducer). See README.md."""
 
-from agent_harness.state_mgmt._abc import Checkpointer, MessageStore, Reducer, TodoStore
+from agent_harness.state_mgmt._abc import (
+    LEDGER_SEQ_KEY,
+    Checkpointer,
+    MessageStore,
+    Reducer,
+    TodoStore,
+)
 from agent_harness.state_mgmt.checkpointer import (
     DBCheckpointer,
     StateMismatchError,
@@ -13,6 +19,7 @@ from agent_harness.state_mgmt.todo_store import DBTodoStore
 __all__ = [
     "Checkpointer",
     "MessageStore",
+    "LEDGER_SEQ_KEY",
     "TodoStore",
     "Reducer",
     "DefaultReducer",
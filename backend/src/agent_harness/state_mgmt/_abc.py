@@ -17,9 +17,11 @@ Owner: 01-eleven-categories-spec.md §範疇 7
 Single-source: 17.md §2.1
 
 Created: 2026-04-29 (Sprint 49.1)
-Last Modified: 2026-06-16
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: MessageStore.save_checkpoint() + LEDGER_SEQ_KEY — compaction checkpoints
+    - 2026-10-16: MessageStore.load_since() — windowed ledger tail (incremental summary)
     - 2026-06-24: Sprint 57.140 — add TodoStore ABC (per-session durable todo list)
     - 2026-06-16: Sprint 57.127 — add MessageStore ABC (per-session message ledger)
 """
@@ -32,6 +34,12 @@ from typing import Any
 from agent_harness._contracts import LoopState, Message, StateVersion, TraceContext
 from agent_harness._contracts.todo import Todo
 
+# Message.metadata key a MessageStore stamps on every message it loads or
+# appends: the message's ledger sequence_num. The loop reads it after a
+# compaction to tell which ledger prefix the summary replaced (local
+# bookkeeping — metadata is never sent to the provider).
+LEDGER_SEQ_KEY = "ledger_seq"
+
 
 class Checkpointer(ABC):
     """Persists LoopState snapshots; supports time-travel."""
@@ -90,6 +98,30 @@ class MessageStore(ABC):
         session MAX). Best-effort — a persistence failure MUST NOT break the loop."""
         ...
 
+    async def load_since(self, after_sequence_num: int) -> tuple[list[Message], int]:
+        """Messages after `after_sequence_num` (oldest-first) + the last sequence_num.
+
+        The windowed read for the incremental session summarizer. sequence_num is
+        1-based and gapless per session, so this default slices load(); DB-backed
+        impls override it with a range query. With no newer messages the returned
+        sequence_num is `after_sequence_num` unchanged.
+        """
+        messages = await self.load()
+        start = max(after_sequence_num, 0)
+        return messages[start:], max(len(messages), start)
+
+    async def save_checkpoint(self, summary: Message, *, through_sequence_num: int) -> None:
+        """Record a compaction checkpoint: `summary` stands in for every ledger
+        message up to and including `through_sequence_num`.
+
+        A checkpointing impl's load() then returns the summary plus only the
+        messages after it, so rehydration cost tracks the live window rather
+        than the session's age. The ledger rows themselves are never touched
+        (load_since() still reads full history). Default: no-op — stores that
+        do not checkpoint keep returning the whole ledger from load().
+        """
+        return None
+
 
 class TodoStore(ABC):
     """Persists + rehydrates the per-session durable todo list (Sprint 57.140).
@@ -23,6 +23,14 @@ Description:
     for the frontend history UI). It is the "production should use a dedicated
     messages table" path the loop.py 57.88 SPIKE NOTE called for.
 
+    Compaction checkpoints (CHAT_LEDGER_CHECKPOINTS): when the loop's semantic
+    compaction replaces a ledger prefix with a summary, save_checkpoint() upserts
+    that summary + the sequence_num it covers into `message_checkpoints`; load()
+    then returns the summary plus only the rows after it (a keyset read on
+    (session_id, sequence_num)), so a long-lived session's send loads the live
+    window, not its whole history. The covered rows are never deleted —
+    load_since() still reads the full ledger (replay / audit / summarizer).
+
     Best-effort: a persistence failure (append) or a read failure (load) MUST NOT
     break the loop — append swallows + logs (a missed ledger write only costs the
     next send some context), load returns [] (degrades to single-turn, today's
@@ -34,9 +42,12 @@ Key Components:
     - DBMessageStore: production impl of the MessageStore ABC
 
 Created: 2026-06-16 (Sprint 57.127)
-Last Modified: 2026-06-25
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: append() — counter-allocated sequence_nums + one multi-row INSERT ... RETURNING
+    - 2026-10-16: compaction checkpoints — save_checkpoint() + windowed load(); ledger_seq tags
+    - 2026-10-16: load_since() — range read of the ledger tail (incremental session summary)
     - 2026-06-25: Sprint 57.143 — own-session ctor+commit (closes AD-UserStop-Resume-Context)
     - 2026-06-16: Initial creation (Sprint 57.127) — messages-table ledger (load + append)
 
@@ -44,6 +55,7 @@ Related:
     - state_mgmt/_abc.py §MessageStore — the ABC this implements
     - _contracts/message_serde.py — _message_to_dict / _message_from_dict row serde
     - infrastructure/db/models/sessions.py §Message — the partitioned ORM table
+    - infrastructure/db/models/sessions.py §MessageCheckpoint — the checkpoint row (0037)
     - api/v1/chat/_category_factories.py §make_chat_message_store — the wiring factory
     - platform_layer/transcripts/retention.py — own-session set_config write-to-messages precedent
     - 09-db-schema-design.md Group 2 (messages table) + multi-tenant-data.md (tenant 鐵律)
@@ -52,15 +64,19 @@ Related:
 from __future__ import annotations
 
 import logging
+from typing import Any
 from uuid import UUID, uuid4
 
-from sqlalchemy import func, select, text
+from sqlalchemy import Insert, func, insert, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from agent_harness._contracts import Message
 from agent_harness._contracts.message_serde import _message_from_dict, _message_to_dict
-from agent_harness.state_mgmt._abc import MessageStore
+from agent_harness.state_mgmt._abc import LEDGER_SEQ_KEY, MessageStore
 from infrastructure.db.models.sessions import Message as MessageRow
+from infrastructure.db.models.sessions import MessageCheckpoint as CheckpointRow
+from infrastructure.db.models.sessions import Session as SessionRow
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +111,10 @@ class DBMessageStore(MessageStore):
     OWN short-lived session, set the RLS tenant context, and append() commits
     immediately. Both always scope to the bound session + tenant (multi-tenant
     鐵律), so the ABC needs no session_id/tenant_id per call.
+
+    With `checkpoints=True` load() starts from the latest compaction checkpoint
+    and save_checkpoint() records new ones; off, load() reads the whole ledger
+    and save_checkpoint() is a no-op.
     """
 
     def __init__(
@@ -103,10 +123,12 @@ class DBMessageStore(MessageStore):
         *,
         session_id: UUID,
         tenant_id: UUID,
+        checkpoints: bool = False,
     ) -> None:
         self._factory = session_factory
         self._session_id = session_id
         self._tenant_id = tenant_id
+        self._checkpoints = checkpoints
 
     async def _set_tenant(self, db: AsyncSession) -> None:
         """SET LOCAL app.tenant_id for this txn — `messages` is FORCE ROW LEVEL SECURITY.
@@ -125,22 +147,42 @@ class DBMessageStore(MessageStore):
         """Return the bound session's prior messages oldest-first (best-effort).
 
         Opens its own session (committed-only view) so it sees every prior append
-        regardless of the request transaction's state.
+        regardless of the request transaction's state. With checkpoints on and a
+        checkpoint recorded, the result is [checkpoint summary, *rows after it];
+        each message carries its sequence_num under metadata[LEDGER_SEQ_KEY] (the
+        summary carries the sequence_num it covers).
         """
         try:
             async with self._factory() as db:
                 await self._set_tenant(db)
+                head: list[Message] = []
+                after_seq = 0
+                if self._checkpoints:
+                    checkpoint = (
+                        await db.execute(
+                            select(CheckpointRow.through_seq, CheckpointRow.summary).where(
+                                CheckpointRow.session_id == self._session_id,
+                                CheckpointRow.tenant_id == self._tenant_id,
+                            )
+                        )
+                    ).one_or_none()
+                    if checkpoint is not None:
+                        summary = _message_from_dict(checkpoint.summary)
+                        summary.metadata["compacted_summary"] = True
+                        summary.metadata[LEDGER_SEQ_KEY] = int(checkpoint.through_seq)
+                        head = [summary]
+                        after_seq = int(checkpoint.through_seq)
                 stmt = (
-                    select(MessageRow)
+                    select(MessageRow.sequence_num, MessageRow.content)
                     .where(
                         MessageRow.session_id == self._session_id,
                         MessageRow.tenant_id == self._tenant_id,
+                        MessageRow.sequence_num > after_seq,
                     )
                     .order_by(MessageRow.sequence_num)
                 )
-                result = await db.execute(stmt)
-                rows = result.scalars().all()
-                return [_message_from_dict(row.content) for row in rows]
+                rows = (await db.execute(stmt)).all()
+                return head + [_tagged(row.content, row.sequence_num) for row in rows]
         except (
             Exception
         ):  # noqa: BLE001 — a read failure degrades to no prior context, never breaks the send
@@ -149,45 +191,138 @@ class DBMessageStore(MessageStore):
             )
             return []
 
+    async def load_since(self, after_sequence_num: int) -> tuple[list[Message], int]:
+        """Messages with sequence_num > after_sequence_num + the last one read (best-effort).
+
+        A (session_id, sequence_num) range read, so the post-send summarizer loads
+        only the unsummarized tail instead of the whole ledger. A read failure
+        returns ([], after_sequence_num) — nothing new to fold in.
+        """
+        try:
+            async with self._factory() as db:
+                await self._set_tenant(db)
+                stmt = (
+                    select(MessageRow.sequence_num, MessageRow.content)
+                    .where(
+                        MessageRow.session_id == self._session_id,
+                        MessageRow.tenant_id == self._tenant_id,
+                        MessageRow.sequence_num > after_sequence_num,
+                    )
+                    .order_by(MessageRow.sequence_num)
+                )
+                rows = (await db.execute(stmt)).all()
+        except Exception:  # noqa: BLE001 — degrade to "nothing new", never break the send
+            logger.exception("DBMessageStore.load_since failed (best-effort)")
+            return [], after_sequence_num
+        if not rows:
+            return [], after_sequence_num
+        return [_tagged(row.content, row.sequence_num) for row in rows], int(rows[-1].sequence_num)
+
     async def append(self, messages: list[Message], *, turn_num: int) -> None:
         """Append NEW messages in their OWN committed transaction (best-effort).
 
-        sequence_num continues from the session MAX. Committing here (not via a
-        request-scoped SAVEPOINT) makes each append durable the moment it runs —
-        so a mid-run user Stop (which rolls back the SSE request txn) still
-        preserves the turn-0 prompt + any completed tool batches (AD-UserStop-
-        Resume-Context).
+        One statement allocates the batch's sequence_nums from the session's
+        counter (sessions.last_message_seq) and inserts every row — a multi-row
+        INSERT ... RETURNING — so a batch costs set_config + 1 statement + commit
+        regardless of its size. Committing here (not via a request-scoped
+        SAVEPOINT) makes each append durable the moment it runs — so a mid-run
+        user Stop (which rolls back the SSE request txn) still preserves the
+        turn-0 prompt + any completed tool batches (AD-UserStop-Resume-Context).
         """
         if not messages:
             return
         try:
             async with self._factory() as db:
                 await self._set_tenant(db)
-                start = await self._next_sequence_num(db)
-                for offset, msg in enumerate(messages):
-                    db.add(
-                        MessageRow(
-                            id=uuid4(),
-                            session_id=self._session_id,
-                            tenant_id=self._tenant_id,
-                            sequence_num=start + offset,
-                            turn_num=turn_num,
-                            role=msg.role,
-                            content_type="text" if isinstance(msg.content, str) else "blocks",
-                            content=_message_to_dict(msg),
-                        )
-                    )
+                result = await db.execute(self._append_stmt(messages, turn_num=turn_num))
+                sequence_nums = sorted(int(seq) for seq in result.scalars().all())
                 await db.commit()
         except (
             Exception
         ):  # noqa: BLE001 — a ledger-write failure only costs the next send some context
             logger.exception("DBMessageStore.append failed (best-effort)")
+            return
+        for msg, seq in zip(messages, sequence_nums):
+            msg.metadata[LEDGER_SEQ_KEY] = seq
+
+    def _append_stmt(self, messages: list[Message], *, turn_num: int) -> Insert:
+        """WITH alloc AS (UPDATE sessions ... RETURNING base) INSERT ... RETURNING.
 
-    async def _next_sequence_num(self, db: AsyncSession) -> int:
-        """The next sequence_num for the bound session (MAX + 1; 1 for a fresh session)."""
-        stmt = select(func.coalesce(func.max(MessageRow.sequence_num), 0)).where(
-            MessageRow.session_id == self._session_id,
-            MessageRow.tenant_id == self._tenant_id,
+        The counter UPDATE row-locks the session, so concurrent appends to one
+        session get disjoint ranges (the old MAX(sequence_num)+1 read could hand
+        two writers the same start). A data-modifying CTE runs exactly once, so
+        every VALUES row reads the same `base`.
+        """
+        count = len(messages)
+        alloc = (
+            update(SessionRow)
+            .where(
+                SessionRow.id == self._session_id,
+                SessionRow.tenant_id == self._tenant_id,
+            )
+            .values(last_message_seq=SessionRow.last_message_seq + count)
+            .returning((SessionRow.last_message_seq - count).label("base"))
+            .cte("alloc")
         )
-        result = await db.execute(stmt)
-        return int(result.scalar_one()) + 1
+        base = select(alloc.c.base).scalar_subquery()
+        return (
+            insert(MessageRow)
+            .values(
+                [
+                    {
+                        "id": uuid4(),
+                        "session_id": self._session_id,
+                        "tenant_id": self._tenant_id,
+                        "sequence_num": base + (offset + 1),
+                        "turn_num": turn_num,
+                        "role": msg.role,
+                        "content_type": "text" if isinstance(msg.content, str) else "blocks",
+                        "content": _message_to_dict(msg),
+                    }
+                    for offset, msg in enumerate(messages)
+                ]
+            )
+            .add_cte(alloc)
+            .returning(MessageRow.sequence_num)
+        )
+
+    async def save_checkpoint(self, summary: Message, *, through_sequence_num: int) -> None:
+        """Upsert the session's compaction checkpoint (best-effort; no-op when off).
+
+        A checkpoint only ever moves forward: an upsert whose through_sequence_num
+        is not past the stored one is ignored, so a stale or out-of-order save
+        cannot make load() re-skip rows a newer summary does not cover.
+        """
+        if not self._checkpoints or through_sequence_num <= 0:
+            return
+        payload = _message_to_dict(summary)
+        try:
+            async with self._factory() as db:
+                await self._set_tenant(db)
+                stmt = pg_insert(CheckpointRow).values(
+                    id=uuid4(),
+                    tenant_id=self._tenant_id,
+                    session_id=self._session_id,
+                    through_seq=through_sequence_num,
+                    summary=payload,
+                )
+                stmt = stmt.on_conflict_do_update(
+                    constraint="uq_message_checkpoints_session",
+                    set_={
+                        "through_seq": stmt.excluded.through_seq,
+                        "summary": stmt.excluded.summary,
+                        "updated_at": func.now(),
+                    },
+                    where=CheckpointRow.through_seq < stmt.excluded.through_seq,
+                )
+                await db.execute(stmt)
+                await db.commit()
+        except Exception:  # noqa: BLE001 — a missed checkpoint only costs a longer next load
+            logger.exception("DBMessageStore.save_checkpoint failed (best-effort)")
+
+
+def _tagged(content: dict[str, Any], sequence_num: int) -> Message:
+    """Deserialize one ledger row, stamping its sequence_num into the metadata."""
+    msg = _message_from_dict(content)
+    msg.metadata[LEDGER_SEQ_KEY] = int(sequence_num)
+    return msg
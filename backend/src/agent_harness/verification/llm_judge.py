@@ -24,9 +24,10 @@ Owner: 01-eleven-categories-spec.md §範疇 10
 Single-source: 17.md §2.1 (Verifier ABC) / §1.1 (VerificationResult)
 
 Created: 2026-05-04 (Sprint 54.1 Day 2)
-Last Modified: 2026-07-01
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: temperature-0 judge requests marked RESPONSE_CACHEABLE_OPTION
     - 2026-07-01: Sprint 57.153 — memory-aware {memory} judge grounding block
     - 2026-06-13: Sprint 57.111 A3 — trace-aware {trace} prompt + optional judge temperature
     - 2026-06-05: Sprint 57.82 — capture response.usage + model into result (B-8 cost-ledger)
@@ -47,7 +48,7 @@ from agent_harness._contracts import (
     TraceContext,
     VerificationResult,
 )
-from agent_harness._contracts.chat import ChatRequest
+from agent_harness._contracts.chat import RESPONSE_CACHEABLE_OPTION, ChatRequest
 from agent_harness.observability import Tracer
 from agent_harness.verification._abc import Verifier
 from agent_harness.verification._obs import verification_span
@@ -99,6 +100,11 @@ class LLMJudgeVerifier(Verifier):
                 request = ChatRequest(
                     messages=[Message(role="user", content=prompt)],
                     temperature=self._temperature,
+                    # Only a temperature-0 verdict is a pure function of the prompt;
+                    # a sampled judge must stay fresh, so it is never cache-served.
+                    extra_options=(
+                        {RESPONSE_CACHEABLE_OPTION: True} if self._temperature == 0.0 else None
+                    ),
                 )
                 response = await self._chat.chat(request, trace_context=trace_context)
                 result = self._parse_response(response.content)
@@ -24,9 +24,15 @@ Description:
     - Static / CORS config (depends on frontend deploy decision; Phase 55)
 
 Created: 2026-04-29 (Sprint 49.4 Day 5)
-Last Modified: 2026-07-23
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: _lifespan shutdown closes the memory vector index (write-through queue)
+    - 2026-10-16: _lifespan shutdown drains the shared coalescing embedding client
+    - 2026-10-16: _start_chat_registries() — Redis-backed chat session + inject registries
+    - 2026-10-16: _lifespan starts / stops the memory-formation worker pool (formation queue)
+    - 2026-10-16: _lifespan shutdown closes the pooled async Qdrant client (vector store)
+    - 2026-10-16: _lifespan shutdown closes the pooled Azure LLM clients
     - 2026-07-23: Sprint 57.167 — _warn_business_domain_mock() at startup (de-Potemkin 1)
     - 2026-06-17: Sprint 57.135 — scheduled transcript-retention sweep job (billing-drainer mirror)
     - 2026-06-13: Sprint 57.112 — mount mfa router (TOTP enroll/confirm/verify; IAM Block C)
@@ -432,6 +438,62 @@ async def _start_transcript_retention_job(app: FastAPI) -> None:
         logger.warning("api.main: transcript retention job not started (fail-open)", exc_info=True)
 
 
+async def _start_chat_registries() -> None:
+    """Swap in the Redis-backed chat registries when CHAT_REGISTRY_BACKEND=redis (fail-open).
+
+    Session status / cancel and mid-run inject then work from any uvicorn worker:
+    each worker heartbeats ownership keys for its runs and listens on its own
+    pub/sub channel for cancels / injects routed to it. A Redis error here
+    leaves the in-memory registries in place (single-worker semantics), and a
+    remote cancel also stops the owner's resumable-stream producer.
+    """
+    try:
+        from core.config import get_settings
+
+        settings = get_settings()
+        if settings.chat_registry_backend != "redis":
+            return
+        from redis.asyncio import Redis
+
+        from api.v1.chat.redis_registry import start_redis_registries
+        from api.v1.chat.stream_hub import get_default_stream_hub
+
+        bus = await start_redis_registries(
+            Redis.from_url(settings.redis_url),
+            owner_ttl_sec=settings.chat_registry_owner_ttl_sec,
+            heartbeat_sec=settings.chat_registry_heartbeat_sec,
+            finished_ttl_sec=settings.chat_registry_finished_ttl_sec,
+            on_cancel=lambda tenant_id, session_id: get_default_stream_hub().cancel(
+                tenant_id, session_id
+            ),
+        )
+        logger.info("api.main: redis chat registries wired (worker=%s)", bus.worker_id)
+    except Exception:  # noqa: BLE001 — fail-open: stay on the in-memory registries
+        logger.warning(
+            "api.main: redis chat registries not wired; in-memory (fail-open)", exc_info=True
+        )
+
+
+def _start_formation_pool() -> None:
+    """Start the memory-formation worker pool when CHAT_MEMORY_FORMATION_QUEUE is set (fail-open).
+
+    "off" (default) → nothing starts and formation stays inline in the chat
+    BackgroundTask. A startup failure is logged; the router's enqueue still works
+    ("postgres" jobs wait durably for the next process that starts the pool).
+    """
+    try:
+        from api.v1.chat.formation_queue import start_formation_pool
+
+        pool = start_formation_pool()
+        if pool is not None:
+            logger.info(
+                "api.main: memory formation pool started (concurrency=%d)",
+                pool.config.concurrency,
+            )
+    except Exception:  # noqa: BLE001 — fail-open: never block startup on the pool
+        logger.warning("api.main: memory formation pool not started (fail-open)", exc_info=True)
+
+
 async def _warm_knowledge_index(app: FastAPI) -> None:
     """Build the process-wide knowledge vector index at startup — NO blocking ingest (fail-soft).
 
@@ -472,6 +534,8 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
     _warn_business_domain_mock()
     await _start_billing_outbox_drainer(app)
     await _start_transcript_retention_job(app)
+    _start_formation_pool()
+    await _start_chat_registries()
     await _warm_knowledge_index(app)
     logger.info("api.main: startup complete")
     try:
@@ -499,6 +563,35 @@ async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
                 await asyncio.wait_for(_ret_task, timeout=10)
             except (TimeoutError, asyncio.TimeoutError, asyncio.CancelledError):
                 _ret_task.cancel()
+        # Memory-formation worker pool (CHAT_MEMORY_FORMATION_QUEUE): bounded wait for
+        # in-flight jobs before the LLM clients + engine below are torn down.
+        from api.v1.chat.formation_queue import stop_formation_pool
+
+        await stop_formation_pool()
+        # Redis chat registries (CHAT_REGISTRY_BACKEND=redis): stop the listener +
+        # heartbeat and release this worker's ownership keys; a no-op otherwise.
+        from api.v1.chat.redis_registry import stop_redis_registries
+
+        await stop_redis_registries()
+        # Memory vector index (MEMORY_VECTOR_WRITE_THROUGH): apply queued write-through
+        # ops and cancel background reconciles while the embedder + store are still up.
+        from api.v1.chat.memory_vector_index import close_memory_vector_index
+
+        await close_memory_vector_index()
+        # Shared coalescing embedding client (EMBEDDING_CACHE): finish queued batches
+        # and their shared-tier cache writes; a no-op when it was never built.
+        from api.v1.chat.embedding_client import drain_embedding_client
+
+        await drain_embedding_client()
+        # Pooled Azure LLM clients (LLM_CLIENT_POOL): close their keep-alive
+        # connections once; a no-op when the pool was never built.
+        from adapters.azure_openai.client_pool import close_azure_client_pool
+
+        await close_azure_client_pool()
+        # Pooled async Qdrant client (QDRANT_ASYNC_CLIENT); a no-op when never built.
+        from api.v1.chat.vector_store import close_vector_store
+
+        await close_vector_store()
         await shutdown_opentelemetry()
         await dispose_engine()
         logger.info("api.main: shutdown complete")
@@ -43,9 +43,10 @@ Key Components:
     - get_tenant / update_tenant (Sprint 57.3)
 
 Created: 2026-05-06 (Sprint 56.1 Day 1)
-Last Modified: 2026-06-16
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: GET list + /{id}/members — keyset `cursor` (no count) + NDJSON streaming mode
     - 2026-06-16: Sprint 57.124 — HITLPolicy PUT cross-field validator (auto<require → 422)
     - 2026-06-15: Sprint 57.119 — Skills system-visibility: +GET /{id}/skills/system (read-only)
     - 2026-06-15: Sprint 57.117 — Skills quota: instructions max_length + SkillListResponse limits
@@ -90,7 +91,8 @@ from datetime import datetime, timedelta, timezone
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from sqlalchemy import func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -99,6 +101,14 @@ from agent_harness._contracts import SUBAGENT_FAILURE_POLICIES
 from agent_harness._contracts.hitl import HITLPolicy, RiskLevel
 from agent_harness.skills import get_default_skill_registry
 from agent_harness.verification.templates import list_templates
+from api.v1.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    ndjson_response,
+    stream_scalars,
+    wants_ndjson,
+)
 from core.feature_flags import FeatureFlagNotFoundError, get_feature_flags_service
 from infrastructure.db.audit_helper import append_audit
 from infrastructure.db.models.agent_catalog import AgentCatalog
@@ -243,9 +253,24 @@ class TenantListResponse(BaseModel):
     """Paginated list response wrapper (Sprint 57.4 US-1)."""
 
     items: list[TenantListItem]
-    total: int
+    total: int | None  # None on a cursor request (the count is skipped)
     limit: int
     offset: int
+    next_cursor: str | None = None
+
+
+_CURSOR_DESCRIPTION = (
+    "Opaque pagination cursor from previous response.next_cursor (replaces offset; "
+    "skips the total count)"
+)
+
+
+def _check_cursor_offset(cursor: str | None, offset: int) -> None:
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and offset are mutually exclusive",
+        )
 
 
 @router.get(
@@ -254,14 +279,16 @@ class TenantListResponse(BaseModel):
     dependencies=[Depends(require_admin_platform_role)],
 )
 async def list_tenants(
+    request: Request,
     state: TenantState | None = Query(None),
     plan: TenantPlan | None = Query(None),
     region: str | None = Query(None, max_length=32),
     search: str | None = Query(None, max_length=128),
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
     db: AsyncSession = Depends(get_db_session),
-) -> TenantListResponse:
+) -> TenantListResponse | StreamingResponse:
     """List tenants with optional filter by state / plan + ILIKE search.
 
     Sprint 57.4 (US-1) — closes plan-time D1 RED finding (backend was
@@ -269,8 +296,13 @@ async def list_tenants(
     Tenants Console frontend page (US-2..US-5).
 
     Auth: super-admin only via require_admin_platform_role.
-    Order: created_at DESC (newest first).
+    Order: created_at DESC, id DESC (newest first).
+
+    Offset pages keep the `total` count; a `cursor` request seeks past the
+    cursor row over idx_tenants_created and skips the count. Every page carries
+    `next_cursor`. `Accept: application/x-ndjson` streams every matching tenant.
     """
+    _check_cursor_offset(cursor, offset)
     base_stmt = select(Tenant)
     if state is not None:
         base_stmt = base_stmt.where(Tenant.state == state)
@@ -281,21 +313,35 @@ async def list_tenants(
     if search is not None:
         like = f"%{search}%"
         base_stmt = base_stmt.where(or_(Tenant.code.ilike(like), Tenant.display_name.ilike(like)))
+    if cursor is not None:
+        after = decode_cursor(cursor, datetime, UUID)
+        base_stmt = base_stmt.where(
+            keyset_after((Tenant.created_at, Tenant.id), after, descending=True)
+        )
 
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total_raw = (await db.execute(count_stmt)).scalar()
-    total = int(total_raw or 0)
+    ordered = base_stmt.order_by(Tenant.created_at.desc(), Tenant.id.desc())
+    if wants_ndjson(request):
+        rows_iter = stream_scalars(db, ordered.offset(offset))
+        return ndjson_response(TenantListItem.model_validate(t) async for t in rows_iter)
 
-    page_stmt = (
-        base_stmt.order_by(Tenant.created_at.desc(), Tenant.id.desc()).limit(limit).offset(offset)
-    )
-    rows = (await db.execute(page_stmt)).scalars().all()
+    total: int | None = None
+    if cursor is None:
+        count_stmt = select(func.count()).select_from(base_stmt.subquery())
+        total_raw = (await db.execute(count_stmt)).scalar()
+        total = int(total_raw or 0)
+
+    rows = (await db.execute(ordered.limit(limit + 1).offset(offset))).scalars().all()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
 
     return TenantListResponse(
-        items=[TenantListItem.model_validate(t) for t in rows],
+        items=[TenantListItem.model_validate(t) for t in page],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
@@ -781,9 +827,10 @@ class TenantMemberListResponse(BaseModel):
     """Paginated response for tenant member list."""
 
     items: list[TenantMemberItem]
-    total: int
+    total: int | None  # None on a cursor request (the count is skipped)
     limit: int
     offset: int
+    next_cursor: str | None = None
 
 
 @router.get(
@@ -793,41 +840,60 @@ class TenantMemberListResponse(BaseModel):
 )
 async def list_tenant_members(
     tenant_id: UUID,
+    request: Request,
     limit: int = Query(50, ge=1, le=200),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
     db: AsyncSession = Depends(get_db_session),
-) -> TenantMemberListResponse:
+) -> TenantMemberListResponse | StreamingResponse:
     """List Users in this tenant (Sprint 57.47 Track B Day 1 stretch).
 
     Auth: require_tenant_match_or_platform_admin (mirrors GET /{tenant_id}
     pattern Sprint 57.13 US-A3) — platform admins read any tenant; a regular
     user reads only their own tenant's members.
 
-    Order: created_at DESC (newest first).
+    Order: created_at DESC, id DESC (newest first). Pagination as GET list:
+    offset + total, or `cursor` (no count); NDJSON streams every member.
 
     Returns 5 fields per User (id/email/display_name/status/created_at).
     role/last_active/capacity_pct columns in mockup fixture are NOT in the
     current User ORM; frontend will display placeholders or hide those
     columns until Phase 58+ adds role/activity tracking.
     """
+    _check_cursor_offset(cursor, offset)
     # Confirm tenant exists (404 else, consistent with GET /{tenant_id} pattern)
     await _load_tenant_or_404(db, tenant_id)
 
     base_stmt = select(User).where(User.tenant_id == tenant_id)
-    count_stmt = select(func.count()).select_from(base_stmt.subquery())
-    total_raw = (await db.execute(count_stmt)).scalar()
-    total = int(total_raw or 0)
+    if cursor is not None:
+        after = decode_cursor(cursor, datetime, UUID)
+        base_stmt = base_stmt.where(
+            keyset_after((User.created_at, User.id), after, descending=True)
+        )
 
-    page_stmt = (
-        base_stmt.order_by(User.created_at.desc(), User.id.desc()).limit(limit).offset(offset)
-    )
-    rows = (await db.execute(page_stmt)).scalars().all()
+    ordered = base_stmt.order_by(User.created_at.desc(), User.id.desc())
+    if wants_ndjson(request):
+        rows_iter = stream_scalars(db, ordered.offset(offset))
+        return ndjson_response(TenantMemberItem.model_validate(u) async for u in rows_iter)
+
+    total: int | None = None
+    if cursor is None:
+        count_stmt = select(func.count()).select_from(base_stmt.subquery())
+        total_raw = (await db.execute(count_stmt)).scalar()
+        total = int(total_raw or 0)
+
+    rows = (await db.execute(ordered.limit(limit + 1).offset(offset))).scalars().all()
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1].created_at, page[-1].id)
 
     return TenantMemberListResponse(
-        items=[TenantMemberItem.model_validate(u) for u in rows],
+        items=[TenantMemberItem.model_validate(u) for u in page],
         total=total,
         limit=limit,
         offset=offset,
+        next_cursor=next_cursor,
     )
 
 
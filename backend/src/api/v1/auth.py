@@ -34,9 +34,10 @@ Description:
     real tenants.id (no more placeholder UUIDs).
 
 Created: 2026-05-09 (Sprint 57.7 Day 1 PM)
-Last Modified: 2026-06-15
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: logout evicts the presented JWT from the verified-claims cache
     - 2026-06-15: Sprint 57.123 — AuthMeTenant += plan + region at all 3 build sites
     - 2026-06-12: Sprint 57.105 — callback + password-login roles claim DB-sourced at issue time
     - 2026-06-06: Sprint 57.86 — add POST /auth/password-login (local credentials; generic 401)
@@ -71,6 +72,7 @@ from core.config import get_settings
 from infrastructure.db.audit_helper import append_audit
 from infrastructure.db.models.identity import Tenant, TenantPlan, User
 from infrastructure.db.session import get_db_session
+from platform_layer.identity.claims_cache import get_default_claims_cache
 from platform_layer.identity.credentials import (
     CredentialsError,
     CredentialsService,
@@ -664,15 +666,32 @@ async def password_login(
     return await issue_session(db, user, operation="password_login")
 
 
+def _evict_cached_claims(request: Request) -> None:
+    # /logout is exempt from TenantContextMiddleware, so read the token the same
+    # way it would: Bearer header first, then the v2_jwt cookie.
+    cache = get_default_claims_cache()
+    if cache is None:
+        return
+    raw = request.headers.get("Authorization", "")
+    token = raw[len("Bearer ") :].strip() if raw.startswith("Bearer ") else None
+    token = token or request.cookies.get(_JWT_COOKIE)
+    if token:
+        cache.invalidate(token)
+
+
 @router.post("/logout")
 async def logout(
+    request: Request,
     return_to: str = Query(default="/auth/login"),
 ) -> JSONResponse:
     """Vendor signout + clear V2 JWT cookie.
 
     Returns JSON with vendor logout URL so frontend can redirect browser
     (POST → 302 chain not ideal; let frontend handle redirect explicitly).
+    The presented JWT (Bearer header or v2_jwt cookie) is also evicted from the
+    verified-claims cache, so this process re-verifies it if it comes back.
     """
+    _evict_cached_claims(request)
     try:
         flow = WorkOSOIDCFlow()
         # Encode return_to for safety even if vendor SDK does it (defense in depth).
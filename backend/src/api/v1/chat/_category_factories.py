@@ -26,9 +26,13 @@ Key Components:
     - make_chat_state_deps(db, session_id, tenant_id) -> (Reducer|None, Checkpointer|None)  (Cat 7)
 
 Created: 2026-05-31 (Sprint 57.63 Day 1)
-Last Modified: 2026-07-07
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: make_chat_message_store threads chat_ledger_checkpoints (windowed ledger load)
+    - 2026-10-16: user / tenant memory layers get fulltext= (MEMORY_FULLTEXT_SEARCH)
+    - 2026-10-16: make_chat_prompt_builder accepts a run-scoped MemorySnapshot
+    - 2026-10-16: Share one memoized chat-flow TiktokenCounter across factories
     - 2026-07-07: Sprint 57.161 — inject TiktokenCounter into StructuralCompactor
     - 2026-07-07: Sprint 57.160 — inject env-gated tool-anchored masker (single-user-turn fix)
     - 2026-07-01: Sprint 57.155 — inject MemoryVectorIndex into UserLayer (CARRY-026 L4 semantic)
@@ -52,6 +56,7 @@ Related:
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from typing import TYPE_CHECKING
 from uuid import UUID
 
@@ -73,7 +78,12 @@ from agent_harness.error_handling import (
     RetryPolicyMatrix,
     TenantErrorBudget,
 )
-from agent_harness.memory import DBSessionSummaryStore, MemoryLayer, MemoryRetrieval
+from agent_harness.memory import (
+    DBSessionSummaryStore,
+    MemoryLayer,
+    MemoryRetrieval,
+    MemorySnapshot,
+)
 from agent_harness.memory.layers.role_layer import RoleLayer
 from agent_harness.memory.layers.session_layer import SessionLayer
 from agent_harness.memory.layers.system_layer import SystemLayer
@@ -188,6 +198,19 @@ def _compaction_tool_anchored_keep() -> int | None:
     return keep if keep >= 1 else None
 
 
+@lru_cache(maxsize=1)
+def _chat_token_counter() -> TiktokenCounter:
+    """Process-wide chat-flow TiktokenCounter.
+
+    One shared instance so its per-message / per-tool memo survives across
+    requests: the structural + preclear compactors and the prompt builder all
+    re-count the same history, and a fresh counter per request would start
+    every chat cold. Pure tokenizer state — no tenant data is retained beyond
+    content hashes → token counts.
+    """
+    return TiktokenCounter(model="gpt-4o")
+
+
 def make_chat_compactor(chat_client: ChatClient) -> Compactor:
     """Cat 4: HybridCompactor (structural-first, semantic fallback).
 
@@ -224,7 +247,7 @@ def make_chat_compactor(chat_client: ChatClient) -> Compactor:
             # of the message-count ratio that is blind to in-place tombstoning —
             # so tool-anchored masking (57.160) surfaces its reduction on the
             # marker + relieves the loop budget WITHOUT also enabling preclear.
-            token_counter=TiktokenCounter(model="gpt-4o"),
+            token_counter=_chat_token_counter(),
         ),
         semantic=SemanticCompactor(
             chat_client=chat_client,
@@ -248,7 +271,7 @@ def make_chat_compactor(chat_client: ChatClient) -> Compactor:
         return ChainedCompactor(
             compactors=[
                 PreClearCompactor(
-                    token_counter=TiktokenCounter(model="gpt-4o"),
+                    token_counter=_chat_token_counter(),
                     preclear_ratio=preclear_ratio,
                     keep_recent_turns=keep_recent,
                     token_budget=budget,
@@ -263,6 +286,7 @@ def make_chat_compactor(chat_client: ChatClient) -> Compactor:
 def make_chat_prompt_builder(
     chat_client: ChatClient,
     memory_retrieval: MemoryRetrieval | None = None,
+    memory_snapshot: MemorySnapshot | None = None,
 ) -> PromptBuilder:
     """Cat 5 (KEYSTONE): the centralized DefaultPromptBuilder for the chat path.
 
@@ -292,6 +316,8 @@ def make_chat_prompt_builder(
         memory_retrieval: the real 5-scope MemoryRetrieval (from
             make_chat_memory_deps) so the prompt and the executor's memory tools
             share ONE retrieval; None preserves the empty-memory standalone path.
+        memory_snapshot: optional run-scoped MemorySnapshot over memory_retrieval
+            (CHAT_MEMORY_SNAPSHOT); the builder then reads memory through it.
     """
     del chat_client  # signature parity; the builder issues no provider call
     return DefaultPromptBuilder(
@@ -299,7 +325,8 @@ def make_chat_prompt_builder(
             memory_retrieval if memory_retrieval is not None else MemoryRetrieval(layers={})
         ),
         cache_manager=InMemoryCacheManager(),
-        token_counter=TiktokenCounter(model="gpt-4o"),
+        token_counter=_chat_token_counter(),
+        memory_snapshot=memory_snapshot,
     )
 
 
@@ -338,14 +365,17 @@ def make_chat_memory_deps(
             session-summary store; the layers themselves use get_session_factory()).
     """
     session_factory = get_session_factory()
+    fulltext = get_settings().memory_fulltext_search
     layers: dict[str, MemoryLayer] = {
         "system": SystemLayer(session_factory),
-        "tenant": TenantLayer(session_factory),
+        "tenant": TenantLayer(session_factory, fulltext=fulltext),
         "role": RoleLayer(session_factory),
         # Sprint 57.155 (CARRY-026 Slice 1): inject the memory vector index into the
         # user layer so the "semantic" axis is real when MEMORY_VECTOR_ENABLED is on.
         # None (flag off / unconfigured) → UserLayer keeps the 57.150 keyword path.
-        "user": UserLayer(session_factory, vector_index=get_memory_vector_index()),
+        "user": UserLayer(
+            session_factory, vector_index=get_memory_vector_index(), fulltext=fulltext
+        ),
         "session": SessionLayer(),
     }
     # Sprint 57.151 (AD-Memory-Formation-Session-Recall): thread the session-summary
@@ -460,10 +490,18 @@ def make_chat_message_store(
     session per load/append (durable appends survive a user-Stop request rollback), so
     it takes the session factory, not the request `db`. `db` is kept only as the
     all-three-present signal (mirrors the memory-layer factories' `del db` precedent).
+
+    CHAT_LEDGER_CHECKPOINTS on → load() starts from the latest compaction checkpoint
+    (summary + the rows after it) and the loop's semantic compactions record new ones.
     """
     if db is None or session_id is None or tenant_id is None:
         return None
-    return DBMessageStore(get_session_factory(), session_id=session_id, tenant_id=tenant_id)
+    return DBMessageStore(
+        get_session_factory(),
+        session_id=session_id,
+        tenant_id=tenant_id,
+        checkpoints=get_settings().chat_ledger_checkpoints,
+    )
 
 
 def make_chat_todo_store(
@@ -0,0 +1,109 @@
+"""
+File: backend/src/api/v1/chat/embedding_client.py
+Purpose: Process-wide EmbeddingClient builder shared by the knowledge + memory vector indexes.
+Category: API / chat composition (wires the embedding adapter + optional coalescer/cache)
+Scope: Phase 57 / embedding cost + latency
+
+Description:
+    knowledge_index.py and memory_vector_index.py each built their own
+    AzureOpenAIEmbeddingClient. They now both call get_embedding_client(config).
+    EMBEDDING_CACHE off → a plain AzureOpenAIEmbeddingClient per caller, exactly
+    as before. On → ONE CoalescingEmbeddingClient per process, so query embeddings
+    from both indexes (and from concurrent chat requests) share the vector cache
+    and coalesce into the same provider calls. The shared tier (redis / disk) is
+    picked from EMBEDDING_CACHE_BACKEND.
+
+Key Components:
+    - get_embedding_client(config) -> EmbeddingClient  (memoized when caching)
+    - drain_embedding_client()  (app lifespan shutdown)
+    - reset_embedding_client()  (test hook)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: drain_embedding_client() — lifespan shutdown awaits background batches
+    - 2026-10-16: Initial creation — shared coalescing/caching embedding client
+
+Related:
+    - adapters/_base/coalescing_embedding_client.py — CoalescingEmbeddingClient
+    - api/v1/chat/knowledge_index.py / memory_vector_index.py — the consumers
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.config import get_settings
+
+if TYPE_CHECKING:
+    from adapters._base.coalescing_embedding_client import EmbeddingCacheStore
+    from adapters._base.embedding_client import EmbeddingClient
+    from adapters.azure_openai.config import AzureOpenAIConfig
+
+logger = logging.getLogger(__name__)
+
+_shared: "EmbeddingClient | None" = None
+
+
+def _cache_store() -> "EmbeddingCacheStore | None":
+    settings = get_settings()
+    if settings.embedding_cache_backend == "redis":
+        from redis.asyncio import Redis
+
+        from adapters._base.coalescing_embedding_client import RedisEmbeddingCacheStore
+
+        return RedisEmbeddingCacheStore(
+            Redis.from_url(settings.redis_url), ttl_seconds=settings.embedding_cache_ttl_sec
+        )
+    if settings.embedding_cache_backend == "disk":
+        from adapters._base.coalescing_embedding_client import DiskEmbeddingCacheStore
+
+        return DiskEmbeddingCacheStore(settings.embedding_cache_dir)
+    return None
+
+
+def get_embedding_client(config: "AzureOpenAIConfig") -> "EmbeddingClient":
+    """Return the embedding client the vector indexes should use.
+
+    EMBEDDING_CACHE off → a fresh AzureOpenAIEmbeddingClient (unchanged behavior).
+    On → the process-wide CoalescingEmbeddingClient (built on first call; the
+    first caller's config wins — both indexes read the same Azure env).
+    """
+    global _shared
+    from adapters.azure_openai.embeddings import AzureOpenAIEmbeddingClient
+
+    settings = get_settings()
+    if not settings.embedding_cache:
+        return AzureOpenAIEmbeddingClient(config)
+    if _shared is None:
+        from adapters._base.coalescing_embedding_client import CoalescingEmbeddingClient
+
+        _shared = CoalescingEmbeddingClient(
+            inner=AzureOpenAIEmbeddingClient(config),
+            store=_cache_store(),
+            max_cached_entries=settings.embedding_cache_max_entries,
+            window_ms=settings.embedding_coalesce_window_ms,
+            max_batch=settings.embedding_max_batch,
+            max_concurrency=settings.embedding_max_concurrency,
+            tokens_per_minute=settings.embedding_tpm_limit,
+        )
+        logger.info(
+            "coalescing embedding client built (backend=%s)", settings.embedding_cache_backend
+        )
+    return _shared
+
+
+async def drain_embedding_client() -> None:
+    """Await the shared coalescer's in-flight batches + cache writes (no-op when never built)."""
+    from adapters._base.coalescing_embedding_client import CoalescingEmbeddingClient
+
+    if isinstance(_shared, CoalescingEmbeddingClient):
+        await _shared.drain()
+
+
+def reset_embedding_client() -> None:
+    """Test hook: drop the shared client so the next call rebuilds from settings."""
+    global _shared
+    _shared = None
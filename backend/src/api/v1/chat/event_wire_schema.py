@@ -1,6 +1,6 @@
 """
 File: backend/src/api/v1/chat/event_wire_schema.py
-Purpose: Declarative single-source wire-schema for the 26 chat SSE event types.
+Purpose: Declarative single-source wire-schema for the 27 chat SSE event types.
 Category: api/v1/chat
 Scope: Phase 57 / Sprint 57.67 (A-5b — event schema codegen)
 
@@ -27,16 +27,17 @@ Description:
     `frontend/src/features/chat_v2/types.ts` (reproduced verbatim).
 
 Key Components:
-    - WIRE_SCHEMA: 26 ordered wire-type → ordered {field: ts_type} entries.
+    - WIRE_SCHEMA: 27 ordered wire-type → ordered {field: ts_type} entries.
     - BASE_FIELDS: universal fields the wrapper adds to every frame (trace_id).
     - TOOL_CALL_ELEMENT_TYPE_NAME / TOOL_CALL_ELEMENT_FIELDS: the named
       `tool_calls` element TS type (mirrors types.ts `LLMToolCall`).
     - validate_ts_type(spec): pragmatic TS-type-string sanity check.
 
 Created: 2026-06-02 (Sprint 57.67)
-Last Modified: 2026-06-16
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: add llm_text_delta wire-type (Cat 1 token streaming) 26→27
     - 2026-07-10: Sprint 57.164 — tool_call_result +error_taxonomy field (count 26 unchanged)
     - 2026-06-24: Sprint 57.140 — add todos_updated wire-type (Cat 1 task primitive) 25→26
     - 2026-06-16: Sprint 57.130 — add loop_terminated wire-type (Cat 8 fatal-terminate) 24→25
@@ -80,7 +81,7 @@ TOOL_CALL_ELEMENT_FIELDS: dict[str, str] = {
 }
 
 
-# === WIRE_SCHEMA: 26 ordered wire-type entries ==============================
+# === WIRE_SCHEMA: 27 ordered wire-type entries ==============================
 # Why: single declarative source of truth for the SSE event contract. Insertion
 # order of the outer dict = generated interface declaration order; insertion
 # order of each inner dict = generated interface FIELD order. Field NAME/SET is
@@ -247,6 +248,12 @@ WIRE_SCHEMA: dict[str, dict[str, str]] = {
     "todos_updated": {
         "todos": "Record<string, unknown>[]",
     },
+    # Token streaming (Cat 1 stream_llm mode): one incremental text chunk of the
+    # in-flight LLM call. The turn's llm_response still follows with the full
+    # content (canonical; the only one persisted to the transcript).
+    "llm_text_delta": {
+        "text": "string",
+    },
 }
 
 
@@ -0,0 +1,192 @@
+"""
+File: backend/src/api/v1/chat/formation_queue.py
+Purpose: Queue-backed post-send memory formation — per-session coalescing queue + worker pool.
+Category: API / chat composition (wires runtime.workers into the memory-formation hook)
+Scope: Phase 57 / durable background work queue
+
+Description:
+    By default every send runs memory formation inline in its Starlette
+    BackgroundTask, so N quick sends in one session pay N cheap-tier formation
+    calls, all competing with interactive LLM traffic, and a restart drops them.
+    With CHAT_MEMORY_FORMATION_QUEUE set the router enqueues instead:
+
+    - "memory": InProcessWorkQueue (single process, not durable);
+    - "postgres": PostgresWorkQueue on the work_queue table (durable, shared by
+      every API process; the pool claims with FOR UPDATE SKIP LOCKED).
+
+    The coalesce key is "<tenant>:<session>", so the latest send supersedes a
+    still-queued job for the same session, and the job is debounced by
+    CHAT_MEMORY_FORMATION_DEBOUNCE_SEC. A WorkerPool with its own concurrency
+    limit drains the queue and drops to one job at a time while
+    CHAT_MEMORY_FORMATION_YIELD_AT chat streams are live (interactive traffic
+    first). Each job rebuilds the formation context from (tenant, session,
+    user, trace) — the same build_chat_memory_extractor the request uses — and
+    runs router._form_session_memory, the body the inline path wraps. Unlike the
+    inline path it does NOT swallow errors: a failed job goes back to the queue
+    through complete(error=...) and retries with backoff.
+
+Key Components:
+    - get_formation_queue() -> WorkQueueBackend | None  (None = queue off)
+    - enqueue_formation(*, tenant_id, session_id, trace_context) -> bool
+    - run_formation_job(envelope)  (the pool's JobHandler)
+    - start_formation_pool() / stop_formation_pool()  (app lifespan)
+    - reset_formation_queue()  (test hook)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: run_formation_job passes the process tracer to the extractor builder
+    - 2026-10-16: run_formation_job calls the raising _form_session_memory so failures retry
+    - 2026-10-16: Initial creation — CHAT_MEMORY_FORMATION_QUEUE (memory | postgres)
+
+Related:
+    - runtime/workers/work_queue.py / postgres_queue.py / worker_pool.py
+    - api/v1/chat/router.py — _post_send_formation (enqueue) / _form_session_memory (body)
+    - api/v1/chat/handler.py — build_chat_memory_extractor
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from uuid import UUID
+
+from agent_harness._contracts import TraceContext
+from core.config import get_settings
+from runtime.workers import (
+    InProcessWorkQueue,
+    TaskEnvelope,
+    WorkerPool,
+    WorkerPoolConfig,
+    WorkQueueBackend,
+)
+
+logger = logging.getLogger(__name__)
+
+QUEUE_NAME = "memory_formation"
+
+_backend: WorkQueueBackend | None = None
+_pool: WorkerPool | None = None
+
+
+def get_formation_queue() -> WorkQueueBackend | None:
+    """The process-wide formation queue for CHAT_MEMORY_FORMATION_QUEUE (None when "off")."""
+    global _backend
+    mode = get_settings().chat_memory_formation_queue
+    if mode == "off":
+        return None
+    if _backend is None:
+        if mode == "postgres":
+            from infrastructure.db.engine import get_session_factory
+            from runtime.workers.postgres_queue import PostgresWorkQueue
+
+            _backend = PostgresWorkQueue(
+                get_session_factory(),
+                QUEUE_NAME,
+                lease_sec=get_settings().chat_memory_formation_lease_sec,
+            )
+        else:
+            _backend = InProcessWorkQueue()
+        logger.info("memory formation queue built (backend=%s)", mode)
+    return _backend
+
+
+async def enqueue_formation(
+    *, tenant_id: UUID, session_id: UUID, trace_context: TraceContext
+) -> bool:
+    """Queue (or supersede) this session's formation job; False when the queue is off."""
+    backend = get_formation_queue()
+    if backend is None:
+        return False
+    user_id = trace_context.user_id
+    await backend.submit(
+        TaskEnvelope.new(
+            tenant_id=str(tenant_id),
+            user_id=str(user_id) if user_id is not None else None,
+            payload={"session_id": str(session_id)},
+            trace_id=trace_context.trace_id,
+            coalesce_key=f"{tenant_id}:{session_id}",
+            delay_sec=get_settings().chat_memory_formation_debounce_sec,
+        )
+    )
+    return True
+
+
+async def run_formation_job(envelope: TaskEnvelope) -> dict[str, Any] | None:
+    """JobHandler: rebuild the formation context for the job's session and form memory.
+
+    Errors propagate to the WorkerPool, which reports them via complete(error=...).
+    """
+    from infrastructure.db.engine import get_session_factory
+    from platform_layer.billing.model_policy import resolve_tenant_model_policy
+    from platform_layer.observability.tracer import get_tracer
+
+    from .handler import build_chat_memory_extractor
+    from .router import _form_session_memory
+
+    tenant_id = UUID(envelope.tenant_id)
+    session_id = UUID(str(envelope.payload["session_id"]))
+    trace_context = TraceContext(
+        trace_id=envelope.trace_id,
+        tenant_id=tenant_id,
+        user_id=UUID(envelope.user_id) if envelope.user_id else None,
+        session_id=session_id,
+    )
+    # The builders only use `db` as a presence signal (their stores open their own
+    # sessions), plus the tenant's model-policy read.
+    async with get_session_factory()() as db:
+        model_policy = await resolve_tenant_model_policy(db, tenant_id)
+        ctx = build_chat_memory_extractor(
+            model_policy, db, session_id, tenant_id, tracer=get_tracer()
+        )
+    if ctx is None:
+        return {"formed": False}
+    formed = await _form_session_memory(
+        memory_extract_ctx=ctx,
+        tenant_id=tenant_id,
+        session_id=session_id,
+        trace_context=trace_context,
+    )
+    return {"formed": formed}
+
+
+def _interactive_busy() -> bool:
+    from .injection_registry import get_default_injection_registry
+
+    threshold = get_settings().chat_memory_formation_yield_at
+    return threshold > 0 and get_default_injection_registry().live_count() >= threshold
+
+
+def start_formation_pool() -> WorkerPool | None:
+    """Start the formation worker pool (None when the queue is off); idempotent."""
+    global _pool
+    backend = get_formation_queue()
+    if backend is None:
+        return None
+    if _pool is None:
+        settings = get_settings()
+        _pool = WorkerPool(
+            backend,
+            run_formation_job,
+            WorkerPoolConfig(
+                concurrency=settings.chat_memory_formation_concurrency,
+                poll_interval_sec=settings.chat_memory_formation_poll_sec,
+            ),
+            busy=_interactive_busy,
+        )
+    _pool.start()
+    return _pool
+
+
+async def stop_formation_pool() -> None:
+    """Stop the pool (bounded wait for in-flight jobs); a no-op when never started."""
+    if _pool is not None:
+        await _pool.stop()
+
+
+def reset_formation_queue() -> None:
+    """Test hook: drop the queue + pool so the next call rebuilds from settings."""
+    global _backend, _pool
+    _backend = None
+    _pool = None
@@ -27,9 +27,19 @@ Key Components:
     - build_handler(mode: ChatMode, message: str) -> AgentLoopImpl  (dispatcher)
 
 Created: 2026-04-30 (Sprint 50.2 Day 1.4)
-Last Modified: 2026-06-14
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: _with_response_cache takes the request tracer (llm_response_cache_total);
+      build_chat_memory_extractor gains a tracer kwarg
+    - 2026-10-16: ChatMemoryExtractContext.summary_store (incremental session summary watermark)
+    - 2026-10-16: thread knowledge_keyword_index (BM25 knowledge_search) into the executor
+    - 2026-10-16: run-scoped MemorySnapshot shared by prompt builder + memory tools
+    - 2026-10-16: cheap tier wrapped in ResponseCacheWrapper (LLM_RESPONSE_CACHE)
+    - 2026-10-16: build_azure_model_profile borrows the pooled Azure clients (LLM_CLIENT_POOL)
+    - 2026-10-16: thread chat_speculative_tool_calls into loop ctor (mid-stream dispatch)
+    - 2026-10-16: thread chat_stream_llm into loop ctor (token streaming)
+    - 2026-10-16: thread chat_parallel_tool_calls into loop ctor (concurrent tool groups)
     - 2026-06-14: Sprint 57.115 — force_load_skill param → "## Active Skill" deterministic injection
     - 2026-06-13: Sprint 57.110 B4 — child loops inherit the composed guardrail engine
     - 2026-06-12: Sprint 57.109 C2 — compactor runs on profile.cheap (semantic summarize tier)
@@ -76,9 +86,16 @@ from __future__ import annotations
 import os
 from collections.abc import Callable
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import TYPE_CHECKING, cast
 
 from adapters._base.chat_client import ChatClient
+from adapters._base.response_cache_wrapper import (
+    InMemoryResponseCacheStore,
+    RedisResponseCacheStore,
+    ResponseCacheStore,
+    ResponseCacheWrapper,
+)
 from adapters._testing.mock_clients import MockChatClient
 from agent_harness._contracts import (
     ChatResponse,
@@ -92,6 +109,7 @@ from agent_harness.guardrails.output import OutputKeywordEscalationGuardrail
 from agent_harness.guardrails.tool.capability_matrix import CapabilityMatrix, PermissionRule
 from agent_harness.guardrails.tool.risky_action_detector import RiskyActionDetector
 from agent_harness.guardrails.tool.tool_guardrail import ToolGuardrail
+from agent_harness.memory import MemorySnapshot
 from agent_harness.orchestrator_loop import AgentLoopImpl
 from agent_harness.output_parser import OutputParserImpl
 from agent_harness.skills import render_catalog_block, render_skill_instructions
@@ -128,6 +146,7 @@ if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import AsyncSession
 
     from adapters._base.model_policy import ModelPolicy
+    from adapters.azure_openai.client_pool import AzureClientPool
     from agent_harness._contracts import (
         MessageInbox,
         SubagentBudget,
@@ -137,6 +156,7 @@ if TYPE_CHECKING:
     from agent_harness.hitl import HITLManager
     from agent_harness.memory.formation import MemoryFormationWorker
     from agent_harness.memory.retrieval import MemoryRetrieval
+    from agent_harness.memory.session_summary_store import DBSessionSummaryStore
     from agent_harness.observability import Tracer
     from agent_harness.orchestrator_loop._abc import AgentLoop
     from agent_harness.skills import SkillRegistry
@@ -408,8 +428,10 @@ def build_real_llm_handler(
     # byte-identical to the Sprint 57.97 env-only path (cheap is action when unset);
     # the cheap tier saves on the per-request llm_judge call (default-ON since 57.83)
     # and the compaction summarize call without touching the user-facing turn.
-    profile = build_azure_model_profile(model_policy)
+    profile = build_azure_model_profile(model_policy, client_pool=_llm_client_pool())
     chat_client: ChatClient = profile.action
+    # Cheap-tier consumers (compactor summarize, judge) share one cache wrapper.
+    cheap_client = _with_response_cache(profile.cheap, tracer=tracer)
     parser = OutputParserImpl()  # built early — the Sprint 57.94 child-loop factory needs it
 
     # Sprint 57.64 Day 2: Cat 3 memory tools (REAL handlers, not placeholder) +
@@ -417,6 +439,13 @@ def build_real_llm_handler(
     # Both fall back to absent when their inputs are missing (e.g. session_id is
     # required for the subagent task_spawn parent attribution).
     memory_retrieval, memory_layers = make_chat_memory_deps(db)
+    # CHAT_MEMORY_SNAPSHOT: one memo of the prompt builder's memory reads for this
+    # run. The executors below get the WATCHED layers, so a memory_write from any
+    # loop (parent or child) invalidates the reads that touched the written scope.
+    memory_snapshot: MemorySnapshot | None = None
+    if get_settings().chat_memory_snapshot:
+        memory_snapshot = MemorySnapshot(memory_retrieval)
+        memory_layers = memory_snapshot.watch(memory_layers)
 
     # Sprint 57.94 (地基 A payoff): when subagents are reachable (session_id present),
     # build a child-loop factory so a FORK / AS_TOOL subagent runs a REAL child loop
@@ -574,6 +603,7 @@ def build_real_llm_handler(
         todo_store=todo_store,
         knowledge_root=knowledge_root,
         knowledge_vector_index=knowledge_vector_index,
+        knowledge_keyword_index=get_settings().knowledge_keyword_index,
     )
 
     # Sprint 57.113: advertise the available skills cheaply in the system prompt
@@ -626,7 +656,7 @@ def build_real_llm_handler(
     # Sprint 57.109 (C2): the semantic summarize runs on the CHEAP tier —
     # compaction is summarisation, not user-facing reasoning (cheap unset →
     # cheap is action → byte-identical).
-    compactor = make_chat_compactor(profile.cheap)
+    compactor = make_chat_compactor(cheap_client)
     # Sprint 57.64 Day 1: Cat 5 (KEYSTONE) — inject DefaultPromptBuilder so the
     # loop takes its structured build() path (loop.py:881 true-branch, emits
     # PromptBuilt) instead of the naked fallback. Closes the AP-8 / AP-2
@@ -637,7 +667,9 @@ def build_real_llm_handler(
     # the executor's memory tools (above) so the prompt renders a per-turn,
     # capped (≤2000-token) memory summary + verify-before-use rules from the same
     # 5-scope layers the tools read/write — one retrieval, no second instance.
-    prompt_builder = make_chat_prompt_builder(chat_client, memory_retrieval=memory_retrieval)
+    prompt_builder = make_chat_prompt_builder(
+        chat_client, memory_retrieval=memory_retrieval, memory_snapshot=memory_snapshot
+    )
     reducer, checkpointer = make_chat_state_deps(db, session_id, tenant_id)
     # Sprint 57.127 (AD-ChatV2-Live-MultiTurn-Context): the per-session message
     # ledger — the main chat loop rehydrates prior conversation from it + persists
@@ -778,7 +810,7 @@ def build_real_llm_handler(
         correction_context_strategy = "keep"
     verifier_registry: VerifierRegistry | None = None
     if verification_mode == "enabled":
-        verifier_registry = make_chat_verifier_registry(profile.cheap, judge_template)
+        verifier_registry = make_chat_verifier_registry(cheap_client, judge_template)
 
     # Sprint 57.101 B1: wire the between-turns injection inbox over the module
     # InjectionRegistry for this (tenant, session) so a mid-run POST /{id}/inject
@@ -834,6 +866,13 @@ def build_real_llm_handler(
         # False → 53.5 baseline (the deferred branch is a no-op anyway since it
         # needs the manager). The later POST /chat/{id}/resume drives resume().
         hitl_deferred=(hitl_manager is not None),
+        # Parallel tool calls: parallel-safe calls of one turn run concurrently
+        # (per-tool ConcurrencyPolicy); HITL-capable groups stay sequential.
+        parallel_tool_calls=settings.chat_parallel_tool_calls,
+        # Token streaming: stream() → llm_text_delta frames ahead of llm_response.
+        stream_llm=settings.chat_stream_llm,
+        # Speculative tool calls: closed read-only calls dispatch mid-stream.
+        speculative_tool_calls=settings.chat_speculative_tool_calls,
         guardrail_engine=guardrail_engine,
         compactor=compactor,
         prompt_builder=prompt_builder,
@@ -865,11 +904,16 @@ class ChatMemoryExtractContext:
     profile() known-facts dedup read (only when former.wants_user_facts). The
     router builds the ctx when EITHER feature flag is on; _maybe_auto_extract calls
     former.form() once.
+
+    `summary_store` is set when the session summarizer is wired; with
+    CHAT_SESSION_SUMMARY_INCREMENTAL on the router reads the summary watermark from
+    it and loads only the ledger tail after it.
     """
 
     former: MemoryFormationWorker
     retrieval: MemoryRetrieval
     message_store: MessageStore
+    summary_store: DBSessionSummaryStore | None = None
 
 
 def build_chat_memory_extractor(
@@ -877,6 +921,8 @@ def build_chat_memory_extractor(
     db: "AsyncSession | None" = None,
     session_id: "UUID | None" = None,
     tenant_id: "UUID | None" = None,
+    *,
+    tracer: "Tracer | None" = None,
 ) -> "ChatMemoryExtractContext | None":
     """Cat 3: the post-send memory-formation context for the chat real_llm path.
 
@@ -919,7 +965,8 @@ def build_chat_memory_extractor(
     from agent_harness.memory.layers.user_layer import UserLayer
     from agent_harness.memory.session_summarizer import SessionSummarizer
 
-    profile = build_azure_model_profile(model_policy)
+    profile = build_azure_model_profile(model_policy, client_pool=_llm_client_pool())
+    cheap_client = _with_response_cache(profile.cheap, tracer=tracer)
     retrieval, memory_layers = make_chat_memory_deps(db)
 
     extractor: MemoryExtractor | None = None
@@ -927,13 +974,14 @@ def build_chat_memory_extractor(
         # make_chat_memory_deps always constructs layers["user"] as a UserLayer
         # (_category_factories.py); the dict value type is the MemoryLayer ABC.
         user_layer = cast("UserLayer", memory_layers["user"])
-        extractor = MemoryExtractor(chat_client=profile.cheap, user_layer=user_layer)
+        extractor = MemoryExtractor(chat_client=cheap_client, user_layer=user_layer)
 
     summarizer: SessionSummarizer | None = None
+    summary_store: "DBSessionSummaryStore | None" = None
     if settings.chat_session_summary:
         summary_store = make_chat_session_summary_store(db)
         if summary_store is not None:
-            summarizer = SessionSummarizer(chat_client=profile.cheap, store=summary_store)
+            summarizer = SessionSummarizer(chat_client=cheap_client, store=summary_store)
 
     if extractor is None and summarizer is None:
         return None
@@ -941,7 +989,7 @@ def build_chat_memory_extractor(
     # makes a single combined cheap-tier call by default. chat_memory_combined_
     # formation=false → the two-call fallback (each collaborator's own method).
     former = MemoryFormationWorker(
-        profile.cheap,
+        cheap_client,
         extractor=extractor,
         summarizer=summarizer,
         combined=settings.chat_memory_combined_formation,
@@ -950,6 +998,7 @@ def build_chat_memory_extractor(
         former=former,
         retrieval=retrieval,
         message_store=message_store,
+        summary_store=summary_store if summarizer is not None else None,
     )
 
 
@@ -1033,6 +1082,55 @@ def build_handler(
     raise ValueError(f"Unsupported mode: {mode!r}")
 
 
+def _llm_client_pool() -> AzureClientPool | None:
+    """The process-wide Azure client pool when LLM_CLIENT_POOL is on, else None.
+
+    None keeps build_azure_model_profile's per-request adapters on private clients
+    (byte-identical). Late import mirrors build_real_llm_handler (azure SDK weight).
+    """
+    settings = get_settings()
+    if not settings.llm_client_pool:
+        return None
+    from adapters.azure_openai.client_pool import get_azure_client_pool
+
+    return get_azure_client_pool(
+        max_connections=settings.llm_client_pool_max_connections,
+        max_keepalive_connections=settings.llm_client_pool_max_keepalive,
+        keepalive_expiry_sec=settings.llm_client_pool_keepalive_expiry_sec,
+    )
+
+
+@lru_cache(maxsize=1)
+def _llm_response_cache_store() -> ResponseCacheStore:
+    """Process-wide response-cache backend (one per process so hits span requests)."""
+    settings = get_settings()
+    if settings.llm_response_cache_backend == "redis":
+        from redis.asyncio import Redis
+
+        return RedisResponseCacheStore(Redis.from_url(settings.redis_url))
+    return InMemoryResponseCacheStore(max_entries=settings.llm_response_cache_max_entries)
+
+
+def _with_response_cache(
+    cheap_client: ChatClient, *, tracer: "Tracer | None" = None
+) -> ChatClient:
+    """Wrap the cheap tier in ResponseCacheWrapper when LLM_RESPONSE_CACHE is on.
+
+    Only caller-marked deterministic requests (RESPONSE_CACHEABLE_OPTION) are ever
+    served from cache; everything else passes through. OFF → the client unchanged.
+    `tracer` receives the wrapper's llm_response_cache_total hit/miss counter.
+    """
+    settings = get_settings()
+    if not settings.llm_response_cache:
+        return cheap_client
+    return ResponseCacheWrapper(
+        inner=cheap_client,
+        store=_llm_response_cache_store(),
+        ttl_seconds=settings.llm_response_cache_ttl_sec,
+        tracer=tracer,
+    )
+
+
 def _hitl_enabled() -> bool:
     """Feature toggle. Default ON; explicit `HITL_ENABLED=false` disables wiring."""
     return os.environ.get("HITL_ENABLED", "true").strip().lower() != "false"
@@ -26,21 +26,26 @@ Description:
     inject request on that loop.
 
 Key Components:
-    - InjectionRegistry: register / put / drain / unregister, keyed by (tenant, session)
+    - InjectionRegistry: register / put / drain / unregister, keyed by (tenant, session);
+      live_count() = chat streams currently running in this process
     - QueueMessageInbox: a MessageInbox (Cat 1 contract) view over one session's queue
     - make_teammate_inbox_scope(): the TEAMMATE child's lifecycle-scoped inbox (Sprint 57.103 B2b)
-    - get_default_injection_registry(): the module singleton (tests reset it — Risk Class C)
+    - get_default_injection_registry(): the module singleton (tests reset it — Risk Class C);
+      set_default_injection_registry() swaps it (CHAT_REGISTRY_BACKEND=redis)
 
 Created: 2026-06-11 (Sprint 57.101)
-Last Modified: 2026-06-11
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: set_default_injection_registry() (Redis-backed cross-worker inject)
+    - 2026-10-16: add live_count() (background formation pool yields to live streams)
     - 2026-06-11: Sprint 57.103 (B2b) — add make_teammate_inbox_scope (lifecycle-scoped inbox)
     - 2026-06-11: Initial creation (Sprint 57.101) — injection channel + QueueMessageInbox
 
 Related:
     - agent_harness/_contracts/inbox.py (MessageInbox ABC the loop drains)
     - api/v1/chat/session_registry.py (tenant-scoped singleton pattern + active-session gate)
+    - api/v1/chat/redis_registry.py (RedisInjectionRegistry — inject delivery to the owner)
     - api/v1/chat/router.py (registers/unregisters the queue + the POST /{id}/inject endpoint)
     - .claude/rules/multi-tenant-data.md 鐵律 (tenant-scoped storage)
     - claudedocs/1-planning/harness-deepening-proposal-20260610.md §2.2 (B1)
@@ -115,6 +120,10 @@ class InjectionRegistry:
             if not sessions:
                 del self._tenants[tenant_id]
 
+    def live_count(self) -> int:
+        """Number of registered queues — the chat streams running right now (lock-free read)."""
+        return sum(len(sessions) for sessions in self._tenants.values())
+
 
 # === QueueMessageInbox: the loop's view over one session's queue =============
 # Why: the loop depends only on the MessageInbox ABC (Cat 1); this binds the ABC
@@ -165,3 +174,9 @@ _default_injection_registry = InjectionRegistry()
 
 def get_default_injection_registry() -> InjectionRegistry:
     return _default_injection_registry
+
+
+def set_default_injection_registry(registry: InjectionRegistry | None) -> None:
+    """Install the process singleton (startup wiring / tests); None → a fresh in-memory one."""
+    global _default_injection_registry
+    _default_injection_registry = registry if registry is not None else InjectionRegistry()
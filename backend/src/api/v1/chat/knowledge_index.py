@@ -22,9 +22,14 @@ Key Components:
     - reset_knowledge_vector_index()  (test hook)
 
 Created: 2026-06-27 (Sprint 57.146)
-Last Modified: 2026-06-27
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: store via get_vector_store() (VECTOR_STORE_BACKEND qdrant | local);
+      QDRANT_URL is only required for the qdrant backend
+    - 2026-10-16: pass incremental / refresh_interval_sec (KNOWLEDGE_VECTOR_INCREMENTAL_INGEST)
+    - 2026-10-16: embedder via get_embedding_client() (shared coalescer/cache when
+      EMBEDDING_CACHE is on)
     - 2026-06-27: Sprint 57.147 — pass docs_root (not a single connector) so the index
       resolves per-tenant corpus/collection at search time (per-tenant isolation Slice 3a)
     - 2026-06-27: Initial creation (Sprint 57.146) — vector-index composition singleton
@@ -41,6 +46,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from api.v1.chat.embedding_client import get_embedding_client
+from api.v1.chat.vector_store import get_vector_store
 from core.config import get_settings
 
 if TYPE_CHECKING:
@@ -69,13 +76,12 @@ def get_knowledge_vector_index() -> "KnowledgeVectorIndex | None":
 
     # Lazy imports — load the adapter / Qdrant client only when actually enabled.
     from adapters.azure_openai.config import AzureOpenAIConfig
-    from adapters.azure_openai.embeddings import AzureOpenAIEmbeddingClient
     from business_domain.knowledge.connector import LocalDocsConnector
     from business_domain.knowledge.vector_index import KnowledgeVectorIndex
-    from infrastructure.vector.qdrant_client import QdrantVectorStore
 
     config = AzureOpenAIConfig()
-    if not config.is_embedding_configured() or not settings.qdrant_url:
+    store = get_vector_store()
+    if not config.is_embedding_configured() or store is None:
         logger.warning(
             "knowledge vector path enabled but not configured "
             "(AZURE_OPENAI_EMBEDDING_DEPLOYMENT / QDRANT_URL); using keyword fallback"
@@ -92,9 +98,11 @@ def get_knowledge_vector_index() -> "KnowledgeVectorIndex | None":
         return None
 
     _singleton = KnowledgeVectorIndex(
-        AzureOpenAIEmbeddingClient(config),
-        QdrantVectorStore(settings.qdrant_url),
+        get_embedding_client(config),
+        store,
         settings.knowledge_docs_root,
+        incremental=settings.knowledge_vector_incremental_ingest,
+        refresh_interval_sec=settings.knowledge_vector_refresh_sec,
     )
     logger.info("knowledge vector index built (model=%s)", config.deployment_embedding)
     return _singleton
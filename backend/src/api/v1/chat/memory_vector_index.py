@@ -16,12 +16,19 @@ Description:
 
 Key Components:
     - get_memory_vector_index() -> MemoryVectorIndex | None  (memoized)
+    - close_memory_vector_index()  (app lifespan shutdown)
     - reset_memory_vector_index()  (test hook)
 
 Created: 2026-07-01 (Sprint 57.155)
-Last Modified: 2026-07-01
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: close_memory_vector_index() — lifespan shutdown flushes write-through ops
+    - 2026-10-16: store via get_vector_store() (VECTOR_STORE_BACKEND qdrant | local);
+      QDRANT_URL is only required for the qdrant backend
+    - 2026-10-16: pass write_through / reconcile_interval_sec (MEMORY_VECTOR_WRITE_THROUGH)
+    - 2026-10-16: embedder via get_embedding_client() (shared coalescer/cache when
+      EMBEDDING_CACHE is on)
     - 2026-07-01: Initial creation (Sprint 57.155) — memory vector-index composition
       singleton (CARRY-026 Slice 1, L4 user semantic axis)
 
@@ -36,6 +43,8 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from api.v1.chat.embedding_client import get_embedding_client
+from api.v1.chat.vector_store import get_vector_store
 from core.config import get_settings
 
 if TYPE_CHECKING:
@@ -64,12 +73,11 @@ def get_memory_vector_index() -> "MemoryVectorIndex | None":
 
     # Lazy imports — load the adapter / Qdrant client only when actually enabled.
     from adapters.azure_openai.config import AzureOpenAIConfig
-    from adapters.azure_openai.embeddings import AzureOpenAIEmbeddingClient
     from agent_harness.memory.vector_index import MemoryVectorIndex
-    from infrastructure.vector.qdrant_client import QdrantVectorStore
 
     config = AzureOpenAIConfig()
-    if not config.is_embedding_configured() or not settings.qdrant_url:
+    store = get_vector_store()
+    if not config.is_embedding_configured() or store is None:
         logger.warning(
             "memory vector path enabled but not configured "
             "(AZURE_OPENAI_DEPLOYMENT_EMBEDDING / QDRANT_URL); using keyword fallback"
@@ -77,13 +85,21 @@ def get_memory_vector_index() -> "MemoryVectorIndex | None":
         return None
 
     _singleton = MemoryVectorIndex(
-        AzureOpenAIEmbeddingClient(config),
-        QdrantVectorStore(settings.qdrant_url),
+        get_embedding_client(config),
+        store,
+        write_through=settings.memory_vector_write_through,
+        reconcile_interval_sec=settings.memory_vector_reconcile_interval_sec,
     )
     logger.info("memory vector index built (model=%s)", config.deployment_embedding)
     return _singleton
 
 
+async def close_memory_vector_index() -> None:
+    """Flush the index's write-through queue + cancel reconciles (no-op when never built)."""
+    if _singleton is not None:
+        await _singleton.close()
+
+
 def reset_memory_vector_index() -> None:
     """Test hook: clear the memoized singleton so the next call rebuilds from settings."""
     global _built, _singleton
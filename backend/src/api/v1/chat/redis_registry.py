@@ -0,0 +1,456 @@
+"""
+File: backend/src/api/v1/chat/redis_registry.py
+Purpose: Redis-backed Session / Injection registries — cross-worker status, cancel and inject.
+Category: api/v1/chat
+Scope: Phase 57 / multi-worker chat pods
+
+Description:
+    SessionRegistry and InjectionRegistry keep a run's status, cancel_event and
+    inject queue in the memory of the uvicorn worker running the loop, so
+    GET /sessions/{id}, POST /sessions/{id}/cancel and POST /{id}/inject only
+    work when the load balancer routes them to that same worker — pods had to
+    run a single worker. With CHAT_REGISTRY_BACKEND=redis these subclasses keep
+    the in-memory state (the loop still polls a local Event / drains a local
+    queue) and add:
+
+    - Ownership keys: `chat:registry:session:{tenant}:{session}` (JSON worker /
+      status / started_at) and `chat:registry:inbox:{tenant}:{id}` (worker id),
+      written on register and kept alive by the worker's heartbeat
+      (EXPIRE chat_registry_owner_ttl_sec every chat_registry_heartbeat_sec).
+      A crashed worker stops heartbeating, so its sessions age out instead of
+      staying "running" forever. A finished session's key is re-written with
+      chat_registry_finished_ttl_sec so status reads keep working for a while.
+    - Delivery: every worker subscribes to its own channel
+      `chat:registry:worker:{worker_id}`. A non-owning worker resolves the
+      owner from the key and PUBLISHes the cancel / inject there; the owner's
+      listener applies it to its local registry. PUBLISH returning 0 receivers
+      means the owner is gone → inject reports "no live queue" (409).
+
+    Tenant scoping is preserved: both key families embed tenant_id, and the
+    owner applies remote operations through the same tenant-keyed local maps.
+
+    Fail-open like the other Redis-backed singletons: a Redis error is logged
+    and the call falls back to its in-process result — a flaky Redis degrades
+    to single-worker behaviour, never to a failed chat.
+
+Key Components:
+    - RegistryBus: one worker's Redis client, pub/sub listener + ownership heartbeat
+    - RedisSessionRegistry: SessionRegistry + ownership keys + remote cancel
+    - RedisInjectionRegistry: InjectionRegistry + inbox keys + remote inject
+    - start_redis_registries() / stop_redis_registries(): startup / shutdown wiring
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — pluggable Redis registry backend
+
+Related:
+    - api/v1/chat/session_registry.py / injection_registry.py (the in-memory bases)
+    - api/v1/chat/router.py (status / cancel / inject endpoints)
+    - api/main.py (_start_chat_registries — lifespan wiring)
+    - core/config chat_registry_* settings
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime
+from typing import TYPE_CHECKING, Any
+from uuid import UUID, uuid4
+
+from agent_harness._contracts import Message
+
+from .injection_registry import InjectionRegistry, set_default_injection_registry
+from .session_registry import SessionEntry, SessionRegistry, set_default_registry
+
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+    from redis.asyncio.client import PubSub
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "chat:registry"
+
+RemoteHandler = Callable[[dict[str, Any]], Awaitable[None]]
+
+
+def _session_key(tenant_id: UUID, session_id: UUID) -> str:
+    return f"{_KEY_PREFIX}:session:{tenant_id}:{session_id}"
+
+
+def _inbox_key(tenant_id: UUID, session_id: UUID) -> str:
+    return f"{_KEY_PREFIX}:inbox:{tenant_id}:{session_id}"
+
+
+def _worker_channel(worker_id: str) -> str:
+    return f"{_KEY_PREFIX}:worker:{worker_id}"
+
+
+def _decode(raw: bytes | str | None) -> str | None:
+    if raw is None:
+        return None
+    return raw.decode("utf-8") if isinstance(raw, bytes) else raw
+
+
+# === RegistryBus: one worker's Redis side ====================================
+# Why: both registries need the same three things — a worker identity, a channel
+# the owner listens on, and a heartbeat for the keys it owns — so they share one
+# bus per process instead of each holding a pub/sub connection.
+class RegistryBus:
+    """A worker's ownership heartbeat + pub/sub listener over one Redis client."""
+
+    def __init__(
+        self,
+        client: Redis,
+        *,
+        owner_ttl_sec: int,
+        heartbeat_sec: float,
+        worker_id: str | None = None,
+    ) -> None:
+        self.client = client
+        self.worker_id = worker_id or uuid4().hex
+        self.owner_ttl_sec = owner_ttl_sec
+        self._heartbeat_sec = heartbeat_sec
+        self._owned: set[str] = set()
+        self._handlers: dict[str, RemoteHandler] = {}
+        self._pubsub: PubSub | None = None
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def on(self, op: str, handler: RemoteHandler) -> None:
+        """Route remote operations named `op` arriving on this worker's channel."""
+        self._handlers[op] = handler
+
+    async def start(self) -> None:
+        """Subscribe to this worker's channel, then start the listener + heartbeat."""
+        if self._tasks:
+            return
+        self._pubsub = self.client.pubsub()
+        await self._pubsub.subscribe(_worker_channel(self.worker_id))
+        self._tasks = [
+            asyncio.create_task(self._listen(), name="chat-registry-listener"),
+            asyncio.create_task(self._heartbeat(), name="chat-registry-heartbeat"),
+        ]
+
+    async def stop(self) -> None:
+        """Stop both tasks and release the keys this worker still owns."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        if self._pubsub is not None:
+            try:
+                await self._pubsub.unsubscribe()
+                await self._pubsub.aclose()
+            except Exception:  # noqa: BLE001 — shutdown is best-effort
+                logger.warning("chat registry: pub/sub close failed", exc_info=True)
+            self._pubsub = None
+        # A graceful shutdown ends this worker's runs; let their keys go now
+        # rather than after the owner TTL.
+        owned, self._owned = list(self._owned), set()
+        if owned:
+            try:
+                await self.client.delete(*owned)
+            except Exception:  # noqa: BLE001 — the TTL expires them anyway
+                logger.warning("chat registry: owned-key release failed", exc_info=True)
+
+    # --- ownership keys -------------------------------------------------------
+
+    async def claim(self, key: str, value: str) -> None:
+        """Write an owned key with the owner TTL; the heartbeat keeps it alive."""
+        self._owned.add(key)
+        await self.store(key, value, ttl_sec=self.owner_ttl_sec)
+
+    async def store(self, key: str, value: str, *, ttl_sec: int) -> None:
+        try:
+            await self.client.set(key, value, ex=ttl_sec)
+        except Exception:  # noqa: BLE001 — fail-open: local state still works
+            logger.warning("chat registry: write %s failed (fail-open)", key, exc_info=True)
+
+    async def load(self, key: str) -> str | None:
+        try:
+            return _decode(await self.client.get(key))
+        except Exception:  # noqa: BLE001 — fail-open: treated as not found
+            logger.warning("chat registry: read %s failed (fail-open)", key, exc_info=True)
+            return None
+
+    async def release(self, key: str) -> None:
+        """Stop heartbeating `key` and delete it."""
+        self._owned.discard(key)
+        try:
+            await self.client.delete(key)
+        except Exception:  # noqa: BLE001 — the TTL expires it anyway
+            logger.warning("chat registry: delete %s failed (fail-open)", key, exc_info=True)
+
+    def disown(self, key: str) -> None:
+        """Stop heartbeating `key`; its current TTL then runs out on its own."""
+        self._owned.discard(key)
+
+    async def beat(self) -> None:
+        """Refresh the TTL of every key this worker owns (one pipelined round trip)."""
+        keys = list(self._owned)
+        if not keys:
+            return
+        try:
+            async with self.client.pipeline(transaction=False) as pipe:
+                for key in keys:
+                    pipe.expire(key, self.owner_ttl_sec)
+                await pipe.execute()
+        except Exception:  # noqa: BLE001 — next beat retries; keys live owner_ttl_sec
+            logger.warning("chat registry: heartbeat failed (fail-open)", exc_info=True)
+
+    async def _heartbeat(self) -> None:
+        while True:
+            await asyncio.sleep(self._heartbeat_sec)
+            await self.beat()
+
+    # --- remote delivery ------------------------------------------------------
+
+    async def send(self, worker_id: str, op: str, payload: dict[str, Any]) -> int:
+        """Publish `op` to `worker_id`'s channel; returns the receiver count (0 = gone)."""
+        body = json.dumps({"op": op, **payload}, separators=(",", ":"))
+        try:
+            return int(await self.client.publish(_worker_channel(worker_id), body))
+        except Exception:  # noqa: BLE001 — fail-open: reported as undelivered
+            logger.warning("chat registry: publish %s failed (fail-open)", op, exc_info=True)
+            return 0
+
+    async def dispatch(self, body: bytes | str) -> None:
+        """Apply one remote operation to this worker's local registries."""
+        try:
+            payload = json.loads(body)
+            handler = self._handlers.get(payload.pop("op", None))
+            if handler is not None:
+                await handler(payload)
+        except Exception:  # noqa: BLE001 — one bad message must not kill the listener
+            logger.warning("chat registry: remote operation failed", exc_info=True)
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                assert self._pubsub is not None
+                async for raw in self._pubsub.listen():
+                    if raw.get("type") == "message":
+                        await self.dispatch(raw["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception:  # noqa: BLE001 — redis-py re-subscribes on reconnect
+                logger.warning("chat registry: listener error; retrying", exc_info=True)
+                await asyncio.sleep(self._heartbeat_sec)
+
+
+# === RedisSessionRegistry: status + cancel across workers ====================
+class RedisSessionRegistry(SessionRegistry):
+    """SessionRegistry whose status is readable — and cancel deliverable — from any worker.
+
+    The owning worker answers from its local entry exactly like the in-memory
+    base; other workers read the ownership key and forward cancels to the owner.
+    `on_cancel` runs on the owner after a REMOTE cancel (the router's local
+    cancel path already stops the resumable-stream producer itself).
+    """
+
+    def __init__(
+        self,
+        bus: RegistryBus,
+        *,
+        finished_ttl_sec: int,
+        on_cancel: Callable[[UUID, UUID], object] | None = None,
+    ) -> None:
+        super().__init__()
+        self._bus = bus
+        self._finished_ttl_sec = finished_ttl_sec
+        self._on_cancel = on_cancel
+        bus.on("cancel", self._apply_remote_cancel)
+
+    def _record(self, entry: SessionEntry) -> str:
+        return json.dumps(
+            {
+                "worker": self._bus.worker_id,
+                "status": entry.status,
+                "started_at": entry.started_at.isoformat(),
+            }
+        )
+
+    async def _publish_final(self, tenant_id: UUID, session_id: UUID) -> None:
+        entry = await super().get(tenant_id, session_id)
+        if entry is None:
+            return
+        key = _session_key(tenant_id, session_id)
+        self._bus.disown(key)
+        await self._bus.store(key, self._record(entry), ttl_sec=self._finished_ttl_sec)
+
+    async def _remote_record(self, tenant_id: UUID, session_id: UUID) -> dict[str, Any] | None:
+        raw = await self._bus.load(_session_key(tenant_id, session_id))
+        if raw is None:
+            return None
+        try:
+            record = json.loads(raw)
+            return record if isinstance(record, dict) else None
+        except json.JSONDecodeError:
+            return None
+
+    async def register(self, tenant_id: UUID, session_id: UUID) -> SessionEntry:
+        entry = await super().register(tenant_id, session_id)
+        await self._bus.claim(_session_key(tenant_id, session_id), self._record(entry))
+        return entry
+
+    async def get(self, tenant_id: UUID, session_id: UUID) -> SessionEntry | None:
+        """Local entry on the owner; elsewhere a snapshot from the ownership key."""
+        entry = await super().get(tenant_id, session_id)
+        if entry is not None:
+            return entry
+        record = await self._remote_record(tenant_id, session_id)
+        if record is None:
+            return None
+        try:
+            return SessionEntry(
+                status=record["status"], started_at=datetime.fromisoformat(record["started_at"])
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    async def cancel(self, tenant_id: UUID, session_id: UUID) -> bool:
+        if await super().cancel(tenant_id, session_id):
+            await self._publish_final(tenant_id, session_id)
+            return True
+        record = await self._remote_record(tenant_id, session_id)
+        if record is None:
+            return False
+        if record.get("status") == "running" and record.get("worker") != self._bus.worker_id:
+            payload = {"tenant_id": str(tenant_id), "session_id": str(session_id)}
+            if not await self._bus.send(str(record.get("worker")), "cancel", payload):
+                # Owner gone before its key expired — record the cancel here.
+                record["status"] = "cancelled"
+                await self._bus.store(
+                    _session_key(tenant_id, session_id),
+                    json.dumps(record),
+                    ttl_sec=self._finished_ttl_sec,
+                )
+        return True
+
+    async def mark_completed(self, tenant_id: UUID, session_id: UUID) -> None:
+        await super().mark_completed(tenant_id, session_id)
+        await self._publish_final(tenant_id, session_id)
+
+    async def cleanup(self, tenant_id: UUID, session_id: UUID) -> None:
+        await super().cleanup(tenant_id, session_id)
+        await self._bus.release(_session_key(tenant_id, session_id))
+
+    async def _apply_remote_cancel(self, payload: dict[str, Any]) -> None:
+        tenant_id, session_id = UUID(payload["tenant_id"]), UUID(payload["session_id"])
+        # super(): never forward again — a run that ended meanwhile is simply done.
+        if not await super().cancel(tenant_id, session_id):
+            return
+        await self._publish_final(tenant_id, session_id)
+        if self._on_cancel is not None:
+            self._on_cancel(tenant_id, session_id)
+
+
+# === RedisInjectionRegistry: inject delivery to the owning worker ============
+def _message_to_wire(message: Message) -> dict[str, Any] | None:
+    # The inject endpoints only build plain-text user messages; richer content
+    # blocks have no wire form here and stay owner-local.
+    if not isinstance(message.content, str):
+        return None
+    return {
+        "role": message.role,
+        "content": message.content,
+        "name": message.name,
+        "metadata": message.metadata,
+    }
+
+
+def _message_from_wire(data: dict[str, Any]) -> Message:
+    return Message(
+        role=data["role"],
+        content=data["content"],
+        name=data.get("name"),
+        metadata=dict(data.get("metadata") or {}),
+    )
+
+
+class RedisInjectionRegistry(InjectionRegistry):
+    """InjectionRegistry whose put() reaches the queue on whichever worker owns it.
+
+    Queues (and drain) stay local to the run's worker; live_count() stays
+    per-process (the formation pool yields to THIS worker's streams).
+    """
+
+    def __init__(self, bus: RegistryBus) -> None:
+        super().__init__()
+        self._bus = bus
+        bus.on("inject", self._apply_remote_inject)
+
+    async def register(self, tenant_id: UUID, session_id: UUID) -> None:
+        await super().register(tenant_id, session_id)
+        await self._bus.claim(_inbox_key(tenant_id, session_id), self._bus.worker_id)
+
+    async def put(self, tenant_id: UUID, session_id: UUID, message: Message) -> bool:
+        if await super().put(tenant_id, session_id, message):
+            return True
+        owner = await self._bus.load(_inbox_key(tenant_id, session_id))
+        if owner is None or owner == self._bus.worker_id:
+            return False
+        wire = _message_to_wire(message)
+        if wire is None:
+            logger.warning("chat registry: non-text inject cannot cross workers")
+            return False
+        payload = {"tenant_id": str(tenant_id), "session_id": str(session_id), "message": wire}
+        return await self._bus.send(owner, "inject", payload) > 0
+
+    async def unregister(self, tenant_id: UUID, session_id: UUID) -> None:
+        await super().unregister(tenant_id, session_id)
+        await self._bus.release(_inbox_key(tenant_id, session_id))
+
+    async def _apply_remote_inject(self, payload: dict[str, Any]) -> None:
+        tenant_id, session_id = UUID(payload["tenant_id"]), UUID(payload["session_id"])
+        # super(): a queue that ended meanwhile drops the message rather than
+        # bouncing it back to Redis.
+        await super().put(tenant_id, session_id, _message_from_wire(payload["message"]))
+
+
+# === Startup / shutdown wiring ================================================
+_bus: RegistryBus | None = None
+
+
+async def start_redis_registries(
+    client: Redis,
+    *,
+    owner_ttl_sec: int,
+    heartbeat_sec: float,
+    finished_ttl_sec: int,
+    on_cancel: Callable[[UUID, UUID], object] | None = None,
+) -> RegistryBus:
+    """Install the Redis-backed registries as the process singletons and start the bus."""
+    global _bus
+    bus = RegistryBus(client, owner_ttl_sec=owner_ttl_sec, heartbeat_sec=heartbeat_sec)
+    set_default_registry(
+        RedisSessionRegistry(bus, finished_ttl_sec=finished_ttl_sec, on_cancel=on_cancel)
+    )
+    set_default_injection_registry(RedisInjectionRegistry(bus))
+    await bus.start()
+    _bus = bus
+    return bus
+
+
+async def stop_redis_registries() -> None:
+    """Stop the bus (a no-op when never started); the singletons revert to in-memory."""
+    global _bus
+    if _bus is None:
+        return
+    bus, _bus = _bus, None
+    await bus.stop()
+    set_default_registry(None)
+    set_default_injection_registry(None)
+
+
+__all__ = [
+    "RedisInjectionRegistry",
+    "RedisSessionRegistry",
+    "RegistryBus",
+    "start_redis_registries",
+    "stop_redis_registries",
+]
@@ -15,6 +15,9 @@ Description:
                                              status for a known session of THIS tenant.
     - POST /api/v1/chat/sessions/{id}/cancel → flips status to "cancelled" and
                                              signals cancel_event for THIS tenant.
+    - GET  /api/v1/chat/sessions/{id}/stream → replays the persisted transcript
+                                             after Last-Event-ID, then follows
+                                             the live run (resumable streams).
 
     POST /chat orchestration (per Sprint 52.5 P0 #11+#12):
         1. JWT middleware populates request.state.tenant_id → Depends extracts.
@@ -35,9 +38,22 @@ Description:
     actual loop run lives in the worker.
 
 Created: 2026-04-30 (Sprint 50.2 Day 1.5)
-Last Modified: 2026-07-16
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: drop the single-row _persist_main_event helper (streams use TranscriptWriter)
+    - 2026-10-16: Formation body split into the raising _form_session_memory (queue jobs);
+      _maybe_auto_extract stays the best-effort inline wrapper
+    - 2026-10-16: Stream reconnect answers 410 when frames between the cursor and the ring are lost
+    - 2026-10-16: Resumable streams — SSE `id:` per persisted frame, StreamHub producer
+      (CHAT_RESUMABLE_STREAMS) + GET /sessions/{id}/stream Last-Event-ID reconnect
+    - 2026-10-16: Main + sidechain transcript rows batched through a per-request TranscriptWriter
+    - 2026-10-16: full-ledger formation reads load_since(0) (checkpointed load() is windowed)
+    - 2026-10-16: post-send formation enqueues onto the formation queue when
+      CHAT_MEMORY_FORMATION_QUEUE is set (_post_send_formation)
+    - 2026-10-16: _maybe_auto_extract loads only the unsummarized ledger tail
+      (CHAT_SESSION_SUMMARY_INCREMENTAL)
+    - 2026-10-16: llm_text_delta frames stream live but are not persisted to message_events
     - 2026-07-16: Sprint 57.166 — cross-burst turn/token aggregate in final loop_end + audit
     - 2026-06-25: Sprint 57.143 — cancel persists interrupt marker (AD-UserStop-Resume-Context)
     - 2026-06-16: Sprint 57.128 — persist post-resume SSE events to message_events (resume replay)
@@ -92,9 +108,10 @@ from collections.abc import AsyncIterator, Sequence
 from typing import Any
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import anyio
+from fastapi import APIRouter, Depends, Header, HTTPException, status
 from fastapi.responses import StreamingResponse
-from sqlalchemy import func, select
+from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.background import BackgroundTask
 
@@ -114,6 +131,7 @@ from agent_harness._contracts.events import (
     SubagentSpawned,
     ToolCallExecuted,
 )
+from agent_harness.memory.session_summary_store import SummaryState
 from agent_harness.observability._abc import Tracer
 from agent_harness.orchestrator_loop import AgentLoop
 from agent_harness.orchestrator_loop.scheduler import CONTINUATION_NUDGE, should_continue_plan
@@ -155,6 +173,7 @@ from platform_layer.tenant.quota import (
 )
 
 from ._category_factories import make_chat_todo_store
+from .formation_queue import enqueue_formation
 from .handler import (
     ChatMemoryExtractContext,
     build_chat_memory_extractor,
@@ -171,6 +190,15 @@ from .schemas import (
 )
 from .session_registry import SessionRegistry, get_default_registry
 from .sse import format_sse_message, serialize_loop_event
+from .stream_hub import (
+    StreamFrame,
+    StreamHub,
+    StreamSubscription,
+    frame_event_id,
+    frames_after,
+    get_default_stream_hub,
+)
+from .transcript_writer import TranscriptOp, TranscriptWriter, make_transcript_writer
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat", tags=["chat"])
@@ -443,7 +471,7 @@ async def chat(
     # session summary (57.151), each independently gated inside the builder. Build
     # the ctx when EITHER flag is on; None (both off / echo / missing env) → no-op.
     memory_extract_ctx: ChatMemoryExtractContext | None = (
-        build_chat_memory_extractor(model_policy, db, session_id, current_tenant)
+        build_chat_memory_extractor(model_policy, db, session_id, current_tenant, tracer=tracer)
         if (
             req.mode == "real_llm"
             and (settings.chat_memory_auto_extract or settings.chat_session_summary)
@@ -451,30 +479,42 @@ async def chat(
         else None
     )
 
-    return StreamingResponse(
-        _stream_loop_events(
-            loop,
+    stream = _stream_loop_events(
+        loop,
+        current_tenant,
+        session_id,
+        registry,
+        user_input=req.message,
+        trace_context=trace_ctx,
+        quota_enforcer=quota_enforcer,
+        estimated_tokens=estimated_tokens,
+        sla_recorder=sla_recorder,
+        chat_start_time=chat_start_time,
+        billing_outbox=billing_outbox,
+        db=db,
+        subagent_event_buffer=subagent_event_buffer,
+        # Sprint 57.107 (B3): the tenant's handoff allowlist for the post-loop
+        # boot hook (None = no restriction). _stream_loop_events is module-
+        # level, so the resolved policy is threaded explicitly.
+        handoff_allowed_targets=harness_policy.handoff_target_allowlist,
+        # Sprint 57.116 (Skills Inspector affordance): the server-confirmed
+        # force-load skill (validated above) — injected onto the opening
+        # loop_start frame so chat-v2 can chip the user turn. None → no chip.
+        active_skill=forced_skill,
+    )
+    # CHAT_RESUMABLE_STREAMS: the run is driven by a producer task publishing to the
+    # stream hub; this response is one subscriber, so a dropped connection leaves the
+    # run going and the client resumes via GET /chat/sessions/{id}/stream.
+    if settings.chat_resumable_streams:
+        stream = _resumable_stream(
+            stream,
             current_tenant,
             session_id,
-            registry,
-            user_input=req.message,
-            trace_context=trace_ctx,
-            quota_enforcer=quota_enforcer,
-            estimated_tokens=estimated_tokens,
-            sla_recorder=sla_recorder,
-            chat_start_time=chat_start_time,
-            billing_outbox=billing_outbox,
-            db=db,
-            subagent_event_buffer=subagent_event_buffer,
-            # Sprint 57.107 (B3): the tenant's handoff allowlist for the post-loop
-            # boot hook (None = no restriction). _stream_loop_events is module-
-            # level, so the resolved policy is threaded explicitly.
-            handoff_allowed_targets=harness_policy.handoff_target_allowlist,
-            # Sprint 57.116 (Skills Inspector affordance): the server-confirmed
-            # force-load skill (validated above) — injected onto the opening
-            # loop_start frame so chat-v2 can chip the user turn. None → no chip.
-            active_skill=forced_skill,
-        ),
+            ring_size=settings.chat_stream_replay_buffer,
+        )
+
+    return StreamingResponse(
+        stream,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -494,8 +534,10 @@ async def chat(
         # memory_extract_ctx is None (echo / flag-off / missing env) → _maybe_auto_extract
         # is a no-op. The extractor / retrieval / message_store all open their OWN
         # sessions, so the request db being torn down does not affect this task.
+        # CHAT_MEMORY_FORMATION_QUEUE set → the task only enqueues a per-session
+        # coalesced job for the formation worker pool (formation_queue.py).
         background=BackgroundTask(
-            _maybe_auto_extract,
+            _post_send_formation,
             memory_extract_ctx=memory_extract_ctx,
             tenant_id=current_tenant,
             session_id=session_id,
@@ -530,18 +572,19 @@ async def list_chat_skills(
 # persists subagent transcripts via parentUuid/isSidechain linkage; the V2
 # equivalent is a sidechain `sessions` row + per-turn `message_events` rows,
 # written HERE at the api layer (the loop + Cat 11 stay persistence-free).
-# Best-effort SAVEPOINT (mirror the sessions/audit observers): a DB flake must
-# never break the SSE stream. Rows commit with the request transaction.
-async def _persist_subagent_transcript(
+# Buffered into the request's TranscriptWriter (rows + the sidechain sessions
+# create / complete as ordered ops), which writes best-effort batches — a DB
+# flake must never break the SSE stream.
+def _persist_subagent_transcript(
     events: "list[LoopEvent]",
     *,
-    db: AsyncSession | None,
+    transcript: TranscriptWriter,
     tenant_id: UUID,
     user_id: UUID | None,
     parent_session_id: UUID,
     sidechain_seq: dict[UUID, int],
 ) -> None:
-    """Persist subagent lifecycle + child-turn events as a sidechain transcript.
+    """Buffer subagent lifecycle + child-turn events as a sidechain transcript.
 
     SubagentSpawned → sidechain `sessions` row (id=subagent_id,
     parent_session_id=parent, is_sidechain=True). SubagentChildEvent →
@@ -552,109 +595,78 @@ async def _persist_subagent_transcript(
     Env-gated via SUBAGENT_TRANSCRIPT_OBSERVER (default on; tests/conftest.py
     sets false for isolation parity with SESSIONS_CHAT_OBSERVER).
     """
-    if db is None or not events:
+    if not transcript.enabled or not events:
         return
     if os.environ.get("SUBAGENT_TRANSCRIPT_OBSERVER", "true").lower() != "true":
         return
-    try:
-        repo = SessionRepository(db)
-        async with db.begin_nested():
-            for ev in events:
-                if isinstance(ev, SubagentSpawned) and ev.subagent_id is not None:
-                    await repo.create_session(
-                        session_id=ev.subagent_id,
-                        user_id=user_id or tenant_id,
-                        tenant_id=tenant_id,
-                        title=f"Subagent · {ev.mode or 'fork'}",
-                        parent_session_id=parent_session_id,
-                        is_sidechain=True,
-                        meta_data={"mode": ev.mode},
-                    )
-                elif isinstance(ev, SubagentChildEvent) and ev.subagent_id is not None:
-                    try:
-                        payload = serialize_loop_event(ev)
-                    except NotImplementedError:
-                        continue
-                    if payload is None:
-                        continue
-                    seq = sidechain_seq.get(ev.subagent_id, 0) + 1
-                    sidechain_seq[ev.subagent_id] = seq
-                    db.add(
-                        MessageEvent(
-                            session_id=ev.subagent_id,
-                            tenant_id=tenant_id,
-                            event_type=payload["type"],
-                            event_data=payload["data"],
-                            sequence_num=seq,
-                            timestamp_ms=int(time.time() * 1000),
-                        )
-                    )
-                elif isinstance(ev, SubagentCompleted) and ev.subagent_id is not None:
-                    row = await repo.get_session(session_id=ev.subagent_id, tenant_id=tenant_id)
-                    if row is not None:
-                        row.status = "completed"
-                        row.meta_data = {
-                            **(row.meta_data or {}),
-                            "summary": ev.summary,
-                            "tokens_used": ev.tokens_used,
-                        }
-    except Exception:  # noqa: BLE001 — best-effort observer (mirror sessions/audit)
-        logger.exception(
-            "chat session %s/%s: subagent transcript persist failed (best-effort)",
-            tenant_id,
-            parent_session_id,
+    for ev in events:
+        if isinstance(ev, SubagentSpawned) and ev.subagent_id is not None:
+            transcript.add_op(
+                _create_sidechain_op(
+                    ev,
+                    tenant_id=tenant_id,
+                    user_id=user_id or tenant_id,
+                    parent_session_id=parent_session_id,
+                )
+            )
+        elif isinstance(ev, SubagentChildEvent) and ev.subagent_id is not None:
+            try:
+                payload = serialize_loop_event(ev)
+            except NotImplementedError:
+                continue
+            if payload is None:
+                continue
+            seq = sidechain_seq.get(ev.subagent_id, 0) + 1
+            sidechain_seq[ev.subagent_id] = seq
+            transcript.add_event(session_id=ev.subagent_id, payload=payload, sequence_num=seq)
+        elif isinstance(ev, SubagentCompleted) and ev.subagent_id is not None:
+            transcript.add_op(_complete_sidechain_op(ev, tenant_id=tenant_id))
+
+
+def _create_sidechain_op(
+    ev: SubagentSpawned, *, tenant_id: UUID, user_id: UUID, parent_session_id: UUID
+) -> TranscriptOp:
+    """The sidechain `sessions` row create, run in the transcript's write order."""
+
+    async def _op(db: AsyncSession) -> None:
+        assert ev.subagent_id is not None
+        await SessionRepository(db).create_session(
+            session_id=ev.subagent_id,
+            user_id=user_id,
+            tenant_id=tenant_id,
+            title=f"Subagent · {ev.mode or 'fork'}",
+            parent_session_id=parent_session_id,
+            is_sidechain=True,
+            meta_data={"mode": ev.mode},
         )
 
+    return _op
 
-# === _persist_main_event: main-session transcript observer (Sprint 57.125) ===
-# Why: the main chat SSE event stream was unpersisted — only subagent sidechains
-# were written to message_events (57.107). Without a durable main transcript,
-# clicking a historical session in chat-v2 cannot replay its conversation
-# (AD-ChatV2-Session-History-Replay-Phase58, arc slice 1/2: this is the backend
-# writer; slice 2 = the frontend replay). Persists the EXACT serialized SSE
-# payload (the same dict yielded to the client, incl. active_skill) so the 57.126
-# frontend can replay it through the live mergeEvent reducer for a pixel-identical
-# historical Turn stream. Mirrors _persist_subagent_transcript: best-effort
-# SAVEPOINT (a DB flake must NEVER break the SSE stream), keyed by the MAIN
-# session_id (sidechain rows are keyed by subagent_id → no collision). Env-gated
-# via MAIN_TRANSCRIPT_OBSERVER (default on; tests/integration/api/conftest.py sets
-# false for isolation parity with SUBAGENT_TRANSCRIPT_OBSERVER). All main event
-# `data` dicts are JSON-native (every serializer str()-coerces UUIDs; trace_id is
-# a hex str) → persist payload["data"] directly (same as the sidechain writer).
-async def _persist_main_event(
-    payload: dict[str, Any],
-    *,
-    db: AsyncSession | None,
-    tenant_id: UUID,
-    session_id: UUID,
-    sequence_num: int,
-) -> None:
-    """Persist one already-serialized main-session SSE event to message_events.
 
-    `payload` is serialize_loop_event's output (with active_skill applied) — the
-    exact frame yielded to the client. Best-effort: a persist failure is logged
-    and swallowed so the SSE stream is never broken.
-    """
-    if db is None:
-        return
-    try:
-        async with db.begin_nested():
-            db.add(
-                MessageEvent(
-                    session_id=session_id,
-                    tenant_id=tenant_id,
-                    event_type=payload["type"],
-                    event_data=payload["data"],
-                    sequence_num=sequence_num,
-                    timestamp_ms=int(time.time() * 1000),
-                )
-            )
-    except Exception:  # noqa: BLE001 — best-effort observer (mirror sidechain)
-        logger.exception(
-            "chat session %s/%s: main transcript persist failed (best-effort)",
-            tenant_id,
-            session_id,
+def _complete_sidechain_op(ev: SubagentCompleted, *, tenant_id: UUID) -> TranscriptOp:
+    """Mark the sidechain completed + fold summary/tokens (after its child rows)."""
+
+    async def _op(db: AsyncSession) -> None:
+        assert ev.subagent_id is not None
+        row = await SessionRepository(db).get_session(
+            session_id=ev.subagent_id, tenant_id=tenant_id
         )
+        if row is not None:
+            row.status = "completed"
+            row.meta_data = {
+                **(row.meta_data or {}),
+                "summary": ev.summary,
+                "tokens_used": ev.tokens_used,
+            }
+            await db.flush()
+
+    return _op
+
+
+# Token streaming: llm_text_delta frames are a live-only UI feed — the turn's
+# llm_response that follows carries the full assembled content, so the replayed
+# transcript stays identical without one message_events row per token chunk.
+_UNPERSISTED_WIRE_TYPES: frozenset[str] = frozenset({"llm_text_delta"})
 
 
 # === _max_main_seq: seed the main transcript sequence across sends (Sprint 57.126) ===
@@ -679,6 +691,40 @@ async def _max_main_seq(
     return int((await db.execute(stmt)).scalar_one())
 
 
+async def _post_send_formation(
+    *,
+    memory_extract_ctx: ChatMemoryExtractContext | None,
+    tenant_id: UUID,
+    session_id: UUID,
+    trace_context: TraceContext,
+) -> None:
+    """Post-send BackgroundTask: enqueue formation (queue on) or run it inline.
+
+    With CHAT_MEMORY_FORMATION_QUEUE set the session's job is queued (superseding
+    a still-queued one) for the formation worker pool; an enqueue failure falls
+    back to the inline path so a queue outage never drops formation.
+    """
+    if memory_extract_ctx is None:
+        return
+    try:
+        if await enqueue_formation(
+            tenant_id=tenant_id, session_id=session_id, trace_context=trace_context
+        ):
+            return
+    except Exception:  # noqa: BLE001 — queue outage → form inline (best-effort either way)
+        logger.exception(
+            "chat session %s/%s: formation enqueue failed; forming inline",
+            tenant_id,
+            session_id,
+        )
+    await _maybe_auto_extract(
+        memory_extract_ctx=memory_extract_ctx,
+        tenant_id=tenant_id,
+        session_id=session_id,
+        trace_context=trace_context,
+    )
+
+
 async def _maybe_auto_extract(
     *,
     memory_extract_ctx: ChatMemoryExtractContext | None,
@@ -686,39 +732,24 @@ async def _maybe_auto_extract(
     session_id: UUID,
     trace_context: TraceContext,
 ) -> None:
-    """Post-completion memory formation body (Sprint 57.149 auto-extract +
+    """Inline post-completion memory formation (Sprint 57.149 auto-extract +
     Sprint 57.151 session summary, combined into ONE call by Sprint 57.152). Runs
     as a Starlette BackgroundTask AFTER the SSE response body is fully sent
     (OUTSIDE the streaming generator, so a client disconnect can't make the
-    generator ignore GeneratorExit).
+    generator ignore GeneratorExit). The formation worker-pool job
+    (formation_queue.run_formation_job) calls _form_session_memory directly so
+    its failures reach the queue's retry.
 
-    Loads the session ledger ONCE, reads the user's known facts via profile() for
-    prompt-level dedup (only when the former extracts facts AND the user is known),
-    then makes ONE call to former.form() — which by default issues a single
-    combined cheap-tier LLM call forming BOTH durable user facts (→ UserLayer) and
-    a rolling per-session conversation summary (→ memory_session_summary), or the
-    two-call fallback when CHAT_MEMORY_COMBINED_FORMATION is off.
     BEST-EFFORT: any failure is logged + swallowed — memory formation must NEVER
     surface to the user.
     """
     if memory_extract_ctx is None:
         return
     try:
-        ledger = await memory_extract_ctx.message_store.load()
-        if not ledger:
-            return
-        known_facts: list[str] | None = None
-        if memory_extract_ctx.former.wants_user_facts and trace_context.user_id is not None:
-            known_hints = await memory_extract_ctx.retrieval.profile(
-                tenant_id=tenant_id, user_id=trace_context.user_id
-            )
-            known_facts = [h.summary for h in known_hints if h.summary]
-        await memory_extract_ctx.former.form(
-            messages=ledger,
-            session_id=session_id,
+        await _form_session_memory(
+            memory_extract_ctx=memory_extract_ctx,
             tenant_id=tenant_id,
-            user_id=trace_context.user_id,
-            known_facts=known_facts,
+            session_id=session_id,
             trace_context=trace_context,
         )
     except Exception:  # noqa: BLE001 — formation is best-effort; never break the stream
@@ -729,6 +760,79 @@ async def _maybe_auto_extract(
         )
 
 
+async def _form_session_memory(
+    *,
+    memory_extract_ctx: ChatMemoryExtractContext,
+    tenant_id: UUID,
+    session_id: UUID,
+    trace_context: TraceContext,
+) -> bool:
+    """Memory formation body; raises on failure. False when there was nothing to form.
+
+    Loads the session ledger ONCE, reads the user's known facts via profile() for
+    prompt-level dedup (only when the former extracts facts AND the user is known),
+    then makes ONE call to former.form() — which by default issues a single
+    combined cheap-tier LLM call forming BOTH durable user facts (→ UserLayer) and
+    a rolling per-session conversation summary (→ memory_session_summary), or the
+    two-call fallback when CHAT_MEMORY_COMBINED_FORMATION is off.
+    CHAT_SESSION_SUMMARY_INCREMENTAL: only the ledger tail after the stored
+    summary's watermark is loaded and formed (see _load_formation_window).
+    """
+    ledger, previous_summary, last_seq = await _load_formation_window(
+        memory_extract_ctx, session_id
+    )
+    if not ledger:
+        return False
+    known_facts: list[str] | None = None
+    if memory_extract_ctx.former.wants_user_facts and trace_context.user_id is not None:
+        known_hints = await memory_extract_ctx.retrieval.profile(
+            tenant_id=tenant_id, user_id=trace_context.user_id
+        )
+        known_facts = [h.summary for h in known_hints if h.summary]
+    await memory_extract_ctx.former.form(
+        messages=ledger,
+        session_id=session_id,
+        tenant_id=tenant_id,
+        user_id=trace_context.user_id,
+        known_facts=known_facts,
+        trace_context=trace_context,
+        previous_summary=previous_summary,
+        last_summarized_seq=last_seq,
+    )
+    return True
+
+
+async def _load_formation_window(
+    memory_extract_ctx: ChatMemoryExtractContext, session_id: UUID
+) -> tuple[list[Message], SummaryState | None, int | None]:
+    """(messages to form from, prior summary to fold them into, watermark to record).
+
+    Incremental summary off (or no summary store) → the whole ledger, no prior
+    summary, no watermark (the pre-watermark behavior). On → the messages after
+    the stored summary's last_summarized_seq plus that summary; a missing / pre-0035
+    summary (watermark 0) or a crossed chat_session_summary_full_every boundary
+    reloads the whole ledger for a full re-summary that records the new watermark.
+    """
+    settings = get_settings()
+    summary_store = memory_extract_ctx.summary_store
+    if not settings.chat_session_summary_incremental or summary_store is None:
+        # load_since(0), not load(): a checkpointing store's load() starts at the
+        # last compaction summary; formation reads the verbatim ledger.
+        messages, _ = await memory_extract_ctx.message_store.load_since(0)
+        return messages, None, None
+    state = await summary_store.load_state(session_id)
+    watermark = state.last_summarized_seq if state is not None else 0
+    messages, last_seq = await memory_extract_ctx.message_store.load_since(watermark)
+    if not messages:
+        return [], None, None
+    every = settings.chat_session_summary_full_every
+    if watermark > 0 and (every <= 0 or last_seq // every == watermark // every):
+        return messages, state, last_seq
+    if watermark > 0:
+        messages, last_seq = await memory_extract_ctx.message_store.load_since(0)
+    return messages, None, last_seq
+
+
 def _drain_subagent_frames(buffer: "list[LoopEvent] | None") -> list[bytes]:
     """Serialize + frame any buffered subagent events (SubagentSpawned/Completed).
 
@@ -864,15 +968,16 @@ async def _stream_loop_events(
     # prompt via pushUserMessage so it is NOT yielded to the stream; the replay
     # reader reconstructs the user turn from this row. It sits before loop_start so
     # the 57.116/120 active_skill stamping reconstructs on replay too.
+    # Main + sidechain transcript rows buffer into ONE per-request writer and are
+    # written as multi-row batches (size / age thresholds + the `finally` below).
+    transcript = make_transcript_writer(db, tenant_id)
     main_transcript_on = os.environ.get("MAIN_TRANSCRIPT_OBSERVER", "true").lower() == "true"
     main_seq = await _max_main_seq(db, tenant_id, session_id) if main_transcript_on else 0
     if main_transcript_on and user_input:
         main_seq += 1
-        await _persist_main_event(
-            {"type": "user_message", "data": {"text": user_input}},
-            db=db,
-            tenant_id=tenant_id,
+        transcript.add_event(
             session_id=session_id,
+            payload={"type": "user_message", "data": {"text": user_input}},
             sequence_num=main_seq,
         )
     # Sprint 57.109 (C2): accumulate the semantic summarize usage off
@@ -908,9 +1013,9 @@ async def _stream_loop_events(
             # Sprint 57.107 (US-4): persist the same buffered events as a sidechain
             # transcript BEFORE the drain pops them (best-effort observer).
             if subagent_event_buffer:
-                await _persist_subagent_transcript(
+                _persist_subagent_transcript(
                     list(subagent_event_buffer),
-                    db=db,
+                    transcript=transcript,
                     tenant_id=tenant_id,
                     user_id=trace_context.user_id,
                     parent_session_id=session_id,
@@ -954,22 +1059,24 @@ async def _stream_loop_events(
             if isinstance(event, LoopCompleted) and not _swallow:
                 payload["data"]["total_turns"] = agg_turns
             # Sprint 57.125: persist the main-session event BEFORE the yield (the
-            # persisted payload == the streamed frame, incl. active_skill). The
-            # best-effort SAVEPOINT inside the helper never blocks/breaks the stream.
+            # persisted payload == the streamed frame, incl. active_skill). Buffered:
+            # pump() writes only a due batch (a no-op in background-flush mode), and
+            # a failed batch is logged + dropped, never breaking the stream.
             # Sprint 57.157: a swallowed (continuing) intermediate LoopCompleted is
             # NOT persisted/yielded — the FE stream stays continuous with one
             # terminal loop_end; only this burst's billing (below) runs for it.
+            # A persisted frame carries its sequence_num as the SSE `id:` (the
+            # Last-Event-ID a reconnect resumes after); live-only frames carry none.
             if not _swallow:
-                if main_transcript_on:
+                event_id: int | None = None
+                if main_transcript_on and payload["type"] not in _UNPERSISTED_WIRE_TYPES:
                     main_seq += 1
-                    await _persist_main_event(
-                        payload,
-                        db=db,
-                        tenant_id=tenant_id,
-                        session_id=session_id,
-                        sequence_num=main_seq,
+                    event_id = main_seq
+                    transcript.add_event(
+                        session_id=session_id, payload=payload, sequence_num=main_seq
                     )
-                yield format_sse_message(payload["type"], payload["data"])
+                await transcript.pump()
+                yield format_sse_message(payload["type"], payload["data"], event_id=event_id)
             # Sprint 57.109 (C2): fold the summarize call's usage (server-side
             # fields on ContextCompacted; structural-only compactions carry 0).
             if isinstance(event, ContextCompacted) and (
@@ -1326,9 +1433,9 @@ async def _stream_loop_events(
         # task_spawn precedes the LoopCompleted that breaks the loop).
         # Sprint 57.107 (US-4): persist the defensive-flush events too.
         if subagent_event_buffer:
-            await _persist_subagent_transcript(
+            _persist_subagent_transcript(
                 list(subagent_event_buffer),
-                db=db,
+                transcript=transcript,
                 tenant_id=tenant_id,
                 user_id=trace_context.user_id,
                 parent_session_id=session_id,
@@ -1344,6 +1451,8 @@ async def _stream_loop_events(
         )
         raise
     finally:
+        # Write whatever the transcript still buffers (stream end / disconnect).
+        await transcript.aclose()
         if natural_completion:
             await registry.mark_completed(tenant_id, session_id)
         # else: leave status as-is (running / cancelled) — caller can poll GET.
@@ -1352,6 +1461,175 @@ async def _stream_loop_events(
         await get_default_injection_registry().unregister(tenant_id, session_id)
 
 
+# === Resumable streams: hub fan-out + Last-Event-ID reconnect ================
+# Why: a dropped POST /chat connection used to lose the stream (and, because the
+# disconnect cancels the generator, the run) — mobile / flaky-proxy users re-sent
+# and paid for the whole run again. With CHAT_RESUMABLE_STREAMS the run's frames
+# are produced by a task publishing to the in-process StreamHub; responses are
+# subscribers. Every persisted frame carries `id: <sequence_num>`, so a reconnect
+# replays message_events after the client's Last-Event-ID (keyset) and then
+# attaches to the live fan-out. In-process only: a reconnect served by another
+# worker gets the persisted replay and then ends.
+async def _publish_stream(
+    frames: AsyncIterator[bytes], hub: StreamHub, tenant_id: UUID, session_id: UUID
+) -> None:
+    """Producer task: drive the run's frame generator into the hub, then close it."""
+    after_seq = 0
+    try:
+        async for frame in frames:
+            event_id = frame_event_id(frame)
+            if event_id is not None:
+                after_seq = event_id
+            hub.publish(tenant_id, session_id, StreamFrame(frame, event_id, after_seq))
+    except Exception:  # noqa: BLE001 — the run's own failure; subscribers just see the end
+        logger.exception("chat session %s/%s: stream producer failed", tenant_id, session_id)
+    finally:
+        hub.close(tenant_id, session_id)
+
+
+async def _resumable_stream(
+    frames: AsyncIterator[bytes], tenant_id: UUID, session_id: UUID, *, ring_size: int
+) -> AsyncIterator[bytes]:
+    """The originating response of a resumable run: one (unbounded) hub subscriber.
+
+    A client disconnect detaches this subscriber only. The finally then waits —
+    shielded from the disconnect's cancellation — for the run to finish, so the
+    request-scoped dependencies the run uses (the db session) outlive the socket.
+    User Stop cancels the producer via StreamHub.cancel (cancel_session).
+    """
+    hub = get_default_stream_hub()
+    hub.open(tenant_id, session_id, ring_size=ring_size)
+    sub = hub.subscribe(tenant_id, session_id, bounded=False)
+    producer = asyncio.create_task(_publish_stream(frames, hub, tenant_id, session_id))
+    hub.attach_producer(tenant_id, session_id, producer)
+    try:
+        if sub is not None:
+            async for frame in sub:
+                yield frame.data
+    finally:
+        if sub is not None:
+            sub.close()
+        with anyio.CancelScope(shield=True):
+            await asyncio.wait({producer})
+
+
+_REPLAY_PAGE_SIZE = 500
+
+
+async def _replay_transcript(
+    tenant_id: UUID, session_id: UUID, *, after: int
+) -> AsyncIterator[tuple[int, bytes]]:
+    """Persisted main-transcript frames after `after`, as (sequence_num, SSE frame).
+
+    Keyset pages over idx_message_events_session, each read on its OWN short
+    tenant-scoped session (no connection is held while the client drains a page).
+    """
+    factory = get_session_factory()
+    while True:
+        async with factory() as replay_db:
+            await replay_db.execute(
+                text("SELECT set_config('app.tenant_id', :tid, true)"),
+                {"tid": str(tenant_id)},
+            )
+            stmt = (
+                select(MessageEvent.sequence_num, MessageEvent.event_type, MessageEvent.event_data)
+                .where(
+                    MessageEvent.session_id == session_id,
+                    MessageEvent.tenant_id == tenant_id,
+                    MessageEvent.sequence_num > after,
+                )
+                .order_by(MessageEvent.sequence_num)
+                .limit(_REPLAY_PAGE_SIZE)
+            )
+            rows = (await replay_db.execute(stmt)).all()
+        for seq, event_type, event_data in rows:
+            yield seq, format_sse_message(event_type, event_data, event_id=seq)
+        if len(rows) < _REPLAY_PAGE_SIZE:
+            return
+        after = rows[-1][0]
+
+
+async def _committed_main_seq(tenant_id: UUID, session_id: UUID) -> int:
+    """Highest committed main-transcript sequence_num, on a short tenant-scoped session."""
+    async with get_session_factory()() as db:
+        await db.execute(
+            text("SELECT set_config('app.tenant_id', :tid, true)"),
+            {"tid": str(tenant_id)},
+        )
+        return await _max_main_seq(db, tenant_id, session_id)
+
+
+async def _replay_and_attach(
+    tenant_id: UUID, session_id: UUID, cursor: int, sub: StreamSubscription | None
+) -> AsyncIterator[bytes]:
+    """Reconnect body: persisted frames after `cursor`, then the live run (if any).
+
+    `sub` is subscribed BEFORE the replay so frames published meanwhile queue up
+    (and rows not yet flushed / committed are still in the hub ring); frames_after
+    drops whatever the replay already delivered.
+    """
+    try:
+        async for seq, frame in _replay_transcript(tenant_id, session_id, after=cursor):
+            cursor = seq
+            yield frame
+        if sub is not None:
+            async for frame in frames_after(sub, cursor):
+                yield frame
+    finally:
+        if sub is not None:
+            sub.close()
+
+
+@router.get("/sessions/{session_id}/stream")
+async def reconnect_session_stream(
+    session_id: UUID,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    current_tenant: UUID = Depends(get_current_tenant),
+) -> StreamingResponse:
+    """Resume a session's SSE stream after `Last-Event-ID` (absent → from the start).
+
+    Replays the persisted transcript after that id, then follows the live run when
+    one is still going in this process (CHAT_RESUMABLE_STREAMS); otherwise the
+    stream ends after the replay. A cross-tenant / unknown session replays nothing
+    (RLS + tenant filter) — never a 404, like GET /sessions/{id}/events.
+
+    410 when frames after the cursor are neither committed nor still in the live
+    run's ring (inline transcript mode commits only when the request ends, and the
+    ring keeps CHAT_STREAM_REPLAY_BUFFER frames): the client must reload the
+    session from /events once the run finishes instead of resuming with a hole.
+    """
+    try:
+        cursor = int(last_event_id) if last_event_id else 0
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Last-Event-ID must be a transcript sequence number.",
+        ) from exc
+    sub = get_default_stream_hub().subscribe(current_tenant, session_id)
+    first_live = sub.first_event_id if sub is not None else None
+    if sub is not None and first_live is not None and first_live > cursor + 1:
+        committed = await _committed_main_seq(current_tenant, session_id)
+        if committed < first_live - 1:
+            sub.close()
+            raise HTTPException(
+                status_code=status.HTTP_410_GONE,
+                detail=(
+                    f"Events {max(cursor, committed) + 1}-{first_live - 1} are no longer "
+                    "replayable; reload the session transcript."
+                ),
+            )
+    return StreamingResponse(
+        _replay_and_attach(current_tenant, session_id, cursor, sub),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+            "X-Session-Id": str(session_id),
+        },
+    )
+
+
 @router.get("/sessions/{session_id}", response_model=ChatSessionResponse)
 async def get_session(
     session_id: UUID,
@@ -1401,6 +1679,8 @@ async def cancel_session(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Session {session_id} not found.",
         )
+    # A resumable run outlives its connection — stop its producer task explicitly.
+    get_default_stream_hub().cancel(current_tenant, session_id)
 
     store = DBMessageStore(get_session_factory(), session_id=session_id, tenant_id=current_tenant)
     try:
@@ -1452,35 +1732,37 @@ async def _stream_resume_events(
     Sprint 57.128 (AD-ChatV2-Resume-Transcript-Persistence): like the send path,
     persist each post-resume event to message_events BEFORE the yield so a later
     GET /sessions/{id}/events replay shows the post-approval continuation. Before
-    this, _stream_resume_events omitted the _persist_main_event call that
+    this, _stream_resume_events omitted the transcript persist that
     _stream_loop_events has, so a paused-then-resumed session's replay stopped at
     the pause. main_seq seeds from the session MAX so post-resume rows continue
     monotonically AFTER the pre-pause events (the 57.126 ordering logic). No
     user_message row (resume has no new user prompt — the original send already
     persisted the prompt + pre-pause events). Best-effort + MAIN_TRANSCRIPT_OBSERVER
-    -gated + db-None-safe, identical to the send path. The active_skill stamping is
+    -gated + db-None-safe + batched through a TranscriptWriter, identical to the
+    send path. The active_skill stamping is
     send-path only (resume → the field stays null, per the _stream_loop_events note).
     """
+    transcript = make_transcript_writer(db, tenant_id)
     main_transcript_on = os.environ.get("MAIN_TRANSCRIPT_OBSERVER", "true").lower() == "true"
     main_seq = await _max_main_seq(db, tenant_id, session_id) if main_transcript_on else 0
-    async for event in loop.resume(state=state, trace_context=trace_context):
-        try:
-            payload = serialize_loop_event(event)
-        except NotImplementedError:
-            logger.debug("sse(resume): skip unserialized event %s", type(event).__name__)
-            continue
-        if payload is None:
-            continue
-        if main_transcript_on:
-            main_seq += 1
-            await _persist_main_event(
-                payload,
-                db=db,
-                tenant_id=tenant_id,
-                session_id=session_id,
-                sequence_num=main_seq,
-            )
-        yield format_sse_message(payload["type"], payload["data"])
+    try:
+        async for event in loop.resume(state=state, trace_context=trace_context):
+            try:
+                payload = serialize_loop_event(event)
+            except NotImplementedError:
+                logger.debug("sse(resume): skip unserialized event %s", type(event).__name__)
+                continue
+            if payload is None:
+                continue
+            event_id: int | None = None
+            if main_transcript_on and payload["type"] not in _UNPERSISTED_WIRE_TYPES:
+                main_seq += 1
+                event_id = main_seq
+                transcript.add_event(session_id=session_id, payload=payload, sequence_num=main_seq)
+            await transcript.pump()
+            yield format_sse_message(payload["type"], payload["data"], event_id=event_id)
+    finally:
+        await transcript.aclose()
 
 
 @router.post("/{session_id}/inject", status_code=status.HTTP_202_ACCEPTED)
@@ -1606,18 +1888,28 @@ async def resume_chat(
         user_id=current_user,
     )
 
+    stream = _stream_resume_events(
+        result.loop,
+        state=result.state,
+        trace_context=trace_ctx,
+        # Sprint 57.128: persist the post-resume transcript to message_events so
+        # the session replay shows the post-approval continuation (deps already
+        # in scope here; the generator mirrors the send path's best-effort persist).
+        tenant_id=current_tenant,
+        session_id=session_id,
+        db=db,
+    )
+    settings = get_settings()
+    if settings.chat_resumable_streams:
+        stream = _resumable_stream(
+            stream,
+            current_tenant,
+            session_id,
+            ring_size=settings.chat_stream_replay_buffer,
+        )
+
     return StreamingResponse(
-        _stream_resume_events(
-            result.loop,
-            state=result.state,
-            trace_context=trace_ctx,
-            # Sprint 57.128: persist the post-resume transcript to message_events so
-            # the session replay shows the post-approval continuation (deps already
-            # in scope here; the generator mirrors the send path's best-effort persist).
-            tenant_id=current_tenant,
-            session_id=session_id,
-            db=db,
-        ),
+        stream,
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -35,11 +35,15 @@ Key Components:
     - SessionEntry: dataclass holding (status / started_at / cancel_event)
     - SessionRegistry: register / get / cancel / mark_completed / cleanup,
       all keyed by (tenant_id, session_id)
+    - get_default_registry() / set_default_registry(): the process singleton
+      (CHAT_REGISTRY_BACKEND=redis installs redis_registry.RedisSessionRegistry)
 
 Created: 2026-04-30 (Sprint 50.2 Day 1.2)
-Last Modified: 2026-05-01
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: set_default_registry() — startup swaps in the Redis-backed
+        registry (multi-worker cancel / status); in-memory stays the default.
     - 2026-05-01: Sprint 52.5 Day 2.1 (P0 #11) — refactor storage to
         nested dict[tenant_id][session_id]; all methods take tenant_id.
         Cross-tenant lookups return None / False / no-op. Pre-existing
@@ -50,6 +54,7 @@ Modification History (newest-first):
 
 Related:
     - .router (creates entries on POST; reads on GET sessions/{id})
+    - .redis_registry (RedisSessionRegistry — the cross-worker subclass)
     - .claude/rules/multi-tenant-data.md 鐵律 1-3
     - claudedocs/5-status/V2-AUDIT-W3-2-PHASE50-2.md (audit source)
     - 06-phase-roadmap.md §Phase 53.1 (HITL pause/resume + persistence)
@@ -165,3 +170,9 @@ _default_registry = SessionRegistry()
 
 def get_default_registry() -> SessionRegistry:
     return _default_registry
+
+
+def set_default_registry(registry: SessionRegistry | None) -> None:
+    """Install the process singleton (startup wiring / tests); None → a fresh in-memory one."""
+    global _default_registry
+    _default_registry = registry if registry is not None else SessionRegistry()
@@ -15,6 +15,7 @@ Description:
         turn_start          ← TurnStarted        (Cat 1, NEW Day 2)
         llm_request         ← LLMRequested       (Cat 1, NEW Day 2)
         llm_response        ← LLMResponded       (Cat 1, NEW Day 2; canonical)
+        llm_text_delta      ← LLMTextDelta       (Cat 1, stream_llm mode only)
         tool_call_request   ← ToolCallRequested  (Cat 6)
         tool_call_result    ← ToolCallExecuted   (Cat 2; success path)
         tool_call_result    ← ToolCallFailed     (Cat 2; error path)
@@ -29,14 +30,28 @@ Description:
     are deferred to their owner sprints (53-54) and currently raise
     NotImplementedError with a clear "not in 50.2 scope" message.
 
+    Dispatch is table-driven: `_SERIALIZERS` maps each LoopEvent class to its
+    per-event serializer, so a frame costs one dict lookup instead of a walk
+    down an isinstance chain (a busy turn emits hundreds of span / subagent /
+    verification frames). A subclass of a wired event resolves through its MRO
+    once and is cached. Frames are encoded with orjson, which handles UUID /
+    datetime / dataclass values natively, so the recursive `_jsonable` pre-pass
+    is gone; without orjson installed the stdlib encoder runs with an
+    equivalent `default=` hook. scripts/benchmark_sse_serialization.py measures
+    frames/sec against the previous path.
+
 Key Components:
     - serialize_loop_event(event) -> dict[str, Any] | None
     - format_sse_message(event_type, data) -> bytes
+    - _SERIALIZERS: LoopEvent class → per-event serializer
 
 Created: 2026-04-30 (Sprint 50.2 Day 1.3)
-Last Modified: 2026-06-16
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: format_sse_message(event_id=) — `id:` line for Last-Event-ID resume
+    - 2026-10-16: type-keyed _SERIALIZERS dispatch + orjson encoder (drops _jsonable)
+    - 2026-10-16: serialize LLMTextDelta → llm_text_delta (token streaming; 26→27 wire)
     - 2026-07-10: Sprint 57.164 — tool_call_result +error_taxonomy (both branches)
     - 2026-06-16: Sprint 57.130 — serialize LoopTerminated → loop_terminated (24→25 wire)
     - 2026-06-14: Sprint 57.116 — loop_start +active_skill (default null; router overrides)
@@ -74,10 +89,16 @@ Related:
 from __future__ import annotations
 
 import json
+from collections.abc import Callable
 from dataclasses import asdict, is_dataclass
 from typing import Any
 from uuid import UUID
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - installation path (stdlib fallback below)
+    orjson = None  # type: ignore[assignment]
+
 from agent_harness._contracts import (
     AgentHandoff,
     ApprovalReceived,
@@ -86,6 +107,7 @@ from agent_harness._contracts import (
     GuardrailTriggered,
     LLMRequested,
     LLMResponded,
+    LLMTextDelta,
     LoopCompleted,
     LoopEvent,
     LoopStarted,
@@ -136,412 +158,518 @@ def serialize_loop_event(event: LoopEvent) -> dict[str, Any] | None:
 
 
 def _serialize_inner(event: LoopEvent) -> dict[str, Any] | None:
-    """Inner serializer — same logic as before P0 #12, no trace_id injection.
+    """Inner serializer — the per-type payload, no trace_id injection.
 
     Pulled out so ``serialize_loop_event`` can wrap it with cross-cutting
     concerns (currently: trace_id injection; future: tenant attribution).
     """
-    if isinstance(event, LoopStarted):
-        return {
-            "type": "loop_start",
-            "data": {
-                "session_id": str(event.session_id) if event.session_id else None,
-                "request_id": str(event.event_id),
-                # Sprint 57.116 (Skills Inspector affordance): the force-loaded
-                # skill name. The Cat-1 loop has no concept of "skill" (it only
-                # receives a system_prompt string) → the serializer defaults this
-                # null; the chat router overrides it on the loop_start frame for a
-                # force-load run (router._stream_loop_events). Keeps events.py /
-                # loop.py diff-0; the wire field is always present for the FE.
-                "active_skill": None,
-            },
-        }
-
-    if isinstance(event, TurnStarted):
-        return {
-            "type": "turn_start",
-            "data": {"turn_num": event.turn_num},
-        }
-
-    if isinstance(event, LLMRequested):
-        return {
-            "type": "llm_request",
-            "data": {"model": event.model, "tokens_in": event.tokens_in},
-        }
-
-    if isinstance(event, LLMResponded):
-        # Day 2: canonical llm_response carrier per 02.md §SSE.
-        return {
-            "type": "llm_response",
-            "data": {
-                "content": event.content,
-                "tool_calls": [
-                    {
-                        "id": getattr(tc, "id", ""),
-                        "name": getattr(tc, "name", ""),
-                        "arguments": getattr(tc, "arguments", {}),
-                    }
-                    for tc in event.tool_calls
-                ],
-                "thinking": event.thinking,
-                # Sprint 57.65 A-2 Tier2 cache field (carried to client).
-                "cached_input_tokens": event.cached_input_tokens,
-                # Sprint 57.108: per-call actuals so the Inspector turn pane can
-                # render tokens.in (overwrite the llm_request estimate) + tokens.out.
-                "input_tokens": event.input_tokens,
-                "output_tokens": event.output_tokens,
-            },
-        }
-
-    if isinstance(event, Thinking):
-        # Day 2: skip — LLMResponded carries the same content via canonical
-        # llm_response. Returning None signals the router to drop the frame.
-        return None
-
-    if isinstance(event, ToolCallRequested):
-        return {
-            "type": "tool_call_request",
-            "data": {
-                "tool_call_id": event.tool_call_id,
-                "tool_name": event.tool_name,
-                "args": event.arguments,
-            },
-        }
-
-    if isinstance(event, ToolCallExecuted):
-        return {
-            "type": "tool_call_result",
-            "data": {
-                "tool_call_id": event.tool_call_id,
-                "tool_name": event.tool_name,
-                "duration_ms": event.duration_ms,
-                "result": event.result_content,
-                "is_error": False,
-                # Sprint 57.164: success has no taxonomy — always null. Declared on
-                # BOTH tool_call_result branches so the shared wire type has one stable
-                # field set (test_event_wire_schema_parity guards this).
-                "error_taxonomy": None,
-            },
-        }
-
-    if isinstance(event, ToolCallFailed):
-        return {
-            "type": "tool_call_result",
-            "data": {
-                "tool_call_id": event.tool_call_id,
-                "tool_name": event.tool_name,
-                "duration_ms": 0.0,
-                "result": event.error,
-                "is_error": True,
-                # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): the typed diagnosis the
-                # chat-v2 ToolBlock renders as a chip (parameter / wrong_tool / …).
-                "error_taxonomy": event.error_taxonomy,
-            },
-        }
-
-    if isinstance(event, LoopCompleted):
-        return {
-            "type": "loop_end",
-            "data": {
-                "stop_reason": event.stop_reason,
-                "total_turns": event.total_turns,
-                # Sprint 57.65 A-2 Tier2 cache fields (carried to client).
-                "cached_input_tokens": event.cached_input_tokens,
-                "cache_hit_rate": event.cache_hit_rate,
-            },
-        }
-
-    # Sprint 57.101 B1 (Cat 1): a mid-run injected message DRAINED at a turn
-    # boundary (the _run_turns top, before the between-turns guardrail). Fired on
-    # drain (proof it landed in the loop), not when the inject POST returned.
-    if isinstance(event, MessageInjected):
-        return {
-            "type": "message_injected",
-            "data": {"text": event.text},
-        }
-
-    # Sprint 57.140 (Cat 1 → 12): the whole todo list after a write_todos call,
-    # so the chat-v2 Todos panel re-renders the structured plan as the agent
-    # maintains it (research #1 task primitive). Each Todo flattened to a dict.
-    if isinstance(event, TodosUpdated):
-        return {
-            "type": "todos_updated",
-            "data": {"todos": todos_to_jsonb(list(event.todos))},
-        }
-
-    # Sprint 53.5 US-2: HITL approval events. Loop emits ApprovalRequested when
-    # Cat 9 ESCALATE → HITLManager.request_approval persists; ApprovalReceived
-    # when wait_for_decision returns. Frontend renders inline ApprovalCard.
-    if isinstance(event, ApprovalRequested):
-        return {
-            "type": "approval_requested",
-            "data": {
-                "approval_request_id": (
-                    str(event.approval_request_id) if event.approval_request_id else None
-                ),
-                "risk_level": event.risk_level,
-                "kind": event.kind,
-                # Sprint 57.108: real approval context for the HITL card —
-                # tool_name only for kind="tool"; reason at all 5 escalate sites.
-                "tool_name": event.tool_name,
-                "reason": event.reason,
-            },
-        }
-
-    if isinstance(event, ApprovalReceived):
-        return {
-            "type": "approval_received",
-            "data": {
-                "approval_request_id": (
-                    str(event.approval_request_id) if event.approval_request_id else None
-                ),
-                "decision": event.decision,
-            },
-        }
-
-    # Sprint 53.6 D2: GuardrailTriggered serializer.
-    # Yielded 7× from agent_harness/orchestrator_loop/loop.py covering Cat 9
-    # Stage 1 (input) / Stage 2 (output) / Stage 3 (tool escalate/reject/timeout
-    # block paths). Pre-existing gap from Sprint 53.3 — chat router never wired
-    # guardrails before Sprint 53.6 US-4 production HITL wiring would have
-    # crashed any chat session that triggered Cat 9 detection.
-    if isinstance(event, GuardrailTriggered):
-        return {
-            "type": "guardrail_triggered",
-            "data": {
-                "guardrail_type": event.guardrail_type,
-                "action": event.action,
-                "reason": event.reason,
-            },
-        }
-
-    # Sprint 57.66 (A-5a+): TripwireTriggered serializer — Cat 9 severe-policy
-    # violation that terminates the loop (per 17.md §6). Already yielded on the
-    # chat path but previously dropped at the serializer (no isinstance branch).
-    if isinstance(event, TripwireTriggered):
-        return {
-            "type": "tripwire_triggered",
-            "data": {
-                "violation_type": event.violation_type,
-                "detail": event.detail,
-            },
-        }
-
-    # Sprint 54.1 US-3: Cat 10 verification events.
-    # Emitted by the in-loop Cat 10 gate during agent_loop.run() (Sprint 57.98 A1).
-    # SSE clients render these next to the LLM final output to surface
-    # verification verdict + correction guidance.
-    if isinstance(event, VerificationPassed):
-        return {
-            "type": "verification_passed",
-            "data": {
-                "verifier": event.verifier,
-                "verifier_type": event.verifier_type,
-                "score": event.score,
-            },
-        }
-
-    if isinstance(event, VerificationFailed):
-        return {
-            "type": "verification_failed",
-            "data": {
-                "verifier": event.verifier,
-                "verifier_type": event.verifier_type,
-                "reason": event.reason,
-                "suggested_correction": event.suggested_correction,
-            },
-        }
-
-    # Sprint 57.12 US-1: Cat 11 subagent lifecycle events.
-    # Emitted by DefaultSubagentDispatcher.spawn (Spawned at start, Completed
-    # when the asyncio.Task resolves). Frontend SubagentTree (US-6) consumes
-    # via chatStore.mergeEvent (per CONVENTION.md §7 3-edit checklist).
-    if isinstance(event, SubagentSpawned):
-        return {
-            "type": "subagent_spawned",
-            "data": {
-                "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
-                "mode": event.mode,
-                "parent_session_id": (
-                    str(event.parent_session_id) if event.parent_session_id else None
-                ),
-            },
-        }
-
-    if isinstance(event, SubagentCompleted):
-        return {
-            "type": "subagent_completed",
-            "data": {
-                "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
-                "summary": event.summary,
-                "tokens_used": event.tokens_used,
-            },
-        }
-
-    # Sprint 57.96 (Cat 11 Scope B): wraps a child subagent loop's inner TAO
-    # event so the chat-v2 Inspector Tree node EXPANDS to the child's per-turn
-    # loop. The inner is re-serialized via its OWN branch (recursion reuses the
-    # existing per-type serializers) → flattened to {inner_type, inner} where
-    # inner is the inner event's `data` dict (a Record on the wire). inner_payload
-    # is None only for a non-serializable / Thinking inner (the ForkExecutor TAO
-    # filter guarantees a serializable inner; the guard is defensive → skip).
-    if isinstance(event, SubagentChildEvent):
-        inner_payload = _serialize_inner(event.inner) if event.inner is not None else None
-        if inner_payload is None:
-            return None
-        return {
-            "type": "subagent_child",
-            "data": {
-                "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
-                "inner_type": inner_payload["type"],
-                "inner": inner_payload["data"],
-            },
-        }
-
-    # Sprint 57.66 (A-5a+): diagnostic events already yielded on the chat path
-    # (Cat 4 context compaction / Cat 5 prompt build / Cat 7 state checkpoint)
-    # but previously dropped at the serializer (no isinstance branch). Surfacing
-    # them lets the client observe per-turn loop internals without a loop.py edit.
-    if isinstance(event, ContextCompacted):
-        return {
-            "type": "context_compacted",
-            "data": {
-                "tokens_before": event.tokens_before,
-                "tokens_after": event.tokens_after,
-                "compaction_strategy": event.compaction_strategy,
-                "messages_compacted": event.messages_compacted,
-                "duration_ms": event.duration_ms,
-            },
-        }
-
-    if isinstance(event, PromptBuilt):
-        return {
-            "type": "prompt_built",
-            "data": {
-                "messages_count": event.messages_count,
-                "estimated_input_tokens": event.estimated_input_tokens,
-                "cache_breakpoints_count": event.cache_breakpoints_count,
-                # Scope-key names (e.g. ["session", "tenant"]), not memory
-                # content — safe to expose. tuple → list for JSON.
-                "memory_layers_used": list(event.memory_layers_used),
-                "position_strategy_used": event.position_strategy_used,
-                "duration_ms": event.duration_ms,
-            },
-        }
-
-    if isinstance(event, StateCheckpointed):
-        return {
-            "type": "state_checkpointed",
-            "data": {
-                "version": event.version,
-            },
-        }
-
-    # Sprint 57.68 (A-3b): AgentHandoff serializer — Cat 11 HANDOFF control
-    # transfer. Emitted by the chat router's post-loop hook AFTER HandoffService
-    # boots the child session (so new_session_id is populated). UUIDs → str()
-    # for the wire (mirrors SubagentSpawned); trace_id auto-injected by the
-    # serialize_loop_event wrapper.
-    if isinstance(event, AgentHandoff):
-        return {
-            "type": "agent_handoff",
-            "data": {
-                "target_agent": event.target_agent,
-                "reason": event.reason,
-                "parent_session_id": (
-                    str(event.parent_session_id) if event.parent_session_id else None
-                ),
-                "new_session_id": (str(event.new_session_id) if event.new_session_id else None),
-            },
-        }
-
-    # Sprint 57.75 (A-5c): Cat 12 span lifecycle events. Emitted by the loop at
-    # all 6 span sites (LOOP / TURN / LLM_CALL / TOOL_EXEC / PROMPT_BUILD /
-    # COMPACTION). The chat-v2 Inspector Trace tab reconstructs the waterfall from
-    # span_id + parent_span_id (indent depth) + span_type (color band); SpanEnded
-    # carries the loop-measured duration_ms for the per-row bar. parent_span_id is
-    # "" for a root (LOOP) span.
-    if isinstance(event, SpanStarted):
-        return {
-            "type": "span_started",
-            "data": {
-                "span_name": event.span_name,
-                "span_id": event.span_id,
-                "parent_span_id": event.parent_span_id,
-                "span_type": event.span_type,
-            },
-        }
-
-    if isinstance(event, SpanEnded):
-        return {
-            "type": "span_ended",
-            "data": {
-                "span_name": event.span_name,
-                "span_id": event.span_id,
-                "span_type": event.span_type,
-                "duration_ms": event.duration_ms,
-            },
-        }
-
-    # Sprint 57.75 (A-5c): Cat 3 memory access. Emitted by the loop per retrieved
-    # hint after PromptBuilder.build() (real_llm path only — echo_demo has no
-    # prompt_builder so the Memory tab stays honestly empty). `summary` is the
-    # hint's capped token-cheap summary (PII-safe); `key` is the content pointer.
-    if isinstance(event, MemoryAccessed):
-        return {
-            "type": "memory_accessed",
-            "data": {
-                "layer": event.layer,
-                "operation": event.operation,
-                "key": event.key,
-                "summary": event.summary,
-                "time_scale": event.time_scale,
-            },
-        }
-
-    # Sprint 57.130: LoopTerminated serializer — Cat 8 ErrorTerminator fatal
-    # terminate (budget_exceeded / circuit_open / fatal_exception /
-    # max_retries_exhausted), yielded from loop.py (:2939 hard / :3008 soft) then
-    # the loop returns. Previously dropped at the serializer (no isinstance branch)
-    # → the SSE stream ended with no terminal frame → the chat-v2 UI hung with a
-    # stuck pending tool chip + no reason. Mirrors tripwire_triggered (the sibling
-    # fatal-terminate event). Closes AD-LoopTerminated-Wire-Surface.
-    if isinstance(event, LoopTerminated):
-        return {
-            "type": "loop_terminated",
-            "data": {
-                "reason": event.reason,
-                "detail": event.detail,
-                "last_state_version": event.last_state_version,
-            },
-        }
-
+    serializer = _SERIALIZERS.get(type(event))
+    if serializer is None:
+        serializer = _resolve_serializer(type(event))
+    return serializer(event)
+
+
+def _resolve_serializer(cls: type) -> _Serializer:
+    """Slow path for a class not in the table: the nearest wired base (cached)."""
+    for base in cls.__mro__[1:]:
+        serializer = _SERIALIZERS.get(base)
+        if serializer is not None:
+            _SERIALIZERS[cls] = serializer
+            return serializer
     raise NotImplementedError(
-        f"SSE serialization for {type(event).__name__} is not in Sprint 50.2 scope."
+        f"SSE serialization for {cls.__name__} is not in Sprint 50.2 scope."
         " See sprint-50-2-plan.md §3.2 deferred / 02-architecture-design.md §SSE for owner sprint."
     )
 
 
-def format_sse_message(event_type: str, data: dict[str, Any]) -> bytes:
-    """Encode an SSE message frame: ``event: <type>\\ndata: <json>\\n\\n``."""
-    payload = json.dumps(_jsonable(data), ensure_ascii=False, separators=(",", ":"))
-    return f"event: {event_type}\ndata: {payload}\n\n".encode("utf-8")
-
-
-def _jsonable(value: Any) -> Any:
-    """Recursively coerce dataclasses + UUIDs to JSON-friendly forms."""
+def _loop_started(event: LoopStarted) -> dict[str, Any]:
+    return {
+        "type": "loop_start",
+        "data": {
+            "session_id": str(event.session_id) if event.session_id else None,
+            "request_id": str(event.event_id),
+            # Sprint 57.116 (Skills Inspector affordance): the force-loaded
+            # skill name. The Cat-1 loop has no concept of "skill" (it only
+            # receives a system_prompt string) → the serializer defaults this
+            # null; the chat router overrides it on the loop_start frame for a
+            # force-load run (router._stream_loop_events). Keeps events.py /
+            # loop.py diff-0; the wire field is always present for the FE.
+            "active_skill": None,
+        },
+    }
+
+
+def _turn_started(event: TurnStarted) -> dict[str, Any]:
+    return {
+        "type": "turn_start",
+        "data": {"turn_num": event.turn_num},
+    }
+
+
+def _llm_requested(event: LLMRequested) -> dict[str, Any]:
+    return {
+        "type": "llm_request",
+        "data": {"model": event.model, "tokens_in": event.tokens_in},
+    }
+
+
+def _llm_responded(event: LLMResponded) -> dict[str, Any]:
+    # Day 2: canonical llm_response carrier per 02.md §SSE.
+    return {
+        "type": "llm_response",
+        "data": {
+            "content": event.content,
+            "tool_calls": [
+                {
+                    "id": getattr(tc, "id", ""),
+                    "name": getattr(tc, "name", ""),
+                    "arguments": getattr(tc, "arguments", {}),
+                }
+                for tc in event.tool_calls
+            ],
+            "thinking": event.thinking,
+            # Sprint 57.65 A-2 Tier2 cache field (carried to client).
+            "cached_input_tokens": event.cached_input_tokens,
+            # Sprint 57.108: per-call actuals so the Inspector turn pane can
+            # render tokens.in (overwrite the llm_request estimate) + tokens.out.
+            "input_tokens": event.input_tokens,
+            "output_tokens": event.output_tokens,
+        },
+    }
+
+
+# Token streaming (stream_llm): one frame per streamed text chunk, ahead of
+# the turn's llm_response (which still carries the full assembled content and
+# stays the canonical record — the router does not persist delta frames).
+def _llm_text_delta(event: LLMTextDelta) -> dict[str, Any]:
+    return {
+        "type": "llm_text_delta",
+        "data": {"text": event.text},
+    }
+
+
+def _thinking(event: Thinking) -> None:
+    # Day 2: skip — LLMResponded carries the same content via canonical
+    # llm_response. Returning None signals the router to drop the frame.
+    return None
+
+
+def _tool_call_requested(event: ToolCallRequested) -> dict[str, Any]:
+    return {
+        "type": "tool_call_request",
+        "data": {
+            "tool_call_id": event.tool_call_id,
+            "tool_name": event.tool_name,
+            "args": event.arguments,
+        },
+    }
+
+
+def _tool_call_executed(event: ToolCallExecuted) -> dict[str, Any]:
+    return {
+        "type": "tool_call_result",
+        "data": {
+            "tool_call_id": event.tool_call_id,
+            "tool_name": event.tool_name,
+            "duration_ms": event.duration_ms,
+            "result": event.result_content,
+            "is_error": False,
+            # Sprint 57.164: success has no taxonomy — always null. Declared on
+            # BOTH tool_call_result branches so the shared wire type has one stable
+            # field set (test_event_wire_schema_parity guards this).
+            "error_taxonomy": None,
+        },
+    }
+
+
+def _tool_call_failed(event: ToolCallFailed) -> dict[str, Any]:
+    return {
+        "type": "tool_call_result",
+        "data": {
+            "tool_call_id": event.tool_call_id,
+            "tool_name": event.tool_name,
+            "duration_ms": 0.0,
+            "result": event.error,
+            "is_error": True,
+            # Sprint 57.164 (AD-Tool-Error-Taxonomy-UI): the typed diagnosis the
+            # chat-v2 ToolBlock renders as a chip (parameter / wrong_tool / …).
+            "error_taxonomy": event.error_taxonomy,
+        },
+    }
+
+
+def _loop_completed(event: LoopCompleted) -> dict[str, Any]:
+    return {
+        "type": "loop_end",
+        "data": {
+            "stop_reason": event.stop_reason,
+            "total_turns": event.total_turns,
+            # Sprint 57.65 A-2 Tier2 cache fields (carried to client).
+            "cached_input_tokens": event.cached_input_tokens,
+            "cache_hit_rate": event.cache_hit_rate,
+        },
+    }
+
+
+# Sprint 57.101 B1 (Cat 1): a mid-run injected message DRAINED at a turn
+# boundary (the _run_turns top, before the between-turns guardrail). Fired on
+# drain (proof it landed in the loop), not when the inject POST returned.
+def _message_injected(event: MessageInjected) -> dict[str, Any]:
+    return {
+        "type": "message_injected",
+        "data": {"text": event.text},
+    }
+
+
+# Sprint 57.140 (Cat 1 → 12): the whole todo list after a write_todos call,
+# so the chat-v2 Todos panel re-renders the structured plan as the agent
+# maintains it (research #1 task primitive). Each Todo flattened to a dict.
+def _todos_updated(event: TodosUpdated) -> dict[str, Any]:
+    return {
+        "type": "todos_updated",
+        "data": {"todos": todos_to_jsonb(list(event.todos))},
+    }
+
+
+# Sprint 53.5 US-2: HITL approval events. Loop emits ApprovalRequested when
+# Cat 9 ESCALATE → HITLManager.request_approval persists; ApprovalReceived
+# when wait_for_decision returns. Frontend renders inline ApprovalCard.
+def _approval_requested(event: ApprovalRequested) -> dict[str, Any]:
+    return {
+        "type": "approval_requested",
+        "data": {
+            "approval_request_id": (
+                str(event.approval_request_id) if event.approval_request_id else None
+            ),
+            "risk_level": event.risk_level,
+            "kind": event.kind,
+            # Sprint 57.108: real approval context for the HITL card —
+            # tool_name only for kind="tool"; reason at all 5 escalate sites.
+            "tool_name": event.tool_name,
+            "reason": event.reason,
+        },
+    }
+
+
+def _approval_received(event: ApprovalReceived) -> dict[str, Any]:
+    return {
+        "type": "approval_received",
+        "data": {
+            "approval_request_id": (
+                str(event.approval_request_id) if event.approval_request_id else None
+            ),
+            "decision": event.decision,
+        },
+    }
+
+
+# Sprint 53.6 D2: GuardrailTriggered serializer.
+# Yielded 7× from agent_harness/orchestrator_loop/loop.py covering Cat 9
+# Stage 1 (input) / Stage 2 (output) / Stage 3 (tool escalate/reject/timeout
+# block paths). Pre-existing gap from Sprint 53.3 — chat router never wired
+# guardrails before Sprint 53.6 US-4 production HITL wiring would have
+# crashed any chat session that triggered Cat 9 detection.
+def _guardrail_triggered(event: GuardrailTriggered) -> dict[str, Any]:
+    return {
+        "type": "guardrail_triggered",
+        "data": {
+            "guardrail_type": event.guardrail_type,
+            "action": event.action,
+            "reason": event.reason,
+        },
+    }
+
+
+# Sprint 57.66 (A-5a+): TripwireTriggered serializer — Cat 9 severe-policy
+# violation that terminates the loop (per 17.md §6). Already yielded on the
+# chat path but previously dropped at the serializer (no isinstance branch).
+def _tripwire_triggered(event: TripwireTriggered) -> dict[str, Any]:
+    return {
+        "type": "tripwire_triggered",
+        "data": {
+            "violation_type": event.violation_type,
+            "detail": event.detail,
+        },
+    }
+
+
+# Sprint 54.1 US-3: Cat 10 verification events.
+# Emitted by the in-loop Cat 10 gate during agent_loop.run() (Sprint 57.98 A1).
+# SSE clients render these next to the LLM final output to surface
+# verification verdict + correction guidance.
+def _verification_passed(event: VerificationPassed) -> dict[str, Any]:
+    return {
+        "type": "verification_passed",
+        "data": {
+            "verifier": event.verifier,
+            "verifier_type": event.verifier_type,
+            "score": event.score,
+        },
+    }
+
+
+def _verification_failed(event: VerificationFailed) -> dict[str, Any]:
+    return {
+        "type": "verification_failed",
+        "data": {
+            "verifier": event.verifier,
+            "verifier_type": event.verifier_type,
+            "reason": event.reason,
+            "suggested_correction": event.suggested_correction,
+        },
+    }
+
+
+# Sprint 57.12 US-1: Cat 11 subagent lifecycle events.
+# Emitted by DefaultSubagentDispatcher.spawn (Spawned at start, Completed
+# when the asyncio.Task resolves). Frontend SubagentTree (US-6) consumes
+# via chatStore.mergeEvent (per CONVENTION.md §7 3-edit checklist).
+def _subagent_spawned(event: SubagentSpawned) -> dict[str, Any]:
+    return {
+        "type": "subagent_spawned",
+        "data": {
+            "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
+            "mode": event.mode,
+            "parent_session_id": (
+                str(event.parent_session_id) if event.parent_session_id else None
+            ),
+        },
+    }
+
+
+def _subagent_completed(event: SubagentCompleted) -> dict[str, Any]:
+    return {
+        "type": "subagent_completed",
+        "data": {
+            "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
+            "summary": event.summary,
+            "tokens_used": event.tokens_used,
+        },
+    }
+
+
+# Sprint 57.96 (Cat 11 Scope B): wraps a child subagent loop's inner TAO
+# event so the chat-v2 Inspector Tree node EXPANDS to the child's per-turn
+# loop. The inner is re-serialized via its OWN branch (recursion reuses the
+# existing per-type serializers) → flattened to {inner_type, inner} where
+# inner is the inner event's `data` dict (a Record on the wire). inner_payload
+# is None only for a non-serializable / Thinking inner (the ForkExecutor TAO
+# filter guarantees a serializable inner; the guard is defensive → skip).
+def _subagent_child_event(event: SubagentChildEvent) -> dict[str, Any] | None:
+    inner_payload = _serialize_inner(event.inner) if event.inner is not None else None
+    if inner_payload is None:
+        return None
+    return {
+        "type": "subagent_child",
+        "data": {
+            "subagent_id": (str(event.subagent_id) if event.subagent_id else None),
+            "inner_type": inner_payload["type"],
+            "inner": inner_payload["data"],
+        },
+    }
+
+
+# Sprint 57.66 (A-5a+): diagnostic events already yielded on the chat path
+# (Cat 4 context compaction / Cat 5 prompt build / Cat 7 state checkpoint)
+# but previously dropped at the serializer (no isinstance branch). Surfacing
+# them lets the client observe per-turn loop internals without a loop.py edit.
+def _context_compacted(event: ContextCompacted) -> dict[str, Any]:
+    return {
+        "type": "context_compacted",
+        "data": {
+            "tokens_before": event.tokens_before,
+            "tokens_after": event.tokens_after,
+            "compaction_strategy": event.compaction_strategy,
+            "messages_compacted": event.messages_compacted,
+            "duration_ms": event.duration_ms,
+        },
+    }
+
+
+def _prompt_built(event: PromptBuilt) -> dict[str, Any]:
+    return {
+        "type": "prompt_built",
+        "data": {
+            "messages_count": event.messages_count,
+            "estimated_input_tokens": event.estimated_input_tokens,
+            "cache_breakpoints_count": event.cache_breakpoints_count,
+            # Scope-key names (e.g. ["session", "tenant"]), not memory
+            # content — safe to expose. tuple → list for JSON.
+            "memory_layers_used": list(event.memory_layers_used),
+            "position_strategy_used": event.position_strategy_used,
+            "duration_ms": event.duration_ms,
+        },
+    }
+
+
+def _state_checkpointed(event: StateCheckpointed) -> dict[str, Any]:
+    return {
+        "type": "state_checkpointed",
+        "data": {
+            "version": event.version,
+        },
+    }
+
+
+# Sprint 57.68 (A-3b): AgentHandoff serializer — Cat 11 HANDOFF control
+# transfer. Emitted by the chat router's post-loop hook AFTER HandoffService
+# boots the child session (so new_session_id is populated). UUIDs → str()
+# for the wire (mirrors SubagentSpawned); trace_id auto-injected by the
+# serialize_loop_event wrapper.
+def _agent_handoff(event: AgentHandoff) -> dict[str, Any]:
+    return {
+        "type": "agent_handoff",
+        "data": {
+            "target_agent": event.target_agent,
+            "reason": event.reason,
+            "parent_session_id": (
+                str(event.parent_session_id) if event.parent_session_id else None
+            ),
+            "new_session_id": (str(event.new_session_id) if event.new_session_id else None),
+        },
+    }
+
+
+# Sprint 57.75 (A-5c): Cat 12 span lifecycle events. Emitted by the loop at
+# all 6 span sites (LOOP / TURN / LLM_CALL / TOOL_EXEC / PROMPT_BUILD /
+# COMPACTION). The chat-v2 Inspector Trace tab reconstructs the waterfall from
+# span_id + parent_span_id (indent depth) + span_type (color band); SpanEnded
+# carries the loop-measured duration_ms for the per-row bar. parent_span_id is
+# "" for a root (LOOP) span.
+def _span_started(event: SpanStarted) -> dict[str, Any]:
+    return {
+        "type": "span_started",
+        "data": {
+            "span_name": event.span_name,
+            "span_id": event.span_id,
+            "parent_span_id": event.parent_span_id,
+            "span_type": event.span_type,
+        },
+    }
+
+
+def _span_ended(event: SpanEnded) -> dict[str, Any]:
+    return {
+        "type": "span_ended",
+        "data": {
+            "span_name": event.span_name,
+            "span_id": event.span_id,
+            "span_type": event.span_type,
+            "duration_ms": event.duration_ms,
+        },
+    }
+
+
+# Sprint 57.75 (A-5c): Cat 3 memory access. Emitted by the loop per retrieved
+# hint after PromptBuilder.build() (real_llm path only — echo_demo has no
+# prompt_builder so the Memory tab stays honestly empty). `summary` is the
+# hint's capped token-cheap summary (PII-safe); `key` is the content pointer.
+def _memory_accessed(event: MemoryAccessed) -> dict[str, Any]:
+    return {
+        "type": "memory_accessed",
+        "data": {
+            "layer": event.layer,
+            "operation": event.operation,
+            "key": event.key,
+            "summary": event.summary,
+            "time_scale": event.time_scale,
+        },
+    }
+
+
+# Sprint 57.130: LoopTerminated serializer — Cat 8 ErrorTerminator fatal
+# terminate (budget_exceeded / circuit_open / fatal_exception /
+# max_retries_exhausted), yielded from loop.py (:2939 hard / :3008 soft) then
+# the loop returns. Previously dropped at the serializer (no isinstance branch)
+# → the SSE stream ended with no terminal frame → the chat-v2 UI hung with a
+# stuck pending tool chip + no reason. Mirrors tripwire_triggered (the sibling
+# fatal-terminate event). Closes AD-LoopTerminated-Wire-Surface.
+def _loop_terminated(event: LoopTerminated) -> dict[str, Any]:
+    return {
+        "type": "loop_terminated",
+        "data": {
+            "reason": event.reason,
+            "detail": event.detail,
+            "last_state_version": event.last_state_version,
+        },
+    }
+
+
+# Per-event serializer signature: the event → its {type, data} payload, or None
+# to skip the frame (Thinking; a non-serializable SubagentChildEvent inner).
+_Serializer = Callable[[Any], "dict[str, Any] | None"]
+
+# Type-keyed dispatch (exact class → serializer). A new wire event = one
+# serializer above + one entry here (+ the event_wire_schema / FE checklist).
+_SERIALIZERS: dict[type, _Serializer] = {
+    LoopStarted: _loop_started,
+    TurnStarted: _turn_started,
+    LLMRequested: _llm_requested,
+    LLMResponded: _llm_responded,
+    LLMTextDelta: _llm_text_delta,
+    Thinking: _thinking,
+    ToolCallRequested: _tool_call_requested,
+    ToolCallExecuted: _tool_call_executed,
+    ToolCallFailed: _tool_call_failed,
+    LoopCompleted: _loop_completed,
+    MessageInjected: _message_injected,
+    TodosUpdated: _todos_updated,
+    ApprovalRequested: _approval_requested,
+    ApprovalReceived: _approval_received,
+    GuardrailTriggered: _guardrail_triggered,
+    TripwireTriggered: _tripwire_triggered,
+    VerificationPassed: _verification_passed,
+    VerificationFailed: _verification_failed,
+    SubagentSpawned: _subagent_spawned,
+    SubagentCompleted: _subagent_completed,
+    SubagentChildEvent: _subagent_child_event,
+    ContextCompacted: _context_compacted,
+    PromptBuilt: _prompt_built,
+    StateCheckpointed: _state_checkpointed,
+    AgentHandoff: _agent_handoff,
+    SpanStarted: _span_started,
+    SpanEnded: _span_ended,
+    MemoryAccessed: _memory_accessed,
+    LoopTerminated: _loop_terminated,
+}
+
+
+def format_sse_message(
+    event_type: str, data: dict[str, Any], *, event_id: int | None = None
+) -> bytes:
+    """Encode an SSE message frame: ``event: <type>\\ndata: <json>\\n\\n``.
+
+    ``event_id`` (the frame's main-transcript sequence_num) is emitted first as
+    ``id: <n>`` so the browser reports it back as ``Last-Event-ID`` on reconnect.
+    """
+    frame = b"event: " + event_type.encode("utf-8") + b"\ndata: " + _dumps(data) + b"\n\n"
+    if event_id is None:
+        return frame
+    return b"id: " + str(event_id).encode("ascii") + b"\n" + frame
+
+
+def _dumps(data: dict[str, Any]) -> bytes:
+    """Compact UTF-8 JSON. orjson serializes UUID (canonical hyphenated str),
+    datetime (ISO-8601), dataclasses and tuples natively; anything it rejects
+    (e.g. an int beyond 64 bits) falls through to the stdlib encoder."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, default=_json_default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:  # orjson.JSONEncodeError subclasses TypeError
+            pass
+    payload = json.dumps(data, default=_json_default, ensure_ascii=False, separators=(",", ":"))
+    return payload.encode("utf-8")
+
+
+def _json_default(value: Any) -> Any:
+    """Coerce the non-native values the wire may carry (dataclass / datetime / UUID)."""
     if is_dataclass(value) and not isinstance(value, type):
-        return _jsonable(asdict(value))
-    if isinstance(value, dict):
-        return {k: _jsonable(v) for k, v in value.items()}
-    if isinstance(value, (list, tuple)):
-        return [_jsonable(v) for v in value]
-    # datetime → ISO string; UUID → canonical hyphenated string.
-    if hasattr(value, "isoformat"):  # datetime
+        return asdict(value)
+    # datetime / date → ISO string; UUID → canonical hyphenated string.
+    if hasattr(value, "isoformat"):
         return value.isoformat()
-    # FIX-025: match UUID explicitly. The prior `hasattr(value, "hex")` heuristic
-    # also matched float (float.hex exists) + bool, stringifying them — so float
-    # wire fields (cache_hit_rate / duration_ms) were emitted as JSON strings.
+    # FIX-025: match UUID explicitly (a `hasattr(value, "hex")` heuristic also
+    # matches float, stringifying float wire fields like cache_hit_rate).
     if isinstance(value, UUID):
         return str(value)
-    return value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -0,0 +1,263 @@
+"""
+File: backend/src/api/v1/chat/stream_hub.py
+Purpose: Tenant-scoped in-memory fan-out of a running chat stream's SSE frames.
+Category: api/v1/chat
+Scope: Phase 57 / resumable SSE streams
+
+Description:
+    A dropped connection on POST /chat used to lose the stream: the client had to
+    re-fetch the whole /sessions/{id}/events transcript and reconcile by hand (or
+    re-send, re-running the LLM work). With CHAT_RESUMABLE_STREAMS the run's SSE
+    frames are produced by a task that publishes them here; the POST response and
+    any reconnect (GET /chat/sessions/{id}/stream with Last-Event-ID) are
+    subscribers, so a disconnect detaches a listener without stopping the run.
+
+    Each published StreamFrame carries its SSE `id:` (the main transcript
+    sequence_num; None for live-only frames such as llm_text_delta / subagent
+    relays) and `after_seq`, the last sequence_num assigned when it was published.
+    A channel keeps a bounded ring of recent frames: subscribe() snapshots the
+    ring + registers a queue in one synchronous step, so a reconnect that first
+    subscribes and then replays message_events misses nothing — rows still
+    buffered by the TranscriptWriter (or uncommitted in the request transaction)
+    are in the ring, older ones are in the table, and the caller de-duplicates
+    by sequence_num (see frames_after).
+
+    A run's sequenced frames are contiguous (one sequence_num each), so a reconnect
+    can tell when neither the table nor the ring still holds a frame it needs:
+    the first ring id (StreamSubscription.first_event_id) exceeds cursor + 1. In
+    the default inline transcript mode rows commit only when the request ends, so
+    a long run can roll frames out of the ring before they are readable. The
+    reconnect endpoint answers 410 then, and frames_after ends at such a jump
+    instead of skipping over it.
+
+    Storage is tenant-scoped (`dict[tenant_id, dict[session_id, _Channel]]`) like
+    SessionRegistry / InjectionRegistry. Every method is synchronous (no await
+    inside), so each runs atomically on the app's event loop and needs no lock.
+    A subscriber that falls `max_queued` frames behind is dropped (its iterator
+    ends); the client reconnects with its Last-Event-ID and replays the gap.
+
+Key Components:
+    - StreamFrame: one encoded SSE frame + its event id / transcript position
+    - StreamHub: open / publish / close / attach_producer / cancel / subscribe
+    - StreamSubscription: async-iterable view (ring backlog, then live frames)
+    - frames_after(): the Last-Event-ID de-duplication filter (ends at a gap)
+    - get_default_stream_hub(): the module singleton (tests reset it)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: gap detection — first_event_id + frames_after stops at a sequence jump
+    - 2026-10-16: Initial creation — resumable SSE fan-out (Last-Event-ID reconnect)
+
+Related:
+    - api/v1/chat/router.py (producer task, POST /chat subscriber, reconnect endpoint)
+    - api/v1/chat/session_registry.py / injection_registry.py (tenant-scoped singletons)
+    - api/v1/chat/transcript_writer.py (the message_events rows a reconnect replays)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+from dataclasses import dataclass, field
+from uuid import UUID
+
+DEFAULT_RING_SIZE = 512
+DEFAULT_MAX_QUEUED = 1024
+
+
+@dataclass(frozen=True)
+class StreamFrame:
+    """One encoded SSE frame of a running stream."""
+
+    data: bytes
+    # The frame's SSE `id:` — its main-transcript sequence_num; None for a frame
+    # that is never persisted (token deltas, subagent relays, handoff).
+    event_id: int | None
+    # The last transcript sequence_num assigned when this frame was published.
+    after_seq: int
+
+
+@dataclass
+class _Channel:
+    ring: deque[StreamFrame]
+    subscribers: set[StreamSubscription] = field(default_factory=set)
+    producer: asyncio.Task[None] | None = None
+
+
+class StreamSubscription:
+    """Frames of one channel: the ring backlog at subscribe time, then live frames.
+
+    Iteration ends when the run's stream closes, the subscriber is dropped for
+    falling behind, or close() is called.
+    """
+
+    def __init__(
+        self,
+        hub: StreamHub,
+        key: tuple[UUID, UUID],
+        backlog: list[StreamFrame],
+        *,
+        bounded: bool,
+    ) -> None:
+        self._hub = hub
+        self._key = key
+        self._backlog = backlog
+        self._bounded = bounded
+        self._queue: asyncio.Queue[StreamFrame | None] = asyncio.Queue()
+        self.dropped = False
+
+    @property
+    def first_event_id(self) -> int | None:
+        """The id of the oldest sequenced frame in the ring backlog (None if none)."""
+        return next((f.event_id for f in self._backlog if f.event_id is not None), None)
+
+    async def __aiter__(self) -> AsyncIterator[StreamFrame]:
+        for frame in self._backlog:
+            yield frame
+        self._backlog = []
+        while True:
+            frame = await self._queue.get()
+            if frame is None:
+                return
+            yield frame
+
+    def close(self) -> None:
+        """Detach from the channel (idempotent); the run keeps going."""
+        self._hub._detach(self._key, self)
+        self._queue.put_nowait(None)
+
+
+class StreamHub:
+    """Tenant-scoped in-memory stream fan-out. DEPRECATED-IN: when a cross-process
+    bus lands (mirrors SessionRegistry's deprecation note)."""
+
+    def __init__(self, *, max_queued: int = DEFAULT_MAX_QUEUED) -> None:
+        self._tenants: dict[UUID, dict[UUID, _Channel]] = {}
+        self._max_queued = max(1, max_queued)
+
+    def open(
+        self, tenant_id: UUID, session_id: UUID, *, ring_size: int = DEFAULT_RING_SIZE
+    ) -> None:
+        """Start a channel for a run. A channel left by an earlier run is closed first."""
+        self.close(tenant_id, session_id)
+        self._tenants.setdefault(tenant_id, {})[session_id] = _Channel(
+            ring=deque(maxlen=max(1, ring_size))
+        )
+
+    def publish(self, tenant_id: UUID, session_id: UUID, frame: StreamFrame) -> None:
+        """Append to the ring + hand to every subscriber. No-op without a channel."""
+        channel = self._channel(tenant_id, session_id)
+        if channel is None:
+            return
+        channel.ring.append(frame)
+        for sub in list(channel.subscribers):
+            if sub._bounded and sub._queue.qsize() >= self._max_queued:
+                sub.dropped = True
+                channel.subscribers.discard(sub)
+                sub._queue.put_nowait(None)
+            else:
+                sub._queue.put_nowait(frame)
+
+    def close(self, tenant_id: UUID, session_id: UUID) -> None:
+        """End a run's channel: subscribers finish; idempotent. Prunes empty tenants."""
+        sessions = self._tenants.get(tenant_id)
+        channel = sessions.pop(session_id, None) if sessions is not None else None
+        if sessions is not None and not sessions:
+            del self._tenants[tenant_id]
+        if channel is None:
+            return
+        for sub in channel.subscribers:
+            sub._queue.put_nowait(None)
+        channel.subscribers.clear()
+
+    def attach_producer(self, tenant_id: UUID, session_id: UUID, task: asyncio.Task[None]) -> None:
+        """Record the task driving the run so cancel() can stop it."""
+        channel = self._channel(tenant_id, session_id)
+        if channel is not None:
+            channel.producer = task
+
+    def cancel(self, tenant_id: UUID, session_id: UUID) -> bool:
+        """Cancel the run's producer task (user Stop). False if no live producer."""
+        channel = self._channel(tenant_id, session_id)
+        if channel is None or channel.producer is None or channel.producer.done():
+            return False
+        channel.producer.cancel()
+        return True
+
+    def subscribe(
+        self, tenant_id: UUID, session_id: UUID, *, bounded: bool = True
+    ) -> StreamSubscription | None:
+        """Attach to a live channel (ring snapshot + live queue); None if no run is live.
+
+        `bounded=False` exempts the subscriber from the lag drop — the run's own
+        originating response, which has no Last-Event-ID to reconnect from yet.
+        """
+        channel = self._channel(tenant_id, session_id)
+        if channel is None:
+            return None
+        sub = StreamSubscription(
+            self, (tenant_id, session_id), list(channel.ring), bounded=bounded
+        )
+        channel.subscribers.add(sub)
+        return sub
+
+    def is_live(self, tenant_id: UUID, session_id: UUID) -> bool:
+        return self._channel(tenant_id, session_id) is not None
+
+    def _channel(self, tenant_id: UUID, session_id: UUID) -> _Channel | None:
+        sessions = self._tenants.get(tenant_id)
+        return sessions.get(session_id) if sessions is not None else None
+
+    def _detach(self, key: tuple[UUID, UUID], sub: StreamSubscription) -> None:
+        channel = self._channel(*key)
+        if channel is not None:
+            channel.subscribers.discard(sub)
+
+
+async def frames_after(
+    frames: AsyncIterator[StreamFrame] | StreamSubscription, cursor: int
+) -> AsyncIterator[bytes]:
+    """Yield frames the client has not seen, given it holds everything up to `cursor`.
+
+    A sequenced frame passes once its id exceeds the cursor (which then advances);
+    a live-only frame passes when it was published at or after the cursor position.
+    A sequenced frame beyond cursor + 1 means frames were lost in between: the
+    stream ends there, so the client reconnects from its Last-Event-ID rather
+    than silently missing them.
+    """
+    async for frame in frames:
+        if frame.event_id is not None:
+            if frame.event_id <= cursor:
+                continue
+            if frame.event_id > cursor + 1:
+                return
+            cursor = frame.event_id
+        elif frame.after_seq < cursor:
+            continue
+        yield frame.data
+
+
+def frame_event_id(frame: bytes) -> int | None:
+    """The `id:` of an encoded SSE frame (format_sse_message puts it first), or None."""
+    if not frame.startswith(b"id: "):
+        return None
+    return int(frame[4 : frame.index(b"\n")])
+
+
+# Module-level singleton — shared across router handlers within a single FastAPI
+# app instance (the run's producer publishes; POST /chat + reconnects subscribe).
+# Tests reset it to avoid cross-test / cross-event-loop leakage.
+_default_stream_hub = StreamHub()
+
+
+def get_default_stream_hub() -> StreamHub:
+    return _default_stream_hub
+
+
+def reset_stream_hub() -> None:
+    """Test hook: drop every channel (fresh singleton)."""
+    global _default_stream_hub
+    _default_stream_hub = StreamHub()
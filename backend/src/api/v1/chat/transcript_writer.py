@@ -0,0 +1,229 @@
+"""
+File: backend/src/api/v1/chat/transcript_writer.py
+Purpose: Per-request buffered writer for the message_events SSE transcript.
+Category: API / chat composition (main + sidechain transcript observers)
+Scope: Phase 57 / batched transcript persistence
+
+Description:
+    The chat stream used to persist every SSE frame on its own: one SAVEPOINT +
+    ORM add per frame, awaited inline before the yield. Span, tool and
+    verification frames make that dozens to hundreds of savepoints per send, each
+    one stalling the stream on a DB round trip. The sidechain transcript observer
+    did the same per subagent child event.
+
+    TranscriptWriter buffers the rows for one request instead. add_event() /
+    add_op() are synchronous (no DB I/O); the buffer is written as ONE multi-row
+    INSERT once it holds `max_rows` rows or its oldest row is `max_delay_sec`
+    old, and on aclose() at stream end. Rows keep the order they were added in,
+    so sequence_num ordering is unchanged; an op (a sidechain `sessions` row
+    create / completion update) runs at its position in that order.
+
+    Two modes:
+    - inline (`db`, the request session): pump() writes a due buffer in one
+      SAVEPOINT on the request transaction — rows commit with the request, as
+      before, but a send costs one round trip per batch instead of per frame.
+    - background (`session_factory`, CHAT_TRANSCRIPT_BACKGROUND_FLUSH): a flusher
+      task writes through its OWN tenant-scoped session and commits, so the SSE
+      yield path never waits on the DB. The request session cannot be used
+      concurrently (the loop and the billing / tool_calls observers share it),
+      hence the separate session — which also makes the transcript survive a
+      user-Stop request rollback (mirrors DBMessageStore, Sprint 57.143).
+
+    Best-effort: a failed batch is logged and dropped; it never breaks the stream.
+
+Key Components:
+    - TranscriptWriter: add_event / add_op / pump / aclose
+    - TranscriptOp: an ordered write callable run on the flush session
+    - make_transcript_writer: the request's writer, configured from Settings
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — buffered multi-row message_events writer
+
+Related:
+    - api/v1/chat/router.py — _stream_loop_events / _stream_resume_events /
+      _persist_subagent_transcript (the producers)
+    - agent_harness/state_mgmt/message_store.py — own-session set_config precedent
+    - infrastructure/db/models/sessions.py §MessageEvent — the partitioned table
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.config import get_settings
+from infrastructure.db.engine import get_session_factory
+from infrastructure.db.models.sessions import MessageEvent
+
+logger = logging.getLogger(__name__)
+
+# An ordered write that is not a message_events row (e.g. the sidechain
+# `sessions` row on SubagentSpawned); run on the flush session in add order.
+TranscriptOp = Callable[[AsyncSession], Awaitable[None]]
+
+
+class TranscriptWriter:
+    """Buffers one request's transcript rows; writes them in multi-row batches.
+
+    With neither `db` nor `session_factory` the writer is disabled: every add is
+    dropped (the db-None case the observers always tolerated).
+    """
+
+    def __init__(
+        self,
+        *,
+        tenant_id: UUID,
+        db: AsyncSession | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+        max_rows: int = 64,
+        max_delay_sec: float = 0.25,
+    ) -> None:
+        self._tenant_id = tenant_id
+        self._db = db
+        self._factory = session_factory
+        self._max_rows = max(1, max_rows)
+        self._max_delay = max(0.0, max_delay_sec)
+        self._pending: list[dict[str, Any] | TranscriptOp] = []
+        self._first_at = 0.0
+        self._full = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._db is not None or self._factory is not None
+
+    @property
+    def background(self) -> bool:
+        return self._factory is not None
+
+    def add_event(self, *, session_id: UUID, payload: dict[str, Any], sequence_num: int) -> None:
+        """Buffer one serialized SSE payload as a message_events row (no I/O)."""
+        self._add(
+            {
+                "session_id": session_id,
+                "tenant_id": self._tenant_id,
+                "event_type": payload["type"],
+                "event_data": payload["data"],
+                "sequence_num": sequence_num,
+                "timestamp_ms": int(time.time() * 1000),
+            }
+        )
+
+    def add_op(self, op: TranscriptOp) -> None:
+        """Buffer an ordered non-row write (runs between the rows around it)."""
+        self._add(op)
+
+    async def pump(self) -> None:
+        """Inline mode: write the buffer if it is due. Background mode: no-op
+        (the flusher task owns the thresholds) — never waits on the DB."""
+        if self.background or not self._pending or not self._due():
+            return
+        await self._flush()
+
+    async def aclose(self) -> None:
+        """Write everything still buffered (stream end; best-effort, idempotent)."""
+        self._closing = True
+        self._full.set()
+        if self._task is not None:
+            try:
+                # Shielded: a second cancel of the stream must not abort the write.
+                await asyncio.shield(self._task)
+            except Exception:  # noqa: BLE001 — the flusher logs its own failures
+                pass
+        if self._pending:
+            await self._flush()
+
+    def _add(self, item: dict[str, Any] | TranscriptOp) -> None:
+        if not self.enabled or self._closing:
+            return
+        if not self._pending:
+            self._first_at = time.monotonic()
+        self._pending.append(item)
+        if len(self._pending) >= self._max_rows:
+            self._full.set()
+        if self.background and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    def _due(self) -> bool:
+        return (
+            len(self._pending) >= self._max_rows
+            or time.monotonic() - self._first_at >= self._max_delay
+        )
+
+    async def _run(self) -> None:
+        """Background flusher: wait until the buffer is due (or closing), write it."""
+        try:
+            while self._pending:
+                remaining = self._first_at + self._max_delay - time.monotonic()
+                if not self._closing and len(self._pending) < self._max_rows and remaining > 0:
+                    try:
+                        await asyncio.wait_for(self._full.wait(), timeout=remaining)
+                    except TimeoutError:
+                        pass
+                self._full.clear()
+                await self._flush()
+        finally:
+            self._task = None
+
+    async def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        try:
+            if self._factory is not None:
+                async with self._factory() as db:
+                    await db.execute(
+                        text("SELECT set_config('app.tenant_id', :tid, true)"),
+                        {"tid": str(self._tenant_id)},
+                    )
+                    await _write(db, batch)
+                    await db.commit()
+            elif self._db is not None:
+                async with self._db.begin_nested():
+                    await _write(self._db, batch)
+        except Exception:  # noqa: BLE001 — best-effort observer; never break the stream
+            logger.exception(
+                "chat tenant %s: transcript batch of %d write(s) failed (best-effort)",
+                self._tenant_id,
+                len(batch),
+            )
+
+
+def make_transcript_writer(db: AsyncSession | None, tenant_id: UUID) -> TranscriptWriter:
+    """The request's transcript writer: inline on `db` by default, own-session
+    background flushes with CHAT_TRANSCRIPT_BACKGROUND_FLUSH (db None → disabled)."""
+    settings = get_settings()
+    background = settings.chat_transcript_background_flush and db is not None
+    return TranscriptWriter(
+        tenant_id=tenant_id,
+        db=db,
+        session_factory=get_session_factory() if background else None,
+        max_rows=settings.chat_transcript_flush_rows,
+        max_delay_sec=settings.chat_transcript_flush_ms / 1000.0,
+    )
+
+
+async def _write(db: AsyncSession, batch: list[dict[str, Any] | TranscriptOp]) -> None:
+    """Run `batch` in order: consecutive rows as one multi-row INSERT, ops in place."""
+    rows: list[dict[str, Any]] = []
+    for item in batch:
+        if isinstance(item, dict):
+            rows.append(item)
+            continue
+        if rows:
+            await db.execute(insert(MessageEvent).values(rows))
+            rows = []
+        await item(db)
+    if rows:
+        await db.execute(insert(MessageEvent).values(rows))
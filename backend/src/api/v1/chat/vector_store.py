@@ -0,0 +1,105 @@
+"""
+File: backend/src/api/v1/chat/vector_store.py
+Purpose: VectorStore builder shared by the knowledge + memory vector indexes (backend selection).
+Category: API / chat composition (picks the Qdrant or embedded NumPy vector store)
+Scope: Phase 57 / vector store backends
+
+Description:
+    knowledge_index.py and memory_vector_index.py each built a QdrantVectorStore
+    from QDRANT_URL. They now both call get_vector_store(), which reads
+    VECTOR_STORE_BACKEND:
+
+    - "qdrant" (default): a fresh QdrantVectorStore per caller, exactly as before
+      (None when QDRANT_URL is empty → the caller falls back to keyword search).
+      With QDRANT_ASYNC_CLIENT on: ONE process-wide AsyncQdrantVectorStore, so
+      both indexes share its connection pool and collection cache;
+    - "local": ONE process-wide LocalVectorStore, so both indexes share its lock
+      and collection cache. VECTOR_STORE_LOCAL_DIR persists the collections
+      (empty = in-memory, rebuilt by the indexes' ingest on restart);
+      VECTOR_STORE_LOCAL_QUANTIZE stores int8 vectors.
+
+    The backend modules load lazily, so the unused SDK (qdrant-client / NumPy)
+    is never imported.
+
+Key Components:
+    - get_vector_store() -> VectorStore | None  (local / async Qdrant memoized)
+    - close_vector_store()  (app shutdown: closes the pooled async Qdrant client)
+    - reset_vector_store()  (test hook)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: QDRANT_ASYNC_CLIENT → shared AsyncQdrantVectorStore; close_vector_store()
+    - 2026-10-16: Initial creation — VECTOR_STORE_BACKEND selection (qdrant | local)
+
+Related:
+    - infrastructure/vector/base.py — VectorStore protocol
+    - infrastructure/vector/qdrant_client.py / local_store.py — the backends
+    - api/v1/chat/knowledge_index.py / memory_vector_index.py — the consumers
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+from core.config import get_settings
+
+if TYPE_CHECKING:
+    from infrastructure.vector.base import VectorStore
+    from infrastructure.vector.qdrant_client import AsyncQdrantVectorStore
+
+logger = logging.getLogger(__name__)
+
+_local: "VectorStore | None" = None
+_async_qdrant: "AsyncQdrantVectorStore | None" = None
+
+
+def get_vector_store() -> "VectorStore | None":
+    """Return the vector store the indexes should use (None = Qdrant backend without a URL)."""
+    global _local, _async_qdrant
+    settings = get_settings()
+    if settings.vector_store_backend == "local":
+        if _local is None:
+            from infrastructure.vector.local_store import LocalVectorStore
+
+            _local = LocalVectorStore(
+                settings.vector_store_local_dir or None,
+                quantize=settings.vector_store_local_quantize,
+            )
+            logger.info(
+                "local vector store built (dir=%s, quantize=%s)",
+                settings.vector_store_local_dir or "<memory>",
+                settings.vector_store_local_quantize,
+            )
+        return _local
+    if not settings.qdrant_url:
+        return None
+    if settings.qdrant_async_client:
+        if _async_qdrant is None:
+            from infrastructure.vector.qdrant_client import AsyncQdrantVectorStore
+
+            _async_qdrant = AsyncQdrantVectorStore(
+                settings.qdrant_url,
+                prefer_grpc=settings.qdrant_prefer_grpc,
+                pool_size=settings.qdrant_pool_size or None,
+            )
+            logger.info("async qdrant vector store built (grpc=%s)", settings.qdrant_prefer_grpc)
+        return _async_qdrant
+    from infrastructure.vector.qdrant_client import QdrantVectorStore
+
+    return QdrantVectorStore(settings.qdrant_url)
+
+
+async def close_vector_store() -> None:
+    """Close the pooled async Qdrant client (no-op when it was never built)."""
+    if _async_qdrant is not None:
+        await _async_qdrant.aclose()
+
+
+def reset_vector_store() -> None:
+    """Test hook: drop the shared stores so the next call rebuilds from settings."""
+    global _local, _async_qdrant
+    _local = None
+    _async_qdrant = None
@@ -25,6 +25,10 @@ Description:
         for `memory_user` (only layer with expires_at column per Day 1
         D1-008 ORM探勘); other layers return 400.
 
+    The three list endpoints also take `cursor` (keyset over (created_at, id),
+    no count) in place of `offset`, and stream NDJSON for
+    `Accept: application/x-ndjson` — see api/v1/pagination.py.
+
     - GET /api/v1/memory/matrix
         Aggregate (layer × time_scale) counts via GROUP BY / count() (no row
         materialisation). system + tenant collapse to one PERMANENT bucket
@@ -48,6 +52,8 @@ Description:
 Created: 2026-05-10 (Sprint 57.12 Day 1 / US-2)
 
 Modification History (newest-first):
+    - 2026-10-16: Keyset `cursor` + NDJSON mode on the list endpoints; count(*) replaces
+      the materialize-every-row `total`
     - 2026-06-04: Sprint 57.76 — add GET /ops (paginated memory_ops history)
     - 2026-06-03: Sprint 57.73 Track B — add GET /matrix layer×time_scale count aggregate
     - 2026-05-17: Sprint 57.19 US-B2 — extend /recent w/ optional scope_id + time_scale params
@@ -60,20 +66,33 @@ Related:
     - platform_layer/identity/auth.py (get_current_tenant + require_audit_role)
     - sprint-57-12-plan.md §US-2 (REST endpoint spec + Day 1 drift D1-007/008/009/010)
     - api/v1/verification.py (sibling 57.11 pattern reference for inline schemas)
+    - api/v1/pagination.py (shared keyset cursor + NDJSON helpers)
     - 17-cross-category-interfaces.md §3 Cat 3 (no NEW ABC methods this sprint)
 """
 
 from __future__ import annotations
 
+import functools
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 from enum import Enum
+from typing import TypeVar
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from sqlalchemy import case, desc, func, select
+from sqlalchemy import Select, case, desc, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.v1.pagination import (
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    ndjson_response,
+    stream_scalars,
+    wants_ndjson,
+)
 from infrastructure.db.models.memory import (
     MemoryOp,
     MemorySystem,
@@ -88,6 +107,12 @@ router = APIRouter(prefix="/memory", tags=["memory"])
 # Hard cap on page size; mirrors verification.py 57.11 _MAX_PAGE_SIZE pattern.
 _MAX_PAGE_SIZE = 200
 
+_CURSOR_DESCRIPTION = (
+    "Opaque pagination cursor from previous response.next_cursor (replaces offset)"
+)
+
+_M = TypeVar("_M", MemorySystem, MemoryTenant, MemoryUser)
+
 
 class MemoryLayer(str, Enum):
     SYSTEM = "system"
@@ -125,10 +150,11 @@ class MemoryEntryItem(BaseModel):
 
 class MemoryEntryPage(BaseModel):
     items: list[MemoryEntryItem]
-    total: int
+    total: int | None  # None on a cursor request (the count is skipped)
     has_more: bool
     next_offset: int | None
     page_size: int
+    next_cursor: str | None = None
 
 
 class MemoryMatrixCell(BaseModel):
@@ -231,33 +257,19 @@ def _validate_page_size(limit: int) -> int:
     return limit
 
 
-async def _list_system(
-    db: AsyncSession, offset: int, limit: int
-) -> tuple[list[MemoryEntryItem], int]:
-    sel = select(MemorySystem).order_by(desc(MemorySystem.created_at))
-    items_orm = (await db.execute(sel.offset(offset).limit(limit))).scalars().all()
-    total = len((await db.execute(select(MemorySystem))).scalars().all())
-    return [_system_to_item(o) for o in items_orm], total
+def _system_query() -> Select[tuple[MemorySystem]]:
+    return select(MemorySystem)
 
 
-async def _list_tenant(
-    db: AsyncSession, current_tenant: UUID, offset: int, limit: int
-) -> tuple[list[MemoryEntryItem], int]:
-    base = select(MemoryTenant).where(MemoryTenant.tenant_id == current_tenant)
-    sel = base.order_by(desc(MemoryTenant.created_at))
-    items_orm = (await db.execute(sel.offset(offset).limit(limit))).scalars().all()
-    total = len((await db.execute(base)).scalars().all())
-    return [_tenant_to_item(o) for o in items_orm], total
+def _tenant_query(current_tenant: UUID) -> Select[tuple[MemoryTenant]]:
+    return select(MemoryTenant).where(MemoryTenant.tenant_id == current_tenant)
 
 
-async def _list_user(
-    db: AsyncSession,
+def _user_query(
     current_tenant: UUID,
-    offset: int,
-    limit: int,
     user_id: UUID | None = None,
     time_scale: MemoryTimeScale | None = None,
-) -> tuple[list[MemoryEntryItem], int]:
+) -> Select[tuple[MemoryUser]]:
     base = select(MemoryUser).where(MemoryUser.tenant_id == current_tenant)
     if user_id is not None:
         base = base.where(MemoryUser.user_id == user_id)
@@ -270,31 +282,67 @@ async def _list_user(
         elif time_scale == MemoryTimeScale.DAILY:
             base = base.where(MemoryUser.expires_at.is_not(None))
             base = base.where(MemoryUser.expires_at <= now + timedelta(days=30))
-    sel = base.order_by(desc(MemoryUser.created_at))
-    items_orm = (await db.execute(sel.offset(offset).limit(limit))).scalars().all()
-    total = len((await db.execute(base)).scalars().all())
-    return [_user_to_item(o) for o in items_orm], total
+    return base
 
 
-def _build_page(
-    items: list[MemoryEntryItem], total: int, offset: int, page_size: int
-) -> MemoryEntryPage:
-    has_more = offset + len(items) < total
-    next_offset = offset + len(items) if has_more else None
+async def _list_page(
+    request: Request,
+    db: AsyncSession,
+    base: Select[tuple[_M]],
+    model: type[_M],
+    to_item: Callable[[_M], MemoryEntryItem],
+    *,
+    offset: int,
+    limit: int,
+    cursor: str | None,
+) -> MemoryEntryPage | StreamingResponse:
+    """One page of `base`, newest-first by (created_at, id).
+
+    Offset mode (no cursor) keeps the `total` count + `next_offset`; cursor mode
+    seeks past the cursor row instead and skips the count (`total` None). Every
+    page carries `next_cursor`, so a client can switch to cursors after page 1.
+    NDJSON mode streams all rows from the cursor / offset on.
+    """
+    if cursor is not None and offset:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="cursor and offset are mutually exclusive",
+        )
+    if cursor is not None:
+        base = base.where(
+            keyset_after(
+                (model.created_at, model.id),
+                decode_cursor(cursor, datetime, UUID),
+                descending=True,
+            )
+        )
+    ordered = base.order_by(desc(model.created_at), desc(model.id)).offset(offset)
+    if wants_ndjson(request):
+        return ndjson_response(to_item(o) async for o in stream_scalars(db, ordered))
+
+    total = None
+    if cursor is None:
+        total = (await db.execute(select(func.count()).select_from(base.subquery()))).scalar_one()
+    rows = (await db.execute(ordered.limit(limit + 1))).scalars().all()
+    page = rows[:limit]
+    has_more = len(rows) > limit
     return MemoryEntryPage(
-        items=items,
+        items=[to_item(o) for o in page],
         total=total,
         has_more=has_more,
-        next_offset=next_offset,
-        page_size=page_size,
+        next_offset=offset + len(page) if has_more and cursor is None else None,
+        next_cursor=encode_cursor(page[-1].created_at, page[-1].id) if has_more else None,
+        page_size=limit,
     )
 
 
 @router.get("/recent", response_model=MemoryEntryPage)
 async def list_recent(
+    request: Request,
     layer: MemoryLayer = Query(..., description="Layer to query (single layer per request)"),
     limit: int = Query(50, ge=1, le=_MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
     scope_id: UUID | None = Query(
         None,
         description=(
@@ -310,7 +358,7 @@ async def list_recent(
     current_tenant: UUID = Depends(get_current_tenant),
     _audit: UUID = Depends(require_audit_role),
     db: AsyncSession = Depends(get_db_session_with_tenant),
-) -> MemoryEntryPage:
+) -> MemoryEntryPage | StreamingResponse:
     """Paginated recent entries from a single layer, sorted by created_at DESC.
 
     Tenant + user layers: filtered by JWT tenant_id via RLS.
@@ -322,39 +370,42 @@ async def list_recent(
     - time_scale: only for layer=user (the only layer with expires_at column)
     """
     _validate_page_size(limit)
+    page = functools.partial(_list_page, request, db, offset=offset, limit=limit, cursor=cursor)
     if layer == MemoryLayer.SYSTEM:
-        items, total = await _list_system(db, offset, limit)
-    elif layer == MemoryLayer.TENANT:
+        return await page(_system_query(), MemorySystem, _system_to_item)
+    if layer == MemoryLayer.TENANT:
         # scope_id (if present) must match current_tenant for tenant layer.
         if scope_id is not None and scope_id != current_tenant:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="scope_id does not match current tenant",
             )
-        items, total = await _list_tenant(db, current_tenant, offset, limit)
-    elif layer == MemoryLayer.USER:
-        items, total = await _list_user(
-            db, current_tenant, offset, limit, user_id=scope_id, time_scale=time_scale
-        )
-    else:
-        # role / session — Phase 58+ scope per AD-Memory-Role-Session-Phase58.
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail=f"layer={layer.value} not yet supported (Phase 58+ scope)",
+        return await page(_tenant_query(current_tenant), MemoryTenant, _tenant_to_item)
+    if layer == MemoryLayer.USER:
+        return await page(
+            _user_query(current_tenant, user_id=scope_id, time_scale=time_scale),
+            MemoryUser,
+            _user_to_item,
         )
-    return _build_page(items, total, offset, limit)
+    # role / session — Phase 58+ scope per AD-Memory-Role-Session-Phase58.
+    raise HTTPException(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        detail=f"layer={layer.value} not yet supported (Phase 58+ scope)",
+    )
 
 
 @router.get("/scope/{layer}/{scope_id}", response_model=MemoryEntryPage)
 async def list_by_scope(
     layer: MemoryLayer,
     scope_id: str,
+    request: Request,
     limit: int = Query(50, ge=1, le=_MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
     current_tenant: UUID = Depends(get_current_tenant),
     _audit: UUID = Depends(require_audit_role),
     db: AsyncSession = Depends(get_db_session_with_tenant),
-) -> MemoryEntryPage:
+) -> MemoryEntryPage | StreamingResponse:
     """Entries scoped to a specific scope_id within a layer.
 
     For tenant layer: scope_id must match current_tenant (cross-tenant rejected
@@ -362,6 +413,7 @@ async def list_by_scope(
     enforced. System layer: scope_id ignored (returns all). Role / session: 501.
     """
     _validate_page_size(limit)
+    page = functools.partial(_list_page, request, db, offset=offset, limit=limit, cursor=cursor)
     if layer == MemoryLayer.USER:
         try:
             user_uuid = UUID(scope_id)
@@ -370,8 +422,8 @@ async def list_by_scope(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="scope_id must be a valid UUID for user layer",
             ) from exc
-        items, total = await _list_user(db, current_tenant, offset, limit, user_id=user_uuid)
-    elif layer == MemoryLayer.TENANT:
+        return await page(_user_query(current_tenant, user_id=user_uuid), MemoryUser, _user_to_item)
+    if layer == MemoryLayer.TENANT:
         try:
             scope_uuid = UUID(scope_id)
         except ValueError as exc:
@@ -386,28 +438,28 @@ async def list_by_scope(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="scope_id does not match current tenant",
             )
-        items, total = await _list_tenant(db, current_tenant, offset, limit)
-    elif layer == MemoryLayer.SYSTEM:
+        return await page(_tenant_query(current_tenant), MemoryTenant, _tenant_to_item)
+    if layer == MemoryLayer.SYSTEM:
         # System layer: scope_id has no semantic meaning; return all (auditor-only).
-        items, total = await _list_system(db, offset, limit)
-    else:
-        raise HTTPException(
-            status_code=status.HTTP_501_NOT_IMPLEMENTED,
-            detail=f"layer={layer.value} not yet supported (Phase 58+ scope)",
-        )
-    return _build_page(items, total, offset, limit)
+        return await page(_system_query(), MemorySystem, _system_to_item)
+    raise HTTPException(
+        status_code=status.HTTP_501_NOT_IMPLEMENTED,
+        detail=f"layer={layer.value} not yet supported (Phase 58+ scope)",
+    )
 
 
 @router.get("/by-time/{layer}/{time_scale}", response_model=MemoryEntryPage)
 async def list_by_time(
     layer: MemoryLayer,
     time_scale: MemoryTimeScale,
+    request: Request,
     limit: int = Query(50, ge=1, le=_MAX_PAGE_SIZE),
     offset: int = Query(0, ge=0),
+    cursor: str | None = Query(None, description=_CURSOR_DESCRIPTION),
     current_tenant: UUID = Depends(get_current_tenant),
     _audit: UUID = Depends(require_audit_role),
     db: AsyncSession = Depends(get_db_session_with_tenant),
-) -> MemoryEntryPage:
+) -> MemoryEntryPage | StreamingResponse:
     """Time-scale filter on expires_at column. Only memory_user has expires_at
     in current ORM (per D1-008); other layers return 400 with explanation.
     """
@@ -421,21 +473,16 @@ async def list_by_time(
             ),
         )
 
-    base = select(MemoryUser).where(MemoryUser.tenant_id == current_tenant)
-    now = datetime.now(UTC)
-    if time_scale == MemoryTimeScale.PERMANENT:
-        base = base.where(MemoryUser.expires_at.is_(None))
-    elif time_scale == MemoryTimeScale.QUARTERLY:
-        base = base.where(MemoryUser.expires_at > now + timedelta(days=30))
-    elif time_scale == MemoryTimeScale.DAILY:
-        base = base.where(MemoryUser.expires_at.is_not(None))
-        base = base.where(MemoryUser.expires_at <= now + timedelta(days=30))
-
-    stmt = base.order_by(desc(MemoryUser.created_at)).offset(offset).limit(limit)
-    items_orm = (await db.execute(stmt)).scalars().all()
-    total = len((await db.execute(base)).scalars().all())
-    items = [_user_to_item(o) for o in items_orm]
-    return _build_page(items, total, offset, limit)
+    return await _list_page(
+        request,
+        db,
+        _user_query(current_tenant, time_scale=time_scale),
+        MemoryUser,
+        _user_to_item,
+        offset=offset,
+        limit=limit,
+        cursor=cursor,
+    )
 
 
 @router.get("/matrix", response_model=MemoryMatrixResponse)
@@ -0,0 +1,163 @@
+"""
+File: backend/src/api/v1/pagination.py
+Purpose: Shared keyset (cursor) pagination + NDJSON streaming for api/v1 listing endpoints.
+Category: api/v1
+Scope: Phase 57 / listing APIs at tenant scale
+
+Description:
+    OFFSET pagination re-reads (and discards) every skipped row, so page N costs
+    O(N); the `count(*)` that came with it scans the whole filtered set on every
+    page. Unpaged listings (/sessions/{id}/events) materialize the full result
+    in memory. This module gives the listing endpoints one shared shape instead:
+
+    - Opaque cursors: the sort key of the last row on a page — `(created_at, id)`
+      / `(started_at, id)` for entity lists, `(session_id, sequence_num)` for a
+      transcript — as base64url JSON. Clients echo `next_cursor` back verbatim;
+      a tampered / foreign cursor is a 400 `invalid cursor`.
+    - keyset_after(): the row-value predicate `(a, b) < (:a, :b)` (or `>`), which
+      Postgres answers with one descent of the matching composite index
+      (migration 0039) regardless of page depth.
+    - NDJSON mode: a request with `Accept: application/x-ndjson` gets every
+      matching row after the cursor as one JSON object per line, read from a
+      server-side cursor (`AsyncSession.stream_scalars` + `yield_per`), so an
+      export holds one chunk of rows in memory instead of the whole result.
+
+    Generalizes the cursor helpers api/v1/loops.py shipped with (Sprint 57.19).
+
+Key Components:
+    - encode_cursor(*values) / decode_cursor(cursor, *types)
+    - keyset_after(columns, values, descending=...)
+    - wants_ndjson(request)
+    - stream_scalars(db, stmt) / ndjson_response(items)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — shared keyset cursors + NDJSON streaming
+
+Related:
+    - api/v1/loops.py (the original (started_at, session_id) cursor)
+    - api/v1/sessions.py / memory.py / admin/tenants.py (the listings using this)
+    - infrastructure/db/migrations/versions/0039_listing_keyset_indexes.py
+"""
+
+from __future__ import annotations
+
+import base64
+import json
+from collections.abc import AsyncIterator, Sequence
+from datetime import datetime
+from typing import Any, TypeVar
+from uuid import UUID
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Rows fetched per server-side cursor round trip in NDJSON mode.
+STREAM_CHUNK_ROWS = 500
+
+_T = TypeVar("_T")
+
+CursorValue = datetime | UUID | int
+
+
+def encode_cursor(*values: CursorValue) -> str:
+    """Opaque cursor for a row's sort key (datetime / UUID / int components)."""
+    parts = [_encode_part(v) for v in values]
+    raw = json.dumps(parts, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple[Any, ...]:
+    """Decode a cursor into `types` (datetime / UUID / int); 400 if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        parts = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+        if not isinstance(parts, list) or len(parts) != len(types):
+            raise ValueError("cursor arity")
+        return tuple(_decode_part(part, kind) for part, kind in zip(parts, types, strict=True))
+    except (ValueError, TypeError, UnicodeError, json.JSONDecodeError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="invalid cursor",
+        ) from exc
+
+
+def _encode_part(value: CursorValue) -> str | int:
+    if isinstance(value, int):
+        return value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def _decode_part(part: Any, kind: type) -> Any:
+    if kind is int:
+        if isinstance(part, bool) or not isinstance(part, int):
+            raise TypeError("cursor int")
+        return part
+    if not isinstance(part, str):
+        raise TypeError("cursor str")
+    if kind is datetime:
+        return datetime.fromisoformat(part)
+    return kind(part)
+
+
+def keyset_after(
+    columns: Sequence[ColumnElement[Any]], values: Sequence[Any], *, descending: bool
+) -> ColumnElement[bool]:
+    """Rows strictly past `values` in (`columns`) order — DESC → older, ASC → newer.
+
+    A row-value comparison rather than the expanded OR/AND form, so the planner
+    matches it to the composite index directly.
+    """
+    if descending:
+        return tuple_(*columns) < tuple_(*values)
+    return tuple_(*columns) > tuple_(*values)
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client asked for the streaming NDJSON representation."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+async def stream_scalars(
+    db: AsyncSession, stmt: Select[tuple[_T]], *, chunk_rows: int = STREAM_CHUNK_ROWS
+) -> AsyncIterator[_T]:
+    """ORM rows of `stmt` from a server-side cursor, `chunk_rows` per round trip."""
+    result = await db.stream_scalars(stmt.execution_options(yield_per=chunk_rows))
+    try:
+        async for row in result:
+            yield row
+    finally:
+        await result.close()
+
+
+async def _ndjson_lines(items: AsyncIterator[BaseModel]) -> AsyncIterator[bytes]:
+    async for item in items:
+        yield item.model_dump_json().encode("utf-8") + b"\n"
+
+
+def ndjson_response(
+    items: AsyncIterator[BaseModel], *, headers: dict[str, str] | None = None
+) -> StreamingResponse:
+    """Stream `items` as NDJSON — one serialized model per line."""
+    return StreamingResponse(_ndjson_lines(items), media_type=NDJSON_MEDIA_TYPE, headers=headers)
+
+
+__all__ = [
+    "NDJSON_MEDIA_TYPE",
+    "STREAM_CHUNK_ROWS",
+    "decode_cursor",
+    "encode_cursor",
+    "keyset_after",
+    "ndjson_response",
+    "stream_scalars",
+    "wants_ndjson",
+]
@@ -16,20 +16,27 @@ Description:
         (AD-ChatV2-SessionList-Backend) — the session LIST. The separate
         history-REPLAY gap (clicking a session to reload its conversation) is
         AD-ChatV2-Session-History-Replay-Phase58 → GET /{id}/events below.
+        Keyset-paged by an opaque (started_at, id) cursor (`limit` + `cursor`
+        → `next_cursor`).
 
     - GET /api/v1/sessions/{session_id}/events
         Sprint 57.125 (history replay, arc slice 1/2): the session's persisted
         SSE event stream, ordered by sequence_num, for the chat-v2 frontend
         (57.126) to replay through the live mergeEvent reducer. Rows are written
-        by the main-session transcript observer (router._persist_main_event).
+        by the main-session transcript writer (router._stream_loop_events).
         A cross-tenant / unknown / event-less session returns 200 + [] (never
         404 — zero events is valid + cross-tenant existence must stay hidden).
+        Unpaged by default (the replay contract); `limit` + `cursor` page it by
+        an opaque (session_id, sequence_num) cursor.
 
     - GET /api/v1/sessions/{session_id}/state
         Returns the LATEST state snapshot for the given session within the
         current tenant. Cross-tenant lookup returns 404 (not 403) per
         multi-tenant 鐵律 — never reveal cross-tenant existence.
 
+    The two listings stream NDJSON (one item per line, server-side cursor) when
+    requested with `Accept: application/x-ndjson` — see api/v1/pagination.py.
+
     Per Sprint 57.19 Day 0 三-prong drift D-PRE-7 pivot:
     - state_mgmt/repository.py does NOT exist. Module contains _abc.py +
       checkpointer.py + reducer.py + decision_reducers.py. State persistence
@@ -44,6 +51,8 @@ Description:
 Created: 2026-05-17 (Sprint 57.19 Day 2 / US-B3)
 
 Modification History (newest-first):
+    - 2026-10-16: docstrings name the transcript writer (router._persist_main_event removed)
+    - 2026-10-16: Keyset cursors on GET /sessions + /{id}/events; NDJSON streaming mode
     - 2026-06-16: Sprint 57.125 — GET /{id}/events replay endpoint (main transcript history)
     - 2026-06-12: Sprint 57.107 B3 — GET /sessions list (lineage fields, sidechain-excluded)
     - 2026-05-17: Initial creation (Sprint 57.19 Day 2 / US-B3) — StateSnapshot direct query
@@ -54,6 +63,7 @@ Related:
     - platform_layer/middleware/tenant_context.py (get_db_session_with_tenant — RLS)
     - sprint-57-19-plan.md §US-B3
     - api/v1/loops.py (sibling sprint pattern)
+    - api/v1/pagination.py (shared keyset cursor + NDJSON helpers)
     - 17-cross-category-interfaces.md §7 Cat 7 (no NEW ABC method this sprint)
 """
 
@@ -63,12 +73,21 @@ from datetime import datetime
 from typing import Any
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from sqlalchemy import desc, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.v1.pagination import (
+    decode_cursor,
+    encode_cursor,
+    ndjson_response,
+    stream_scalars,
+    wants_ndjson,
+)
 from infrastructure.db.models.sessions import MessageEvent
+from infrastructure.db.models.sessions import Session as SessionORM
 from infrastructure.db.models.state import StateSnapshot
 from infrastructure.db.repositories.session_repository import SessionRepository
 from platform_layer.identity.auth import get_current_tenant
@@ -76,6 +95,10 @@ from platform_layer.middleware.tenant_context import get_db_session_with_tenant
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+_MAX_PAGE_SIZE = 200
+_DEFAULT_PAGE_SIZE = 50
+_MAX_EVENTS_PAGE_SIZE = 1000
+
 
 class SessionListItem(BaseModel):
     """One top-level session row with handoff lineage (Sprint 57.107 B3)."""
@@ -93,34 +116,54 @@ class SessionListResponse(BaseModel):
     """Top-level session list, newest-first (sidechains excluded)."""
 
     sessions: list[SessionListItem]
+    next_cursor: str | None = None  # None → no older sessions
+
+
+def _session_to_item(row: SessionORM) -> SessionListItem:
+    return SessionListItem(
+        id=row.id,
+        title=row.title,
+        status=row.status,
+        agent_role=(row.meta_data or {}).get("agent_role"),
+        handoff_parent_id=row.handoff_parent_id,
+        started_at_ms=_to_ms(row.started_at),
+        total_turns=row.total_turns,
+    )
 
 
 @router.get("", response_model=SessionListResponse)
 async def list_sessions(
+    request: Request,
+    limit: int = Query(_DEFAULT_PAGE_SIZE, ge=1, le=_MAX_PAGE_SIZE),
+    cursor: str | None = Query(
+        None, description="Opaque pagination cursor from previous response.next_cursor"
+    ),
     current_tenant: UUID = Depends(get_current_tenant),
     db: AsyncSession = Depends(get_db_session_with_tenant),
-) -> SessionListResponse:
+) -> SessionListResponse | StreamingResponse:
     """List the current tenant's top-level sessions, newest-first.
 
     Lineage: a handoff-booted child carries `handoff_parent_id` + its target
     persona in `agent_role` (from meta_data) so the FE can render the chain.
     Sidechain rows (subagent transcripts, Sprint 57.107 US-4) are excluded —
     they are nested under their parent, not top-level conversations.
+
+    Sort: started_at DESC, id DESC (stable tiebreaker for the cursor). NDJSON
+    mode streams every session after `cursor` and ignores `limit`.
     """
-    rows = await SessionRepository(db).list_sessions(tenant_id=current_tenant)
+    before = decode_cursor(cursor, datetime, UUID) if cursor is not None else None
+    repo = SessionRepository(db)
+    if wants_ndjson(request):
+        stmt = repo.top_level_query(tenant_id=current_tenant, before=before)
+        return ndjson_response(_session_to_item(row) async for row in stream_scalars(db, stmt))
+
+    rows = await repo.list_sessions(tenant_id=current_tenant, limit=limit + 1, before=before)
+    page = rows[:limit]
+    next_cursor = None
+    if len(rows) > limit:
+        next_cursor = encode_cursor(page[-1].started_at, page[-1].id)
     return SessionListResponse(
-        sessions=[
-            SessionListItem(
-                id=row.id,
-                title=row.title,
-                status=row.status,
-                agent_role=(row.meta_data or {}).get("agent_role"),
-                handoff_parent_id=row.handoff_parent_id,
-                started_at_ms=_to_ms(row.started_at),
-                total_turns=row.total_turns,
-            )
-            for row in rows
-        ]
+        sessions=[_session_to_item(row) for row in page], next_cursor=next_cursor
     )
 
 
@@ -203,39 +246,72 @@ class SessionEventsResponse(BaseModel):
     """
 
     events: list[SessionEventItem]
+    next_cursor: str | None = None  # set only on a full page of a `limit` request
+
+
+def _event_to_item(row: MessageEvent) -> SessionEventItem:
+    return SessionEventItem(
+        type=row.event_type,
+        data=row.event_data,
+        sequence_num=row.sequence_num,
+        timestamp_ms=row.timestamp_ms,
+    )
 
 
 @router.get("/{session_id}/events", response_model=SessionEventsResponse)
 async def list_session_events(
     session_id: UUID,
+    request: Request,
+    limit: int | None = Query(
+        None,
+        ge=1,
+        le=_MAX_EVENTS_PAGE_SIZE,
+        description="Page size; omitted → the whole transcript in one response",
+    ),
+    cursor: str | None = Query(
+        None, description="Opaque pagination cursor from previous response.next_cursor"
+    ),
     current_tenant: UUID = Depends(get_current_tenant),
     db: AsyncSession = Depends(get_db_session_with_tenant),
-) -> SessionEventsResponse:
+) -> SessionEventsResponse | StreamingResponse:
     """Return `session_id`'s persisted SSE event stream, ordered by sequence_num.
 
     The chat-v2 frontend (Sprint 57.126) replays these events through the live
     mergeEvent reducer to reconstruct a historical conversation. Rows are written
-    by the main-session transcript observer (Sprint 57.125,
-    router._persist_main_event). Tenant-scoped + RLS + a redundant app-layer
+    by the main-session transcript writer (Sprint 57.125,
+    router._stream_loop_events). Tenant-scoped + RLS + a redundant app-layer
     tenant_id filter (defence-in-depth). A cross-tenant / unknown / event-less
     session returns 200 + [] (never 404 — zero events is a valid state and
     cross-tenant existence must not be revealed).
+
+    The cursor is bound to this session: one minted for another session is a
+    400. NDJSON mode (export) streams every event after `cursor` from a
+    server-side cursor and ignores `limit`.
     """
     stmt = (
         select(MessageEvent)
         .where(MessageEvent.session_id == session_id)
         .where(MessageEvent.tenant_id == current_tenant)
-        .order_by(MessageEvent.sequence_num)
     )
+    if cursor is not None:
+        cursor_session_id, after_seq = decode_cursor(cursor, UUID, int)
+        if cursor_session_id != session_id:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="invalid cursor",
+            )
+        stmt = stmt.where(MessageEvent.sequence_num > after_seq)
+    stmt = stmt.order_by(MessageEvent.sequence_num)
+    if wants_ndjson(request):
+        return ndjson_response(_event_to_item(row) async for row in stream_scalars(db, stmt))
+
+    if limit is not None:
+        stmt = stmt.limit(limit + 1)
     rows = (await db.execute(stmt)).scalars().all()
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(session_id, rows[-1].sequence_num)
     return SessionEventsResponse(
-        events=[
-            SessionEventItem(
-                type=row.event_type,
-                data=row.event_data,
-                sequence_num=row.sequence_num,
-                timestamp_ms=row.timestamp_ms,
-            )
-            for row in rows
-        ]
+        events=[_event_to_item(row) for row in rows], next_cursor=next_cursor
     )
@@ -22,9 +22,10 @@ Lifecycle:
     each domain's mock_executor.py gets swapped.
 
 Created: 2026-04-30 (Sprint 51.0 Day 3)
-Last Modified: 2026-07-23
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: opt-in knowledge_keyword_index (BM25 DocsKeywordIndex for knowledge_search)
     - 2026-07-23: Sprint 57.167 — mark mock-mode business results `_mock` (de-Potemkin 1)
     - 2026-06-26: Sprint 57.145 — opt-in knowledge_root (registers knowledge_search tool)
     - 2026-06-24: Sprint 57.140 — opt-in todo_store (registers write_todos task-primitive tool)
@@ -87,7 +88,7 @@ if TYPE_CHECKING:
 from .audit_domain.tools import register_audit_tools
 from .correlation.tools import register_correlation_tools
 from .incident.tools import register_incident_tools
-from .knowledge import register_knowledge_tools
+from .knowledge import get_docs_keyword_index, register_knowledge_tools
 from .patrol.tools import register_patrol_tools
 from .rootcause.tools import register_rootcause_tools
 
@@ -314,6 +315,7 @@ def make_default_executor(
     todo_store: "TodoStore | None" = None,
     knowledge_root: str | None = None,
     knowledge_vector_index: "KnowledgeVectorIndex | None" = None,
+    knowledge_keyword_index: bool = False,
 ) -> tuple[ToolRegistryImpl, ToolExecutorImpl]:
     """Build a registry+executor pair with echo_tool + 18 business tools (19 total).
 
@@ -452,6 +454,8 @@ def make_default_executor(
     # company docs folder freely and grounds answers in real snippets + source paths.
     # A missing/invalid root (connector raises ValueError) → skip registration so the
     # agent degrades gracefully (knowledge_search absent), never breaking the build.
+    # knowledge_keyword_index: the keyword path uses the process-wide BM25 index
+    # for this root (built once, refreshed by mtime/size) instead of a full scan.
     if knowledge_root:
         try:
             register_knowledge_tools(
@@ -459,6 +463,9 @@ def make_default_executor(
                 handlers,
                 docs_root=knowledge_root,
                 vector_index=knowledge_vector_index,
+                keyword_index=(
+                    get_docs_keyword_index(knowledge_root) if knowledge_keyword_index else None
+                ),
             )
         except ValueError:
             pass
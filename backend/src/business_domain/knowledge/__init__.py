@@ -6,6 +6,7 @@ Scope: Phase 57 / Sprint 57.145
 """
 
 from .connector import KnowledgeHit, LocalDocsConnector
+from .keyword_index import DocsKeywordIndex, get_docs_keyword_index
 from .tools import (
     KNOWLEDGE_SEARCH_SPEC,
     make_knowledge_search_handler,
@@ -13,9 +14,11 @@ from .tools import (
 )
 
 __all__ = [
+    "DocsKeywordIndex",
     "KnowledgeHit",
     "LocalDocsConnector",
     "KNOWLEDGE_SEARCH_SPEC",
+    "get_docs_keyword_index",
     "make_knowledge_search_handler",
     "register_knowledge_tools",
 ]
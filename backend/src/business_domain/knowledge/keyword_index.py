@@ -0,0 +1,289 @@
+"""
+File: backend/src/business_domain/knowledge/keyword_index.py
+Purpose: DocsKeywordIndex — in-memory BM25 inverted index over a docs root (keyword search).
+Category: Business domain / knowledge (Cat 2 Tools — keyword retrieval)
+Scope: Phase 57 / knowledge keyword index
+
+Description:
+    LocalDocsConnector.search() rglobs the root, resolves every path, reads every
+    .md/.txt file and casefolds every line on EACH query, synchronously inside the
+    async knowledge_search handler. On a ~4k-doc runbook corpus each search blocks
+    the event loop for seconds, stalling every concurrent chat.
+
+    DocsKeywordIndex indexes the same corpus ONCE per root:
+    - unit = a split_sections() section (the snippet the connector returns), with
+      its body precomputed, so a hit costs no file read;
+    - postings: term -> {section id: weighted tf}; heading terms count x2 and the
+      file-stem terms x3 (the connector's filename > heading > body ordering);
+    - ranking: Okapi BM25 (k1=1.2, b=0.75); each file contributes its best
+      section, so results keep the connector's one-hit-per-source shape;
+    - refresh: incremental by (mtime_ns, size). Only new / changed files are
+      re-read; deleted files drop out. The stat pass runs at most once per
+      `refresh_interval_sec`.
+
+    search_async() runs refresh + scoring in a worker thread (asyncio.to_thread),
+    so the event loop never blocks on disk. A threading.Lock serializes index
+    mutation, so concurrent first queries build it once.
+
+    Tokenization: casefolded word runs. CJK runs become character bigrams, so
+    "反模式" matches inside longer CJK text, as the substring match did before.
+
+Key Components:
+    - DocsKeywordIndex: refresh() / search() / search_async()
+    - get_docs_keyword_index(root): process-wide instance per resolved root
+    - reset_docs_keyword_indexes(): test hook
+    - tokenize(text)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — BM25 inverted index for keyword knowledge_search
+
+Related:
+    - connector.py — LocalDocsConnector (file listing + path-safety reused) / KnowledgeHit
+    - chunking.py — split_sections (the indexed unit)
+    - tools.py — make_knowledge_search_handler(keyword_index=...)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import math
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .chunking import split_sections
+from .connector import KnowledgeHit, LocalDocsConnector
+
+logger = logging.getLogger(__name__)
+
+_K1 = 1.2
+_B = 0.75
+_HEADING_WEIGHT = 2
+_FILENAME_WEIGHT = 3
+_DEFAULT_REFRESH_INTERVAL_SEC = 5.0
+
+_WORD_RE = re.compile(r"[^\W_]+")
+_CJK_RE = re.compile("[\u3040-\u30ff\u3400-\u4dbf\u4e00-\u9fff\uac00-\ud7af]")
+
+
+def tokenize(text: str) -> list[str]:
+    """Casefolded word tokens; CJK runs → overlapping character bigrams."""
+    tokens: list[str] = []
+    for word in _WORD_RE.findall(text.casefold()):
+        if len(word) > 1 and _CJK_RE.search(word):
+            tokens.extend(word[i : i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+@dataclass
+class _Section:
+    source: str
+    snippet: str
+    length: int
+    tf: Counter[str]
+
+
+@dataclass
+class _FileEntry:
+    stamp: tuple[int, int]  # (mtime_ns, size)
+    section_ids: list[int] = field(default_factory=list)
+
+
+class DocsKeywordIndex:
+    """BM25 inverted index over one docs root, refreshed incrementally by mtime/size."""
+
+    def __init__(
+        self,
+        root: Path | str,
+        *,
+        refresh_interval_sec: float = _DEFAULT_REFRESH_INTERVAL_SEC,
+    ) -> None:
+        self._connector = LocalDocsConnector(root)  # raises ValueError on a missing root
+        self._refresh_interval_sec = refresh_interval_sec
+        self._files: dict[Path, _FileEntry] = {}
+        self._sections: dict[int, _Section] = {}
+        self._postings: dict[str, dict[int, int]] = {}
+        self._total_length = 0
+        self._next_id = 0
+        self._last_refresh: float | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> Path:
+        return self._connector.root
+
+    @property
+    def section_count(self) -> int:
+        return len(self._sections)
+
+    # --- maintenance (call with the lock held) ------------------------------
+    def _add_file(self, path: Path, stamp: tuple[int, int]) -> None:
+        entry = _FileEntry(stamp=stamp)
+        self._files[path] = entry
+        try:
+            text = path.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return
+        source = path.relative_to(self._connector.root).as_posix()
+        stem_terms = Counter(tokenize(path.stem))
+        for section in split_sections(text):
+            tf = Counter(tokenize(section.body))
+            for term, count in Counter(tokenize(section.heading_path)).items():
+                tf[term] += (_HEADING_WEIGHT - 1) * count
+            for term, count in stem_terms.items():
+                tf[term] += _FILENAME_WEIGHT * count
+            if not tf:
+                continue
+            section_id = self._next_id
+            self._next_id += 1
+            length = sum(tf.values())
+            self._sections[section_id] = _Section(source, section.body, length, tf)
+            self._total_length += length
+            for term, count in tf.items():
+                self._postings.setdefault(term, {})[section_id] = count
+            entry.section_ids.append(section_id)
+
+    def _drop_file(self, path: Path) -> None:
+        entry = self._files.pop(path)
+        for section_id in entry.section_ids:
+            section = self._sections.pop(section_id)
+            self._total_length -= section.length
+            for term in section.tf:
+                posting = self._postings[term]
+                del posting[section_id]
+                if not posting:
+                    del self._postings[term]
+
+    def _refresh_locked(self) -> tuple[int, int]:
+        seen: set[Path] = set()
+        changed = 0
+        for path in self._connector.list_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            seen.add(path)
+            stamp = (stat.st_mtime_ns, stat.st_size)
+            entry = self._files.get(path)
+            if entry is not None and entry.stamp == stamp:
+                continue
+            if entry is not None:
+                self._drop_file(path)
+            self._add_file(path, stamp)
+            changed += 1
+        removed = [path for path in self._files if path not in seen]
+        for path in removed:
+            self._drop_file(path)
+        self._last_refresh = time.monotonic()
+        return changed, len(removed)
+
+    def refresh(self) -> tuple[int, int]:
+        """Re-stat the corpus; re-index new / changed files, drop deleted ones.
+
+        Returns (changed, removed). Blocking — call via search_async() or a thread.
+        """
+        with self._lock:
+            changed, removed = self._refresh_locked()
+        if changed or removed:
+            logger.info(
+                "knowledge keyword index refreshed root=%s changed=%d removed=%d sections=%d",
+                self._connector.root,
+                changed,
+                removed,
+                len(self._sections),
+            )
+        return changed, removed
+
+    def _maybe_refresh(self) -> None:
+        last = self._last_refresh
+        if last is None or time.monotonic() - last >= self._refresh_interval_sec:
+            self.refresh()
+
+    # --- query ----------------------------------------------------------------
+    def search(self, query: str, top_k: int = 5) -> list[KnowledgeHit]:
+        """BM25-rank the corpus for `query`; best section per source, up to top_k.
+
+        Blocking (may refresh) — the async handler goes through search_async().
+        """
+        terms = list(dict.fromkeys(tokenize(query)))
+        if not terms:
+            return []
+        top_k = max(1, min(top_k, 20))
+        self._maybe_refresh()
+        with self._lock:
+            total_sections = len(self._sections)
+            if total_sections == 0:
+                return []
+            avg_length = self._total_length / total_sections
+            scores: dict[int, float] = {}
+            for term in terms:
+                posting = self._postings.get(term)
+                if not posting:
+                    continue
+                df = len(posting)
+                idf = math.log(1.0 + (total_sections - df + 0.5) / (df + 0.5))
+                for section_id, tf in posting.items():
+                    norm = _K1 * (1.0 - _B + _B * self._sections[section_id].length / avg_length)
+                    scores[section_id] = scores.get(section_id, 0.0) + idf * (
+                        tf * (_K1 + 1.0) / (tf + norm)
+                    )
+            best: dict[str, tuple[float, str]] = {}
+            for section_id, score in scores.items():
+                section = self._sections[section_id]
+                current = best.get(section.source)
+                if current is None or score > current[0]:
+                    best[section.source] = (score, section.snippet)
+        ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))
+        return [
+            KnowledgeHit(source=source, snippet=snippet, score=score)
+            for source, (score, snippet) in ranked[:top_k]
+        ]
+
+    async def search_async(self, query: str, top_k: int = 5) -> list[KnowledgeHit]:
+        """search() in a worker thread — refresh I/O + scoring stay off the event loop."""
+        return await asyncio.to_thread(self.search, query, top_k)
+
+
+_INDEXES: dict[Path, DocsKeywordIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_docs_keyword_index(
+    root: Path | str,
+    *,
+    refresh_interval_sec: float = _DEFAULT_REFRESH_INTERVAL_SEC,
+) -> DocsKeywordIndex:
+    """Process-wide index for a docs root (one per resolved root; built lazily on first search).
+
+    Raises ValueError when the root is missing (same contract as LocalDocsConnector).
+    """
+    resolved = Path(root).resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(resolved)
+        if index is None:
+            index = DocsKeywordIndex(resolved, refresh_interval_sec=refresh_interval_sec)
+            _INDEXES[resolved] = index
+        return index
+
+
+def reset_docs_keyword_indexes() -> None:
+    """Test hook: drop every process-wide index."""
+    with _INDEXES_LOCK:
+        _INDEXES.clear()
+
+
+__all__ = [
+    "DocsKeywordIndex",
+    "get_docs_keyword_index",
+    "reset_docs_keyword_indexes",
+    "tokenize",
+]
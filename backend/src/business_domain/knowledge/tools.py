@@ -19,9 +19,11 @@ Key Components:
     - register_knowledge_tools(): registers spec + handler over a docs root
 
 Created: 2026-06-26 (Sprint 57.145)
-Last Modified: 2026-06-27
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: opt-in keyword_index (BM25 DocsKeywordIndex); the keyword path now runs
+      off the event loop (index worker thread / asyncio.to_thread for the connector scan)
     - 2026-06-27: Sprint 57.147 — dual-arity handler + forgery guard + thread context.tenant_id
       to per-tenant vector search (AD-Knowledge-Connector-RBAC-Citation-Slice3 isolation half)
     - 2026-06-27: Sprint 57.146 — opt-in vector_index (semantic-primary, keyword fail-soft fallback)
@@ -35,6 +37,7 @@ Related:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from pathlib import Path
@@ -55,6 +58,7 @@ from agent_harness.tools import ToolHandler, ToolRegistry
 from .connector import KnowledgeHit, LocalDocsConnector
 
 if TYPE_CHECKING:
+    from .keyword_index import DocsKeywordIndex
     from .vector_index import KnowledgeVectorIndex
 
 logger = logging.getLogger(__name__)
@@ -138,6 +142,7 @@ KNOWLEDGE_SEARCH_SPEC: ToolSpec = ToolSpec(
 def make_knowledge_search_handler(
     connector: LocalDocsConnector,
     vector_index: "KnowledgeVectorIndex | None" = None,
+    keyword_index: "DocsKeywordIndex | None" = None,
 ) -> ToolHandler:
     """Build a dual-arity (ToolCall, ExecutionContext) -> str handler over a real docs connector.
 
@@ -153,8 +158,18 @@ def make_knowledge_search_handler(
     similarity (embedding + Qdrant); on ANY embedding/Qdrant error it fails soft to
     the keyword connector so the tool never goes dark. vector_index None → keyword
     behavior (shared root).
+
+    The keyword path never blocks the event loop: with a keyword_index (BM25 inverted
+    index, built once per root + refreshed by mtime/size) it is an index lookup in a
+    worker thread; without one the connector's full-corpus scan runs via
+    asyncio.to_thread (same hits as before).
     """
 
+    async def keyword_search(query: str, top_k: int) -> list[KnowledgeHit]:
+        if keyword_index is not None:
+            return await keyword_index.search_async(query, top_k=top_k)
+        return await asyncio.to_thread(connector.search, query, top_k)
+
     async def handler(call: ToolCall, context: ExecutionContext) -> str:
         args = dict(call.arguments)
         forge = _reject_forged_scope(args, context)
@@ -177,9 +192,9 @@ def make_knowledge_search_handler(
                     "knowledge_search vector path failed; falling back to keyword",
                     exc_info=True,
                 )
-                hits = connector.search(query, top_k=top_k)
+                hits = await keyword_search(query, top_k)
         else:
-            hits = connector.search(query, top_k=top_k)
+            hits = await keyword_search(query, top_k)
         return json.dumps(
             {
                 "hits": [
@@ -199,6 +214,7 @@ def register_knowledge_tools(
     *,
     docs_root: Path | str,
     vector_index: "KnowledgeVectorIndex | None" = None,
+    keyword_index: "DocsKeywordIndex | None" = None,
 ) -> None:
     """Register the REAL knowledge_search tool backed by a LocalDocsConnector(docs_root).
 
@@ -206,8 +222,11 @@ def register_knowledge_tools(
     handlers). The connector is built once here; a missing root raises clearly so
     the caller (make_default_executor opt-in) can decide to skip registration.
     Sprint 57.146: an optional vector_index makes the handler semantic-primary
-    (keyword fail-soft fallback).
+    (keyword fail-soft fallback). An optional keyword_index (BM25 DocsKeywordIndex
+    over the same root) replaces the per-query corpus scan on the keyword path.
     """
     connector = LocalDocsConnector(docs_root)
     registry.register(KNOWLEDGE_SEARCH_SPEC)
-    handlers["knowledge_search"] = make_knowledge_search_handler(connector, vector_index)
+    handlers["knowledge_search"] = make_knowledge_search_handler(
+        connector, vector_index, keyword_index
+    )
@@ -20,32 +20,61 @@ Description:
     search() ensures the tenant's collection is populated (idempotent — skipped when
     the count already matches), so no startup-blocking all-tenant ingest is needed.
 
+    Incremental mode (incremental=True): the count check re-reads and re-splits the
+    whole corpus on EVERY query, re-embeds everything whenever the section count
+    moves, and never notices an edit that keeps the count. Instead each collection
+    gets an ingest manifest — point id -> (source, section content hash) — whose
+    durable copy lives in the collection itself (every point's payload carries
+    `source` / `section_hash` / `embed_model`; a cold process rebuilds the manifest
+    with one payload-only scroll). Point ids are derived from (source, hash,
+    ordinal), so an unchanged section keeps its id. ingest() re-reads only files
+    whose (mtime_ns, size) moved, embeds + upserts only new sections and deletes the
+    removed ones — cost proportional to the diff. search() consults the in-memory
+    manifest and only re-stats the corpus once per `refresh_interval_sec`; between
+    refreshes a query touches no disk. A changed embedding model invalidates the
+    loaded manifest (full re-embed into a recreated collection).
+
 Key Components:
     - KnowledgeVectorIndex: search(query, top_k, tenant_id) + ingest(tenant_id) (idempotent)
+      + manifest_version(tenant_id) (incremental mode)
 
 Created: 2026-06-27 (Sprint 57.146)
-Last Modified: 2026-06-27
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: orphans from another embed model → re-embed every section into the
+      recreated collection (was: only the diff, wiping current-model points)
+    - 2026-10-16: store typed as the VectorStore protocol (Qdrant or local NumPy backend)
+    - 2026-10-16: incremental=True — per-collection ingest manifest (content-hash point
+      ids, payload-backed), diff-only embed/upsert/delete, disk-free search between refreshes
+    - 2026-10-16: ingest embeds through adapters' embed_in_batches() (was a private
+      _embed_bodies copy shared with the other vector index)
+    - 2026-10-16: _embed_bodies — a self_batching embedder gets the whole corpus in
+      one embed() (it paces concurrent batches itself); plain embedders keep the loop
     - 2026-06-27: Sprint 57.147 — per-tenant collection + filter + corpus subfolder + lazy ingest
     - 2026-06-27: Initial creation (Sprint 57.146) — embedding/Qdrant semantic index
       (AD-Knowledge-Connector-First-Real-Source Slice 2)
 
 Related:
     - adapters/_base/embedding_client.py — EmbeddingClient ABC
-    - infrastructure/vector/qdrant_client.py — QdrantVectorStore
+    - infrastructure/vector/base.py — VectorStore (qdrant_client.py / local_store.py)
     - infrastructure/vector/qdrant_namespace.py — per-tenant naming + payload filter
     - chunking.py — section unit · connector.py — KnowledgeHit + file source
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import logging
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
 from uuid import UUID
 
+from adapters._base.coalescing_embedding_client import embed_in_batches
 from adapters._base.embedding_client import EmbeddingClient
-from infrastructure.vector.qdrant_client import QdrantVectorStore
+from infrastructure.vector.base import VectorStore
 from infrastructure.vector.qdrant_namespace import QdrantNamespaceStrategy
 
 from .chunking import split_sections
@@ -60,6 +89,42 @@ _DEFAULT_COLLECTION = "knowledge_local_docs"
 # returns HTTP 429 (Sprint 57.146 Day-3 drive-through finding); 16 sections
 # (~6k tokens) per call fits comfortably and the SDK retries any residual 429.
 _EMBED_BATCH = 16
+_DEFAULT_REFRESH_INTERVAL_SEC = 30.0
+# Payload fields that make up the durable manifest (scrolled back on a cold start).
+_MANIFEST_FIELDS = ["source", "section_hash", "embed_model"]
+
+
+def _section_hash(body: str) -> str:
+    return hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+
+
+def _point_id(source: str, section_hash: str, ordinal: int) -> int:
+    """Stable 63-bit point id: the same section content at the same source keeps its id."""
+    digest = hashlib.sha256(f"{source}\0{section_hash}\0{ordinal}".encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") >> 1
+
+
+@dataclass
+class _IngestManifest:
+    """In-memory view of one collection's ingested sections."""
+
+    by_source: dict[str, list[int]] = field(default_factory=dict)  # source -> point ids
+    stamps: dict[str, tuple[int, int]] = field(default_factory=dict)  # source -> (mtime_ns, size)
+    version: int = 0
+    checked_at: float | None = None
+    # Point ids left by a different embedding model — purged on the next ingest.
+    orphans: list[int] = field(default_factory=list)
+
+    @property
+    def section_count(self) -> int:
+        return sum(len(ids) for ids in self.by_source.values())
+
+
+@dataclass(frozen=True)
+class _PendingSection:
+    point_id: int
+    section_hash: str
+    body: str
 
 
 class KnowledgeVectorIndex:
@@ -73,14 +138,21 @@ class KnowledgeVectorIndex:
     def __init__(
         self,
         embedder: EmbeddingClient,
-        store: QdrantVectorStore,
+        store: VectorStore,
         docs_root: Path | str,
+        *,
+        incremental: bool = False,
+        refresh_interval_sec: float = _DEFAULT_REFRESH_INTERVAL_SEC,
     ) -> None:
         self._embedder = embedder
         self._store = store
         # Base root; the per-tenant connector is resolved at ingest/search time so a
         # single process-wide index serves every tenant (collection/corpus by tenant_id).
         self._docs_root = Path(docs_root)
+        self._incremental = incremental
+        self._refresh_interval_sec = refresh_interval_sec
+        self._manifests: dict[str, _IngestManifest] = {}
+        self._locks: dict[str, asyncio.Lock] = {}
 
     # --- per-tenant resolution -------------------------------------------------
     def _collection_for(self, tenant_id: UUID | None) -> str:
@@ -119,6 +191,16 @@ class KnowledgeVectorIndex:
     async def ingest(self, tenant_id: UUID | None = None) -> int:
         """Embed the tenant's sections + upsert into its collection. Idempotent. Returns count.
 
+        Incremental mode diffs against the manifest (see module docstring) and
+        re-embeds only new / changed sections; otherwise the count-checked full path.
+        """
+        if self._incremental:
+            return await self._ingest_incremental(tenant_id, force=True)
+        return await self._ingest_full(tenant_id)
+
+    async def _ingest_full(self, tenant_id: UUID | None) -> int:
+        """Count-checked full ingest (the 57.146 / 57.147 path).
+
         Skips re-embedding when the collection already holds the expected count.
         Otherwise recreates the collection (clean dim on a corpus / model change)
         and upserts. Each point's payload carries the tenant_id so the search-time
@@ -135,9 +217,7 @@ class KnowledgeVectorIndex:
         if await self._store.count(collection) == expected:
             return expected  # already ingested — idempotent no-op
         bodies = [body for _, body in pairs]
-        vectors: list[list[float]] = []
-        for start in range(0, len(bodies), _EMBED_BATCH):
-            vectors.extend(await self._embedder.embed(bodies[start : start + _EMBED_BATCH]))
+        vectors = await embed_in_batches(self._embedder, bodies, batch_size=_EMBED_BATCH)
         if not vectors:
             return 0
         dim = len(vectors[0])
@@ -157,6 +237,168 @@ class KnowledgeVectorIndex:
         )
         return expected
 
+    # --- incremental (manifest) ingest -----------------------------------------
+    def manifest_version(self, tenant_id: UUID | None = None) -> int | None:
+        """Bumped on every ingest that changed the collection; None before the first ingest."""
+        manifest = self._manifests.get(self._collection_for(tenant_id))
+        return manifest.version if manifest is not None else None
+
+    def _is_fresh(self, manifest: _IngestManifest | None) -> bool:
+        return (
+            manifest is not None
+            and manifest.checked_at is not None
+            and time.monotonic() - manifest.checked_at < self._refresh_interval_sec
+        )
+
+    async def _load_manifest(self, collection: str) -> _IngestManifest:
+        """Rebuild the manifest from the collection's point payloads (payload-only scroll)."""
+        manifest = _IngestManifest()
+        model = self._embedder.model_name()
+        for point_id, payload in await self._store.scroll_payloads(collection, _MANIFEST_FIELDS):
+            source = payload.get("source")
+            if payload.get("embed_model") != model or not isinstance(source, str):
+                manifest.orphans.append(point_id)
+                continue
+            manifest.by_source.setdefault(source, []).append(point_id)
+        return manifest
+
+    @staticmethod
+    def _stat_files(connector: LocalDocsConnector) -> dict[str, tuple[Path, tuple[int, int]]]:
+        stamps: dict[str, tuple[Path, tuple[int, int]]] = {}
+        for path in connector.list_files():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            rel = path.relative_to(connector.root).as_posix()
+            stamps[rel] = (path, (stat.st_mtime_ns, stat.st_size))
+        return stamps
+
+    @staticmethod
+    def _read_sections(paths: dict[str, Path]) -> dict[str, list[_PendingSection]]:
+        sections: dict[str, list[_PendingSection]] = {}
+        for rel, path in paths.items():
+            try:
+                text = path.read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                sections[rel] = []
+                continue
+            ordinals: dict[str, int] = {}
+            pending: list[_PendingSection] = []
+            for section in split_sections(text):
+                digest = _section_hash(section.body)
+                ordinal = ordinals.get(digest, 0)
+                ordinals[digest] = ordinal + 1
+                pending.append(
+                    _PendingSection(_point_id(rel, digest, ordinal), digest, section.body)
+                )
+            sections[rel] = pending
+        return sections
+
+    async def _ingest_incremental(self, tenant_id: UUID | None, *, force: bool) -> int:
+        """Diff the corpus against the manifest; embed/upsert new sections, delete removed ones.
+
+        force=False (search path) returns straight from memory while the manifest is
+        fresh. File stat + reads run in a worker thread; a per-collection lock makes
+        concurrent first queries ingest once.
+        """
+        collection = self._collection_for(tenant_id)
+        if not force and self._is_fresh(self._manifests.get(collection)):
+            return self._manifests[collection].section_count
+        lock = self._locks.setdefault(collection, asyncio.Lock())
+        async with lock:
+            manifest = self._manifests.get(collection)
+            if not force and self._is_fresh(manifest):
+                assert manifest is not None
+                return manifest.section_count
+            if manifest is None:
+                manifest = await self._load_manifest(collection)
+            if manifest.orphans:
+                # Another embedding model wrote some points → the collection is recreated
+                # below, so every section is re-embedded, not just the diff.
+                manifest.by_source.clear()
+                manifest.stamps.clear()
+            connector = self._connector_for(tenant_id)
+            files = await asyncio.to_thread(self._stat_files, connector)
+            changed = {
+                rel: path
+                for rel, (path, stamp) in files.items()
+                if manifest.stamps.get(rel) != stamp
+            }
+            fresh = await asyncio.to_thread(self._read_sections, changed)
+
+            stale: set[int] = set(manifest.orphans)
+            for rel in manifest.by_source:
+                if rel not in files:
+                    stale.update(manifest.by_source[rel])
+            new: list[tuple[str, _PendingSection]] = []
+            for rel, sections in fresh.items():
+                known = set(manifest.by_source.get(rel, ()))
+                wanted = {section.point_id for section in sections}
+                stale.update(known - wanted)
+                new.extend((rel, section) for section in sections if section.point_id not in known)
+            stale.difference_update(section.point_id for _, section in new)
+
+            if new:
+                vectors = await embed_in_batches(
+                    self._embedder, [section.body for _, section in new], batch_size=_EMBED_BATCH
+                )
+                if len(vectors) != len(new):
+                    raise RuntimeError(
+                        f"embedder returned {len(vectors)} vectors for {len(new)} sections"
+                    )
+                if manifest.orphans:
+                    # Different embedding model → dim may differ; start the collection clean.
+                    await self._store.recreate_collection(collection, len(vectors[0]))
+                else:
+                    await self._store.ensure_collection(collection, len(vectors[0]))
+                tenant_payload = {"tenant_id": str(tenant_id)} if tenant_id is not None else {}
+                model = self._embedder.model_name()
+                await self._store.upsert(
+                    collection,
+                    [
+                        (
+                            section.point_id,
+                            vector,
+                            {
+                                "source": rel,
+                                "snippet": section.body,
+                                "section_hash": section.section_hash,
+                                "embed_model": model,
+                                **tenant_payload,
+                            },
+                        )
+                        for (rel, section), vector in zip(new, vectors)
+                    ],
+                )
+            if stale:
+                await self._store.delete_points(collection, sorted(stale))
+
+            # Commit the new state only after the store accepted it (a failed embed /
+            # upsert leaves the old manifest → the same diff is retried next time).
+            manifest.orphans = []
+            for rel in [rel for rel in manifest.by_source if rel not in files]:
+                del manifest.by_source[rel]
+            manifest.stamps = {
+                rel: stamp for rel, (_, stamp) in files.items() if rel in manifest.stamps
+            }
+            for rel, sections in fresh.items():
+                manifest.by_source[rel] = [section.point_id for section in sections]
+                manifest.stamps[rel] = files[rel][1]
+            if new or stale:
+                manifest.version += 1
+                logger.info(
+                    "knowledge vector index incremental ingest (tenant=%s) "
+                    "added=%d removed=%d sections=%d",
+                    tenant_id if tenant_id is not None else "shared",
+                    len(new),
+                    len(stale),
+                    manifest.section_count,
+                )
+            manifest.checked_at = time.monotonic()
+            self._manifests[collection] = manifest
+            return manifest.section_count
+
     async def search(
         self,
         query: str,
@@ -171,7 +413,10 @@ class KnowledgeVectorIndex:
         """
         if not query.strip():
             return []
-        await self.ingest(tenant_id)  # lazy per-tenant ensure (idempotent skip when populated)
+        if self._incremental:
+            await self._ingest_incremental(tenant_id, force=False)  # no-op between refreshes
+        else:
+            await self.ingest(tenant_id)  # lazy per-tenant ensure (idempotent skip when populated)
         collection = self._collection_for(tenant_id)
         payload_filter = (
             QdrantNamespaceStrategy.payload_filter(tenant_id) if tenant_id is not None else None
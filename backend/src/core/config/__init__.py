@@ -8,6 +8,26 @@ Per project rules (.claude/rules/code-quality.md): always use Pydantic
 Settings (not raw os.environ) so type-safe + validation + .env support.
 
 Modification History (newest-first):
+    - 2026-10-16: add jwt_claims_cache + max_entries / ttl_sec (verified-claims cache)
+    - 2026-10-16: add chat_registry_backend + owner TTL / heartbeat / finished TTL (multi-worker)
+    - 2026-10-16: add chat_resumable_streams + chat_stream_replay_buffer (Last-Event-ID resume)
+    - 2026-10-16: add chat_transcript_background_flush + flush_rows / flush_ms (batched transcript)
+    - 2026-10-16: add chat_ledger_checkpoints (compaction-checkpointed ledger loads)
+    - 2026-10-16: add chat_memory_formation_queue + debounce / concurrency / yield / lease knobs
+    - 2026-10-16: add chat_session_summary_incremental + chat_session_summary_full_every
+    - 2026-10-16: add qdrant_async_client + qdrant_prefer_grpc / qdrant_pool_size
+    - 2026-10-16: add vector_store_backend + vector_store_local_dir / _quantize (embedded store)
+    - 2026-10-16: add memory_vector_write_through + memory_vector_reconcile_interval_sec
+    - 2026-10-16: add memory_fulltext_search (ranked, index-served user / tenant memory reads)
+    - 2026-10-16: add knowledge_vector_incremental_ingest + knowledge_vector_refresh_sec
+    - 2026-10-16: add knowledge_keyword_index (BM25 keyword knowledge_search)
+    - 2026-10-16: add chat_memory_snapshot (run-scoped memoized memory reads)
+    - 2026-10-16: add embedding_cache + embedding_* coalescer / cache / TPM knobs
+    - 2026-10-16: add llm_response_cache + backend / ttl / max_entries (cheap-tier response cache)
+    - 2026-10-16: add llm_client_pool + llm_client_pool_* limits (shared keep-alive Azure clients)
+    - 2026-10-16: add chat_speculative_tool_calls (read-only tools dispatched mid-stream)
+    - 2026-10-16: add chat_stream_llm (token streaming → llm_text_delta SSE frames)
+    - 2026-10-16: add chat_parallel_tool_calls (ConcurrencyPolicy-aware tool dispatch)
     - 2026-06-27: Sprint 57.146 — add knowledge_vector_enabled + qdrant_url (vector search)
     - 2026-06-26: Sprint 57.145 — add knowledge_docs_root (first real knowledge connector)
     - 2026-06-24: Sprint 57.137 — add sandbox_require_isolation (fail-closed python_sandbox)
@@ -71,6 +91,15 @@ class Settings(BaseSettings):
     jwt_secret: str = "change-me-in-production"
     jwt_algorithm: str = "HS256"
     jwt_expires_minutes: int = 60
+    # Verified-claims cache: TenantContextMiddleware re-verifies the same bearer token
+    # on every poll / list call / SSE reconnect. When on, claims of a successfully
+    # decoded token are kept per process, keyed by sha256(token), for at most
+    # jwt_claims_cache_ttl_sec and never past the token's `exp`; LRU-bounded at
+    # jwt_claims_cache_max_entries. Logout evicts the presented token. Default OFF.
+    # Env: JWT_CLAIMS_CACHE / JWT_CLAIMS_CACHE_MAX_ENTRIES / JWT_CLAIMS_CACHE_TTL_SEC.
+    jwt_claims_cache: bool = False
+    jwt_claims_cache_max_entries: int = 10000
+    jwt_claims_cache_ttl_sec: int = 300
 
     # ---- RBAC (Sprint 57.7 US-A3 — DB-backed RBAC opt-in) ----------
     # When False (default): _require_role only checks JWT claim path
@@ -189,6 +218,74 @@ class Settings(BaseSettings):
     # on). False → no summarize + no store threaded → byte-identical to 57.150.
     # Env: CHAT_SESSION_SUMMARY.
     chat_session_summary: bool = True
+    # When True (with CHAT_SESSION_SUMMARY): the summary row records the ledger
+    # sequence_num it covers (memory_session_summary.last_summarized_seq, migration
+    # 0035) and each send loads only the messages after it, folding them into the
+    # prior summary — per-send cost tracks the new messages instead of the whole
+    # conversation. chat_session_summary_full_every > 0 forces a full re-summary
+    # of the ledger each time the watermark crosses a multiple of that many
+    # messages (drift control); 0 = never. Default OFF (full ledger each send).
+    # Env: CHAT_SESSION_SUMMARY_INCREMENTAL / CHAT_SESSION_SUMMARY_FULL_EVERY.
+    chat_session_summary_incremental: bool = False
+    chat_session_summary_full_every: int = 0
+    # When the loop's semantic compaction replaces a prefix of the session's
+    # message ledger with a summary, DBMessageStore records that summary + the
+    # sequence_num it covers (message_checkpoints, migration 0037), and the next
+    # send loads the summary plus only the ledger rows after it instead of every
+    # row — load cost tracks the live window, not the session's age. The covered
+    # rows stay in `messages` (replay / audit / the post-send summarizer).
+    # Default OFF (full ledger each send). Env: CHAT_LEDGER_CHECKPOINTS.
+    chat_ledger_checkpoints: bool = False
+    # The chat stream's message_events transcript (main + subagent sidechains) is
+    # buffered per request and written as multi-row INSERTs once
+    # CHAT_TRANSCRIPT_FLUSH_ROWS rows are queued or the oldest is
+    # CHAT_TRANSCRIPT_FLUSH_MS old, plus a final flush at stream end. Default: the
+    # batches go through the request session (rows commit with the request, as
+    # before). CHAT_TRANSCRIPT_BACKGROUND_FLUSH=true hands them to a flusher task on
+    # its OWN committed tenant-scoped session so the SSE yield never waits on the DB.
+    chat_transcript_background_flush: bool = False
+    chat_transcript_flush_rows: int = 64
+    chat_transcript_flush_ms: int = 250
+    # Resumable chat streams: the run is driven by a producer task that publishes its
+    # SSE frames to an in-process hub (api/v1/chat/stream_hub.py), so a dropped
+    # POST /chat connection no longer stops the run; the client reconnects with
+    # GET /chat/sessions/{id}/stream + Last-Event-ID (persisted replay, then live).
+    # The hub keeps the last CHAT_STREAM_REPLAY_BUFFER frames per run for frames not
+    # yet readable from message_events. Default OFF (disconnect cancels the run).
+    # Env: CHAT_RESUMABLE_STREAMS / CHAT_STREAM_REPLAY_BUFFER.
+    chat_resumable_streams: bool = False
+    chat_stream_replay_buffer: int = 512
+    # Chat session / injection registries (api/v1/chat/session_registry.py +
+    # injection_registry.py) hold running sessions, cancel handles and inject queues.
+    # "memory" (default) keeps them in this process, so status / cancel / inject only
+    # work on the worker running the loop. "redis" (via redis_url) adds per-session
+    # ownership keys — refreshed every chat_registry_heartbeat_sec, expiring after
+    # chat_registry_owner_ttl_sec without one (a dead worker's sessions age out) — and
+    # delivers cancel / inject to the owning worker over its pub/sub channel, so any
+    # worker can serve them. Finished sessions stay readable for
+    # chat_registry_finished_ttl_sec. Env: CHAT_REGISTRY_BACKEND / _HEARTBEAT_SEC /
+    # _OWNER_TTL_SEC / _FINISHED_TTL_SEC.
+    chat_registry_backend: Literal["memory", "redis"] = "memory"
+    chat_registry_heartbeat_sec: float = 5.0
+    chat_registry_owner_ttl_sec: int = 30
+    chat_registry_finished_ttl_sec: int = 3600
+    # Post-send memory formation runs inline in the request's BackgroundTask by
+    # default ("off"). "memory" / "postgres" enqueue it instead (in-process queue /
+    # durable work_queue table, migration 0036) keyed per session: a newer send
+    # for the same session replaces the queued job, and the job only becomes
+    # claimable chat_memory_formation_debounce_sec after the latest send. A
+    # dedicated worker pool runs at most chat_memory_formation_concurrency jobs;
+    # while >= chat_memory_formation_yield_at chat streams are live in this
+    # process it drops to one job at a time (0 = never yield). A running job's
+    # lease (postgres) is chat_memory_formation_lease_sec; an expired lease is
+    # re-queued. Env: CHAT_MEMORY_FORMATION_QUEUE / _DEBOUNCE_SEC / _CONCURRENCY /
+    # _YIELD_AT / _LEASE_SEC / _POLL_SEC.
+    chat_memory_formation_queue: Literal["off", "memory", "postgres"] = "off"
+    chat_memory_formation_debounce_sec: float = 5.0
+    chat_memory_formation_concurrency: int = 2
+    chat_memory_formation_yield_at: int = 8
+    chat_memory_formation_lease_sec: int = 300
+    chat_memory_formation_poll_sec: float = 1.0
 
     # AD-Chat-Default-Persona-Demo-Leak (2026-07-15): the real-chat 主流量 default
     # persona. False (production) → the clean DEFAULT_SYSTEM_PROMPT (a real enterprise
@@ -224,12 +321,97 @@ class Settings(BaseSettings):
     # continuation. Env: CHAT_SCHEDULER_MAX_BURSTS.
     chat_scheduler_max_bursts: int = 3
 
+    # ---- Parallel tool calls (ConcurrencyPolicy-aware dispatch) ----------
+    # When True (default): consecutive READ_ONLY_PARALLEL / ALL_PARALLEL tool calls
+    # of one LLM turn run their Cat 9 checks + execution concurrently (turn latency
+    # = slowest call, not the sum); events + tool messages still land in call order
+    # and any group that could route to HITL stays sequential. False → the
+    # one-after-another baseline. Env: CHAT_PARALLEL_TOOL_CALLS.
+    chat_parallel_tool_calls: bool = True
+
+    # ---- Token streaming (LLM stream() → llm_text_delta SSE frames) ---------
+    # When True: the chat loop consumes ChatClient.stream() and forwards each text
+    # chunk as an llm_text_delta frame (time-to-first-token ≈ first chunk instead of
+    # the whole generation); the turn still ends with the full llm_response. Default
+    # OFF: an api_version that streams no usage falls back to a count_tokens()
+    # estimate for quota / cost, so it is opted into per deployment. Env:
+    # CHAT_STREAM_LLM.
+    chat_stream_llm: bool = False
+    # When True (and chat_stream_llm is on): a READ_ONLY_PARALLEL tool call whose
+    # arguments JSON closes mid-stream is Cat 9-checked + dispatched immediately,
+    # overlapping tool I/O with the rest of the generation; its result is adopted
+    # only if the finalized turn issues the same call. Default OFF (a discarded
+    # speculation still spent one read-only tool run). Env: CHAT_SPECULATIVE_TOOL_CALLS.
+    chat_speculative_tool_calls: bool = False
+    # When True: each chat run reads memory through a run-scoped MemorySnapshot —
+    # the prompt builder's per-turn search() / profile() / recent_sessions() results
+    # are reused on later turns until a memory_write (or evict) on a layer during the
+    # run invalidates the reads that touched it. Default OFF (every turn re-reads).
+    # Env: CHAT_MEMORY_SNAPSHOT.
+    chat_memory_snapshot: bool = False
+
+    # ---- Pooled LLM clients (process-wide keep-alive Azure clients) ----------
+    # When True: every chat request's Azure adapters (action + cheap tier, so the
+    # judge / compaction summarize / memory formation / child loops too) borrow
+    # ONE shared AsyncAzureOpenAI per (endpoint, api_version, deployment) instead of
+    # opening a private httpx pool per request — keep-alive connections are reused
+    # across sends and sessions; api/main.py closes them on shutdown. Default OFF
+    # (per-request clients, byte-identical). Env: LLM_CLIENT_POOL.
+    llm_client_pool: bool = False
+    # httpx limits of each pooled client. Env: LLM_CLIENT_POOL_MAX_CONNECTIONS /
+    # LLM_CLIENT_POOL_MAX_KEEPALIVE / LLM_CLIENT_POOL_KEEPALIVE_EXPIRY_SEC.
+    llm_client_pool_max_connections: int = 100
+    llm_client_pool_max_keepalive: int = 20
+    llm_client_pool_keepalive_expiry_sec: float = 30.0
+
+    # ---- Cheap-tier LLM response cache ---------------------------------------
+    # When True: the cheap-tier ChatClient (judge / compaction summarize / memory
+    # formation) is wrapped in ResponseCacheWrapper — a request its caller marks
+    # deterministic (RESPONSE_CACHEABLE_OPTION) is served from a tenant-scoped cache
+    # on repeat (TTL llm_response_cache_ttl_sec). Backend "memory" = per-process LRU
+    # (llm_response_cache_max_entries); "redis" = shared via redis_url. Default OFF.
+    # Env: LLM_RESPONSE_CACHE / LLM_RESPONSE_CACHE_BACKEND / LLM_RESPONSE_CACHE_TTL_SEC /
+    # LLM_RESPONSE_CACHE_MAX_ENTRIES.
+    llm_response_cache: bool = False
+    llm_response_cache_backend: Literal["memory", "redis"] = "memory"
+    llm_response_cache_ttl_sec: int = 3600
+    llm_response_cache_max_entries: int = 1024
+
+    # ---- Embedding coalescer + vector cache ---------------------------------
+    # When True: the knowledge + memory vector indexes share ONE
+    # CoalescingEmbeddingClient — vectors cached by sha256(model, text) in a
+    # per-process LRU (embedding_cache_max_entries) plus an optional shared tier
+    # ("redis" via redis_url with TTL embedding_cache_ttl_sec, or "disk" under
+    # embedding_cache_dir); concurrent cache misses coalesce into one API call within
+    # embedding_coalesce_window_ms (<= embedding_max_batch texts per call); batches
+    # run up to embedding_max_concurrency at a time under an embedding_tpm_limit
+    # tokens-per-minute budget (0 = unlimited). Default OFF (direct client, the
+    # sequential 16-per-call ingest). Env: EMBEDDING_CACHE / EMBEDDING_CACHE_BACKEND /
+    # EMBEDDING_CACHE_MAX_ENTRIES / EMBEDDING_CACHE_TTL_SEC / EMBEDDING_CACHE_DIR /
+    # EMBEDDING_COALESCE_WINDOW_MS / EMBEDDING_MAX_BATCH / EMBEDDING_MAX_CONCURRENCY /
+    # EMBEDDING_TPM_LIMIT.
+    embedding_cache: bool = False
+    embedding_cache_backend: Literal["memory", "redis", "disk"] = "memory"
+    embedding_cache_max_entries: int = 10_000
+    embedding_cache_ttl_sec: int = 7 * 86400
+    embedding_cache_dir: str = ".cache/embeddings"
+    embedding_coalesce_window_ms: float = 5.0
+    embedding_max_batch: int = 16
+    embedding_max_concurrency: int = 4
+    embedding_tpm_limit: int = 0
+
     # ---- Sprint 57.145 knowledge connector (first real external source) -
     # Root folder the knowledge_search tool reads (.md/.txt, recursive). Default =
     # in-repo planning docs (real content, zero setup); prod overrides to a company
     # docs folder. A missing/empty root → make_default_executor skips registration
     # (knowledge_search absent, agent degrades gracefully). Env: KNOWLEDGE_DOCS_ROOT.
     knowledge_docs_root: str = _DEFAULT_KNOWLEDGE_DOCS_ROOT
+    # When True: the knowledge_search keyword path ranks with a process-wide BM25
+    # inverted index over knowledge_docs_root (sections precomputed, built once and
+    # refreshed by file mtime/size off the event loop) instead of re-reading the whole
+    # corpus per query. Default OFF (per-query scan, tier scoring). Env:
+    # KNOWLEDGE_KEYWORD_INDEX.
+    knowledge_keyword_index: bool = False
 
     # ---- Sprint 57.146 knowledge embedding / Qdrant vector search ---
     # When True (default False): knowledge_search retrieves by semantic similarity
@@ -240,6 +422,35 @@ class Settings(BaseSettings):
     # Qdrant connection URL for the knowledge vector index (dev container on 6333).
     # Env: QDRANT_URL.
     qdrant_url: str = "http://localhost:6333"
+    # When True: the Qdrant backend is AsyncQdrantVectorStore — one pooled native-async
+    # client per process shared by the knowledge + memory indexes, with a known-
+    # collection cache (no collection_exists probe per call), cached filters, and
+    # tenant_id / user_id payload indexes created with each collection. Default OFF
+    # (sync client in a worker thread per call). qdrant_prefer_grpc switches the
+    # transport to gRPC (port 6334); qdrant_pool_size caps pooled connections
+    # (0 = client default). Env: QDRANT_ASYNC_CLIENT / QDRANT_PREFER_GRPC /
+    # QDRANT_POOL_SIZE.
+    qdrant_async_client: bool = False
+    qdrant_prefer_grpc: bool = False
+    qdrant_pool_size: int = 0
+    # When True: the vector index keeps a per-collection ingest manifest (content-hash
+    # point ids, persisted in the point payloads) and re-embeds only new / changed
+    # sections, deleting removed ones; search re-stats the corpus at most once per
+    # knowledge_vector_refresh_sec instead of re-reading it on every query. Default
+    # OFF (count-checked full re-ingest). Env: KNOWLEDGE_VECTOR_INCREMENTAL_INGEST /
+    # KNOWLEDGE_VECTOR_REFRESH_SEC.
+    knowledge_vector_incremental_ingest: bool = False
+    knowledge_vector_refresh_sec: float = 30.0
+    # Vector store backend for the knowledge + memory vector indexes. "qdrant"
+    # (default) = the Qdrant service at qdrant_url. "local" = an embedded NumPy store
+    # in the API process (brute-force cosine over a normalized matrix, payload
+    # pre-filtered) — no extra service, for dev / CI / edge / small tenants.
+    # vector_store_local_dir persists its collections (empty = in-memory only);
+    # vector_store_local_quantize stores int8 vectors (4x smaller, ~1e-2 score error).
+    # Env: VECTOR_STORE_BACKEND / VECTOR_STORE_LOCAL_DIR / VECTOR_STORE_LOCAL_QUANTIZE.
+    vector_store_backend: Literal["qdrant", "local"] = "qdrant"
+    vector_store_local_dir: str = ""
+    vector_store_local_quantize: bool = False
 
     # ---- Sprint 57.155 Cat 3 memory semantic axis (CARRY-026 Slice 1, L4 user) --
     # When True (default False): the user memory layer's "semantic" time_scale is
@@ -248,6 +459,20 @@ class Settings(BaseSettings):
     # qdrant_url config as the knowledge vector path. OFF → 57.150 keyword/ILIKE
     # behavior byte-identical, zero added cost. Env: MEMORY_VECTOR_ENABLED.
     memory_vector_enabled: bool = False
+    # When True (with MEMORY_VECTOR_ENABLED): the memory vector index is maintained on
+    # write — UserLayer.write / evict enqueue the fact's point upsert / delete — and a
+    # semantic recall is one query embed + one Qdrant query (no per-recall count or
+    # full user-row load). A background reconcile per user (at most once per
+    # memory_vector_reconcile_interval_sec) re-embeds drifted / pre-existing facts
+    # and deletes orphans. Default OFF (lazy count-guarded ingest on every recall).
+    # Env: MEMORY_VECTOR_WRITE_THROUGH / MEMORY_VECTOR_RECONCILE_INTERVAL_SEC.
+    memory_vector_write_through: bool = False
+    memory_vector_reconcile_interval_sec: float = 3600.0
+    # When True: UserLayer / TenantLayer keyword reads use the GIN-indexed tsvector +
+    # pg_trgm match from migration 0034 and rank hints by its relevance score (run
+    # `alembic upgrade head` first). Default OFF (unindexed ILIKE + fixed substring
+    # boosts). Env: MEMORY_FULLTEXT_SEARCH.
+    memory_fulltext_search: bool = False
 
     # ---- Sprint 57.112 IAM Block C MFA (TOTP) -----------------------
     # mfa_issuer_name: the otpauth:// issuer label shown in the user's authenticator
@@ -0,0 +1,93 @@
+"""memory_user / memory_tenant full-text + trigram search indexes.
+
+Revision ID: 0034_memory_fulltext_search
+Revises: 0033_session_summary_updated_at
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0034_memory_fulltext_search.py
+Purpose: Index-backed memory reads. UserLayer / TenantLayer matched with
+    content ILIKE '%q%' OR'd across content / category (/ key), which no B-tree can
+    serve — every read was a sequential scan of the tenant's memory rows, repeated
+    several times per turn (50k+ rows on the larger tenants). This adds a stored
+    generated tsvector per table (GIN-indexed, ranked with ts_rank_cd) plus a
+    pg_trgm GIN index on content so the substring arm (CJK / partial-word queries)
+    is index-served too.
+Category: Infrastructure / Migration (Cat 3 Memory read path)
+Scope: Cat 3 memory full-text search
+
+upgrade():
+    1. CREATE EXTENSION IF NOT EXISTS pg_trgm.
+    2. memory_user.search_tsv = to_tsvector('simple', category || ' ' || content)
+       and memory_tenant.search_tsv = to_tsvector('simple', key || ' ' || category ||
+       ' ' || content) — GENERATED ALWAYS ... STORED, so writers need no change.
+       The 'simple' config (no stemming / stop words) keeps mixed-language content
+       matchable. MUST match the expressions on the ORM Computed() columns.
+    3. GIN indexes: idx_memory_{user,tenant}_search_tsv (tsvector) +
+       idx_memory_{user,tenant}_content_trgm (content gin_trgm_ops).
+
+    No RLS change. The ALTER rewrites both tables once (stored column backfill).
+
+downgrade():
+    Drop the indexes, then the columns. The pg_trgm extension is left installed
+    (other objects may depend on it).
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0033_session_summary_updated_at.py — previous migration
+    - infrastructure/db/models/memory.py — MemoryUser / MemoryTenant.search_tsv (Computed)
+    - agent_harness/memory/layers/_fulltext.py — the ranked match the indexes serve
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0034_memory_fulltext_search"
+down_revision: Union[str, None] = "0033_session_summary_updated_at"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# MUST match MemoryUser.search_tsv / MemoryTenant.search_tsv (models/memory.py).
+_USER_TSV = "to_tsvector('simple'::regconfig, coalesce(category, '') || ' ' || content)"
+_TENANT_TSV = (
+    "to_tsvector('simple'::regconfig, "
+    "coalesce(key, '') || ' ' || coalesce(category, '') || ' ' || content)"
+)
+
+_TABLES = (("memory_user", _USER_TSV), ("memory_tenant", _TENANT_TSV))
+
+
+def upgrade() -> None:
+    """pg_trgm + generated search_tsv columns + GIN indexes."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table, expression in _TABLES:
+        op.execute(
+            f"ALTER TABLE {table} ADD COLUMN search_tsv tsvector "
+            f"GENERATED ALWAYS AS ({expression}) STORED"
+        )
+        op.create_index(
+            f"idx_{table}_search_tsv",
+            table,
+            ["search_tsv"],
+            postgresql_using="gin",
+        )
+        op.create_index(
+            f"idx_{table}_content_trgm",
+            table,
+            ["content"],
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    """Drop the indexes, then the generated columns (pg_trgm stays installed)."""
+    for table, _ in reversed(_TABLES):
+        op.drop_index(f"idx_{table}_content_trgm", table_name=table)
+        op.drop_index(f"idx_{table}_search_tsv", table_name=table)
+        op.drop_column(table, "search_tsv")
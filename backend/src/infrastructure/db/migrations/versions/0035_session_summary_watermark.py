@@ -0,0 +1,65 @@
+"""memory_session_summary.last_summarized_seq — rolling-summary watermark.
+
+Revision ID: 0035_session_summary_watermark
+Revises: 0034_memory_fulltext_search
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0035_session_summary_watermark.py
+Purpose: Record how far into the session ledger the rolling summary has read. The
+    post-send summarizer re-rendered and re-summarized the WHOLE `messages` ledger
+    on every send — O(n²) cheap-tier tokens over a long conversation. With the
+    watermark it feeds only the prior summary + the messages after
+    last_summarized_seq (CHAT_SESSION_SUMMARY_INCREMENTAL).
+Category: Infrastructure / Migration (Cat 3 Memory session summary)
+Scope: Cat 3 memory incremental session summary
+
+upgrade():
+    Add memory_session_summary.last_summarized_seq INTEGER NOT NULL DEFAULT 0 —
+    the messages.sequence_num of the last message folded into the summary.
+    Existing rows get 0, which the summarizer treats as "unknown" → the next
+    send does one full re-summary and records the real watermark.
+
+    No RLS change (junction table, tenant via the session FK — see 0033).
+
+downgrade():
+    Drop the last_summarized_seq column.
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0034_memory_fulltext_search.py — previous migration
+    - infrastructure/db/models/memory.py:MemorySessionSummary — ORM (+ last_summarized_seq)
+    - agent_harness/memory/session_summary_store.py — load_state() / upsert_summary()
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0035_session_summary_watermark"
+down_revision: Union[str, None] = "0034_memory_fulltext_search"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add last_summarized_seq (additive; existing rows = 0 = full re-summary next send)."""
+    op.add_column(
+        "memory_session_summary",
+        sa.Column(
+            "last_summarized_seq",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Drop the last_summarized_seq column."""
+    op.drop_column("memory_session_summary", "last_summarized_seq")
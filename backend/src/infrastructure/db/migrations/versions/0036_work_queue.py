@@ -0,0 +1,154 @@
+"""work_queue — durable coalescing background job queue.
+
+Revision ID: 0036_work_queue
+Revises: 0035_session_summary_watermark
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0036_work_queue.py
+Purpose: Create the work_queue table backing PostgresWorkQueue (runtime/workers):
+    post-send memory formation (and later background jobs) is enqueued here
+    instead of running inline in the request's BackgroundTask, so it survives a
+    restart, coalesces per session and drains through a bounded worker pool.
+Category: Infrastructure / Migration (runtime.workers — durable work queue)
+Scope: Phase 57 / durable background work queue
+
+Tables:
+    work_queue
+       - tenant_id FK → tenants(id) ON DELETE CASCADE (TenantScopedMixin).
+       - UNIQUE (task_id).
+       - uq_work_queue_pending_key UNIQUE (queue, coalesce_key) WHERE
+         status = 'pending' — the coalescing upsert target.
+       - idx_work_queue_due (queue, not_before) WHERE status = 'pending'.
+       - idx_work_queue_running (queue, coalesce_key) WHERE status = 'running'.
+       - CHECK on the status enum.
+       - RLS: same two-policy shape + all-zeros system sentinel escape as
+         0025_billing_outbox — the enqueue runs under the job's tenant (WITH
+         CHECK), the pool claims / completes across tenants under the sentinel.
+
+downgrade():
+    Drops both policies + indexes + the table.
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0025_billing_outbox.py — sentinel-escape RLS pattern
+    - infrastructure/db/models/work_queue.py:WorkQueueJob — ORM
+    - runtime/workers/postgres_queue.py — PostgresWorkQueue
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0036_work_queue"
+down_revision: Union[str, None] = "0035_session_summary_watermark"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# All-zeros sentinel tenant (see 0025_billing_outbox): the worker pool claims
+# and completes jobs across tenants under it; no request ever runs under it.
+_SYSTEM_SENTINEL = "00000000-0000-0000-0000-000000000000"
+
+
+def upgrade() -> None:
+    """Create work_queue + indexes + RLS (two policies + system escape)."""
+
+    op.create_table(
+        "work_queue",
+        sa.Column("id", sa.BigInteger, primary_key=True, autoincrement=True),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("queue", sa.String(64), nullable=False),
+        sa.Column("task_id", sa.String(64), nullable=False),
+        sa.Column("coalesce_key", sa.String(256), nullable=True),
+        sa.Column("user_id", sa.String(64), nullable=True),
+        sa.Column("trace_id", sa.String(64), nullable=False),
+        sa.Column("payload", postgresql.JSONB, nullable=False),
+        sa.Column("result", postgresql.JSONB, nullable=True),
+        sa.Column(
+            "status",
+            sa.String(16),
+            nullable=False,
+            server_default=sa.text("'pending'"),
+        ),
+        sa.Column("attempts", sa.Integer, nullable=False, server_default=sa.text("0")),
+        sa.Column("max_retries", sa.Integer, nullable=False, server_default=sa.text("2")),
+        sa.Column(
+            "not_before",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("lease_until", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_error", sa.Text, nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.UniqueConstraint("task_id", name="uq_work_queue_task_id"),
+        sa.CheckConstraint(
+            "status IN ('pending', 'running', 'done', 'failed', 'cancelled')",
+            name="ck_work_queue_status",
+        ),
+    )
+    op.create_index("ix_work_queue_tenant_id", "work_queue", ["tenant_id"])
+    op.create_index(
+        "uq_work_queue_pending_key",
+        "work_queue",
+        ["queue", "coalesce_key"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_work_queue_due",
+        "work_queue",
+        ["queue", "not_before"],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+    op.create_index(
+        "idx_work_queue_running",
+        "work_queue",
+        ["queue", "coalesce_key"],
+        postgresql_where=sa.text("status = 'running'"),
+    )
+
+    # ----- RLS (two policies + worker-pool system-context escape) -------
+    op.execute("ALTER TABLE work_queue ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE work_queue FORCE ROW LEVEL SECURITY")
+    op.execute(f"""
+        CREATE POLICY tenant_isolation_work_queue ON work_queue
+            USING (
+                tenant_id = current_setting('app.tenant_id', true)::uuid
+                OR current_setting('app.tenant_id', true)::uuid
+                   = '{_SYSTEM_SENTINEL}'::uuid
+            )
+        """)
+    op.execute("""
+        CREATE POLICY tenant_insert_work_queue ON work_queue
+            FOR INSERT
+            WITH CHECK (tenant_id = current_setting('app.tenant_id', true)::uuid)
+        """)
+
+
+def downgrade() -> None:
+    """Drop RLS policies + indexes + table."""
+    op.execute("DROP POLICY IF EXISTS tenant_insert_work_queue ON work_queue")
+    op.execute("DROP POLICY IF EXISTS tenant_isolation_work_queue ON work_queue")
+    op.drop_index("idx_work_queue_running", table_name="work_queue")
+    op.drop_index("idx_work_queue_due", table_name="work_queue")
+    op.drop_index("uq_work_queue_pending_key", table_name="work_queue")
+    op.drop_index("ix_work_queue_tenant_id", table_name="work_queue")
+    op.drop_table("work_queue")
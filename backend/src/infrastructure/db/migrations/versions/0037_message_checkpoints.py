@@ -0,0 +1,127 @@
+"""message_checkpoints — per-session compaction checkpoint over the messages ledger.
+
+Revision ID: 0037_message_checkpoints
+Revises: 0036_work_queue
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0037_message_checkpoints.py
+Purpose: Create the message_checkpoints table. DBMessageStore.load() read and
+    deserialized EVERY `messages` row for the session on every loop.run(), only
+    for the loop to compact most of it again — send latency grew with session
+    age. When the loop's semantic compaction replaces a ledger prefix with a
+    summary, the store now upserts that summary + the sequence_num it covers
+    here, and load() returns the summary plus only the rows after it (keyset on
+    messages (session_id, sequence_num)). The covered `messages` rows are kept
+    (replay / audit); only the live read skips them (CHAT_LEDGER_CHECKPOINTS).
+Category: Infrastructure / Migration (Cat 7 State Management — message ledger)
+Scope: Cat 7 windowed ledger loading
+
+Tables:
+    message_checkpoints
+       - tenant_id FK → tenants(id) ON DELETE CASCADE (TenantScopedMixin).
+       - session_id FK → sessions(id) ON DELETE CASCADE; UNIQUE (the conflict target).
+       - through_seq INTEGER NOT NULL — messages.sequence_num the summary covers.
+       - summary JSONB NOT NULL — the summary Message (_message_to_dict payload).
+       - created_at / updated_at.
+       - idx_message_checkpoints_tenant_session (tenant_id, session_id).
+       - RLS: tenant_isolation_* (USING) + tenant_insert_* (WITH CHECK) + FORCE,
+         mirroring 0031_session_todos (strict per-tenant, no sentinel escape —
+         the store always writes under the bound tenant via _set_tenant).
+
+downgrade():
+    Drops both policies + the index + the table.
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0036_work_queue.py — previous migration
+    - 0031_session_todos.py — one-row-per-session table + two-policy RLS (mirror)
+    - infrastructure/db/models/sessions.py:MessageCheckpoint — ORM
+    - agent_harness/state_mgmt/message_store.py:DBMessageStore — load() / save_checkpoint()
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "0037_message_checkpoints"
+down_revision: Union[str, None] = "0036_work_queue"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create message_checkpoints + index + RLS (two policies, strict per-tenant)."""
+
+    op.create_table(
+        "message_checkpoints",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            primary_key=True,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+        sa.Column(
+            "tenant_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("tenants.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column(
+            "session_id",
+            postgresql.UUID(as_uuid=True),
+            sa.ForeignKey("sessions.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("through_seq", sa.Integer(), nullable=False),
+        sa.Column("summary", postgresql.JSONB(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint("session_id", name="uq_message_checkpoints_session"),
+    )
+    op.create_index(
+        "idx_message_checkpoints_tenant_session",
+        "message_checkpoints",
+        ["tenant_id", "session_id"],
+    )
+
+    # ----- RLS (two policies, strict per-tenant — no sentinel escape) ------
+    op.execute("ALTER TABLE message_checkpoints ENABLE ROW LEVEL SECURITY")
+    op.execute("ALTER TABLE message_checkpoints FORCE ROW LEVEL SECURITY")
+    op.execute("""
+        CREATE POLICY tenant_isolation_message_checkpoints ON message_checkpoints
+            USING (tenant_id = current_setting('app.tenant_id', true)::uuid)
+        """)
+    op.execute("""
+        CREATE POLICY tenant_insert_message_checkpoints ON message_checkpoints
+            FOR INSERT
+            WITH CHECK (tenant_id = current_setting('app.tenant_id', true)::uuid)
+        """)
+
+
+def downgrade() -> None:
+    """Drop RLS policies + index + table."""
+    op.execute(
+        "DROP POLICY IF EXISTS tenant_insert_message_checkpoints ON message_checkpoints"
+    )
+    op.execute(
+        "DROP POLICY IF EXISTS tenant_isolation_message_checkpoints ON message_checkpoints"
+    )
+    op.drop_index("idx_message_checkpoints_tenant_session", table_name="message_checkpoints")
+    op.drop_table("message_checkpoints")
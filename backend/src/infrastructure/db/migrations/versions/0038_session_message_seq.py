@@ -0,0 +1,78 @@
+"""sessions.last_message_seq — per-session ledger sequence counter.
+
+Revision ID: 0038_session_message_seq
+Revises: 0037_message_checkpoints
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0038_session_message_seq.py
+Purpose: Give DBMessageStore.append() a counter to allocate sequence_nums from.
+    Each append ran MAX(sequence_num) over the session's `messages` partitions and
+    then inserted row by row through the ORM — 3-4 round trips per user prompt and
+    per tool batch. With the counter, one statement bumps it by the batch size
+    (UPDATE ... RETURNING, row-locking the session) and inserts every row
+    (multi-row INSERT ... RETURNING).
+Category: Infrastructure / Migration (Cat 7 State Management — message ledger)
+Scope: Cat 7 batched ledger append
+
+upgrade():
+    1. Add sessions.last_message_seq INTEGER NOT NULL DEFAULT 0.
+    2. Backfill it with each session's MAX(messages.sequence_num), so the first
+       counter-allocated append continues the existing ledger without a gap or
+       collision. Sessions without messages keep 0.
+
+    No RLS change (sessions RLS lands in 0009).
+
+downgrade():
+    Drop the last_message_seq column.
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0037_message_checkpoints.py — previous migration
+    - infrastructure/db/models/sessions.py:Session — ORM (+ last_message_seq)
+    - agent_harness/state_mgmt/message_store.py:DBMessageStore.append — the allocator
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0038_session_message_seq"
+down_revision: Union[str, None] = "0037_message_checkpoints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_BACKFILL_SQL = """
+    UPDATE sessions s
+       SET last_message_seq = m.max_seq
+      FROM (
+            SELECT session_id, MAX(sequence_num) AS max_seq
+              FROM messages
+             GROUP BY session_id
+           ) m
+     WHERE s.id = m.session_id
+"""
+
+
+def upgrade() -> None:
+    """Add last_message_seq + backfill from the existing ledger."""
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "last_message_seq",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("0"),
+        ),
+    )
+    op.execute(_BACKFILL_SQL)
+
+
+def downgrade() -> None:
+    """Drop the last_message_seq column."""
+    op.drop_column("sessions", "last_message_seq")
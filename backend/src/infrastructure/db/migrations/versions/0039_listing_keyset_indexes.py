@@ -0,0 +1,71 @@
+"""Composite (…, created_at / started_at, id) indexes for keyset-paginated listings.
+
+Revision ID: 0039_listing_keyset_indexes
+Revises: 0038_session_message_seq
+Create Date: 2026-10-16
+
+File: backend/src/infrastructure/db/migrations/versions/0039_listing_keyset_indexes.py
+Purpose: Back the opaque-cursor pagination of the listing endpoints. Each cursor is
+    the sort key of the last row seen, and the next page is a row-value seek
+    (`(created_at, id) < (:c, :i)`), so every page is one index descent
+    regardless of depth. This holds only when an index leads with the listing's
+    equality filter and then carries the full sort key.
+Category: Infrastructure / Migration (api/v1 listing pagination)
+Scope: keyset pagination + NDJSON streaming of listing APIs
+
+upgrade():
+    Create:
+      - idx_sessions_tenant_started    sessions (tenant_id, started_at, id)
+      - idx_memory_system_created      memory_system (created_at, id)
+      - idx_memory_tenant_created      memory_tenant (tenant_id, created_at, id)
+      - idx_memory_user_created        memory_user (tenant_id, created_at, id)
+      - idx_tenants_created            tenants (created_at, id)
+      - idx_users_tenant_created       users (tenant_id, created_at, id)
+    message_events needs none: idx_message_events_session already leads with
+    (session_id, sequence_num). Postgres scans these ascending indexes backwards
+    for the DESC listings.
+
+downgrade():
+    Drop the six indexes.
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - 0038_session_message_seq.py — previous migration
+    - api/v1/pagination.py — cursor encoding + keyset_after()
+    - api/v1/sessions.py / memory.py / admin/tenants.py — the listings
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "0039_listing_keyset_indexes"
+down_revision: Union[str, None] = "0038_session_message_seq"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_INDEXES: tuple[tuple[str, str, list[str]], ...] = (
+    ("idx_sessions_tenant_started", "sessions", ["tenant_id", "started_at", "id"]),
+    ("idx_memory_system_created", "memory_system", ["created_at", "id"]),
+    ("idx_memory_tenant_created", "memory_tenant", ["tenant_id", "created_at", "id"]),
+    ("idx_memory_user_created", "memory_user", ["tenant_id", "created_at", "id"]),
+    ("idx_tenants_created", "tenants", ["created_at", "id"]),
+    ("idx_users_tenant_created", "users", ["tenant_id", "created_at", "id"]),
+)
+
+
+def upgrade() -> None:
+    """Create the keyset listing indexes."""
+    for name, table, columns in _INDEXES:
+        op.create_index(name, table, columns)
+
+
+def downgrade() -> None:
+    """Drop the keyset listing indexes."""
+    for name, table, _columns in reversed(_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -94,6 +94,7 @@ from infrastructure.db.models.memory import (
 # Day 2.1 — Sessions
 from infrastructure.db.models.sessions import (
     Message,
+    MessageCheckpoint,
     MessageEvent,
     Session,
 )
@@ -130,6 +131,9 @@ from infrastructure.db.models.verification_log import (
     VerifierType,
 )
 
+# Durable coalescing background work queue (runtime/workers/postgres_queue.py)
+from infrastructure.db.models.work_queue import WorkQueueJob, WorkQueueStatus
+
 __all__ = [
     # Identity
     "Tenant",
@@ -144,6 +148,7 @@ __all__ = [
     "Session",
     "Message",
     "MessageEvent",
+    "MessageCheckpoint",
     # Tools
     "ToolRegistry",
     "ToolCall",
@@ -199,4 +204,7 @@ __all__ = [
     "AgentCatalog",
     # Tenant Skills (Sprint 57.114 — per-tenant custom Skills catalog overlay)
     "TenantSkill",
+    # Work Queue (durable coalescing background jobs)
+    "WorkQueueJob",
+    "WorkQueueStatus",
 ]
@@ -26,9 +26,10 @@ Key Components:
     - RolePermission: per-role action permissions (resource_type / pattern / action)
 
 Created: 2026-04-29 (Sprint 49.2 Day 1.5)
-Last Modified: 2026-06-06
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: tenants / users (…, created_at, id) keyset indexes (0039)
     - 2026-06-06: Sprint 57.86 — User +password_hash col (closes AD-Auth-Credentials-PasswordLogin)
     - 2026-05-26: Sprint 57.46 — Tenant +5 SaaS cols (closes AD-TenantSettings-Schema-Ext)
     - 2026-05-05: Sprint 56.1 Day 1 — Tenant ENHANCE: state/plan Enum + progress JSONB (D1)
@@ -179,7 +180,11 @@ class Tenant(Base):
         server_default=func.now(),
     )
 
-    __table_args__ = (Index("idx_tenants_state", "state"),)
+    __table_args__ = (
+        Index("idx_tenants_state", "state"),
+        # Keyset pagination of the admin tenant list (created_at, id cursor, 0039)
+        Index("idx_tenants_created", "created_at", "id"),
+    )
 
 
 # =====================================================================
@@ -231,6 +236,7 @@ class User(Base, TenantScopedMixin):
     __table_args__ = (
         UniqueConstraint("tenant_id", "email", name="uq_users_tenant_email"),
         # idx_users_tenant is auto-created by TenantScopedMixin (index=True)
+        Index("idx_users_tenant_created", "tenant_id", "created_at", "id"),
         Index(
             "idx_users_external",
             "external_id",
@@ -31,9 +31,13 @@ Description:
     (no client integration; that lands in Phase 51.2).
 
 Created: 2026-04-29 (Sprint 49.3 Day 2.3)
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: (tenant_id,) created_at, id keyset indexes on system / tenant / user (0039)
+    - 2026-10-16: MemorySessionSummary += last_summarized_seq (rolling-summary watermark, 0035)
+    - 2026-10-16: MemoryUser / MemoryTenant += search_tsv (generated tsvector) + GIN
+      full-text / trigram indexes (migration 0034)
     - 2026-06-30: Sprint 57.151 — MemorySessionSummary += updated_at (rolling-summary recency)
     - 2026-06-30: Sprint 57.150 — add dedup_key + uq_memory_user_dedup (write-side upsert)
     - 2026-06-04: Sprint 57.76 — add MemoryOp (append-only memory_ops ops log)
@@ -57,6 +61,7 @@ from uuid import UUID as PyUUID
 from sqlalchemy import (
     BigInteger,
     Boolean,
+    Computed,
     DateTime,
     ForeignKey,
     Index,
@@ -68,7 +73,7 @@ from sqlalchemy import (
     func,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 from sqlalchemy.dialects.postgresql import UUID as PgUUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -109,6 +114,11 @@ class MemorySystem(Base):
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
 
+    __table_args__ = (
+        # Keyset pagination of the memory list endpoints (created_at, id cursor, 0039)
+        Index("idx_memory_system_created", "created_at", "id"),
+    )
+
 
 # ============================================================================
 # Layer 2 — memory_tenant  (TenantScopedMixin)
@@ -147,12 +157,31 @@ class MemoryTenant(Base, TenantScopedMixin):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # Full-text document (migration 0034): generated + stored by PG, so writers never
+    # set it; deferred so plain row loads do not carry it. Expression MUST match 0034.
+    search_tsv: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple'::regconfig, "
+            "coalesce(key, '') || ' ' || coalesce(category, '') || ' ' || content)",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     __table_args__ = (
         UniqueConstraint("tenant_id", "key", name="uq_memory_tenant_key"),
         # NOTE: TenantScopedMixin already provides ix_memory_tenant_tenant_id;
         # 09.md L424's idx_memory_tenant_tenant is satisfied by that.
         Index("idx_memory_tenant_category", "tenant_id", "category"),
+        Index("idx_memory_tenant_created", "tenant_id", "created_at", "id"),
+        Index("idx_memory_tenant_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index(
+            "idx_memory_tenant_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -264,6 +293,15 @@ class MemoryUser(Base, TenantScopedMixin):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # Full-text document (migration 0034) — generated + stored, deferred; see MemoryTenant.
+    search_tsv: Mapped[Any] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('simple'::regconfig, coalesce(category, '') || ' ' || content)",
+            persisted=True,
+        ),
+        deferred=True,
+    )
 
     __table_args__ = (
         # Write-side dedup conflict target (Sprint 57.150). Nullable dedup_key →
@@ -271,11 +309,19 @@ class MemoryUser(Base, TenantScopedMixin):
         UniqueConstraint("tenant_id", "user_id", "dedup_key", name="uq_memory_user_dedup"),
         Index("idx_memory_user_user", "user_id"),
         Index("idx_memory_user_category", "user_id", "category"),
+        Index("idx_memory_user_created", "tenant_id", "created_at", "id"),
         Index(
             "idx_memory_user_expires",
             "expires_at",
             postgresql_where=text("expires_at IS NOT NULL"),
         ),
+        Index("idx_memory_user_search_tsv", "search_tsv", postgresql_using="gin"),
+        Index(
+            "idx_memory_user_content_trgm",
+            "content",
+            postgresql_using="gin",
+            postgresql_ops={"content": "gin_trgm_ops"},
+        ),
     )
 
 
@@ -332,6 +378,12 @@ class MemorySessionSummary(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+    # messages.sequence_num of the last ledger message folded into the summary
+    # (migration 0035). The incremental summarizer feeds only the prior summary +
+    # the messages after it; 0 = unknown (pre-0035 row) → one full re-summary.
+    last_summarized_seq: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default=text("0")
+    )
 
 
 # ============================================================================
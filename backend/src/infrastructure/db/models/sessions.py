@@ -13,6 +13,7 @@ Description:
         sessions          - per-tenant conversation root (NOT partitioned)
         messages          - per-session message ledger (PARTITIONED by created_at month)
         message_events    - per-session SSE event stream (PARTITIONED by created_at month)
+        message_checkpoints - per-session compaction checkpoint over `messages` (1 row/session)
 
     Partition design (per 09-db-schema-design.md L1040-1095):
         - Partition by RANGE (created_at) at monthly boundaries
@@ -32,6 +33,9 @@ Created: 2026-04-29 (Sprint 49.2 Day 2.1)
 Last Modified: 2026-06-02
 
 Modification History:
+    - 2026-10-16: idx_sessions_tenant_started (tenant_id, started_at, id) keyset index (0039)
+    - 2026-10-16: add Session.last_message_seq (per-session ledger sequence counter)
+    - 2026-10-16: add MessageCheckpoint (compaction checkpoint for windowed ledger loads)
     - 2026-06-24: Sprint 57.140 — add SessionTodos (per-session durable todo list, task primitive)
     - 2026-06-12: Sprint 57.107 B3 — add parent_session_id + is_sidechain (subagent transcripts)
     - 2026-06-02: Sprint 57.68 A-3b — add Session.handoff_parent_id FK + index (HANDOFF linkage)
@@ -121,6 +125,12 @@ class Session(Base, TenantScopedMixin):
         nullable=False, default=False, server_default=text("FALSE")
     )
 
+    # messages.sequence_num of the session's last ledger row — the counter
+    # DBMessageStore.append() allocates batches from (migration 0038).
+    last_message_seq: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default=text("0")
+    )
+
     total_turns: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_tokens: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     total_cost_usd: Mapped[Decimal] = mapped_column(
@@ -146,6 +156,8 @@ class Session(Base, TenantScopedMixin):
         Index("idx_sessions_tenant_user", "tenant_id", "user_id"),
         Index("idx_sessions_status", "status"),
         Index("idx_sessions_active", text("last_active_at DESC")),
+        # Keyset pagination of a tenant's session list (newest-first cursor, 0039)
+        Index("idx_sessions_tenant_started", "tenant_id", "started_at", "id"),
         # Sprint 57.68 — handoff chain lookups (children of a parent session)
         Index("idx_sessions_handoff_parent", "handoff_parent_id"),
         # Sprint 57.107 — sidechain children of a parent session (partial: only
@@ -315,4 +327,50 @@ class SessionTodos(Base, TenantScopedMixin):
     )
 
 
-__all__ = ["Session", "Message", "MessageEvent", "SessionTodos"]
+# =====================================================================
+# MessageCheckpoint - per-session compaction checkpoint (NOT partitioned, 1 row/session)
+# =====================================================================
+class MessageCheckpoint(Base, TenantScopedMixin):
+    """Latest compaction checkpoint over a session's `messages` ledger.
+
+    `summary` (a serialized Cat-3 Message) stands in for every ledger row with
+    sequence_num <= through_seq, so DBMessageStore.load() reads the summary plus
+    only the rows after it. The covered rows stay in `messages` (replay / audit).
+    One row per session (UNIQUE session_id, the upsert conflict target); NOT
+    partitioned, tenant-scoped (TenantScopedMixin → tenant_id NOT NULL + RLS).
+    Migration 0037_message_checkpoints.
+    """
+
+    __tablename__ = "message_checkpoints"
+
+    id: Mapped[PyUUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        primary_key=True,
+        server_default=text("gen_random_uuid()"),
+    )
+    session_id: Mapped[PyUUID] = mapped_column(
+        PgUUID(as_uuid=True),
+        ForeignKey("sessions.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    # messages.sequence_num of the last ledger row the summary covers.
+    through_seq: Mapped[int] = mapped_column(Integer, nullable=False)
+    # The summary Message as a _message_to_dict payload.
+    summary: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+
+    __table_args__ = (
+        # One checkpoint per session (the upsert conflict target).
+        UniqueConstraint("session_id", name="uq_message_checkpoints_session"),
+        Index("idx_message_checkpoints_tenant_session", "tenant_id", "session_id"),
+    )
+
+
+__all__ = ["Session", "Message", "MessageEvent", "SessionTodos", "MessageCheckpoint"]
@@ -0,0 +1,131 @@
+"""
+File: backend/src/infrastructure/db/models/work_queue.py
+Purpose: WorkQueueJob ORM — durable, coalescing background job (PostgresWorkQueue storage).
+Category: Infrastructure / ORM (runtime.workers — durable work queue)
+Scope: Phase 57 / durable background work queue
+
+Description:
+    One row per background job of a named `queue` (e.g. "memory_formation").
+    runtime/workers/postgres_queue.py:PostgresWorkQueue is the only writer:
+
+    - coalescing: a partial UNIQUE (queue, coalesce_key) WHERE status='pending'
+      lets enqueue use INSERT ... ON CONFLICT DO UPDATE — a later submit for the
+      same key replaces the queued payload / not_before instead of adding a row;
+    - claim: due pending rows (not_before <= now) are taken with FOR UPDATE SKIP
+      LOCKED and leased (status='running', lease_until); a key with a running row
+      is skipped so one key never runs twice concurrently;
+    - retry / crash recovery: a failed attempt goes back to pending with backoff
+      while attempts <= max_retries; an expired lease (crashed worker) is
+      re-queued by the next claim.
+
+    `user_id` / `trace_id` mirror the runtime TaskEnvelope (plain strings).
+
+Key Components:
+    - WorkQueueStatus: enum mirror of the CHECK constraint
+    - WorkQueueJob: ORM (TenantScopedMixin)
+
+Created: 2026-10-16
+
+Modification History:
+    - 2026-10-16: Initial creation
+
+Related:
+    - migrations/versions/0036_work_queue.py
+    - runtime/workers/postgres_queue.py (PostgresWorkQueue)
+    - infrastructure/db/models/billing_outbox.py — the claim / sentinel-RLS precedent
+"""
+
+from __future__ import annotations
+
+import enum
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    CheckConstraint,
+    DateTime,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+
+from infrastructure.db.base import Base, TenantScopedMixin
+
+
+class WorkQueueStatus(str, enum.Enum):
+    """work_queue.status — matches CHECK constraint."""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class WorkQueueJob(Base, TenantScopedMixin):
+    """Durable background job row (see module docstring)."""
+
+    __tablename__ = "work_queue"
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    queue: Mapped[str] = mapped_column(String(64), nullable=False)
+    task_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    coalesce_key: Mapped[str | None] = mapped_column(String(256), nullable=True)
+    user_id: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    trace_id: Mapped[str] = mapped_column(String(64), nullable=False)
+    payload: Mapped[dict[str, object]] = mapped_column(JSONB, nullable=False)
+    result: Mapped[dict[str, object] | None] = mapped_column(JSONB, nullable=True)
+    status: Mapped[str] = mapped_column(
+        String(16), nullable=False, server_default=text("'pending'")
+    )
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("0"))
+    max_retries: Mapped[int] = mapped_column(Integer, nullable=False, server_default=text("2"))
+    not_before: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    lease_until: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint("task_id", name="uq_work_queue_task_id"),
+        CheckConstraint(
+            "status IN ('pending', 'running', 'done', 'failed', 'cancelled')",
+            name="ck_work_queue_status",
+        ),
+        # Coalescing: at most ONE queued job per (queue, key); the enqueue upsert
+        # targets this index (ON CONFLICT ... WHERE status = 'pending').
+        Index(
+            "uq_work_queue_pending_key",
+            "queue",
+            "coalesce_key",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Claim path: due pending rows per queue.
+        Index(
+            "idx_work_queue_due",
+            "queue",
+            "not_before",
+            postgresql_where=text("status = 'pending'"),
+        ),
+        # Running-key exclusion + lease-expiry sweep.
+        Index(
+            "idx_work_queue_running",
+            "queue",
+            "coalesce_key",
+            postgresql_where=text("status = 'running'"),
+        ),
+    )
+
+
+__all__ = ["WorkQueueJob", "WorkQueueStatus"]
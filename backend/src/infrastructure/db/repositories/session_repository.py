@@ -18,9 +18,10 @@ Description:
         + tenant_id (TenantScopedMixin) + provided session_id (PK).
 
 Created: 2026-05-10 (Sprint 57.7 Day 3 Tier 2)
-Last Modified: 2026-06-02
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: list_sessions keyset `before` cursor + top_level_query (NDJSON export)
     - 2026-06-12: Sprint 57.107 B3 — sidechain params + list_sessions (top-level, newest-first)
     - 2026-06-02: Sprint 57.68 A-3b — handoff params + get_session + mark_handed_off
     - 2026-05-10: Initial creation (Sprint 57.7 US-R1 — AD-Reality-3a closure)
@@ -34,10 +35,11 @@ Related:
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any, cast
 from uuid import UUID
 
-from sqlalchemy import CursorResult, select, update
+from sqlalchemy import CursorResult, Select, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from infrastructure.db.models.sessions import Session
@@ -130,19 +132,37 @@ class SessionRepository:
         result = await self._db.execute(stmt)
         return result.scalar_one_or_none()
 
-    async def list_sessions(self, *, tenant_id: UUID, limit: int = 50) -> list[Session]:
+    @staticmethod
+    def top_level_query(
+        *, tenant_id: UUID, before: tuple[datetime, UUID] | None = None
+    ) -> Select[tuple[Session]]:
+        """Top-level sessions of a tenant, newest-first by (started_at, id).
+
+        `before` is the (started_at, id) of the last row already seen; only
+        strictly older rows follow (keyset over idx_sessions_tenant_started).
+        """
+        stmt = select(Session).where(
+            (Session.tenant_id == tenant_id) & (Session.is_sidechain.is_(False))
+        )
+        if before is not None:
+            stmt = stmt.where(tuple_(Session.started_at, Session.id) < tuple_(*before))
+        return stmt.order_by(Session.started_at.desc(), Session.id.desc())
+
+    async def list_sessions(
+        self,
+        *,
+        tenant_id: UUID,
+        limit: int = 50,
+        before: tuple[datetime, UUID] | None = None,
+    ) -> list[Session]:
         """List top-level sessions for a tenant, newest-first (Sprint 57.107).
 
         Excludes sidechain rows (subagent child transcripts) so the chat
         session list stays a top-level view; sidechains are reachable via
         their parent (`parent_session_id`). Tenant-scoped (multi-tenant 鐵律).
+        Pass the last row's (started_at, id) as `before` for the next page.
         """
-        stmt = (
-            select(Session)
-            .where((Session.tenant_id == tenant_id) & (Session.is_sidechain.is_(False)))
-            .order_by(Session.started_at.desc())
-            .limit(limit)
-        )
+        stmt = self.top_level_query(tenant_id=tenant_id, before=before).limit(limit)
         result = await self._db.execute(stmt)
         return list(result.scalars().all())
 
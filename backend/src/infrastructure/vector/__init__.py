@@ -19,6 +19,9 @@ is missing, the per-tenant collection prevents accidental mixing.
 
 from __future__ import annotations
 
+from infrastructure.vector.base import VectorHit, VectorStore
 from infrastructure.vector.qdrant_namespace import QdrantNamespaceStrategy
 
-__all__ = ["QdrantNamespaceStrategy"]
+# Backends are imported from their modules (qdrant_client / local_store) so that
+# importing the package never loads qdrant-client or NumPy.
+__all__ = ["QdrantNamespaceStrategy", "VectorHit", "VectorStore"]
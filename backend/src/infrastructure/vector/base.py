@@ -0,0 +1,87 @@
+"""
+File: backend/src/infrastructure/vector/base.py
+Purpose: VectorStore protocol + VectorHit — the backend-neutral vector store surface.
+Category: Infrastructure / Vector
+Scope: Phase 57 / vector store backends
+
+Description:
+    The async surface both vector indexes (knowledge + Cat 3 memory) consume.
+    QdrantVectorStore (qdrant_client.py) and LocalVectorStore (local_store.py)
+    satisfy it structurally, so the composition layer picks a backend from config
+    without the indexes changing. payload_filter everywhere is the
+    QdrantNamespaceStrategy shape: {"must": [{"key": k, "match": {"value": v}}]}.
+
+    Kept free of SDK imports so the local backend never loads qdrant-client.
+
+Key Components:
+    - VectorHit: one search result (payload dict + cosine score)
+    - VectorStore: ensure_collection / recreate_collection / count / upsert /
+      scroll_payloads / delete_points / search / search_batch
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: add search_batch() (several queries against one collection per call)
+    - 2026-10-16: Initial creation — VectorHit moved here from qdrant_client.py
+      (still re-exported there) + the VectorStore protocol
+
+Related:
+    - qdrant_client.py — QdrantVectorStore (remote)
+    - local_store.py — LocalVectorStore (embedded NumPy)
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Protocol
+
+
+@dataclass(frozen=True)
+class VectorHit:
+    """One search result: the stored payload + its cosine similarity score."""
+
+    payload: dict[str, Any]
+    score: float
+
+
+class VectorStore(Protocol):
+    """Async vector store surface shared by the Qdrant and local backends."""
+
+    async def ensure_collection(self, name: str, dim: int) -> None: ...
+
+    async def recreate_collection(self, name: str, dim: int) -> None: ...
+
+    async def count(self, name: str, payload_filter: dict[str, Any] | None = None) -> int: ...
+
+    async def upsert(
+        self, name: str, points: list[tuple[int, list[float], dict[str, Any]]]
+    ) -> None: ...
+
+    async def scroll_payloads(
+        self,
+        name: str,
+        fields: list[str],
+        *,
+        payload_filter: dict[str, Any] | None = None,
+        batch_size: int = 1024,
+    ) -> list[tuple[int, dict[str, Any]]]: ...
+
+    async def delete_points(self, name: str, ids: list[int]) -> None: ...
+
+    async def search(
+        self,
+        name: str,
+        query_vector: list[float],
+        top_k: int,
+        payload_filter: dict[str, Any] | None = None,
+    ) -> list[VectorHit]: ...
+
+    async def search_batch(
+        self,
+        name: str,
+        queries: list[tuple[list[float], int, dict[str, Any] | None]],
+    ) -> list[list[VectorHit]]: ...
+
+
+__all__ = ["VectorHit", "VectorStore"]
@@ -0,0 +1,370 @@
+"""
+File: backend/src/infrastructure/vector/local_store.py
+Purpose: LocalVectorStore — embedded NumPy vector store (drop-in VectorStore, no Qdrant service).
+Category: Infrastructure / Vector
+Scope: Phase 57 / vector store backends
+
+Description:
+    QdrantVectorStore pays a network hop, an asyncio.to_thread hand-off and a
+    collection_exists round trip on every call. For dev, CI, edge deployments and
+    small tenants (< ~200k vectors per collection) a brute-force matmul in-process
+    is faster and needs no extra service. LocalVectorStore implements the same
+    VectorStore surface (base.py):
+
+    - storage: one row-normalized matrix per collection — float32, or int8
+      (round(v * 127)) with quantize=True (4x smaller, ~1e-2 score error) — plus
+      an int64 id vector and the payload list;
+    - search: payload pre-filter (the QdrantNamespaceStrategy "must"/"match"
+      shape, e.g. tenant_id AND user_id) → boolean mask over cached per-key
+      payload columns → one matmul over the surviving rows → argpartition top-k.
+      Cosine = dot product because rows and the query are unit-normalized. Small
+      collections are scored inline; above `_INLINE_LIMIT` matrix elements the
+      matmul runs in a worker thread so the event loop is not blocked;
+    - persistence (root given): <root>/<collection>/{vectors,ids}.npy +
+      payloads.json, written atomically (tmp + os.replace) after each mutation
+      and memory-mapped (np.load mmap_mode="r") on first access in a new process;
+      root=None keeps everything in memory (tests / CI);
+    - upsert by id replaces in place (Qdrant semantics); a dim mismatch raises
+      ValueError, like Qdrant rejecting a wrong-sized vector.
+
+    Writes rewrite the collection files (O(n) per mutation) — the intended corpus
+    sizes make that cheap; large / write-heavy tenants stay on Qdrant.
+
+Key Components:
+    - LocalVectorStore(root=None, *, quantize=False)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: add search_batch() (VectorStore protocol)
+    - 2026-10-16: Initial creation — embedded NumPy VectorStore backend
+
+Related:
+    - base.py — VectorStore protocol / VectorHit
+    - qdrant_client.py — the remote backend with the same surface
+    - api/v1/chat/vector_store.py — VECTOR_STORE_BACKEND selection
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from infrastructure.vector.base import VectorHit
+
+# Above this many matrix elements (rows x dim) search runs in a worker thread.
+_INLINE_LIMIT = 1 << 21
+_INT8_SCALE = 127.0
+
+
+def _normalize(vectors: npt.NDArray[np.float32]) -> npt.NDArray[np.float32]:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0.0] = 1.0
+    normalized: npt.NDArray[np.float32] = (vectors / norms).astype(np.float32, copy=False)
+    return normalized
+
+
+def _filter_terms(payload_filter: dict[str, Any] | None) -> list[tuple[str, Any]]:
+    """[(key, value)] from the QdrantNamespaceStrategy filter shape (AND of exact matches)."""
+    if not payload_filter:
+        return []
+    terms: list[tuple[str, Any]] = []
+    for clause in payload_filter.get("must", []):
+        match = clause.get("match") if isinstance(clause, dict) else None
+        if not isinstance(match, dict) or "value" not in match or "key" not in clause:
+            raise ValueError(f"LocalVectorStore supports only must/match filters, got {clause!r}")
+        terms.append((str(clause["key"]), match["value"]))
+    if set(payload_filter) - {"must"}:
+        raise ValueError("LocalVectorStore supports only 'must' payload filters")
+    return terms
+
+
+class _Collection:
+    """One collection's matrix + ids + payloads (call with the store lock held)."""
+
+    def __init__(
+        self,
+        vectors: npt.NDArray[Any],
+        ids: npt.NDArray[np.int64],
+        payloads: list[dict[str, Any]],
+    ) -> None:
+        self.vectors = vectors
+        self.ids = ids
+        self.payloads = payloads
+        self.rows = {int(point_id): row for row, point_id in enumerate(ids.tolist())}
+        self._columns: dict[str, npt.NDArray[np.object_]] = {}
+
+    @classmethod
+    def empty(cls, dim: int, quantize: bool) -> _Collection:
+        dtype = np.int8 if quantize else np.float32
+        return cls(np.zeros((0, dim), dtype=dtype), np.zeros(0, dtype=np.int64), [])
+
+    @property
+    def dim(self) -> int:
+        return int(self.vectors.shape[1])
+
+    @property
+    def quantized(self) -> bool:
+        return bool(self.vectors.dtype == np.int8)
+
+    def _encode(self, vectors: npt.NDArray[np.float32]) -> npt.NDArray[Any]:
+        if self.quantized:
+            quantized: npt.NDArray[np.int8] = np.clip(
+                np.rint(vectors * _INT8_SCALE), -127, 127
+            ).astype(np.int8)
+            return quantized
+        return vectors
+
+    def upsert(self, points: list[tuple[int, list[float], dict[str, Any]]]) -> None:
+        latest = {int(point_id): (vector, payload) for point_id, vector, payload in points}
+        matrix = np.asarray([vector for vector, _ in latest.values()], dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] != self.dim:
+            raise ValueError(f"vector dim {matrix.shape[-1]} != collection dim {self.dim}")
+        encoded = self._encode(_normalize(matrix))
+        if not self.vectors.flags.writeable:
+            self.vectors = np.array(self.vectors)  # detach from the read-only memmap
+        new_rows: list[int] = []
+        for offset, (point_id, (_, payload)) in enumerate(latest.items()):
+            row = self.rows.get(point_id)
+            if row is None:
+                new_rows.append(offset)
+                continue
+            self.vectors[row] = encoded[offset]
+            self.payloads[row] = dict(payload)
+        if new_rows:
+            ids = list(latest)
+            start = len(self.payloads)
+            self.vectors = np.concatenate([self.vectors, encoded[new_rows]])
+            self.ids = np.concatenate([self.ids, np.asarray([ids[i] for i in new_rows])])
+            for index, offset in enumerate(new_rows):
+                self.payloads.append(dict(latest[ids[offset]][1]))
+                self.rows[ids[offset]] = start + index
+        self._columns.clear()
+
+    def delete(self, point_ids: list[int]) -> bool:
+        drop = [self.rows[int(point_id)] for point_id in point_ids if int(point_id) in self.rows]
+        if not drop:
+            return False
+        keep = np.ones(len(self.payloads), dtype=bool)
+        keep[drop] = False
+        self.vectors = self.vectors[keep]
+        self.ids = self.ids[keep]
+        self.payloads = [payload for payload, kept in zip(self.payloads, keep) if kept]
+        self.rows = {int(point_id): row for row, point_id in enumerate(self.ids.tolist())}
+        self._columns.clear()
+        return True
+
+    def _column(self, key: str) -> npt.NDArray[np.object_]:
+        column = self._columns.get(key)
+        if column is None:
+            column = np.empty(len(self.payloads), dtype=object)
+            column[:] = [payload.get(key) for payload in self.payloads]
+            self._columns[key] = column
+        return column
+
+    def select(self, payload_filter: dict[str, Any] | None) -> npt.NDArray[np.intp] | None:
+        """Row indexes passing the filter; None = every row (no filter)."""
+        terms = _filter_terms(payload_filter)
+        if not terms:
+            return None
+        mask = np.ones(len(self.payloads), dtype=bool)
+        for key, value in terms:
+            mask &= self._column(key) == value
+        return np.flatnonzero(mask)
+
+    def score(
+        self, query: npt.NDArray[np.float32], rows: npt.NDArray[np.intp] | None, top_k: int
+    ) -> list[tuple[int, float]]:
+        matrix = self.vectors if rows is None else self.vectors[rows]
+        if matrix.shape[0] == 0 or top_k <= 0:
+            return []
+        scores = matrix @ query
+        if self.quantized:
+            scores = scores / _INT8_SCALE
+        k = min(top_k, scores.shape[0])
+        best = np.argpartition(-scores, k - 1)[:k]
+        best = best[np.argsort(-scores[best], kind="stable")]
+        positions = best if rows is None else rows[best]
+        return [(int(row), float(scores[i])) for row, i in zip(positions, best)]
+
+
+class LocalVectorStore:
+    """Embedded NumPy vector store; same async surface as QdrantVectorStore."""
+
+    def __init__(self, root: Path | str | None = None, *, quantize: bool = False) -> None:
+        self._root = Path(root) if root is not None else None
+        self._quantize = quantize
+        self._collections: dict[str, _Collection] = {}
+        self._lock = threading.Lock()
+
+    # --- persistence (call with the lock held) ----------------------------------
+    def _dir(self, name: str) -> Path | None:
+        return self._root / name if self._root is not None else None
+
+    def _load(self, name: str) -> _Collection | None:
+        collection = self._collections.get(name)
+        if collection is not None:
+            return collection
+        directory = self._dir(name)
+        if directory is None or not (directory / "ids.npy").is_file():
+            return None
+        vectors = np.load(directory / "vectors.npy", mmap_mode="r")
+        ids = np.load(directory / "ids.npy")
+        payloads = json.loads((directory / "payloads.json").read_text(encoding="utf-8"))
+        collection = _Collection(vectors, ids.astype(np.int64, copy=False), payloads)
+        self._collections[name] = collection
+        return collection
+
+    def _save(self, name: str, collection: _Collection) -> None:
+        directory = self._dir(name)
+        if directory is None:
+            return
+        directory.mkdir(parents=True, exist_ok=True)
+        suffix = f".{os.getpid()}.tmp"
+
+        def _save_array(filename: str, array: npt.NDArray[Any]) -> None:
+            tmp = directory / (filename + suffix)
+            with tmp.open("wb") as handle:
+                np.save(handle, np.asarray(array))
+            os.replace(tmp, directory / filename)
+
+        _save_array("vectors.npy", collection.vectors)
+        tmp = directory / ("payloads.json" + suffix)
+        tmp.write_text(json.dumps(collection.payloads), encoding="utf-8")
+        os.replace(tmp, directory / "payloads.json")
+        # ids.npy goes last: its presence marks a complete collection for _load().
+        _save_array("ids.npy", collection.ids)
+
+    def _create(self, name: str, dim: int) -> None:
+        collection = _Collection.empty(dim, self._quantize)
+        self._collections[name] = collection
+        self._save(name, collection)
+
+    # --- VectorStore surface ----------------------------------------------------
+    async def ensure_collection(self, name: str, dim: int) -> None:
+        """Create the collection if it does not already exist (idempotent)."""
+        with self._lock:
+            if self._load(name) is None:
+                self._create(name, dim)
+
+    async def recreate_collection(self, name: str, dim: int) -> None:
+        """Drop (if present) + create the collection — clean re-ingest / dim change."""
+        with self._lock:
+            self._collections.pop(name, None)
+            directory = self._dir(name)
+            if directory is not None and directory.exists():
+                shutil.rmtree(directory)
+            self._create(name, dim)
+
+    async def count(self, name: str, payload_filter: dict[str, Any] | None = None) -> int:
+        """Number of points (matching payload_filter when given); 0 if the collection is absent."""
+        with self._lock:
+            collection = self._load(name)
+            if collection is None:
+                return 0
+            rows = collection.select(payload_filter)
+            return len(collection.payloads) if rows is None else int(rows.shape[0])
+
+    async def upsert(
+        self, name: str, points: list[tuple[int, list[float], dict[str, Any]]]
+    ) -> None:
+        """Upsert (id, vector, payload) points; the collection must exist (as in Qdrant)."""
+        if not points:
+            return
+        with self._lock:
+            collection = self._load(name)
+            if collection is None:
+                raise ValueError(f"collection {name!r} does not exist")
+            collection.upsert(points)
+            self._save(name, collection)
+
+    async def scroll_payloads(
+        self,
+        name: str,
+        fields: list[str],
+        *,
+        payload_filter: dict[str, Any] | None = None,
+        batch_size: int = 1024,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """(id, selected payload fields) of every matching point; [] if the collection is absent."""
+        with self._lock:
+            collection = self._load(name)
+            if collection is None:
+                return []
+            rows = collection.select(payload_filter)
+            positions = range(len(collection.payloads)) if rows is None else rows.tolist()
+            return [
+                (
+                    int(collection.ids[row]),
+                    {k: v for k, v in collection.payloads[row].items() if k in fields},
+                )
+                for row in positions
+            ]
+
+    async def delete_points(self, name: str, ids: list[int]) -> None:
+        """Delete points by id (no-op for an empty list / absent collection)."""
+        if not ids:
+            return
+        with self._lock:
+            collection = self._load(name)
+            if collection is not None and collection.delete(ids):
+                self._save(name, collection)
+
+    def _search_sync(
+        self,
+        name: str,
+        queries: list[tuple[list[float], int, dict[str, Any] | None]],
+    ) -> list[list[VectorHit]]:
+        with self._lock:
+            collection = self._load(name)
+            if collection is None:
+                return [[] for _ in queries]
+            matrix = _normalize(np.asarray([vector for vector, _, _ in queries], dtype=np.float32))
+            if matrix.shape[1] != collection.dim:
+                raise ValueError(f"query dim {matrix.shape[1]} != collection dim {collection.dim}")
+            results: list[list[VectorHit]] = []
+            for query, (_, top_k, payload_filter) in zip(matrix, queries):
+                scored = collection.score(query, collection.select(payload_filter), top_k)
+                results.append(
+                    [
+                        VectorHit(payload=dict(collection.payloads[row]), score=score)
+                        for row, score in scored
+                    ]
+                )
+            return results
+
+    async def search(
+        self,
+        name: str,
+        query_vector: list[float],
+        top_k: int,
+        payload_filter: dict[str, Any] | None = None,
+    ) -> list[VectorHit]:
+        """Cosine top-k over the rows passing payload_filter (pre-filtered, then scored)."""
+        hits = await self.search_batch(name, [(query_vector, top_k, payload_filter)])
+        return hits[0]
+
+    async def search_batch(
+        self,
+        name: str,
+        queries: list[tuple[list[float], int, dict[str, Any] | None]],
+    ) -> list[list[VectorHit]]:
+        """Several (vector, top_k, payload_filter) searches under one lock pass, in order."""
+        if not queries:
+            return []
+        collection = self._collections.get(name)
+        if collection is not None and collection.vectors.size * len(queries) <= _INLINE_LIMIT:
+            return self._search_sync(name, queries)
+        return await asyncio.to_thread(self._search_sync, name, queries)
+
+
+__all__ = ["LocalVectorStore"]
@@ -12,14 +12,29 @@ Description:
     accepts a payload_filter in the QdrantNamespaceStrategy shape for per-tenant
     isolation — default None for the single shared knowledge collection here).
 
+    AsyncQdrantVectorStore (QDRANT_ASYNC_CLIENT) is the native-async alternative:
+    one pooled AsyncQdrantClient (REST or gRPC) per process, a known-collection →
+    dim cache so reads skip the collection_exists round trip, cached Filter models,
+    tenant_id / user_id keyword payload indexes created with each collection, and
+    search_batch() for several queries in one round trip.
+
 Key Components:
     - VectorHit: one search result (payload dict + cosine score)
-    - QdrantVectorStore: ensure_collection / recreate_collection / count / upsert / search
+    - QdrantVectorStore: ensure_collection / recreate_collection / count / upsert / search /
+      search_batch / scroll_payloads / delete_points
+    - AsyncQdrantVectorStore: the same surface on AsyncQdrantClient + aclose()
 
 Created: 2026-06-27 (Sprint 57.146)
-Last Modified: 2026-07-01
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: AsyncQdrantVectorStore scroll_payloads/delete_points treat a collection
+      dropped behind the cache as absent (evict _dims), like count/search_batch
+    - 2026-10-16: add AsyncQdrantVectorStore (native async, collection cache, payload
+      indexes, pooled client) + search_batch() on both stores
+    - 2026-10-16: VectorHit moved to base.py (re-exported); satisfies the VectorStore protocol
+    - 2026-10-16: scroll_payloads() gains payload_filter (memory vector reconciler)
+    - 2026-10-16: add scroll_payloads() + delete_points() (knowledge incremental ingest manifest)
     - 2026-07-01: Sprint 57.155 — count() gains payload_filter (Cat 3 memory per-user count)
     - 2026-06-27: Initial creation (Sprint 57.146) — first real Qdrant client
       (AD-Knowledge-Connector-First-Real-Source Slice 2; closes CARRY-026 for KB)
@@ -33,18 +48,45 @@ Related:
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+import json
+import logging
+from functools import lru_cache
 from typing import Any
 
-from qdrant_client import QdrantClient, models
+from qdrant_client import AsyncQdrantClient, QdrantClient, models
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from infrastructure.vector.base import VectorHit
+
+logger = logging.getLogger(__name__)
+
+# Payload keys every namespaced query filters on (QdrantNamespaceStrategy) — indexed
+# on creation so Qdrant serves the filter from an index instead of a payload scan.
+_INDEXED_PAYLOAD_KEYS = ("tenant_id", "user_id")
+
+
+@lru_cache(maxsize=1024)
+def _parse_filter(canonical: str) -> models.Filter:
+    return models.Filter.model_validate(json.loads(canonical))
 
 
-@dataclass(frozen=True)
-class VectorHit:
-    """One Qdrant search result: the stored payload + its cosine similarity score."""
+def _to_filter(payload_filter: dict[str, Any] | None) -> models.Filter | None:
+    """Filter model for a dict filter, memoized (the per-tenant / per-user set is small)."""
+    if not payload_filter:
+        return None
+    return _parse_filter(json.dumps(payload_filter, sort_keys=True, default=str))
 
-    payload: dict[str, Any]
-    score: float
+
+def _to_hits(points: list[Any]) -> list[VectorHit]:
+    return [VectorHit(payload=dict(p.payload or {}), score=float(p.score)) for p in points]
+
+
+def _is_not_found(exc: Exception) -> bool:
+    """True for a missing-collection error from either transport (REST 404 / gRPC NOT_FOUND)."""
+    if isinstance(exc, UnexpectedResponse):
+        return exc.status_code == 404
+    code = getattr(exc, "code", None)
+    return callable(code) and getattr(code(), "name", "") == "NOT_FOUND"
 
 
 class QdrantVectorStore:
@@ -119,6 +161,56 @@ class QdrantVectorStore:
 
         await asyncio.to_thread(_upsert)
 
+    async def scroll_payloads(
+        self,
+        name: str,
+        fields: list[str],
+        *,
+        payload_filter: dict[str, Any] | None = None,
+        batch_size: int = 1024,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Every point's (id, selected payload fields), no vectors. [] if the collection is absent.
+
+        Used to rebuild an ingest manifest from the collection itself on a cold start,
+        and (with payload_filter, same shape as search()) to diff one user's points.
+        """
+
+        def _scroll() -> list[tuple[int, dict[str, Any]]]:
+            client = self._get_client()
+            if not client.collection_exists(name):
+                return []
+            sfilter = models.Filter.model_validate(payload_filter) if payload_filter else None
+            rows: list[tuple[int, dict[str, Any]]] = []
+            offset: Any = None
+            while True:
+                points, offset = client.scroll(
+                    collection_name=name,
+                    scroll_filter=sfilter,
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=models.PayloadSelectorInclude(include=fields),
+                    with_vectors=False,
+                )
+                rows.extend((int(point.id), dict(point.payload or {})) for point in points)
+                if offset is None:
+                    return rows
+
+        return await asyncio.to_thread(_scroll)
+
+    async def delete_points(self, name: str, ids: list[int]) -> None:
+        """Delete points by id (no-op for an empty list / absent collection)."""
+
+        def _delete() -> None:
+            client = self._get_client()
+            if not ids or not client.collection_exists(name):
+                return
+            client.delete(
+                collection_name=name,
+                points_selector=models.PointIdsList(points=list(ids)),
+            )
+
+        await asyncio.to_thread(_delete)
+
     async def search(
         self,
         name: str,
@@ -147,5 +239,232 @@ class QdrantVectorStore:
 
         return await asyncio.to_thread(_search)
 
+    async def search_batch(
+        self,
+        name: str,
+        queries: list[tuple[list[float], int, dict[str, Any] | None]],
+    ) -> list[list[VectorHit]]:
+        """Several (vector, top_k, payload_filter) searches in one round trip, in order."""
+
+        def _search_batch() -> list[list[VectorHit]]:
+            client = self._get_client()
+            if not queries or not client.collection_exists(name):
+                return [[] for _ in queries]
+            responses = client.query_batch_points(
+                collection_name=name,
+                requests=[
+                    models.QueryRequest(
+                        query=vector, limit=top_k, filter=_to_filter(pf), with_payload=True
+                    )
+                    for vector, top_k, pf in queries
+                ],
+            )
+            return [_to_hits(response.points) for response in responses]
+
+        return await asyncio.to_thread(_search_batch)
+
+
+class AsyncQdrantVectorStore:
+    """Native-async Qdrant store: one pooled client + a known-collection cache.
+
+    `_dims` maps each collection this process has seen to its vector size, so
+    ensure_collection is free after the first call and reads go straight to the
+    query (no collection_exists probe). A collection dropped behind our back
+    surfaces as a not-found error on the next call: the entry is evicted and the
+    call answers as for an absent collection.
+    """
+
+    def __init__(
+        self, url: str, *, prefer_grpc: bool = False, pool_size: int | None = None
+    ) -> None:
+        self._url = url
+        self._prefer_grpc = prefer_grpc
+        self._pool_size = pool_size
+        self._client: AsyncQdrantClient | None = None
+        self._dims: dict[str, int] = {}
+
+    def _get_client(self) -> AsyncQdrantClient:
+        if self._client is None:
+            self._client = AsyncQdrantClient(
+                url=self._url, prefer_grpc=self._prefer_grpc, pool_size=self._pool_size
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled connections (app shutdown); the next call reconnects."""
+        if self._client is not None:
+            client, self._client = self._client, None
+            await client.close()
+
+    async def _known(self, name: str) -> bool:
+        """Whether the collection exists, probing Qdrant only on a cache miss."""
+        if name in self._dims:
+            return True
+        try:
+            info = await self._get_client().get_collection(name)
+        except Exception as exc:
+            if _is_not_found(exc):
+                return False
+            raise
+        self._dims[name] = int(getattr(info.config.params.vectors, "size", 0) or 0)
+        return True
+
+    async def _create(self, name: str, dim: int) -> None:
+        client = self._get_client()
+        await client.create_collection(
+            collection_name=name,
+            vectors_config=models.VectorParams(size=dim, distance=models.Distance.COSINE),
+        )
+        for key in _INDEXED_PAYLOAD_KEYS:
+            await client.create_payload_index(
+                collection_name=name,
+                field_name=key,
+                field_schema=models.PayloadSchemaType.KEYWORD,
+            )
+        self._dims[name] = dim
+
+    async def ensure_collection(self, name: str, dim: int) -> None:
+        """Create the cosine collection (+ payload indexes) unless already known."""
+        if await self._known(name):
+            if self._dims[name] not in (0, dim):
+                logger.warning(
+                    "qdrant collection %s has dim %d, caller expects %d",
+                    name,
+                    self._dims[name],
+                    dim,
+                )
+            return
+        await self._create(name, dim)
+
+    async def recreate_collection(self, name: str, dim: int) -> None:
+        """Drop (if present) + create the collection — clean re-ingest / dim change."""
+        self._dims.pop(name, None)
+        try:
+            await self._get_client().delete_collection(name)
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+        await self._create(name, dim)
+
+    async def count(self, name: str, payload_filter: dict[str, Any] | None = None) -> int:
+        """Number of points (matching payload_filter when given); 0 if the collection is absent."""
+        if not await self._known(name):
+            return 0
+        try:
+            result = await self._get_client().count(
+                collection_name=name, count_filter=_to_filter(payload_filter)
+            )
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+            self._dims.pop(name, None)
+            return 0
+        return int(result.count)
+
+    async def upsert(
+        self, name: str, points: list[tuple[int, list[float], dict[str, Any]]]
+    ) -> None:
+        """Upsert (id, vector, payload) points into the collection."""
+        await self._get_client().upsert(
+            collection_name=name,
+            points=[
+                models.PointStruct(id=pid, vector=vec, payload=payload)
+                for pid, vec, payload in points
+            ],
+        )
+
+    async def scroll_payloads(
+        self,
+        name: str,
+        fields: list[str],
+        *,
+        payload_filter: dict[str, Any] | None = None,
+        batch_size: int = 1024,
+    ) -> list[tuple[int, dict[str, Any]]]:
+        """Every matching point's (id, selected payload fields); [] if the collection is absent."""
+        if not await self._known(name):
+            return []
+        client = self._get_client()
+        rows: list[tuple[int, dict[str, Any]]] = []
+        offset: Any = None
+        while True:
+            try:
+                points, offset = await client.scroll(
+                    collection_name=name,
+                    scroll_filter=_to_filter(payload_filter),
+                    limit=batch_size,
+                    offset=offset,
+                    with_payload=models.PayloadSelectorInclude(include=fields),
+                    with_vectors=False,
+                )
+            except Exception as exc:
+                if not _is_not_found(exc):
+                    raise
+                self._dims.pop(name, None)
+                return []
+            rows.extend((int(point.id), dict(point.payload or {})) for point in points)
+            if offset is None:
+                return rows
+
+    async def delete_points(self, name: str, ids: list[int]) -> None:
+        """Delete points by id (no-op for an empty list / absent collection)."""
+        if not ids or not await self._known(name):
+            return
+        try:
+            await self._get_client().delete(
+                collection_name=name, points_selector=models.PointIdsList(points=list(ids))
+            )
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+            self._dims.pop(name, None)
+
+    async def search(
+        self,
+        name: str,
+        query_vector: list[float],
+        top_k: int,
+        payload_filter: dict[str, Any] | None = None,
+    ) -> list[VectorHit]:
+        """Cosine top-k search; [] if the collection is absent."""
+        hits = await self.search_batch(name, [(query_vector, top_k, payload_filter)])
+        return hits[0]
+
+    async def search_batch(
+        self,
+        name: str,
+        queries: list[tuple[list[float], int, dict[str, Any] | None]],
+    ) -> list[list[VectorHit]]:
+        """Several (vector, top_k, payload_filter) searches in one round trip, in order."""
+        if not queries or not await self._known(name):
+            return [[] for _ in queries]
+        client = self._get_client()
+        try:
+            if len(queries) == 1:
+                vector, top_k, pf = queries[0]
+                response = await client.query_points(
+                    collection_name=name,
+                    query=vector,
+                    limit=top_k,
+                    query_filter=_to_filter(pf),
+                    with_payload=True,
+                )
+                return [_to_hits(response.points)]
+            responses = await client.query_batch_points(
+                collection_name=name,
+                requests=[
+                    models.QueryRequest(
+                        query=vector, limit=top_k, filter=_to_filter(pf), with_payload=True
+                    )
+                    for vector, top_k, pf in queries
+                ],
+            )
+        except Exception as exc:
+            if not _is_not_found(exc):
+                raise
+            self._dims.pop(name, None)
+            return [[] for _ in queries]
+        return [_to_hits(response.points) for response in responses]
+
 
-__all__ = ["QdrantVectorStore", "VectorHit"]
+__all__ = ["AsyncQdrantVectorStore", "QdrantVectorStore", "VectorHit"]
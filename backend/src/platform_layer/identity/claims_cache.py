@@ -0,0 +1,215 @@
+"""
+File: backend/src/platform_layer/identity/claims_cache.py
+Purpose: Bounded, exp-capped cache of verified JWT claims keyed by token hash.
+Category: Platform layer / Identity (request hot path)
+Scope: Phase 57 / polling + SSE reconnect load
+Owner: platform_layer/identity owner
+
+Description:
+    TenantContextMiddleware verifies the bearer JWT on every request, and the
+    same token is presented thousands of times before it expires (approval
+    queue polls, session list calls, SSE reconnects). Signature verification
+    is pure CPU on the event loop thread. VerifiedClaimsCache remembers the
+    claims of tokens that JWTManager.decode() ACCEPTED, so a repeat
+    presentation skips the decode:
+
+        key      = sha256(token)            (the raw token is never stored)
+        deadline = min(claims.exp, now + ttl_seconds)
+
+    An entry is dropped on the first read at or past its deadline, so a cached
+    token is never honoured beyond its own `exp` (nor longer than the TTL cap,
+    which also bounds how long a rotated JWT secret keeps old tokens alive).
+    Rejected tokens (expired / bad signature / malformed) are never cached —
+    they always take the full decode path and its 401.
+
+    Invalidation: invalidate(token) — logout (api/v1/auth.py) evicts the
+    presented token — and clear().
+    The cache is per process. The repo has no server-side token revocation —
+    a token stays valid until `exp` on any worker that re-decodes it — so
+    eviction restores exactly the no-cache behaviour, no more.
+
+    Bounded LRU (max_entries). Metrics: `stats` (hits / misses / expired /
+    evictions / invalidations, hit_rate) plus a `jwt_claims_cache_total`
+    counter (label result=hit|miss) through the optional Tracer.
+
+Key Components:
+    - VerifiedClaimsCache: get / put / invalidate / clear
+    - ClaimsCacheStats: counters + hit_rate
+    - get_default_claims_cache() / set_default_claims_cache(): process singleton
+      (None while JWT_CLAIMS_CACHE is off)
+
+Created: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: drop invalidate_subject() (no revocation path calls it)
+    - 2026-10-16: Initial creation — verified-claims cache for TenantContextMiddleware
+
+Related:
+    - platform_layer/identity/jwt.py — JWTManager.decode (the work being skipped)
+    - platform_layer/middleware/tenant_context.py — consumer
+    - api/v1/auth.py — logout invalidation
+    - core/config/__init__.py — jwt_claims_cache / _max_entries / _ttl_sec
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Literal
+
+from agent_harness._contracts import MetricEvent, SpanCategory
+from core.config import get_settings
+from platform_layer.identity.jwt import JWTClaims
+
+if TYPE_CHECKING:
+    from agent_harness.observability._abc import Tracer
+
+_DEFAULT_MAX_ENTRIES = 10_000
+_DEFAULT_TTL_SECONDS = 300
+
+
+@dataclass
+class ClaimsCacheStats:
+    hits: int = 0
+    misses: int = 0
+    expired: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _token_key(token: str) -> bytes:
+    return hashlib.sha256(token.encode()).digest()
+
+
+class VerifiedClaimsCache:
+    """Per-process LRU of verified JWT claims; entries never outlive `exp`.
+
+    Args:
+        max_entries: LRU bound (least recently presented token evicted first).
+        ttl_seconds: cap on how long one verification is reused.
+        tracer: optional Tracer for the jwt_claims_cache_total counter.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = _DEFAULT_TTL_SECONDS,
+        tracer: "Tracer | None" = None,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._tracer = tracer
+        self._data: OrderedDict[bytes, tuple[float, JWTClaims]] = OrderedDict()
+        self.stats = ClaimsCacheStats()
+
+    def _record(self, result: Literal["hit", "miss"]) -> None:
+        if self._tracer is None:
+            return
+        self._tracer.record_metric(
+            MetricEvent(
+                metric_name="jwt_claims_cache_total",
+                metric_type="counter",
+                value=1.0,
+                timestamp=datetime.now(timezone.utc),
+                category=SpanCategory.OBSERVABILITY,
+                labels={"result": result},
+            )
+        )
+
+    def get(self, token: str) -> JWTClaims | None:
+        """Cached claims for `token`, or None (never seen / past its deadline)."""
+        key = _token_key(token)
+        entry = self._data.get(key)
+        if entry is not None and time.time() >= entry[0]:
+            del self._data[key]
+            self.stats.expired += 1
+            entry = None
+        if entry is None:
+            self.stats.misses += 1
+            self._record("miss")
+            return None
+        self._data.move_to_end(key)
+        self.stats.hits += 1
+        self._record("hit")
+        return entry[1]
+
+    def put(self, token: str, claims: JWTClaims) -> None:
+        """Remember claims that JWTManager.decode() just accepted for `token`."""
+        now = time.time()
+        deadline = min(float(claims.exp), now + self._ttl_seconds)
+        if deadline <= now:
+            return
+        key = _token_key(token)
+        self._data[key] = (deadline, claims)
+        self._data.move_to_end(key)
+        while len(self._data) > self._max_entries:
+            self._data.popitem(last=False)
+            self.stats.evictions += 1
+
+    def invalidate(self, token: str) -> bool:
+        """Evict one token (logout). True if it was cached."""
+        if self._data.pop(_token_key(token), None) is None:
+            return False
+        self.stats.invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# === process singleton ======================================================
+
+_DEFAULT_CACHE: VerifiedClaimsCache | None = None
+_DEFAULT_RESOLVED = False
+
+
+def get_default_claims_cache() -> VerifiedClaimsCache | None:
+    """Process-wide cache, built from Settings on first use; None while JWT_CLAIMS_CACHE is off."""
+    global _DEFAULT_CACHE, _DEFAULT_RESOLVED
+    if not _DEFAULT_RESOLVED:
+        settings = get_settings()
+        if settings.jwt_claims_cache:
+            from platform_layer.observability.tracer import get_tracer
+
+            _DEFAULT_CACHE = VerifiedClaimsCache(
+                max_entries=settings.jwt_claims_cache_max_entries,
+                ttl_seconds=settings.jwt_claims_cache_ttl_sec,
+                tracer=get_tracer(),
+            )
+        _DEFAULT_RESOLVED = True
+    return _DEFAULT_CACHE
+
+
+def set_default_claims_cache(cache: VerifiedClaimsCache | None) -> None:
+    """Install `cache` as the process-wide cache (None = disabled). Tests use this."""
+    global _DEFAULT_CACHE, _DEFAULT_RESOLVED
+    _DEFAULT_CACHE = cache
+    _DEFAULT_RESOLVED = True
+
+
+def reset_default_claims_cache() -> None:
+    """Forget the singleton so the next get_default_claims_cache() re-reads Settings."""
+    global _DEFAULT_CACHE, _DEFAULT_RESOLVED
+    _DEFAULT_CACHE = None
+    _DEFAULT_RESOLVED = False
+
+
+__all__ = [
+    "ClaimsCacheStats",
+    "VerifiedClaimsCache",
+    "get_default_claims_cache",
+    "reset_default_claims_cache",
+    "set_default_claims_cache",
+]
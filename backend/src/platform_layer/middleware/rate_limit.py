@@ -28,14 +28,19 @@ Description:
     api/main.py — it depends on request.state.{tenant_id, roles} that the
     tenant-context middleware sets from the JWT.
 
+    Pure ASGI (like TenantContextMiddleware): an allowed request calls the next
+    app with the original receive / send, so streamed (SSE) bodies pass through
+    untouched instead of via BaseHTTPMiddleware's task + memory-stream relay.
+
 Key Components:
-    - RateLimitMiddleware: BaseHTTPMiddleware enforcing per-tenant HTTP limits
+    - RateLimitMiddleware: pure ASGI middleware enforcing per-tenant HTTP limits
     - HTTP_RESOURCE: "api_requests" (the resource key for edge HTTP requests)
 
 Created: 2026-05-28 (Sprint 57.58)
-Last Modified: 2026-05-28
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: pure ASGI rewrite (no BaseHTTPMiddleware hop); same bypasses + 429
     - 2026-05-29: Sprint 57.60 — _load_rate_limits drops transitional meta_data fallback
     - 2026-05-28: Sprint 57.59 US-3 — _load_rate_limits reads config table (fallback meta_data)
     - 2026-05-28: Sprint 57.58 Track A — initial creation (RateLimits RuntimeEnforcement)
@@ -54,8 +59,9 @@ from __future__ import annotations
 import logging
 from uuid import UUID
 
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
+from starlette.requests import Request
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from infrastructure.db.engine import get_session_factory
 from platform_layer.tenant.rate_limit_config_store import (
@@ -76,7 +82,7 @@ HTTP_RESOURCE = "api_requests"
 _BYPASS_ROLES: frozenset[str] = frozenset({"admin", "service"})
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
+class RateLimitMiddleware:
     """Per-tenant HTTP rate-limit enforcement (sliding window, fail-open)."""
 
     # Paths that never count against a tenant's rate limit:
@@ -94,6 +100,9 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         "/api/v1/telemetry",
     )
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
     @staticmethod
     def _is_exempt_path(path: str) -> bool:
         for prefix in RateLimitMiddleware.EXEMPT_PATH_PREFIXES:
@@ -103,25 +112,36 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         # must not perturb the enforcement counter.
         return path.endswith("/rate-limits/usage")
 
-    async def dispatch(self, request, call_next):  # type: ignore[no-untyped-def]
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        rejection = await self._enforce(Request(scope))
+        if rejection is not None:
+            await rejection(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
+
+    async def _enforce(self, request: Request) -> Response | None:
+        """The 429 response when the tenant is over a limit; None lets the request through."""
         # --- 1. Bypass: exempt path ---
         if self._is_exempt_path(request.url.path):
-            return await call_next(request)
+            return None
 
         # --- 2. Bypass: no tenant scope (internal call) ---
         tenant_id = getattr(request.state, "tenant_id", None)
         if not isinstance(tenant_id, UUID):
-            return await call_next(request)
+            return None
 
         # --- 3. Bypass: admin / service role ---
         roles = getattr(request.state, "roles", None) or []
         if _BYPASS_ROLES & set(roles):
-            return await call_next(request)
+            return None
 
         # --- 4. Counter not wired (dev / pre-startup) -> fail-open ---
         counter = maybe_get_rate_limit_counter()
         if counter is None:
-            return await call_next(request)
+            return None
 
         # --- 5. Enforce. Any failure here is fail-open (log + allow). ---
         try:
@@ -160,8 +180,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 "rate_limit_middleware: enforcement error; failing open",
                 exc_info=True,
             )
-
-        return await call_next(request)
+        return None
 
     async def _load_rate_limits(self, tenant_id: UUID) -> list[object]:
         """Load this tenant's {label, value} rate-limit list (empty on miss).
@@ -8,9 +8,11 @@ Owner: platform_layer owner
 Description:
     Two collaborating pieces:
 
-    1. TenantContextMiddleware (BaseHTTPMiddleware)
+    1. TenantContextMiddleware (pure ASGI)
        - Reads `Authorization: Bearer <jwt>` header.
-       - Decodes via JWTManager (signature + expiration).
+       - Decodes via JWTManager (signature + expiration); with JWT_CLAIMS_CACHE
+         on, a token already verified in this process is served from
+         VerifiedClaimsCache (never past its `exp`) instead.
        - Populates request.state with: tenant_id (UUID), user_id (UUID),
          roles (list[str]).
        - Returns 401 (header missing / token expired / signature bad).
@@ -37,10 +39,20 @@ Description:
     `get_current_tenant` dep in platform_layer.identity continue to
     work without code changes.
 
+    Pure ASGI rather than BaseHTTPMiddleware: BaseHTTPMiddleware runs the
+    downstream app in a separate task and relays the response through a memory
+    stream, a per-request hop that every chunk of a long SSE response also pays.
+    Here a passing request calls the next app directly with the original
+    receive / send; only a rejection builds a JSONResponse.
+
 Created: 2026-04-29 (Sprint 49.3 Day 4.4)
-Last Modified: 2026-06-06
+Last Modified: 2026-10-16
 
 Modification History (newest-first):
+    - 2026-10-16: only the default JWTManager uses the process-wide claims cache
+    - 2026-10-16: reuse verified claims via VerifiedClaimsCache (JWT_CLAIMS_CACHE; default OFF)
+    - 2026-10-16: pure ASGI rewrite (no BaseHTTPMiddleware task / stream hop); same
+        exemptions, token sources, 401 bodies / headers and request.state contract
     - 2026-06-13: Sprint 57.112 — EXEMPT /api/v1/mfa/verify (challenge-gated TOTP second factor)
     - 2026-06-06: Sprint 57.87 — EXEMPT /api/v1/tenants/register (pre-JWT self-service registration)
     - 2026-06-06: Sprint 57.86 — EXEMPT /api/v1/auth/password-login (pre-JWT local sign-in)
@@ -58,6 +70,7 @@ Related:
     - sprint-49-3-plan.md §3 (SET LOCAL middleware)
     - claudedocs/5-status/V2-AUDIT-OPEN-ISSUES-20260501.md issue #14
     - platform_layer/identity/jwt.py — JWTManager (decode source)
+    - platform_layer/identity/claims_cache.py — VerifiedClaimsCache (skips repeat decodes)
 """
 
 from __future__ import annotations
@@ -68,20 +81,30 @@ from uuid import UUID
 from fastapi import Request
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
-from starlette.types import ASGIApp
+from starlette.responses import JSONResponse, Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from infrastructure.db.engine import get_session_factory
+from platform_layer.identity.claims_cache import VerifiedClaimsCache, get_default_claims_cache
 from platform_layer.identity.jwt import (
     JWTAuthError,
+    JWTClaims,
     JWTExpiredError,
     JWTInvalidError,
     JWTManager,
 )
 
 
-class TenantContextMiddleware(BaseHTTPMiddleware):
+def _bearer_required() -> JSONResponse:
+    # Built only on the rejection path — a passing request renders no response.
+    return JSONResponse(
+        {"error": "Authorization Bearer token required"},
+        status_code=401,
+        headers={"WWW-Authenticate": 'Bearer realm="api"'},
+    )
+
+
+class TenantContextMiddleware:
     """Extract JWT (Bearer header or v2_jwt cookie) → request.state.{tenant_id, user_id, roles}.
 
     JWT source priority: `Authorization: Bearer <jwt>` header (API clients /
@@ -152,24 +175,52 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
         app: ASGIApp,
         *,
         jwt_manager: JWTManager | None = None,
+        claims_cache: VerifiedClaimsCache | None = None,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         # Lazy default — resolves Settings the first time the middleware
         # processes a request, so tests can construct the app under custom
         # JWT_SECRET env vars without ordering pain.
         self._jwt_manager = jwt_manager
+        # None → the process-wide cache (itself None while JWT_CLAIMS_CACHE is off),
+        # but only with the default JWTManager: claims verified under a custom
+        # manager / secret must never be served to, or from, other middleware.
+        self._claims_cache = claims_cache
+        self._use_default_claims_cache = jwt_manager is None
 
     def _get_jwt_manager(self) -> JWTManager:
         if self._jwt_manager is None:
             self._jwt_manager = JWTManager()
         return self._jwt_manager
 
-    async def dispatch(self, request, call_next):  # type: ignore[no-untyped-def]
-        path = request.url.path
-        for prefix in self.EXEMPT_PATH_PREFIXES:
-            if path == prefix or path.startswith(prefix + "/"):
-                return await call_next(request)
+    def _get_claims_cache(self) -> VerifiedClaimsCache | None:
+        if self._claims_cache is not None:
+            return self._claims_cache
+        if not self._use_default_claims_cache:
+            return None
+        return get_default_claims_cache()
+
+    def _is_exempt_path(self, path: str) -> bool:
+        return any(
+            path == prefix or path.startswith(prefix + "/") for prefix in self.EXEMPT_PATH_PREFIXES
+        )
 
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Non-HTTP scopes (lifespan / websocket) pass straight through, as they
+        # did under BaseHTTPMiddleware.
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        if not self._is_exempt_path(request.url.path):
+            rejection = self._authenticate(request)
+            if rejection is not None:
+                await rejection(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+    def _authenticate(self, request: Request) -> Response | None:
+        """Populate request.state from the JWT; the 401 response when it can't."""
         # JWT source priority: Authorization: Bearer header (API clients,
         # tests) → v2_jwt httpOnly cookie (SPA browser, set by /auth/callback).
         # When an Authorization header is present it must be a non-empty Bearer
@@ -177,15 +228,10 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
         # the header almost certainly meant it (and error messages stay stable
         # for the existing test suite).
         token: str | None
-        _unauth = JSONResponse(
-            {"error": "Authorization Bearer token required"},
-            status_code=401,
-            headers={"WWW-Authenticate": 'Bearer realm="api"'},
-        )
         raw = request.headers.get(self.AUTH_HEADER)
         if raw is not None:
             if not raw.startswith(self.BEARER_PREFIX):
-                return _unauth
+                return _bearer_required()
             token = raw[len(self.BEARER_PREFIX) :].strip()
             if not token:
                 return JSONResponse(
@@ -196,10 +242,39 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
         else:
             token = request.cookies.get(self.JWT_COOKIE_NAME)
             if not token:
-                return _unauth
+                return _bearer_required()
+
+        cache = self._get_claims_cache()
+        claims = cache.get(token) if cache is not None else None
+        if claims is None:
+            decoded = self._decode(token)
+            if isinstance(decoded, Response):
+                return decoded  # rejected tokens are never cached
+            claims = decoded
+            if cache is not None:
+                cache.put(token, claims)
 
+        # Parse user_id from `sub`. JWT spec stores sub as string; we expect
+        # UUID-shaped values from our own issuer. If `sub` cannot parse,
+        # treat as auth failure (not 500) — the issuer is misconfigured.
         try:
-            claims = self._get_jwt_manager().decode(token)
+            user_id = UUID(claims.sub)
+        except (ValueError, TypeError):
+            return JSONResponse(
+                {"error": "token sub is not a valid UUID"},
+                status_code=401,
+                headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
+            )
+
+        request.state.tenant_id = claims.tenant_id
+        request.state.user_id = user_id
+        request.state.roles = list(claims.roles)
+        return None
+
+    def _decode(self, token: str) -> JWTClaims | Response:
+        """Verify `token` → its claims, or the 401 response for why it was rejected."""
+        try:
+            return self._get_jwt_manager().decode(token)
         except JWTExpiredError:
             return JSONResponse(
                 {"error": "token expired"},
@@ -219,23 +294,6 @@ class TenantContextMiddleware(BaseHTTPMiddleware):
             # Catch-all for any other JWTAuthError subclass added later.
             return JSONResponse({"error": "authentication failed"}, status_code=401)
 
-        # Parse user_id from `sub`. JWT spec stores sub as string; we expect
-        # UUID-shaped values from our own issuer. If `sub` cannot parse,
-        # treat as auth failure (not 500) — the issuer is misconfigured.
-        try:
-            user_id = UUID(claims.sub)
-        except (ValueError, TypeError):
-            return JSONResponse(
-                {"error": "token sub is not a valid UUID"},
-                status_code=401,
-                headers={"WWW-Authenticate": 'Bearer error="invalid_token"'},
-            )
-
-        request.state.tenant_id = claims.tenant_id
-        request.state.user_id = user_id
-        request.state.roles = list(claims.roles)
-        return await call_next(request)
-
 
 async def get_db_session_with_tenant(
     request: Request,
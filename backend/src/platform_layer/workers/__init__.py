@@ -28,6 +28,8 @@ Per Phase 49.4 worker-queue-decision: Temporal won over Celery.
 
 from runtime.workers import (
     AgentLoopWorker,
+    InProcessWorkQueue,
+    JobHandler,
     MockQueueBackend,
     QueueBackend,
     SseEmit,
@@ -36,12 +38,17 @@ from runtime.workers import (
     TaskResult,
     TaskStatus,
     WorkerConfig,
+    WorkerPool,
+    WorkerPoolConfig,
+    WorkQueueBackend,
     build_agent_loop_handler,
     execute_loop_with_sse,
 )
 
 __all__ = [
     "AgentLoopWorker",
+    "InProcessWorkQueue",
+    "JobHandler",
     "MockQueueBackend",
     "QueueBackend",
     "SseEmit",
@@ -49,7 +56,10 @@ __all__ = [
     "TaskHandler",
     "TaskResult",
     "TaskStatus",
+    "WorkQueueBackend",
     "WorkerConfig",
+    "WorkerPool",
+    "WorkerPoolConfig",
     "build_agent_loop_handler",
     "execute_loop_with_sse",
 ]
@@ -4,6 +4,10 @@ Single-source map:
 - AgentLoopWorker: agent_loop_worker.py (framework owner)
 - QueueBackend ABC: queue_backend.py
 - MockQueueBackend: queue_backend.py (test double)
+- WorkQueueBackend ABC (claim / complete): queue_backend.py
+- InProcessWorkQueue: work_queue.py
+- PostgresWorkQueue: postgres_queue.py (import directly — pulls in the DB models)
+- WorkerPool: worker_pool.py
 """
 
 from runtime.workers.agent_loop_worker import (
@@ -20,10 +24,15 @@ from runtime.workers.queue_backend import (
     TaskEnvelope,
     TaskResult,
     TaskStatus,
+    WorkQueueBackend,
 )
+from runtime.workers.work_queue import InProcessWorkQueue
+from runtime.workers.worker_pool import JobHandler, WorkerPool, WorkerPoolConfig
 
 __all__ = [
     "AgentLoopWorker",
+    "InProcessWorkQueue",
+    "JobHandler",
     "MockQueueBackend",
     "QueueBackend",
     "SseEmit",
@@ -31,7 +40,10 @@ __all__ = [
     "TaskHandler",
     "TaskResult",
     "TaskStatus",
+    "WorkQueueBackend",
     "WorkerConfig",
+    "WorkerPool",
+    "WorkerPoolConfig",
     "build_agent_loop_handler",
     "execute_loop_with_sse",
 ]
@@ -0,0 +1,347 @@
+"""
+File: backend/src/runtime/workers/postgres_queue.py
+Purpose: PostgresWorkQueue — durable coalescing WorkQueueBackend on the work_queue table.
+Category: Runtime / Workers (execution plane — concrete adapter)
+Scope: Phase 57 / durable background work queue
+
+Description:
+    The durable half of the WorkQueueBackend pair (work_queue.py is the
+    in-process half); jobs survive restarts and several API processes can
+    share one queue. Storage is the work_queue table (migration 0036):
+
+    - submit: INSERT ... ON CONFLICT (queue, coalesce_key) WHERE status='pending'
+      DO UPDATE — the latest envelope replaces the queued job's payload / trace /
+      not_before and the queued task_id is returned (coalescing + debounce). Runs
+      under the job's own tenant (RLS WITH CHECK);
+    - claim: first sweeps expired leases (a crashed worker's running rows go back
+      to pending, or to failed once out of retries / superseded) and prunes
+      finished rows (done / cancelled / failed) older than `_FINISHED_RETENTION`,
+      then takes due pending rows whose key has no running row, FOR UPDATE SKIP
+      LOCKED, and leases them for `lease_sec`. Runs under the all-zeros system
+      sentinel (cross-tenant, the billing_outbox drainer precedent);
+    - complete: done, or — on error with retries left and no newer pending job
+      for the key — back to pending with exponential backoff.
+
+    Each call is its own short transaction on `session_factory`.
+
+Key Components:
+    - PostgresWorkQueue(session_factory, queue, *, lease_sec=300, retry_backoff_sec=5.0)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: _sweep also prunes failed rows (they previously piled up forever)
+    - 2026-10-16: Initial creation — durable coalescing WorkQueueBackend
+
+Related:
+    - queue_backend.py — WorkQueueBackend contract
+    - infrastructure/db/models/work_queue.py — WorkQueueJob ORM
+    - platform_layer/billing/billing_outbox.py — SKIP LOCKED claim + sentinel RLS precedent
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import and_, delete, exists, func, or_, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import aliased
+
+from infrastructure.db.models.work_queue import WorkQueueJob
+from runtime.workers.queue_backend import (
+    TaskEnvelope,
+    TaskResult,
+    TaskStatus,
+    WorkQueueBackend,
+)
+
+# Cross-tenant system context for claim / complete (see migration 0036 RLS).
+SYSTEM_SENTINEL_TENANT = "00000000-0000-0000-0000-000000000000"
+_FINISHED_RETENTION = timedelta(days=1)
+_STATUS = {
+    "pending": TaskStatus.PENDING,
+    "running": TaskStatus.RUNNING,
+    "done": TaskStatus.COMPLETED,
+    "failed": TaskStatus.FAILED,
+    "cancelled": TaskStatus.CANCELLED,
+}
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _envelope(row: WorkQueueJob) -> TaskEnvelope:
+    return TaskEnvelope(
+        task_id=row.task_id,
+        tenant_id=str(row.tenant_id),
+        user_id=row.user_id,
+        payload=dict(row.payload),
+        trace_id=row.trace_id,
+        enqueued_at=row.created_at,
+        max_retries=row.max_retries,
+        coalesce_key=row.coalesce_key,
+        not_before=row.not_before,
+    )
+
+
+class PostgresWorkQueue(WorkQueueBackend):
+    """Durable coalescing work queue on the work_queue table (one logical `queue`)."""
+
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession],
+        queue: str,
+        *,
+        lease_sec: int = 300,
+        retry_backoff_sec: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._queue = queue
+        self._lease = timedelta(seconds=lease_sec)
+        self._retry_backoff_sec = retry_backoff_sec
+
+    @staticmethod
+    async def _set_tenant(db: AsyncSession, tenant_id: str) -> None:
+        """SET LOCAL app.tenant_id for the current transaction (RLS context)."""
+        await db.execute(text("SELECT set_config('app.tenant_id', :tid, true)"), {"tid": tenant_id})
+
+    def _pending_sibling(self) -> Any:
+        """EXISTS a pending row with the same (queue, coalesce_key) as the outer row."""
+        sibling = aliased(WorkQueueJob)
+        return exists().where(
+            sibling.queue == WorkQueueJob.queue,
+            sibling.coalesce_key == WorkQueueJob.coalesce_key,
+            sibling.status == "pending",
+        )
+
+    async def submit(self, envelope: TaskEnvelope) -> str:
+        not_before = envelope.not_before or envelope.enqueued_at
+        insert = pg_insert(WorkQueueJob).values(
+            tenant_id=UUID(envelope.tenant_id),
+            queue=self._queue,
+            task_id=envelope.task_id,
+            coalesce_key=envelope.coalesce_key,
+            user_id=envelope.user_id,
+            trace_id=envelope.trace_id,
+            payload=envelope.payload,
+            max_retries=envelope.max_retries,
+            not_before=not_before,
+        )
+        stmt = insert.on_conflict_do_update(
+            index_elements=["queue", "coalesce_key"],
+            index_where=text("status = 'pending'"),
+            set_={
+                "payload": insert.excluded.payload,
+                "user_id": insert.excluded.user_id,
+                "trace_id": insert.excluded.trace_id,
+                "max_retries": insert.excluded.max_retries,
+                "not_before": insert.excluded.not_before,
+            },
+        ).returning(WorkQueueJob.task_id)
+        async with self._session_factory() as db:
+            await self._set_tenant(db, envelope.tenant_id)
+            task_id = (await db.execute(stmt)).scalar_one()
+            await db.commit()
+        return str(task_id)
+
+    async def poll(self, task_id: str) -> TaskResult:
+        async with self._session_factory() as db:
+            await self._set_tenant(db, SYSTEM_SENTINEL_TENANT)
+            row = (
+                (await db.execute(select(WorkQueueJob).where(WorkQueueJob.task_id == task_id)))
+                .scalars()
+                .first()
+            )
+        if row is None:
+            return TaskResult(task_id=task_id, status=TaskStatus.FAILED, error="unknown task_id")
+        return TaskResult(
+            task_id=task_id,
+            status=_STATUS[row.status],
+            result=dict(row.result) if row.result is not None else None,
+            error=row.last_error,
+            completed_at=row.finished_at,
+            retries=max(row.attempts - 1, 0),
+        )
+
+    async def cancel(self, task_id: str) -> bool:
+        """Cancel a PENDING job; a RUNNING job cannot be interrupted (returns False)."""
+        async with self._session_factory() as db:
+            await self._set_tenant(db, SYSTEM_SENTINEL_TENANT)
+            cancelled = (
+                await db.execute(
+                    update(WorkQueueJob)
+                    .where(WorkQueueJob.task_id == task_id, WorkQueueJob.status == "pending")
+                    .values(status="cancelled", finished_at=func.now())
+                    .returning(WorkQueueJob.id)
+                )
+            ).first()
+            await db.commit()
+        return cancelled is not None
+
+    async def list_pending(self, *, tenant_id: str | None = None) -> list[TaskEnvelope]:
+        stmt = select(WorkQueueJob).where(
+            WorkQueueJob.queue == self._queue, WorkQueueJob.status == "pending"
+        )
+        if tenant_id is not None:
+            stmt = stmt.where(WorkQueueJob.tenant_id == UUID(tenant_id))
+        async with self._session_factory() as db:
+            await self._set_tenant(db, SYSTEM_SENTINEL_TENANT)
+            rows = (await db.execute(stmt.order_by(WorkQueueJob.not_before))).scalars().all()
+        return [_envelope(row) for row in rows]
+
+    async def _sweep(self, db: AsyncSession) -> None:
+        """Recover expired leases and prune old finished rows (inside the claim txn)."""
+        expired = and_(
+            WorkQueueJob.queue == self._queue,
+            WorkQueueJob.status == "running",
+            WorkQueueJob.lease_until < func.now(),
+        )
+        await db.execute(
+            update(WorkQueueJob)
+            .where(
+                expired,
+                or_(WorkQueueJob.attempts > WorkQueueJob.max_retries, self._pending_sibling()),
+            )
+            .values(
+                status="failed",
+                lease_until=None,
+                finished_at=func.now(),
+                last_error="lease expired",
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            update(WorkQueueJob)
+            .where(expired)
+            .values(status="pending", lease_until=None, not_before=func.now())
+            .execution_options(synchronize_session=False)
+        )
+        await db.execute(
+            delete(WorkQueueJob)
+            .where(
+                WorkQueueJob.queue == self._queue,
+                WorkQueueJob.status.in_(("done", "cancelled", "failed")),
+                WorkQueueJob.finished_at < func.now() - _FINISHED_RETENTION,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def claim(self, *, limit: int) -> list[TaskEnvelope]:
+        if limit <= 0:
+            return []
+        running = aliased(WorkQueueJob)
+        key_running = exists().where(
+            running.queue == WorkQueueJob.queue,
+            running.coalesce_key == WorkQueueJob.coalesce_key,
+            running.status == "running",
+        )
+        async with self._session_factory() as db:
+            await self._set_tenant(db, SYSTEM_SENTINEL_TENANT)
+            await self._sweep(db)
+            rows = (
+                (
+                    await db.execute(
+                        select(WorkQueueJob)
+                        .where(
+                            WorkQueueJob.queue == self._queue,
+                            WorkQueueJob.status == "pending",
+                            WorkQueueJob.not_before <= func.now(),
+                            ~key_running,
+                        )
+                        .order_by(WorkQueueJob.not_before, WorkQueueJob.id)
+                        .limit(limit)
+                        .with_for_update(skip_locked=True, of=WorkQueueJob)
+                    )
+                )
+                .scalars()
+                .all()
+            )
+            lease_until = _utcnow() + self._lease
+            for row in rows:
+                row.status = "running"
+                row.attempts += 1
+                row.lease_until = lease_until
+            envelopes = [_envelope(row) for row in rows]
+            await db.commit()
+        return envelopes
+
+    async def complete(
+        self,
+        task_id: str,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        try:
+            await self._complete(task_id, result=result, error=error, allow_retry=True)
+        except IntegrityError:
+            # A newer job for the key was queued between the sibling check and the
+            # re-queue (partial unique index) — it supersedes the retry.
+            await self._complete(task_id, result=result, error=error, allow_retry=False)
+
+    async def _complete(
+        self,
+        task_id: str,
+        *,
+        result: dict[str, Any] | None,
+        error: str | None,
+        allow_retry: bool,
+    ) -> None:
+        async with self._session_factory() as db:
+            await self._set_tenant(db, SYSTEM_SENTINEL_TENANT)
+            row = (
+                (
+                    await db.execute(
+                        select(WorkQueueJob)
+                        .where(WorkQueueJob.task_id == task_id, WorkQueueJob.status == "running")
+                        .with_for_update()
+                    )
+                )
+                .scalars()
+                .first()
+            )
+            if row is None:
+                return  # lease already swept / unknown task
+            row.lease_until = None
+            retry = (
+                error is not None
+                and allow_retry
+                and row.attempts <= row.max_retries
+                and not await self._has_pending(db, row.coalesce_key)
+            )
+            if retry:
+                backoff = self._retry_backoff_sec * (2 ** (row.attempts - 1))
+                row.status = "pending"
+                row.not_before = _utcnow() + timedelta(seconds=backoff)
+                row.last_error = error
+            else:
+                row.status = "failed" if error is not None else "done"
+                row.result = result
+                row.last_error = error
+                row.finished_at = _utcnow()
+            await db.commit()
+
+    async def _has_pending(self, db: AsyncSession, coalesce_key: str | None) -> bool:
+        if coalesce_key is None:
+            return False
+        found = (
+            await db.execute(
+                select(WorkQueueJob.id)
+                .where(
+                    WorkQueueJob.queue == self._queue,
+                    WorkQueueJob.coalesce_key == coalesce_key,
+                    WorkQueueJob.status == "pending",
+                )
+                .limit(1)
+            )
+        ).first()
+        return found is not None
+
+
+__all__ = ["PostgresWorkQueue", "SYSTEM_SENTINEL_TENANT"]
@@ -13,13 +13,20 @@ Description:
     For Phase 49.4 - 50.1 we ship MockQueueBackend (in-memory) so the loop
     framework can be tested + integrated without standing up Temporal server.
 
+    WorkQueueBackend extends the ABC with the worker-side claim/complete pair
+    that a pooled consumer (worker_pool.WorkerPool) drives. Envelopes may carry
+    a `coalesce_key` (a later submit with the same key replaces the still-queued
+    job instead of adding one) and a `not_before` (debounce / retry backoff).
+    Implementations: work_queue.InProcessWorkQueue / postgres_queue.PostgresWorkQueue.
+
     All side effects (network, persistence) live in concrete adapters.
     QueueBackend ABC is pure abstraction.
 
 Created: 2026-04-29 (Sprint 49.4 Day 2)
-Last Modified: 2026-04-29
+Last Modified: 2026-10-16
 
 Modification History:
+    - 2026-10-16: TaskEnvelope coalesce_key / not_before; WorkQueueBackend claim/complete ABC
     - 2026-04-29: Initial creation (Sprint 49.4 Day 2) — neutral ABC + Mock impl
 
 Related:
@@ -34,7 +41,7 @@ import asyncio
 import uuid
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from enum import Enum
 from typing import Any
 
@@ -53,6 +60,7 @@ class TaskEnvelope:
 
     `tenant_id` is required (multi-tenant rule 1). `trace_id` is required
     for Cat 12 observability (every span across worker boundary keeps trace).
+    `coalesce_key` / `not_before` are honoured by WorkQueueBackend impls only.
     """
 
     task_id: str
@@ -62,6 +70,8 @@ class TaskEnvelope:
     trace_id: str
     enqueued_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     max_retries: int = 2
+    coalesce_key: str | None = None
+    not_before: datetime | None = None
 
     @classmethod
     def new(
@@ -72,14 +82,20 @@ class TaskEnvelope:
         trace_id: str,
         user_id: str | None = None,
         max_retries: int = 2,
+        coalesce_key: str | None = None,
+        delay_sec: float = 0.0,
     ) -> "TaskEnvelope":
+        enqueued_at = datetime.now(timezone.utc)
         return cls(
             task_id=str(uuid.uuid4()),
             tenant_id=tenant_id,
             user_id=user_id,
             payload=payload,
             trace_id=trace_id,
+            enqueued_at=enqueued_at,
             max_retries=max_retries,
+            coalesce_key=coalesce_key,
+            not_before=enqueued_at + timedelta(seconds=delay_sec) if delay_sec > 0 else None,
         )
 
 
@@ -117,6 +133,35 @@ class QueueBackend(ABC):
         ...
 
 
+class WorkQueueBackend(QueueBackend):
+    """QueueBackend plus the consumer side a pooled worker drives.
+
+    Contract shared by every impl:
+    - submit() with a coalesce_key that matches a still-PENDING job replaces that
+      job's payload / not_before in place and returns ITS task_id (latest wins);
+    - claim() never hands out a job whose coalesce_key is already RUNNING, so two
+      jobs for the same key never execute concurrently;
+    - complete(error=...) re-queues with backoff while retries remain and no newer
+      job for the key is pending (that job supersedes the retry).
+    """
+
+    @abstractmethod
+    async def claim(self, *, limit: int) -> list[TaskEnvelope]:
+        """Mark up to `limit` due PENDING jobs RUNNING and return them (oldest due first)."""
+        ...
+
+    @abstractmethod
+    async def complete(
+        self,
+        task_id: str,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Record the outcome of a claimed job (error → retry or FAILED)."""
+        ...
+
+
 # ---------------------------------------------------------------------------
 # Mock implementation — test double; in-memory only
 # ---------------------------------------------------------------------------
@@ -0,0 +1,204 @@
+"""
+File: backend/src/runtime/workers/work_queue.py
+Purpose: InProcessWorkQueue — in-memory coalescing WorkQueueBackend (single-process deployments).
+Category: Runtime / Workers (execution plane)
+Scope: Phase 57 / durable background work queue
+
+Description:
+    The in-process half of the WorkQueueBackend pair (postgres_queue.py is the
+    durable half). Unlike MockQueueBackend it is meant for production use in a
+    single API process: jobs live only in memory (lost on restart — use the
+    Postgres backend when that matters), but the queue semantics are the same:
+
+    - coalescing: a submit whose coalesce_key matches a PENDING job replaces that
+      job's envelope (payload / trace / not_before) and keeps its task_id, so a
+      burst of sends for one session leaves ONE queued job carrying the latest;
+    - debounce: a job is not claimable before its not_before; a superseding
+      submit moves not_before forward again;
+    - per-key exclusion: claim() skips a key that is RUNNING; a submit for it
+      queues behind the running job instead of racing it;
+    - retries: complete(error=...) re-queues with exponential backoff while
+      attempts <= max_retries and no newer job for the key is pending.
+
+    Finished results are kept for poll() in a bounded LRU (`_RESULT_CAPACITY`).
+
+Key Components:
+    - InProcessWorkQueue(*, retry_backoff_sec=5.0, clock=None)
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — in-memory coalescing WorkQueueBackend
+
+Related:
+    - queue_backend.py — WorkQueueBackend contract / TaskEnvelope
+    - postgres_queue.py — durable implementation of the same contract
+    - worker_pool.py — the bounded consumer
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import OrderedDict
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from runtime.workers.queue_backend import (
+    TaskEnvelope,
+    TaskResult,
+    TaskStatus,
+    WorkQueueBackend,
+)
+
+_RESULT_CAPACITY = 1024
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class InProcessWorkQueue(WorkQueueBackend):
+    """In-memory coalescing work queue (see module docstring for the semantics)."""
+
+    def __init__(
+        self,
+        *,
+        retry_backoff_sec: float = 5.0,
+        clock: Callable[[], datetime] | None = None,
+    ) -> None:
+        self._retry_backoff_sec = retry_backoff_sec
+        self._clock = clock or _utcnow
+        self._pending: dict[str, TaskEnvelope] = {}
+        self._pending_keys: dict[str, str] = {}
+        self._running: dict[str, TaskEnvelope] = {}
+        self._running_keys: set[str] = set()
+        self._attempts: dict[str, int] = {}
+        self._results: OrderedDict[str, TaskResult] = OrderedDict()
+        self._lock = asyncio.Lock()
+
+    def _due_at(self, envelope: TaskEnvelope) -> datetime:
+        return envelope.not_before or envelope.enqueued_at
+
+    def _record(self, result: TaskResult) -> None:
+        self._results[result.task_id] = result
+        self._results.move_to_end(result.task_id)
+        while len(self._results) > _RESULT_CAPACITY:
+            self._results.popitem(last=False)
+
+    async def submit(self, envelope: TaskEnvelope) -> str:
+        async with self._lock:
+            key = envelope.coalesce_key
+            existing = self._pending_keys.get(key) if key is not None else None
+            if existing is not None:
+                self._pending[existing] = replace(envelope, task_id=existing)
+                return existing
+            self._pending[envelope.task_id] = envelope
+            if key is not None:
+                self._pending_keys[key] = envelope.task_id
+            self._record(TaskResult(task_id=envelope.task_id, status=TaskStatus.PENDING))
+            return envelope.task_id
+
+    async def poll(self, task_id: str) -> TaskResult:
+        async with self._lock:
+            return self._results.get(
+                task_id,
+                TaskResult(task_id=task_id, status=TaskStatus.FAILED, error="unknown task_id"),
+            )
+
+    async def cancel(self, task_id: str) -> bool:
+        """Drop a PENDING job; a RUNNING job cannot be interrupted (returns False)."""
+        async with self._lock:
+            envelope = self._pending.pop(task_id, None)
+            if envelope is None:
+                return False
+            if envelope.coalesce_key is not None:
+                self._pending_keys.pop(envelope.coalesce_key, None)
+            self._record(
+                TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus.CANCELLED,
+                    completed_at=self._clock(),
+                    retries=max(self._attempts.pop(task_id, 0) - 1, 0),
+                )
+            )
+            return True
+
+    async def list_pending(self, *, tenant_id: str | None = None) -> list[TaskEnvelope]:
+        async with self._lock:
+            return [
+                e for e in self._pending.values() if tenant_id is None or e.tenant_id == tenant_id
+            ]
+
+    async def claim(self, *, limit: int) -> list[TaskEnvelope]:
+        if limit <= 0:
+            return []
+        async with self._lock:
+            now = self._clock()
+            due = sorted(
+                (
+                    e
+                    for e in self._pending.values()
+                    if self._due_at(e) <= now and e.coalesce_key not in self._running_keys
+                ),
+                key=self._due_at,
+            )
+            claimed = due[:limit]
+            for envelope in claimed:
+                del self._pending[envelope.task_id]
+                if envelope.coalesce_key is not None:
+                    self._pending_keys.pop(envelope.coalesce_key, None)
+                    self._running_keys.add(envelope.coalesce_key)
+                self._running[envelope.task_id] = envelope
+                attempts = self._attempts.get(envelope.task_id, 0) + 1
+                self._attempts[envelope.task_id] = attempts
+                self._record(
+                    TaskResult(
+                        task_id=envelope.task_id, status=TaskStatus.RUNNING, retries=attempts - 1
+                    )
+                )
+            return claimed
+
+    async def complete(
+        self,
+        task_id: str,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        async with self._lock:
+            envelope = self._running.pop(task_id, None)
+            if envelope is None:
+                return
+            key = envelope.coalesce_key
+            if key is not None:
+                self._running_keys.discard(key)
+            attempts = self._attempts.get(task_id, 1)
+            superseded = key is not None and key in self._pending_keys
+            if error is not None and attempts <= envelope.max_retries and not superseded:
+                backoff = self._retry_backoff_sec * (2 ** (attempts - 1))
+                retry = replace(envelope, not_before=self._clock() + timedelta(seconds=backoff))
+                self._pending[task_id] = retry
+                if key is not None:
+                    self._pending_keys[key] = task_id
+                self._record(
+                    TaskResult(
+                        task_id=task_id, status=TaskStatus.PENDING, error=error, retries=attempts
+                    )
+                )
+                return
+            self._attempts.pop(task_id, None)
+            self._record(
+                TaskResult(
+                    task_id=task_id,
+                    status=TaskStatus.FAILED if error is not None else TaskStatus.COMPLETED,
+                    result=result,
+                    error=error,
+                    completed_at=self._clock(),
+                    retries=attempts - 1,
+                )
+            )
+
+
+__all__ = ["InProcessWorkQueue"]
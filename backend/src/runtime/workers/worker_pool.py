@@ -0,0 +1,188 @@
+"""
+File: backend/src/runtime/workers/worker_pool.py
+Purpose: WorkerPool — bounded, yielding consumer that drains a WorkQueueBackend.
+Category: Runtime / Workers (execution plane)
+Scope: Phase 57 / durable background work queue
+
+Description:
+    AgentLoopWorker executes one envelope per run_once() and only speaks to
+    MockQueueBackend. Background work (post-send memory formation) needs a
+    long-running consumer with its OWN concurrency budget that stays out of the
+    way of interactive traffic. WorkerPool:
+
+    - claims at most `concurrency - in_flight` jobs per poll, so no more than
+      `concurrency` handlers ever run at once;
+    - yields to interactive work: while the `busy()` probe is true the effective
+      limit drops to `busy_concurrency` (default 1 — a backlog still drains, but
+      one job at a time, so background LLM calls never pile onto a busy process);
+    - sleeps `poll_interval_sec` between empty polls and wakes early when a
+      running job frees a slot;
+    - reports each outcome through backend.complete() (handler exception →
+      error string → the backend's retry policy). A claim failure is logged and
+      retried on the next poll — a DB flake must never kill the pool.
+
+    stop() stops claiming and waits (bounded) for in-flight jobs; a job cut off
+    at the deadline is cancelled and, with the Postgres backend, re-claimed
+    after its lease expires.
+
+Key Components:
+    - WorkerPoolConfig(concurrency, busy_concurrency, poll_interval_sec)
+    - WorkerPool(backend, handler, config=None, *, busy=None)
+    - JobHandler: async (TaskEnvelope) -> dict | None
+
+Created: 2026-10-16
+Last Modified: 2026-10-16
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation — bounded yielding WorkQueueBackend consumer
+
+Related:
+    - queue_backend.py — WorkQueueBackend claim / complete contract
+    - work_queue.py / postgres_queue.py — the backends
+    - api/v1/chat/formation_queue.py — the memory-formation wiring
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+from runtime.workers.queue_backend import TaskEnvelope, WorkQueueBackend
+
+logger = logging.getLogger(__name__)
+
+JobHandler = Callable[[TaskEnvelope], Awaitable["dict[str, Any] | None"]]
+
+
+@dataclass(frozen=True)
+class WorkerPoolConfig:
+    concurrency: int = 2
+    busy_concurrency: int = 1
+    poll_interval_sec: float = 1.0
+
+
+class WorkerPool:
+    """Bounded consumer of a WorkQueueBackend (see module docstring)."""
+
+    def __init__(
+        self,
+        backend: WorkQueueBackend,
+        handler: JobHandler,
+        config: WorkerPoolConfig | None = None,
+        *,
+        busy: Callable[[], bool] | None = None,
+    ) -> None:
+        self.backend = backend
+        self.handler = handler
+        self.config = config or WorkerPoolConfig()
+        self._busy = busy
+        self._in_flight: set[asyncio.Task[None]] = set()
+        self._stop = asyncio.Event()
+        self._runner: asyncio.Task[None] | None = None
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._in_flight)
+
+    def _limit(self) -> int:
+        limit = max(self.config.concurrency, 1)
+        if self._busy is not None and self._busy():
+            limit = min(limit, max(self.config.busy_concurrency, 0))
+        return limit
+
+    async def run_once(self) -> int:
+        """Claim up to the free slots and start those jobs; return how many started."""
+        free = self._limit() - len(self._in_flight)
+        if free <= 0:
+            return 0
+        envelopes = await self.backend.claim(limit=free)
+        for envelope in envelopes:
+            task = asyncio.create_task(self._execute(envelope))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+        return len(envelopes)
+
+    async def _execute(self, envelope: TaskEnvelope) -> None:
+        try:
+            result = await self.handler(envelope)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # noqa: BLE001 — handler failure goes to the retry policy
+            logger.warning(
+                "worker pool: job %s (tenant %s) failed: %s",
+                envelope.task_id,
+                envelope.tenant_id,
+                exc,
+            )
+            await self._complete(envelope.task_id, error=f"{type(exc).__name__}: {exc}")
+            return
+        await self._complete(envelope.task_id, result=result)
+
+    async def _complete(
+        self,
+        task_id: str,
+        *,
+        result: dict[str, Any] | None = None,
+        error: str | None = None,
+    ) -> None:
+        try:
+            await self.backend.complete(task_id, result=result, error=error)
+        except Exception:  # noqa: BLE001 — an unrecorded outcome is re-run after the lease
+            logger.exception("worker pool: recording the outcome of job %s failed", task_id)
+
+    async def drain(self) -> None:
+        """Wait for every in-flight job (tests / shutdown)."""
+        while self._in_flight:
+            await asyncio.gather(*list(self._in_flight), return_exceptions=True)
+
+    async def _wait(self) -> None:
+        """Sleep one poll interval; a finishing job or stop() ends the wait early."""
+        waiters: set[asyncio.Future[Any]] = set(self._in_flight)
+        stop = asyncio.ensure_future(self._stop.wait())
+        waiters.add(stop)
+        try:
+            await asyncio.wait(
+                waiters,
+                timeout=self.config.poll_interval_sec,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
+        finally:
+            stop.cancel()
+
+    async def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                started = await self.run_once()
+            except Exception:  # noqa: BLE001 — a claim flake must not kill the pool
+                logger.exception("worker pool: claim failed")
+                started = 0
+            if started == 0:
+                await self._wait()
+            else:
+                await asyncio.sleep(0)
+
+    def start(self) -> None:
+        """Start the poll loop in the background (idempotent)."""
+        if self._runner is None or self._runner.done():
+            self._stop.clear()
+            self._runner = asyncio.create_task(self._run())
+
+    async def stop(self, *, timeout: float = 10.0) -> None:
+        """Stop claiming, then wait up to `timeout` for in-flight jobs (the rest are cancelled)."""
+        self._stop.set()
+        if self._runner is not None:
+            await self._runner
+            self._runner = None
+        if not self._in_flight:
+            return
+        pending = list(self._in_flight)
+        _, late = await asyncio.wait(pending, timeout=timeout)
+        for task in late:
+            task.cancel()
+        if late:
+            await asyncio.gather(*late, return_exceptions=True)
+
+
+__all__ = ["JobHandler", "WorkerPool", "WorkerPoolConfig"]
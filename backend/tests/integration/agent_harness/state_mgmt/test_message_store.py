@@ -12,6 +12,8 @@ Description:
     - tenant isolation: a store bound to tenant_b cannot load tenant_a's rows
     - append() survives the request session being rolled back (the user-Stop case)
     - make_chat_message_store None-guard (legacy / test callers)
+    - compaction checkpoint: load() = summary + tail; load_since(0) = full ledger
+    - batched append: counter-allocated sequence_nums, disjoint under concurrency
 
     Sprint 57.143 ctor change: DBMessageStore now takes a session FACTORY and
     opens its OWN tenant-scoped session per call (set_config + commit). So the
@@ -27,12 +29,15 @@ Pre-requisite (per tests/conftest.py):
 Created: 2026-06-16 (Sprint 57.127)
 
 Modification History (newest-first):
+    - 2026-10-16: batched append — counter allocation + concurrent-append test
+    - 2026-10-16: checkpointed load() + forward-only save_checkpoint() tests
     - 2026-06-25: Sprint 57.143 — own-session ctor + committed-seed fixture + durability test
     - 2026-06-16: Initial creation (Sprint 57.127)
 """
 
 from __future__ import annotations
 
+import asyncio
 from collections.abc import AsyncIterator
 from uuid import uuid4
 
@@ -42,7 +47,7 @@ from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent_harness._contracts import Message, ToolCall
-from agent_harness.state_mgmt import DBMessageStore
+from agent_harness.state_mgmt import LEDGER_SEQ_KEY, DBMessageStore
 from api.v1.chat._category_factories import make_chat_message_store
 from infrastructure.db import get_session_factory
 from infrastructure.db.models import Session as SessionModel
@@ -182,6 +187,75 @@ async def test_append_empty_is_noop(committed_session: tuple[object, object]) ->
     assert await store.load() == []
 
 
+@pytest.mark.asyncio
+async def test_checkpoint_windows_load_keeps_full_ledger(
+    committed_session: tuple[object, object],
+) -> None:
+    """With checkpoints on, load() returns the checkpoint summary + only the rows
+    after it; the covered rows stay readable via load_since(0) (replay / audit),
+    and an older checkpoint never overwrites a newer one."""
+    sid, tid = committed_session
+    store = DBMessageStore(get_session_factory(), session_id=sid, tenant_id=tid, checkpoints=True)
+    await store.append(
+        [
+            Message(role="user", content="q1"),
+            Message(role="assistant", content="a1"),
+            Message(role="user", content="q2"),
+            Message(role="assistant", content="a2"),
+        ],
+        turn_num=0,
+    )
+    summary = Message(role="assistant", content="q1/a1 summary")
+    await store.save_checkpoint(summary, through_sequence_num=2)
+    # A stale save (covers less) is ignored.
+    await store.save_checkpoint(Message(role="assistant", content="stale"), through_sequence_num=1)
+
+    loaded = await store.load()
+    assert [m.content for m in loaded] == ["q1/a1 summary", "q2", "a2"]
+    assert loaded[0].metadata["compacted_summary"] is True
+    assert [m.metadata[LEDGER_SEQ_KEY] for m in loaded] == [2, 3, 4]
+
+    full, last_seq = await store.load_since(0)
+    assert [m.content for m in full] == ["q1", "a1", "q2", "a2"]
+    assert last_seq == 4
+
+    # Checkpoints off → the same ledger loads in full (the checkpoint is ignored).
+    plain = DBMessageStore(get_session_factory(), session_id=sid, tenant_id=tid)
+    assert [m.content for m in await plain.load()] == ["q1", "a1", "q2", "a2"]
+
+
+@pytest.mark.asyncio
+async def test_batched_append_allocates_from_session_counter(
+    committed_session: tuple[object, object],
+) -> None:
+    """append() allocates sequence_nums from sessions.last_message_seq in one
+    statement: concurrent batches get disjoint, gapless ranges, each message is
+    stamped with its sequence_num, and the counter ends at the ledger MAX."""
+    sid, tid = committed_session
+    store = DBMessageStore(get_session_factory(), session_id=sid, tenant_id=tid)
+    batches = [
+        [Message(role="user", content=f"q{i}"), Message(role="assistant", content=f"a{i}")]
+        for i in range(4)
+    ]
+
+    await asyncio.gather(*(store.append(batch, turn_num=i) for i, batch in enumerate(batches)))
+
+    stamped = sorted(m.metadata[LEDGER_SEQ_KEY] for batch in batches for m in batch)
+    assert stamped == list(range(1, 9))
+    for batch in batches:  # a batch's rows are contiguous and in order
+        assert batch[1].metadata[LEDGER_SEQ_KEY] == batch[0].metadata[LEDGER_SEQ_KEY] + 1
+    _, last_seq = await store.load_since(0)
+    assert last_seq == 8
+    async with get_session_factory()() as s:
+        await s.execute(text("SELECT set_config('app.tenant_id', :tid, true)"), {"tid": str(tid)})
+        counter = (
+            await s.execute(
+                text("SELECT last_message_seq FROM sessions WHERE id = :sid"), {"sid": str(sid)}
+            )
+        ).scalar_one()
+    assert counter == 8
+
+
 def test_factory_none_guard() -> None:
     """make_chat_message_store returns None when db / session / tenant is missing."""
     sid, tid = uuid4(), uuid4()
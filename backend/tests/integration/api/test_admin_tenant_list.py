@@ -13,6 +13,7 @@ Description:
     - 200 filter by plan — only matching tenants returned
     - 200 search by ILIKE on code substring
     - 200 pagination limit + offset behavior
+    - 200 keyset cursor pages (total skipped) + NDJSON streaming mode
     - 200 empty result for non-matching search
     - Response shape matches TenantListResponse
 
@@ -24,6 +25,7 @@ Description:
 Created: 2026-05-07 (Sprint 57.4 Day 1)
 
 Modification History (newest-first):
+    - 2026-10-16: keyset cursor + NDJSON list tests
     - 2026-05-26: Sprint 57.47 Day 1 — shape 7→12 fields + region filter tests (AD-AdminT-Ext)
 """
 
@@ -262,6 +264,38 @@ async def test_list_tenants_pagination(db_session: AsyncSession) -> None:
     assert ids1.isdisjoint(ids2)
 
 
+async def test_list_tenants_cursor_pagination(db_session: AsyncSession) -> None:
+    """next_cursor seeks the next slice; a cursor page skips the count (total None)."""
+    for i in range(3):
+        await _seed_tenant_with(db_session, code=f"CURSOR_{i}")
+    app = _build_app(db_session=db_session)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        page1 = (await ac.get("/api/v1/admin/tenants?search=CURSOR_&limit=2")).json()
+        url = f"/api/v1/admin/tenants?search=CURSOR_&limit=2&cursor={page1['next_cursor']}"
+        page2 = (await ac.get(url)).json()
+    assert page1["total"] == 3 and page1["next_cursor"] is not None
+    assert page2["total"] is None and page2["next_cursor"] is None
+    assert len(page2["items"]) == 1
+    ids1 = {item["id"] for item in page1["items"]}
+    assert ids1.isdisjoint({item["id"] for item in page2["items"]})
+
+
+async def test_list_tenants_ndjson_streams_matches(db_session: AsyncSession) -> None:
+    for i in range(3):
+        await _seed_tenant_with(db_session, code=f"NDJSON_{i}")
+    app = _build_app(db_session=db_session)
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as ac:
+        resp = await ac.get(
+            "/api/v1/admin/tenants?search=NDJSON_&limit=1",
+            headers={"Accept": "application/x-ndjson"},
+        )
+    assert resp.status_code == 200
+    codes = sorted(json.loads(line)["code"] for line in resp.text.splitlines())
+    assert codes == ["NDJSON_0", "NDJSON_1", "NDJSON_2"]
+
+
 async def test_list_tenants_empty_filter(db_session: AsyncSession) -> None:
     """Search with no match → items=[] + total=0."""
     await _seed_tenant_with(db_session, code="EXISTING_CODE")
@@ -7,7 +7,7 @@ Scope: Phase 57 / Sprint 57.128 (AD-ChatV2-Resume-Transcript-Persistence)
 Description:
     Drives the REAL `_stream_resume_events` with a fake loop whose `resume()`
     yields post-resume LoopEvents. Closes AD-ChatV2-Resume-Transcript-Persistence
-    — before this, `_stream_resume_events` omitted the `_persist_main_event` call
+    — before this, `_stream_resume_events` omitted the transcript persist
     its send-path sibling `_stream_loop_events` has, so a paused-then-resumed
     session's replay stopped at the pause. Asserts:
     - each serializable post-resume event → a `message_events` row keyed by the
@@ -21,6 +21,7 @@ Description:
 Created: 2026-06-16 (Sprint 57.128)
 
 Modification History (newest-first):
+    - 2026-10-16: pre-pause rows seeded through TranscriptWriter (_persist_main_event removed)
     - 2026-06-16: Initial creation (Sprint 57.128 — resume transcript writer)
 
 Related:
@@ -40,7 +41,8 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from agent_harness._contracts import LoopCompleted, LoopEvent, TraceContext
 from agent_harness._contracts.events import LLMRequested, Thinking, TurnStarted
-from api.v1.chat.router import _persist_main_event, _stream_resume_events
+from api.v1.chat.router import _stream_resume_events
+from api.v1.chat.transcript_writer import TranscriptWriter
 from infrastructure.db.models.sessions import MessageEvent
 from infrastructure.db.models.sessions import Session as SessionModel
 from tests.conftest import seed_tenant, seed_user
@@ -132,14 +134,14 @@ async def test_resume_seq_continues_past_pre_pause_max(
     user = await seed_user(db_session, tenant, email="resume@seq.test")
     session_id = await _seed_main_session(db_session, tenant_id=tenant.id, user_id=user.id)
     # Simulate the pre-pause events the original send already persisted (seq 1..5).
+    writer = TranscriptWriter(tenant_id=tenant.id, db=db_session)
     for i in range(1, 6):
-        await _persist_main_event(
-            {"type": "turn_start", "data": {"turn_num": 0}},
-            db=db_session,
-            tenant_id=tenant.id,
+        writer.add_event(
             session_id=session_id,
+            payload={"type": "turn_start", "data": {"turn_num": 0}},
             sequence_num=i,
         )
+    await writer.aclose()
 
     await _drive_resume(db_session, tenant_id=tenant.id, session_id=session_id, user_id=user.id)
 
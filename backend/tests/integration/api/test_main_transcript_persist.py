@@ -25,7 +25,7 @@ Modification History (newest-first):
     - 2026-06-16: Initial creation (Sprint 57.125 — main transcript writer)
 
 Related:
-    - api/v1/chat/router.py (_persist_main_event + _stream_loop_events)
+    - api/v1/chat/router.py (_stream_loop_events + its TranscriptWriter)
     - api/v1/sessions.py (GET /{id}/events reader)
     - sprint-57-125-plan.md §3.1
 """
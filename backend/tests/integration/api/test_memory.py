@@ -13,11 +13,12 @@ Description:
     - Layer routing: tenant + user + system fully wired; role + session 501
     - Scope mismatch: tenant scope_id != current_tenant → 404
     - Time-scale filter: by-time only on layer=user (others → 400)
-    - Pagination: cursor-style has_more + next_offset
+    - Pagination: cursor-style has_more + next_offset; keyset `cursor` (no total)
 
 Created: 2026-05-10 (Sprint 57.12 Day 1 / US-2)
 
 Modification History (newest-first):
+    - 2026-10-16: keyset cursor page test
     - 2026-05-10: Initial creation (Sprint 57.12 Day 1 / US-2)
 
 Related:
@@ -200,6 +201,28 @@ async def test_recent_pagination_has_more(db_session: AsyncSession) -> None:
     assert body["next_offset"] == 2
 
 
+async def test_recent_cursor_pages_skip_count(db_session: AsyncSession) -> None:
+    tenant = await seed_tenant(db_session, code="MEM_CURSOR")
+    user = await seed_user(db_session, tenant, email="cursor@mem.test")
+    for i in range(5):
+        await _seed_user_memory(db_session, tenant=tenant, user_id=user.id, content=f"e{i}")
+    app = _build_app(db_session=db_session, tenant_id=tenant.id, audit_user_id=uuid4())
+    async with await _client(app) as ac:
+        first = (await ac.get("/api/v1/memory/recent?layer=user&limit=2")).json()
+        rest = (
+            await ac.get(f"/api/v1/memory/recent?layer=user&limit=10&cursor={first['next_cursor']}")
+        ).json()
+        both = await ac.get(
+            f"/api/v1/memory/recent?layer=user&offset=2&cursor={first['next_cursor']}"
+        )
+    assert first["total"] == 5 and first["next_cursor"] is not None
+    assert rest["total"] is None
+    assert rest["has_more"] is False and rest["next_cursor"] is None
+    seen = [item["id"] for item in first["items"] + rest["items"]]
+    assert len(seen) == len(set(seen)) == 5
+    assert both.status_code == 400
+
+
 async def test_recent_tenant_layer_isolation(db_session: AsyncSession) -> None:
     """Tenant A's tenant-layer memory is invisible to tenant B."""
     tenant_a = await seed_tenant(db_session, code="MEM_ISO_A")
@@ -11,20 +11,24 @@ Description:
     - Cross-tenant session → 200 + [] (never 404; never reveal existence; 鐵律)
     - Unknown session id → 200 + []
     - Item shape == {type, data, sequence_num, timestamp_ms} (the 57.126 replay contract)
+    - `limit` pages by a (session_id, sequence_num) cursor; a foreign cursor → 400
+    - NDJSON mode streams the transcript one event per line
 
 Created: 2026-06-16 (Sprint 57.125)
 
 Modification History (newest-first):
+    - 2026-10-16: keyset cursor paging + NDJSON export
     - 2026-06-16: Initial creation (Sprint 57.125 — history replay reader)
 
 Related:
     - api/v1/sessions.py (GET /{id}/events — list_session_events)
-    - api/v1/chat/router.py (_persist_main_event — the writer)
+    - api/v1/chat/router.py (_stream_loop_events — the writer, via TranscriptWriter)
     - sprint-57-125-plan.md §3.3
 """
 
 from __future__ import annotations
 
+import json
 from collections.abc import AsyncIterator
 from typing import Any
 from uuid import UUID, uuid4
@@ -34,6 +38,7 @@ from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.v1.pagination import encode_cursor
 from api.v1.sessions import router as sessions_router
 from infrastructure.db.models import Tenant
 from infrastructure.db.models.sessions import MessageEvent
@@ -161,3 +166,45 @@ async def test_events_unknown_session_returns_empty(db_session: AsyncSession) ->
         resp = await ac.get(f"/api/v1/sessions/{uuid4()}/events")
     assert resp.status_code == 200
     assert resp.json()["events"] == []
+
+
+async def _seed_transcript(db: AsyncSession, code: str, n: int) -> tuple[Tenant, UUID]:
+    tenant = await seed_tenant(db, code=code)
+    user = await seed_user(db, tenant, email=f"ev@{code.lower()}.test")
+    sid = await _seed_session(db, tenant=tenant, user_id=user.id)
+    for seq in range(1, n + 1):
+        await _seed_event(
+            db, tenant_id=tenant.id, session_id=sid, event_type="turn_start", seq=seq
+        )
+    return tenant, sid
+
+
+async def test_events_paged_by_cursor(db_session: AsyncSession) -> None:
+    tenant, sid = await _seed_transcript(db_session, "SESSEV_PAGE", 5)
+    app = _build_app(db_session=db_session, tenant_id=tenant.id)
+    async with _client(app) as ac:
+        first = (await ac.get(f"/api/v1/sessions/{sid}/events?limit=2")).json()
+        rest = (
+            await ac.get(f"/api/v1/sessions/{sid}/events?limit=10&cursor={first['next_cursor']}")
+        ).json()
+        foreign = await ac.get(
+            f"/api/v1/sessions/{sid}/events?cursor={encode_cursor(uuid4(), 2)}"
+        )
+    assert [e["sequence_num"] for e in first["events"]] == [1, 2]
+    assert [e["sequence_num"] for e in rest["events"]] == [3, 4, 5]
+    assert rest["next_cursor"] is None
+    assert foreign.status_code == 400
+
+
+async def test_events_ndjson_export(db_session: AsyncSession) -> None:
+    tenant, sid = await _seed_transcript(db_session, "SESSEV_NDJSON", 4)
+    app = _build_app(db_session=db_session, tenant_id=tenant.id)
+    async with _client(app) as ac:
+        resp = await ac.get(
+            f"/api/v1/sessions/{sid}/events?cursor={encode_cursor(sid, 1)}",
+            headers={"Accept": "application/x-ndjson"},
+        )
+    assert resp.status_code == 200
+    events = [json.loads(line) for line in resp.text.splitlines()]
+    assert [e["sequence_num"] for e in events] == [2, 3, 4]
+    assert set(events[0].keys()) == {"type", "data", "sequence_num", "timestamp_ms"}
@@ -11,10 +11,12 @@ Description:
     - Sidechain rows (is_sidechain=True subagent transcripts) are excluded
     - Tenant isolation: tenant B sees none of tenant A's sessions (鐵律)
     - Empty tenant → empty list (200, not 404)
+    - Keyset pages via next_cursor; NDJSON mode streams every session
 
 Created: 2026-06-12 (Sprint 57.107 Day 2 / US-3)
 
 Modification History (newest-first):
+    - 2026-10-16: keyset cursor paging + NDJSON mode
     - 2026-06-12: Initial creation (Sprint 57.107 Day 2 / US-3)
 
 Related:
@@ -25,6 +27,7 @@ Related:
 
 from __future__ import annotations
 
+import json
 from collections.abc import AsyncIterator
 from datetime import datetime, timedelta, timezone
 from uuid import UUID
@@ -170,3 +173,45 @@ async def test_list_sessions_empty_tenant_returns_empty_list(db_session: AsyncSe
         resp = await ac.get("/api/v1/sessions")
     assert resp.status_code == 200
     assert resp.json()["sessions"] == []
+
+
+async def test_list_sessions_keyset_pages_follow_next_cursor(db_session: AsyncSession) -> None:
+    """limit=2 → first page + next_cursor; the cursor page holds the rest, no cursor."""
+    tenant = await seed_tenant(db_session, code="SESSLIST_KEYSET")
+    user = await seed_user(db_session, tenant, email="list@keyset.test")
+    t0 = datetime(2026, 6, 12, 10, 0, tzinfo=timezone.utc)
+    rows = [
+        await _seed_session(
+            db_session, tenant=tenant, user_id=user.id, started_at=t0 + timedelta(minutes=i)
+        )
+        for i in range(3)
+    ]
+
+    app = _build_app(db_session=db_session, tenant_id=tenant.id)
+    async with _client(app) as ac:
+        first = (await ac.get("/api/v1/sessions?limit=2")).json()
+        second = (await ac.get(f"/api/v1/sessions?limit=2&cursor={first['next_cursor']}")).json()
+        bad = await ac.get("/api/v1/sessions?cursor=not-a-cursor")
+    assert [s["id"] for s in first["sessions"]] == [str(rows[2].id), str(rows[1].id)]
+    assert first["next_cursor"] is not None
+    assert [s["id"] for s in second["sessions"]] == [str(rows[0].id)]
+    assert second["next_cursor"] is None
+    assert bad.status_code == 400
+
+
+async def test_list_sessions_ndjson_streams_all_rows(db_session: AsyncSession) -> None:
+    tenant = await seed_tenant(db_session, code="SESSLIST_NDJSON")
+    user = await seed_user(db_session, tenant, email="list@ndjson.test")
+    for _ in range(3):
+        await _seed_session(db_session, tenant=tenant, user_id=user.id)
+
+    app = _build_app(db_session=db_session, tenant_id=tenant.id)
+    async with _client(app) as ac:
+        resp = await ac.get(
+            "/api/v1/sessions?limit=1", headers={"Accept": "application/x-ndjson"}
+        )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert len(lines) == 3  # NDJSON ignores limit
+    assert {"id", "started_at_ms", "total_turns"} <= set(lines[0])
@@ -22,6 +22,7 @@ Description:
     in the drive-through, not assertable in a single-txn test.
 
 Created: 2026-06-30 (Sprint 57.151)
+Last Modified: 2026-10-16 (load_state + last_summarized_seq watermark, 0035)
 """
 
 from __future__ import annotations
@@ -210,3 +211,60 @@ async def test_recent_for_user_empty_when_none(db_session: AsyncSession) -> None
         tenant_id=t.id, user_id=u.id, exclude_session_id=None, limit=10
     )
     assert rows == []
+
+
+async def test_watermark_round_trip_and_untouched_when_omitted(db_session: AsyncSession) -> None:
+    """upsert_summary(last_summarized_seq=) persists the watermark (0035); a later
+    upsert without it keeps the stored value; load_state reads both back."""
+    t = await seed_tenant(db_session, code="SUMM_WM")
+    u = await seed_user(db_session, t, email="wm@summ.test")
+    sid = await _seed_session(db_session, t.id, u.id)
+    store = DBSessionSummaryStore(_shared_factory(db_session))  # type: ignore[arg-type]
+
+    assert await store.load_state(sid) is None
+    await store.upsert_summary(
+        session_id=sid,
+        summary="first",
+        key_decisions=["a"],
+        unresolved_issues=[],
+        last_summarized_seq=6,
+    )
+    await store.upsert_summary(
+        session_id=sid, summary="second", key_decisions=["a"], unresolved_issues=["x"]
+    )
+
+    state = await store.load_state(sid)
+    assert state is not None
+    assert state.summary == "second"
+    assert state.unresolved_issues == ["x"]
+    assert state.last_summarized_seq == 6
+
+
+async def test_watermark_never_moves_backwards(db_session: AsyncSession) -> None:
+    """A write carrying an older watermark (a slower concurrent send) is dropped;
+    the newer summary and its watermark stay."""
+    t = await seed_tenant(db_session, code="SUMM_WM_MONO")
+    u = await seed_user(db_session, t, email="mono@summ.test")
+    sid = await _seed_session(db_session, t.id, u.id)
+    store = DBSessionSummaryStore(_shared_factory(db_session))  # type: ignore[arg-type]
+
+    id1 = await store.upsert_summary(
+        session_id=sid,
+        summary="newer",
+        key_decisions=[],
+        unresolved_issues=[],
+        last_summarized_seq=9,
+    )
+    id2 = await store.upsert_summary(
+        session_id=sid,
+        summary="older",
+        key_decisions=[],
+        unresolved_issues=[],
+        last_summarized_seq=4,
+    )
+
+    assert id1 == id2
+    state = await store.load_state(sid)
+    assert state is not None
+    assert state.summary == "newer"
+    assert state.last_summarized_seq == 9
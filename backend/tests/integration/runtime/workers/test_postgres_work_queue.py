@@ -0,0 +1,155 @@
+"""
+File: backend/tests/integration/runtime/workers/test_postgres_work_queue.py
+Purpose: PostgresWorkQueue integration — coalescing upsert, key exclusion, retry, lease recovery,
+    finished-row pruning.
+Category: Tests / Integration (runtime.workers)
+Created: 2026-10-16
+
+Why integration: the queue opens its own short transactions (ON CONFLICT upsert,
+FOR UPDATE SKIP LOCKED claim) on a session factory, so it only sees COMMITTED
+rows. Seed data is committed through a dedicated NullPool engine and removed in
+the fixture teardown (mirrors tests/integration/billing/test_billing_outbox_drain.py).
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from uuid import UUID, uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import delete, text, update
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.pool import NullPool
+
+from core.config import get_settings
+from infrastructure.db.models import Tenant
+from infrastructure.db.models.work_queue import WorkQueueJob
+from runtime.workers import TaskEnvelope, TaskStatus
+from runtime.workers.postgres_queue import SYSTEM_SENTINEL_TENANT, PostgresWorkQueue
+
+pytestmark = pytest.mark.asyncio
+
+_engine: AsyncEngine | None = None
+
+
+def _get_factory() -> async_sessionmaker[AsyncSession]:
+    global _engine
+    if _engine is None:
+        _engine = create_async_engine(get_settings().database_url, poolclass=NullPool)
+    return async_sessionmaker(_engine, expire_on_commit=False)
+
+
+@pytest_asyncio.fixture
+async def tenant_id() -> AsyncIterator[UUID]:
+    global _engine
+    factory = _get_factory()
+    code = f"wq-{uuid4().hex[:8]}"
+    async with factory() as s:
+        tenant = Tenant(code=code, display_name=code)
+        s.add(tenant)
+        await s.flush()
+        tid = tenant.id
+        await s.commit()
+    try:
+        yield tid
+    finally:
+        async with factory() as s:
+            await s.execute(text("SELECT set_config('app.tenant_id', :t, true)"), {"t": str(tid)})
+            await s.execute(delete(WorkQueueJob).where(WorkQueueJob.tenant_id == tid))
+            await s.execute(delete(Tenant).where(Tenant.id == tid))
+            await s.commit()
+        if _engine is not None:
+            await _engine.dispose()
+            _engine = None
+
+
+def _job(tenant_id: UUID, key: str, n: int) -> TaskEnvelope:
+    return TaskEnvelope.new(
+        tenant_id=str(tenant_id),
+        payload={"n": n},
+        trace_id=f"trace-{n}",
+        coalesce_key=f"{tenant_id}:{key}",
+    )
+
+
+def _queue() -> PostgresWorkQueue:
+    # A unique queue name per test keeps claims away from other tests' rows.
+    return PostgresWorkQueue(_get_factory(), f"test-{uuid4().hex[:8]}", retry_backoff_sec=0)
+
+
+async def test_latest_submit_supersedes_and_running_key_is_excluded(tenant_id: UUID) -> None:
+    queue = _queue()
+    first = await queue.submit(_job(tenant_id, "s1", 1))
+    assert await queue.submit(_job(tenant_id, "s1", 2)) == first
+    [running] = await queue.claim(limit=5)
+    assert running.task_id == first and running.payload == {"n": 2}
+
+    follow_up = await queue.submit(_job(tenant_id, "s1", 3))  # queues behind the running job
+    assert follow_up != first
+    assert await queue.claim(limit=5) == []
+    await queue.complete(first, result={"ok": True})
+    assert (await queue.poll(first)).status is TaskStatus.COMPLETED
+    [next_job] = await queue.claim(limit=5)
+    assert next_job.task_id == follow_up
+
+
+async def test_failure_retries_then_fails(tenant_id: UUID) -> None:
+    queue = _queue()
+    task_id = await queue.submit(
+        TaskEnvelope.new(
+            tenant_id=str(tenant_id), payload={}, trace_id="t", coalesce_key="k", max_retries=1
+        )
+    )
+    for _ in range(2):
+        [job] = await queue.claim(limit=1)
+        await queue.complete(job.task_id, error="boom")
+    result = await queue.poll(task_id)
+    assert result.status is TaskStatus.FAILED and result.error == "boom"
+
+
+async def test_expired_lease_is_requeued(tenant_id: UUID) -> None:
+    queue = _queue()
+    task_id = await queue.submit(_job(tenant_id, "s1", 1))
+    await queue.claim(limit=1)
+    async with _get_factory()() as s:  # simulate a crashed worker
+        await s.execute(
+            text("SELECT set_config('app.tenant_id', :t, true)"), {"t": SYSTEM_SENTINEL_TENANT}
+        )
+        await s.execute(
+            update(WorkQueueJob)
+            .where(WorkQueueJob.task_id == task_id)
+            .values(lease_until=text("now() - interval '1 second'"))
+        )
+        await s.commit()
+    [job] = await queue.claim(limit=1)
+    assert job.task_id == task_id
+    assert (await queue.poll(task_id)).retries == 1
+
+
+async def test_sweep_prunes_old_failed_rows(tenant_id: UUID) -> None:
+    queue = _queue()
+    task_id = await queue.submit(
+        TaskEnvelope.new(
+            tenant_id=str(tenant_id), payload={}, trace_id="t", coalesce_key="k", max_retries=0
+        )
+    )
+    [job] = await queue.claim(limit=1)
+    await queue.complete(job.task_id, error="boom")
+    async with _get_factory()() as s:  # age the failed row past the retention window
+        await s.execute(
+            text("SELECT set_config('app.tenant_id', :t, true)"), {"t": SYSTEM_SENTINEL_TENANT}
+        )
+        await s.execute(
+            update(WorkQueueJob)
+            .where(WorkQueueJob.task_id == task_id)
+            .values(finished_at=text("now() - interval '2 days'"))
+        )
+        await s.commit()
+    assert await queue.claim(limit=1) == []  # claim runs the sweep
+    assert (await queue.poll(task_id)).error == "unknown task_id"
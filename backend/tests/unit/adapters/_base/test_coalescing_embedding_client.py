@@ -0,0 +1,190 @@
+"""
+File: backend/tests/unit/adapters/_base/test_coalescing_embedding_client.py
+Purpose: Unit tests for CoalescingEmbeddingClient (micro-batching + two-tier vector cache).
+Category: Tests / Adapters
+
+Description:
+    A counting EmbeddingClient double records every provider call:
+    - concurrent single-text embeds coalesce into one call; duplicates embed once;
+    - repeats are memory hits (zero calls); a fresh wrapper is served by the
+      shared tier (fakeredis / on-disk) with bit-identical vectors;
+    - a large list is split at max_batch and flushed as concurrent batches;
+    - a provider error fails the waiters of that batch only; a broken tier fails open;
+    - the TPM limiter delays once the trailing-minute budget is spent;
+    - embed_in_batches hands a self_batching client the whole list, chunks otherwise.
+
+Modification History (newest-first):
+    - 2026-10-16: embed_in_batches coverage
+    - 2026-10-16: Initial creation (embedding coalescer + cache)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import AsyncIterator
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from adapters._base import coalescing_embedding_client as module
+from adapters._base.coalescing_embedding_client import (
+    CoalescingEmbeddingClient,
+    DiskEmbeddingCacheStore,
+    EmbeddingCacheStore,
+    RedisEmbeddingCacheStore,
+    TokenRateLimiter,
+    embed_in_batches,
+)
+from adapters._base.embedding_client import EmbeddingClient
+from adapters._testing.embedding import DeterministicEmbeddingClient
+
+
+class _CountingEmbedder(EmbeddingClient):
+    def __init__(self, *, fail_on: str | None = None, delay: float = 0.0) -> None:
+        self._real = DeterministicEmbeddingClient(dim=8)
+        self.calls: list[list[str]] = []
+        self._fail_on = fail_on
+        self._delay = delay
+        self.max_parallel = 0
+        self._active = 0
+
+    async def embed(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append(list(texts))
+        self._active += 1
+        self.max_parallel = max(self.max_parallel, self._active)
+        try:
+            await asyncio.sleep(self._delay)
+            if self._fail_on is not None and self._fail_on in texts:
+                raise RuntimeError("provider 500")
+            return await self._real.embed(texts)
+        finally:
+            self._active -= 1
+
+    def model_name(self) -> str:
+        return "counting-8d"
+
+
+async def test_concurrent_queries_coalesce_into_one_call() -> None:
+    inner = _CountingEmbedder()
+    client = CoalescingEmbeddingClient(inner=inner, window_ms=20)
+
+    results = await asyncio.gather(
+        client.embed(["alpha"]), client.embed(["beta"]), client.embed(["alpha", "gamma"])
+    )
+
+    assert len(inner.calls) == 1
+    assert sorted(inner.calls[0]) == ["alpha", "beta", "gamma"]  # "alpha" embedded once
+    expected = await DeterministicEmbeddingClient(dim=8).embed(["alpha", "beta", "gamma"])
+    assert results == [[expected[0]], [expected[1]], [expected[0], expected[2]]]
+
+
+async def test_repeat_is_a_memory_hit() -> None:
+    inner = _CountingEmbedder()
+    client = CoalescingEmbeddingClient(inner=inner, window_ms=0)
+
+    first = await client.embed(["what is our refund policy?"])
+    second = await client.embed(["what is our refund policy?"])
+
+    assert first == second
+    assert len(inner.calls) == 1
+    assert (client.stats.memory_hits, client.stats.misses, client.stats.api_calls) == (1, 1, 1)
+
+
+@pytest.fixture(params=["redis", "disk"])
+async def store(
+    request: pytest.FixtureRequest, tmp_path: Path
+) -> AsyncIterator[EmbeddingCacheStore]:
+    if request.param == "disk":
+        yield DiskEmbeddingCacheStore(tmp_path / "emb")
+        return
+    redis = FakeRedis(decode_responses=False)
+    yield RedisEmbeddingCacheStore(redis, ttl_seconds=60)
+    await redis.aclose()
+
+
+async def test_shared_tier_serves_a_fresh_wrapper(store: EmbeddingCacheStore) -> None:
+    sections = [f"section {i}" for i in range(5)]
+    warm = CoalescingEmbeddingClient(inner=_CountingEmbedder(), store=store, window_ms=0)
+    vectors = await warm.embed(sections)
+    await warm.drain()  # the shared-tier write completes after embed() returns
+
+    inner = _CountingEmbedder()
+    cold = CoalescingEmbeddingClient(inner=inner, store=store, window_ms=0)
+    assert await cold.embed(sections) == vectors  # float64 round trip is exact
+    assert inner.calls == []  # unchanged re-ingest costs zero API calls
+    assert cold.stats.store_hits == 5
+
+
+async def test_large_input_is_split_into_concurrent_batches() -> None:
+    inner = _CountingEmbedder(delay=0.01)
+    client = CoalescingEmbeddingClient(inner=inner, window_ms=5, max_batch=4, max_concurrency=3)
+    texts = [f"t{i}" for i in range(10)]
+
+    vectors = await client.embed(texts)
+
+    assert vectors == await DeterministicEmbeddingClient(dim=8).embed(texts)
+    assert sorted(len(call) for call in inner.calls) == [2, 4, 4]
+    assert inner.max_parallel == 3
+    assert client.self_batching
+
+
+async def test_embed_in_batches_chunks_only_plain_embedders() -> None:
+    texts = [f"t{i}" for i in range(5)]
+    plain = _CountingEmbedder()
+    assert await embed_in_batches(plain, texts, batch_size=2) == await plain._real.embed(texts)
+    assert [len(call) for call in plain.calls] == [2, 2, 1]
+
+    inner = _CountingEmbedder()
+    client = CoalescingEmbeddingClient(inner=inner, window_ms=5, max_batch=16)
+    await embed_in_batches(client, texts, batch_size=2)
+    assert [len(call) for call in inner.calls] == [5]  # the coalescer paces its own batches
+
+
+async def test_provider_error_fails_only_its_batch() -> None:
+    inner = _CountingEmbedder(fail_on="bad")
+    client = CoalescingEmbeddingClient(inner=inner, window_ms=0)
+
+    with pytest.raises(RuntimeError, match="provider 500"):
+        await client.embed(["bad"])
+    assert await client.embed(["good"]) == await DeterministicEmbeddingClient(dim=8).embed(["good"])
+    with pytest.raises(RuntimeError):
+        await client.embed(["bad"])  # a failure is never cached
+    assert len(inner.calls) == 3
+
+
+class _BrokenStore:
+    async def get_many(self, keys: list[str]) -> dict[str, list[float]]:
+        raise ConnectionError("redis down")
+
+    async def set_many(self, items: dict[str, list[float]]) -> None:
+        raise ConnectionError("redis down")
+
+
+async def test_broken_store_fails_open() -> None:
+    inner = _CountingEmbedder()
+    client = CoalescingEmbeddingClient(inner=inner, store=_BrokenStore(), window_ms=0)
+
+    assert len(await client.embed(["x"])) == 1
+    assert len(inner.calls) == 1
+    assert client.stats.store_errors == 2
+
+
+async def test_tpm_limiter_waits_for_the_window(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    slept: list[float] = []
+
+    async def fake_sleep(seconds: float) -> None:
+        slept.append(seconds)
+        now[0] += seconds
+
+    monkeypatch.setattr(module.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(module.asyncio, "sleep", fake_sleep)
+    limiter = TokenRateLimiter(tokens_per_minute=100)
+
+    await limiter.acquire(60)
+    now[0] += 10
+    await limiter.acquire(40)  # exactly fills the budget — no wait
+    await limiter.acquire(30)  # must wait for the first spend to leave the window
+
+    assert slept == [50.0]
@@ -0,0 +1,190 @@
+"""
+File: backend/tests/unit/adapters/_base/test_response_cache_wrapper.py
+Purpose: Unit tests for ResponseCacheWrapper (cheap-tier deterministic response cache).
+Category: Tests / Adapters
+
+Description:
+    Drives the wrapper over MockChatClient with both backends (in-memory LRU and
+    fakeredis-backed RedisResponseCacheStore):
+    - a marked repeat is served from cache (inner called once, usage zeroed);
+    - unmarked requests / requests without a tenant always pass through;
+    - tenants never share entries; any key component change is a miss;
+    - TTL expiry + LRU bound; a failing store degrades to the provider (fail-open).
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation (LLM response cache)
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+from uuid import uuid4
+
+import pytest
+from fakeredis.aioredis import FakeRedis
+
+from adapters._base.response_cache_wrapper import (
+    InMemoryResponseCacheStore,
+    RedisResponseCacheStore,
+    ResponseCacheStore,
+    ResponseCacheWrapper,
+    response_cache_key,
+)
+from adapters._testing.mock_clients import MockChatClient
+from agent_harness._contracts import (
+    RESPONSE_CACHEABLE_OPTION,
+    ChatRequest,
+    ChatResponse,
+    ContentBlock,
+    Message,
+    StopReason,
+    TokenUsage,
+    ToolCall,
+    TraceContext,
+)
+
+_CACHEABLE = {RESPONSE_CACHEABLE_OPTION: True}
+
+
+def _request(text: str = "summarise this", **kwargs: object) -> ChatRequest:
+    return ChatRequest(
+        messages=[Message(role="user", content=text)],
+        temperature=0.0,
+        extra_options=_CACHEABLE,
+        **kwargs,  # type: ignore[arg-type]
+    )
+
+
+def _response(content: str) -> ChatResponse:
+    return ChatResponse(
+        model="cheap-model",
+        content=content,
+        stop_reason=StopReason.END_TURN,
+        usage=TokenUsage(prompt_tokens=40, completion_tokens=10, total_tokens=50),
+    )
+
+
+def _ctx(tenant_id: object | None = None) -> TraceContext:
+    return TraceContext(tenant_id=tenant_id or uuid4())  # type: ignore[arg-type]
+
+
+@pytest.fixture(params=["memory", "redis"])
+async def store(request: pytest.FixtureRequest) -> AsyncIterator[ResponseCacheStore]:
+    if request.param == "memory":
+        yield InMemoryResponseCacheStore()
+        return
+    client = FakeRedis(decode_responses=False)
+    yield RedisResponseCacheStore(client)
+    await client.aclose()
+
+
+async def test_marked_repeat_is_served_from_cache(store: ResponseCacheStore) -> None:
+    inner = MockChatClient(responses=[_response("first"), _response("second")])
+    wrapper = ResponseCacheWrapper(inner=inner, store=store)
+    ctx = _ctx()
+
+    miss = await wrapper.chat(_request(), trace_context=ctx)
+    hit = await wrapper.chat(_request(), trace_context=ctx)
+
+    assert inner.chat_call_count == 1
+    assert miss.content == hit.content == "first"
+    assert miss.usage is not None and miss.usage.total_tokens == 50
+    assert hit.usage == TokenUsage(prompt_tokens=0, completion_tokens=0)  # nothing spent
+    assert (wrapper.stats.hits, wrapper.stats.misses) == (1, 1)
+
+
+async def test_tool_calls_and_blocks_round_trip(store: ResponseCacheStore) -> None:
+    original = ChatResponse(
+        model="cheap-model",
+        content=[ContentBlock(type="text", text="calling")],
+        tool_calls=[ToolCall(id="c1", name="lookup", arguments={"q": ["a", 1]})],
+        stop_reason=StopReason.TOOL_USE,
+    )
+    wrapper = ResponseCacheWrapper(inner=MockChatClient(responses=[original]), store=store)
+    ctx = _ctx()
+    await wrapper.chat(_request(), trace_context=ctx)
+    hit = await wrapper.chat(_request(), trace_context=ctx)
+
+    assert hit.content == original.content
+    assert hit.tool_calls == original.tool_calls
+    assert hit.stop_reason is StopReason.TOOL_USE
+
+
+async def test_unmarked_or_tenantless_requests_bypass() -> None:
+    inner = MockChatClient()
+    wrapper = ResponseCacheWrapper(inner=inner, store=InMemoryResponseCacheStore())
+    unmarked = ChatRequest(messages=[Message(role="user", content="hi")], temperature=0.0)
+    ctx = _ctx()
+
+    for _ in range(2):
+        await wrapper.chat(unmarked, trace_context=ctx)
+        await wrapper.chat(_request(), trace_context=TraceContext())
+        await wrapper.chat(_request())
+
+    assert inner.chat_call_count == 6
+    assert wrapper.stats.bypassed == 6
+    assert wrapper.stats.hits == 0
+
+
+async def test_tenants_are_isolated_and_key_components_matter() -> None:
+    inner = MockChatClient()
+    wrapper = ResponseCacheWrapper(inner=inner, store=InMemoryResponseCacheStore())
+    tenant_a, tenant_b = uuid4(), uuid4()
+
+    await wrapper.chat(_request(), trace_context=_ctx(tenant_a))
+    await wrapper.chat(_request(), trace_context=_ctx(tenant_b))
+    assert inner.chat_call_count == 2
+
+    base = response_cache_key(_request(), deployment="d", tenant_id="t")
+    assert response_cache_key(_request(), deployment="d", tenant_id="t") == base
+    variants = [
+        response_cache_key(_request(), deployment="other", tenant_id="t"),
+        response_cache_key(_request("different"), deployment="d", tenant_id="t"),
+        response_cache_key(_request(max_tokens=64), deployment="d", tenant_id="t"),
+        response_cache_key(
+            ChatRequest(
+                messages=[Message(role="user", content="summarise this")],
+                temperature=0.5,
+                extra_options=_CACHEABLE,
+            ),
+            deployment="d",
+            tenant_id="t",
+        ),
+    ]
+    assert base not in variants
+    assert len(set(variants)) == len(variants)
+
+
+async def test_ttl_expiry_and_lru_bound(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("adapters._base.response_cache_wrapper.time.monotonic", lambda: now[0])
+    store = InMemoryResponseCacheStore(max_entries=2)
+
+    await store.set("a", b"1", ttl_seconds=10)
+    await store.set("b", b"2", ttl_seconds=10)
+    assert await store.get("a") == b"1"  # a refreshed → b least recent
+    await store.set("c", b"3", ttl_seconds=10)
+    assert await store.get("b") is None
+    assert len(store) == 2
+
+    now[0] += 11
+    assert await store.get("a") is None
+    assert await store.get("c") is None
+
+
+class _BrokenStore:
+    async def get(self, key: str) -> bytes | None:
+        raise ConnectionError("redis down")
+
+    async def set(self, key: str, value: bytes, *, ttl_seconds: int) -> None:
+        raise ConnectionError("redis down")
+
+
+async def test_broken_store_fails_open() -> None:
+    inner = MockChatClient(responses=[_response("a"), _response("b")])
+    wrapper = ResponseCacheWrapper(inner=inner, store=_BrokenStore())
+    ctx = _ctx()
+
+    assert (await wrapper.chat(_request(), trace_context=ctx)).content == "a"
+    assert (await wrapper.chat(_request(), trace_context=ctx)).content == "b"
+    assert wrapper.stats.store_errors == 4
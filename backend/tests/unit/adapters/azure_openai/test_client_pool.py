@@ -0,0 +1,126 @@
+"""
+File: backend/tests/unit/adapters/azure_openai/test_client_pool.py
+Purpose: Unit tests for AzureClientPool (shared keep-alive AsyncAzureOpenAI registry).
+Category: Tests / Adapters / Azure OpenAI
+
+Description:
+    No network: AsyncAzureOpenAI construction is offline, so the tests assert on
+    client identity + closed state only.
+    - one client per (endpoint, api_version, deployment, credentials) key;
+    - pooled adapters borrow the shared client; aclose() leaves it open;
+    - build_azure_model_profile threads the pool into both tiers;
+    - pool.close() / close_azure_client_pool() close every client, idempotently.
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation (pooled LLM clients)
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from adapters.azure_openai import client_pool as client_pool_module
+from adapters.azure_openai.adapter import AzureOpenAIAdapter
+from adapters.azure_openai.client_pool import (
+    AzureClientPool,
+    close_azure_client_pool,
+    get_azure_client_pool,
+)
+from adapters.azure_openai.config import AzureOpenAIConfig
+from adapters.azure_openai.profile import build_azure_model_profile
+
+
+def _config(**overrides: str) -> AzureOpenAIConfig:
+    fields = {
+        "api_key": "placeholder-key",
+        "endpoint": "https://placeholder.openai.azure.com/",
+        "api_version": "2024-02-15-preview",
+        "deployment_name": "deploy-a",
+        "model_name": "gpt-4o",
+    }
+    fields.update(overrides)
+    return AzureOpenAIConfig(**fields)  # type: ignore[arg-type]
+
+
+def test_same_target_shares_one_client() -> None:
+    pool = AzureClientPool()
+    first = pool.get(_config())
+    assert pool.get(_config()) is first
+    assert pool.get(_config(model_name="gpt-4o-mini")) is first  # model is not transport
+    assert pool.size == 1
+
+
+@pytest.mark.parametrize(
+    "override",
+    [
+        {"deployment_name": "deploy-b"},
+        {"api_version": "2025-01-01-preview"},
+        {"endpoint": "https://other.openai.azure.com/"},
+        {"api_key": "other-key"},
+    ],
+)
+def test_distinct_targets_get_distinct_clients(override: dict[str, str]) -> None:
+    pool = AzureClientPool()
+    assert pool.get(_config()) is not pool.get(_config(**override))
+    assert pool.size == 2
+
+
+async def test_pooled_adapter_borrows_and_aclose_keeps_client_open() -> None:
+    pool = AzureClientPool(max_connections=4, max_keepalive_connections=2)
+    a = AzureOpenAIAdapter(_config(), client_pool=pool)
+    b = AzureOpenAIAdapter(_config(), client_pool=pool)
+    shared = a._get_client()
+    assert b._get_client() is shared
+
+    await a.aclose()
+    assert not shared.is_closed()
+    assert b._get_client() is shared
+
+    await pool.close()
+    assert shared.is_closed()
+    assert pool.size == 0
+    await pool.close()  # idempotent
+
+
+async def test_unpooled_adapter_keeps_private_client() -> None:
+    adapter = AzureOpenAIAdapter(_config())
+    client = adapter._get_client()
+    assert AzureOpenAIAdapter(_config())._get_client() is not client
+    await adapter.aclose()
+    assert client.is_closed()
+
+
+def test_profile_threads_pool_into_both_tiers(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AZURE_OPENAI_ENDPOINT", "https://placeholder.openai.azure.com/")
+    monkeypatch.setenv("AZURE_OPENAI_API_KEY", "placeholder-key")
+    monkeypatch.setenv("AZURE_OPENAI_DEPLOYMENT_NAME", "system-deploy")
+    monkeypatch.setenv("AZURE_OPENAI_CHEAP_DEPLOYMENT_NAME", "cheap-deploy")
+    pool = AzureClientPool()
+
+    first = build_azure_model_profile(client_pool=pool)
+    second = build_azure_model_profile(client_pool=pool)
+    assert isinstance(first.action, AzureOpenAIAdapter)
+    assert isinstance(first.cheap, AzureOpenAIAdapter)
+    assert isinstance(second.action, AzureOpenAIAdapter)
+    assert isinstance(second.cheap, AzureOpenAIAdapter)
+
+    assert first.action._get_client() is second.action._get_client()
+    assert first.cheap._get_client() is second.cheap._get_client()
+    assert first.action._get_client() is not first.cheap._get_client()
+    assert pool.size == 2
+
+
+async def test_process_pool_is_lazy_and_closed_on_shutdown(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(client_pool_module, "_POOL", None)
+    await close_azure_client_pool()  # never built → no-op
+
+    pool = get_azure_client_pool(max_connections=8)
+    assert get_azure_client_pool() is pool
+    client = pool.get(_config())
+
+    await close_azure_client_pool()
+    assert client.is_closed()
+    assert get_azure_client_pool() is not pool  # rebuilt after shutdown
+    await close_azure_client_pool()
@@ -21,6 +21,7 @@ Created: 2026-04-29 (Sprint 49.4)
 from __future__ import annotations
 
 import asyncio
+from collections.abc import AsyncIterator
 from types import SimpleNamespace
 
 import pytest
@@ -210,6 +211,50 @@ class TestChat:
         assert resp.tool_calls[0].name == "add"
         assert resp.tool_calls[0].arguments == {"a": 1, "b": 2}
 
+    @pytest.mark.asyncio
+    async def test_stream_requests_usage_and_emits_it(
+        self,
+        azure_adapter: AzureOpenAIAdapter,
+        sample_request: ChatRequest,
+    ) -> None:
+        """stream() asks for include_usage; the final usage chunk becomes a usage event."""
+        seen: dict[str, object] = {}
+
+        async def _chunks() -> AsyncIterator[object]:
+            delta = SimpleNamespace(content="4", tool_calls=None)
+            yield SimpleNamespace(
+                usage=None, choices=[SimpleNamespace(delta=delta, finish_reason="stop")]
+            )
+            yield SimpleNamespace(
+                usage=SimpleNamespace(
+                    prompt_tokens=12,
+                    completion_tokens=1,
+                    total_tokens=13,
+                    prompt_tokens_details=SimpleNamespace(cached_tokens=8),
+                ),
+                choices=[],
+            )
+
+        async def _fake_create(**kwargs: object) -> AsyncIterator[object]:
+            seen.update(kwargs)
+            return _chunks()
+
+        azure_adapter._client = SimpleNamespace(  # type: ignore[assignment]
+            chat=SimpleNamespace(completions=SimpleNamespace(create=_fake_create))
+        )
+
+        events = [e async for e in azure_adapter.stream(sample_request)]
+        assert seen["stream_options"] == {"include_usage": True}
+        usage = [e.payload for e in events if e.event_type == "usage"]
+        assert usage == [
+            {
+                "prompt_tokens": 12,
+                "completion_tokens": 1,
+                "cached_input_tokens": 8,
+                "total_tokens": 13,
+            }
+        ]
+
 
 # ---------------------------------------------------------------------------
 # 7. cancellation — CancelledError must propagate, not be swallowed
@@ -3,13 +3,17 @@ File: backend/tests/unit/adapters/azure_openai/test_token_counting.py
 Purpose: Verify count_tokens() against tiktoken behavior on known inputs.
 Category: Tests / Adapters / Azure OpenAI
 Scope: Phase 49 / Sprint 49.4
+
+Modification History (newest-first):
+    - 2026-10-16: adapters share one process-wide counter per model
 """
 
 from __future__ import annotations
 
 import pytest
 
-from adapters.azure_openai.adapter import AzureOpenAIAdapter
+from adapters.azure_openai.adapter import AzureOpenAIAdapter, _shared_token_counter
+from adapters.azure_openai.config import AzureOpenAIConfig
 from agent_harness._contracts import Message
 
 
@@ -39,3 +43,16 @@ async def test_count_tokens_scales_with_content(
     n_short = await azure_adapter.count_tokens(messages=[short])
     n_long = await azure_adapter.count_tokens(messages=[long])
     assert n_long > n_short * 5  # long message significantly larger
+
+
+def test_adapters_share_one_counter_per_model(
+    azure_config: AzureOpenAIConfig, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Adapters are built per request; the counter (and its memo) is process-wide.
+    from agent_harness.context_mgmt.token_counter import tiktoken_counter
+
+    monkeypatch.setattr(tiktoken_counter.tiktoken, "get_encoding", lambda name: object())
+    _shared_token_counter.cache_clear()
+    first = AzureOpenAIAdapter(config=azure_config)._get_token_counter()
+    assert AzureOpenAIAdapter(config=azure_config)._get_token_counter() is first
+    _shared_token_counter.cache_clear()
@@ -0,0 +1,126 @@
+"""
+File: tests/unit/agent_harness/context_mgmt/test_token_counter_memoized.py
+Purpose: Unit tests for the memoized counting layer (impl: token_counter/memoized.py).
+Category: Tests / 範疇 4 (Context Management)
+
+Description:
+    Uses GenericApproxCounter (tokenizer-free, runs offline) with an
+    instrumented subclass that records every uncached per-message / per-tool
+    count, so the tests assert on tokenizer work avoided rather than timing:
+    - a repeated count() re-encodes nothing and returns the same total;
+    - memoized totals equal an unmemoized (max_cached_entries=0) counter;
+    - the key covers every token-bearing field but ignores metadata;
+    - the LRU bound evicts least-recently-used entries.
+
+Modification History (newest-first):
+    - 2026-10-16: drop the RunningTokenTotal tests (class removed)
+    - 2026-10-16: Initial creation (memoized token counting)
+"""
+
+from __future__ import annotations
+
+from agent_harness._contracts import ContentBlock, Message, ToolCall, ToolSpec
+from agent_harness.context_mgmt.token_counter.generic_approx import GenericApproxCounter
+
+
+class _CountingApprox(GenericApproxCounter):
+    def __init__(self, **kwargs: int) -> None:
+        super().__init__(**kwargs)
+        self.encoded_messages: list[Message] = []
+        self.encoded_tools: list[str] = []
+
+    def _message_tokens(self, msg: Message) -> int:
+        self.encoded_messages.append(msg)
+        return super()._message_tokens(msg)
+
+    def _tool_tokens(self, tool: ToolSpec) -> int:
+        self.encoded_tools.append(tool.name)
+        return super()._tool_tokens(tool)
+
+
+def _history(n: int) -> list[Message]:
+    msgs: list[Message] = [Message(role="system", content="You are helpful.")]
+    for i in range(n):
+        msgs.append(
+            Message(
+                role="assistant",
+                content="",
+                tool_calls=[ToolCall(id=f"c{i}", name="lookup", arguments={"q": f"term {i}"})],
+            )
+        )
+        msgs.append(Message(role="tool", content="result " * (i + 1), tool_call_id=f"c{i}"))
+    return msgs
+
+
+def _text(t: str) -> ContentBlock:
+    return ContentBlock(type="text", text=t)
+
+
+_TOOL = ToolSpec(
+    name="lookup",
+    description="Look something up.",
+    input_schema={"type": "object", "properties": {"q": {"type": "string"}}},
+)
+
+
+def test_repeat_count_hits_cache_and_matches_unmemoized() -> None:
+    counter = _CountingApprox()
+    msgs = _history(20)
+
+    first = counter.count(messages=msgs, tools=[_TOOL])
+    assert len(counter.encoded_messages) == len(msgs)
+    assert counter.encoded_tools == ["lookup"]
+
+    second = counter.count(messages=msgs, tools=[_TOOL])
+    assert second == first
+    assert len(counter.encoded_messages) == len(msgs)  # nothing re-encoded
+    assert counter.encoded_tools == ["lookup"]
+    assert counter.cache_stats()["message_hits"] == len(msgs)
+
+    # Structural-compactor shape: count the full, then a subset → all hits.
+    counter.count(messages=msgs[:1] + msgs[-4:])
+    assert len(counter.encoded_messages) == len(msgs)
+
+    unmemoized = GenericApproxCounter(max_cached_entries=0)
+    assert unmemoized.count(messages=msgs, tools=[_TOOL]) == first
+
+
+def test_key_covers_token_fields_but_not_metadata() -> None:
+    counter = _CountingApprox()
+    base = Message(role="user", content="hello there")
+
+    counter.count(messages=[base])
+    counter.count(messages=[Message(role="user", content="hello there", metadata={"hitl": True})])
+    assert len(counter.encoded_messages) == 1
+
+    variants = [
+        Message(role="assistant", content="hello there"),
+        Message(role="user", content="hello there!"),
+        Message(role="user", content="hello there", name="bob"),
+        Message(role="user", content=[_text("hello"), _text(" there")]),
+        Message(role="user", content=[_text("hello "), _text("there")]),
+    ]
+    for variant in variants:
+        counter.count(messages=[variant])
+    assert len(counter.encoded_messages) == 1 + len(variants)
+
+    call_a = Message(role="assistant", content="", tool_calls=[ToolCall("c", "t", {"x": 1})])
+    call_b = Message(role="assistant", content="", tool_calls=[ToolCall("c", "t", {"x": 2})])
+    assert counter.message_tokens(call_a) == counter.message_tokens(call_b)  # same length
+    assert len(counter.encoded_messages) == 3 + len(variants)  # but counted separately
+
+
+def test_lru_bound_evicts_oldest() -> None:
+    counter = _CountingApprox(max_cached_entries=2)
+    a, b, c = (Message(role="user", content=t) for t in ("a", "b", "c"))
+
+    counter.count(messages=[a, b])
+    counter.count(messages=[a])  # refresh a → b is now least recent
+    counter.count(messages=[c])  # evicts b
+    assert counter.cache_stats()["message_entries"] == 2
+
+    encoded = len(counter.encoded_messages)
+    counter.count(messages=[a, c])
+    assert len(counter.encoded_messages) == encoded
+    counter.count(messages=[b])
+    assert counter.encoded_messages[-1] is b
@@ -8,6 +8,7 @@ Category: Tests / 範疇 3
 Scope: Phase 57 / Sprint 57.152
 
 Created: 2026-06-30
+Last Modified: 2026-10-16 (incremental summary — previous_summary + watermark)
 """
 
 from __future__ import annotations
@@ -21,6 +22,7 @@ from adapters._testing.mock_clients import MockChatClient
 from agent_harness._contracts import ChatResponse, Message
 from agent_harness._contracts.chat import StopReason
 from agent_harness.memory.formation import MemoryFormationWorker
+from agent_harness.memory.session_summary_store import SummaryState
 
 _COMBINED_JSON = (
     '{"facts": [{"content": "User is Chris", "confidence": 0.9}], '
@@ -55,13 +57,21 @@ class _SummarizerStub:
     def __init__(self) -> None:
         self.store_calls: list[dict[str, Any]] = []
         self.summarize_calls: list[dict[str, Any]] = []
+        self.incremental_calls: list[dict[str, Any]] = []
 
-    async def store_summary(self, parsed: dict[str, Any], *, session_id: Any) -> None:
-        self.store_calls.append({"parsed": parsed, "session_id": session_id})
+    async def store_summary(
+        self, parsed: dict[str, Any], *, session_id: Any, last_summarized_seq: Any = None
+    ) -> None:
+        self.store_calls.append(
+            {"parsed": parsed, "session_id": session_id, "last_summarized_seq": last_summarized_seq}
+        )
 
     async def summarize_and_store(self, **kwargs: Any) -> None:
         self.summarize_calls.append(kwargs)
 
+    async def summarize_incremental(self, **kwargs: Any) -> None:
+        self.incremental_calls.append(kwargs)
+
 
 def _chat(content: str) -> MockChatClient:
     return MockChatClient(
@@ -246,3 +256,51 @@ def test_parse_combined_shapes() -> None:
         [],
         None,
     )  # noqa: SLF001
+
+
+_PREVIOUS = SummaryState(
+    summary="Planned the billing migration.",
+    key_decisions=["dual-write"],
+    unresolved_issues=["invoice schema"],
+    last_summarized_seq=4,
+)
+
+
+@pytest.mark.asyncio
+async def test_combined_incremental_folds_previous_summary_and_records_watermark() -> None:
+    """previous_summary → the prompt carries it + only the tail; the watermark is stored."""
+    chat = _chat(_COMBINED_JSON)
+    summ = _SummarizerStub()
+    worker = MemoryFormationWorker(chat, summarizer=summ)  # type: ignore[arg-type]
+    tail = [Message(role="user", content="invoice schema is settled")]
+
+    await worker.form(
+        messages=tail,
+        session_id=uuid4(),
+        tenant_id=uuid4(),
+        previous_summary=_PREVIOUS,
+        last_summarized_seq=6,
+    )
+
+    prompt = chat.last_request.messages[0].content
+    assert "CURRENT SUMMARY" in prompt and "Planned the billing migration." in prompt
+    assert "invoice schema is settled" in prompt
+    assert summ.store_calls[0]["last_summarized_seq"] == 6
+
+
+@pytest.mark.asyncio
+async def test_separate_incremental_delegates_to_summarize_incremental() -> None:
+    summ = _SummarizerStub()
+    worker = MemoryFormationWorker(  # type: ignore[arg-type]
+        _chat(_COMBINED_JSON), summarizer=summ, combined=False
+    )
+    await worker.form(
+        messages=_msgs(),
+        session_id=uuid4(),
+        tenant_id=uuid4(),
+        previous_summary=_PREVIOUS,
+        last_summarized_seq=6,
+    )
+    assert summ.summarize_calls == []
+    assert summ.incremental_calls[0]["previous"] is _PREVIOUS
+    assert summ.incremental_calls[0]["last_summarized_seq"] == 6
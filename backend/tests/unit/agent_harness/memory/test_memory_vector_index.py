@@ -7,6 +7,7 @@ Created: 2026-07-01
 
 from __future__ import annotations
 
+import asyncio
 import math
 from typing import Any, cast
 from uuid import uuid4
@@ -239,3 +240,111 @@ async def test_user_a_cannot_retrieve_user_b_fact() -> None:
     # both users' points live in the ONE per-tenant collection (isolation by filter, not collection)
     coll = next(iter(store.collections))
     assert len(store.collections[coll]) == 2
+
+
+# --- write-through maintenance ---------------------------------------------------
+
+
+class _WriteThroughStore(_FakeMemStore):
+    """+ delete_points / scroll_payloads; count() must never be called on this path."""
+
+    async def count(self, name: str, payload_filter: Any = None) -> int:
+        raise AssertionError("write-through recall must not count")
+
+    async def delete_points(self, name: str, ids: list[int]) -> None:
+        drop = set(ids)
+        self.collections[name] = [p for p in self.collections.get(name, []) if p[0] not in drop]
+
+    async def scroll_payloads(
+        self, name: str, fields: list[str], *, payload_filter: Any = None
+    ) -> list[tuple[int, dict[str, Any]]]:
+        return [
+            (pid, {k: v for k, v in pl.items() if k in fields})
+            for pid, _, pl in self.collections.get(name, [])
+            if _match(payload_filter, pl)
+        ]
+
+
+def _write_through(store: Any, embedder: Any) -> MemoryVectorIndex:
+    return MemoryVectorIndex(cast(Any, embedder), cast(Any, store), write_through=True)
+
+
+async def test_write_through_queue_coalesces_and_applies_ops() -> None:
+    tid, uid = uuid4(), uuid4()
+    store = _WriteThroughStore()
+    embedder = _CountingEmbedder()
+    index = _write_through(store, embedder)
+
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k1", "first draft", 0.5))
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k1", "edited fact", 0.6))
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k2", "short lived", 0.5))
+    index.enqueue_delete(tenant_id=tid, user_id=uid, dedup_key="k2")
+    await index.flush()
+
+    assert embedder.batch_sizes == [1]  # k1's two writes coalesced; k2 upsert+delete → delete
+    (point,) = next(iter(store.collections.values()))
+    assert point[0] == MemoryVectorIndex._point_id(uid, "k1")
+    assert point[2]["content"] == "edited fact"
+
+    hits = await index.recall(tenant_id=tid, user_id=uid, query="edited fact", top_k=3)
+    assert [h.dedup_key for h in hits] == ["k1"]
+    assert embedder.batch_sizes == [1, 1]  # recall = one query embed (no count, no rows)
+
+
+async def test_reconcile_repairs_edits_and_orphans() -> None:
+    tid, uid = uuid4(), uuid4()
+    store = _WriteThroughStore()
+    embedder = _CountingEmbedder()
+    index = _write_through(store, embedder)
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k1", "kept", 0.5))
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k2", "old text", 0.5))
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k3", "deleted in db", 0.5))
+    await index.flush()
+
+    db_rows = [
+        MemoryRow("k1", "kept", 0.5),
+        MemoryRow("k2", "new text", 0.5),  # edited in place, write-through missed it
+        MemoryRow("k4", "written before the flag", 0.5),
+    ]
+    assert await index.reconcile(tenant_id=tid, user_id=uid, rows=db_rows) == (2, 1)
+    assert await index.reconcile(tenant_id=tid, user_id=uid, rows=db_rows) == (0, 0)
+
+    contents = sorted(p[2]["content"] for p in next(iter(store.collections.values())))
+    assert contents == ["kept", "new text", "written before the flag"]
+
+
+async def test_schedule_reconcile_is_rate_limited_per_user() -> None:
+    tid, uid = uuid4(), uuid4()
+    index = _write_through(_WriteThroughStore(), _CountingEmbedder())
+    loads = 0
+
+    async def _load() -> list[MemoryRow]:
+        nonlocal loads
+        loads += 1
+        return [MemoryRow("k1", "fact", 0.5)]
+
+    assert index.schedule_reconcile(tenant_id=tid, user_id=uid, load_rows=_load)
+    assert not index.schedule_reconcile(tenant_id=tid, user_id=uid, load_rows=_load)
+    for task in list(index._tasks):
+        await task
+    assert loads == 1
+
+
+async def test_close_flushes_queue_and_cancels_reconciles() -> None:
+    tid, uid = uuid4(), uuid4()
+    store = _WriteThroughStore()
+    index = _write_through(store, _CountingEmbedder())
+    reconcile_started = asyncio.Event()
+
+    async def _stuck_load() -> list[MemoryRow]:
+        reconcile_started.set()
+        await asyncio.Event().wait()
+        return []
+
+    index.enqueue_upsert(tenant_id=tid, user_id=uid, row=MemoryRow("k1", "fact", 0.5))
+    index.schedule_reconcile(tenant_id=tid, user_id=uid, load_rows=_stuck_load)
+    await reconcile_started.wait()
+    await index.close()
+
+    assert [p[2]["content"] for p in next(iter(store.collections.values()))] == ["fact"]
+    assert not index._tasks  # the reconcile was cancelled + awaited
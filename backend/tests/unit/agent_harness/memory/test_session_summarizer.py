@@ -5,6 +5,7 @@ Category: Tests / 範疇 3
 Scope: Phase 57 / Sprint 57.151 (US-2)
 
 Created: 2026-06-30
+Last Modified: 2026-10-16 (summarize_incremental + watermark)
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ from adapters._testing.mock_clients import MockChatClient
 from agent_harness._contracts import ChatResponse, Message
 from agent_harness._contracts.chat import StopReason
 from agent_harness.memory.session_summarizer import SessionSummarizer
+from agent_harness.memory.session_summary_store import SummaryState
 
 
 class _StoreStub:
@@ -131,3 +133,43 @@ async def test_non_string_decision_items_dropped() -> None:
     )
     assert store.calls[0]["key_decisions"] == ["keep", "trim"]
     assert store.calls[0]["unresolved_issues"] == []  # non-list → []
+
+
+@pytest.mark.asyncio
+async def test_incremental_prompt_has_previous_summary_and_only_new_messages() -> None:
+    """summarize_incremental feeds the stored summary + the tail and advances the watermark."""
+    chat = _resp('{"summary": "OIDC fixed; refresh tokens next.", "key_decisions": []}')
+    store = _StoreStub()
+    summarizer = SessionSummarizer(chat_client=chat, store=store)  # type: ignore[arg-type]
+    previous = SummaryState(
+        summary="Debugged the OIDC callback.",
+        key_decisions=["pin redirect URI"],
+        unresolved_issues=["refresh-token path"],
+        last_summarized_seq=8,
+    )
+
+    await summarizer.summarize_incremental(
+        previous=previous,
+        new_messages=[Message(role="user", content="now the refresh tokens")],
+        session_id=uuid4(),
+        last_summarized_seq=10,
+    )
+
+    prompt = chat.last_request.messages[0].content
+    assert "Debugged the OIDC callback." in prompt
+    assert "[user] now the refresh tokens" in prompt
+    assert store.calls[0]["summary"] == "OIDC fixed; refresh tokens next."
+    assert store.calls[0]["last_summarized_seq"] == 10
+
+
+@pytest.mark.asyncio
+async def test_incremental_without_new_messages_no_op() -> None:
+    chat = _resp('{"summary": "x"}')
+    summarizer = SessionSummarizer(chat_client=chat, store=_StoreStub())  # type: ignore[arg-type]
+    await summarizer.summarize_incremental(
+        previous=SummaryState("s", [], [], 3),
+        new_messages=[],
+        session_id=uuid4(),
+        last_summarized_seq=3,
+    )
+    assert chat.chat_call_count == 0
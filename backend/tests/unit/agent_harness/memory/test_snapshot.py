@@ -0,0 +1,160 @@
+"""
+File: backend/tests/unit/agent_harness/memory/test_snapshot.py
+Purpose: Unit tests for MemorySnapshot (run-scoped memoized memory reads).
+Category: Tests / Cat 3
+
+Description:
+    Counting stub layers under a real MemoryRetrieval:
+    - repeated search / profile reads hit the snapshot (layers read once);
+    - a write through a watched layer invalidates only reads touching its scope;
+    - a failing read is not cached;
+    - DefaultPromptBuilder reads through the snapshot and reports per-build counts.
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import UUID, uuid4
+
+import pytest
+
+from agent_harness._contracts import MemoryHint, TraceContext
+from agent_harness.context_mgmt.cache_manager import InMemoryCacheManager
+from agent_harness.context_mgmt.token_counter.generic_approx import GenericApproxCounter
+from agent_harness.memory._abc import MemoryLayer, MemoryScope
+from agent_harness.memory.retrieval import MemoryRetrieval
+from agent_harness.memory.snapshot import MemorySnapshot
+from agent_harness.prompt_builder.builder import DefaultPromptBuilder
+from tests.unit.agent_harness.prompt_builder.conftest import make_state, msg
+
+
+def _hint(layer: str) -> MemoryHint:
+    return MemoryHint(
+        hint_id=uuid4(),
+        layer=layer,  # type: ignore[arg-type]
+        time_scale="long_term",
+        summary=f"{layer} fact",
+        confidence=0.9,
+        relevance_score=0.8,
+        full_content_pointer=f"db://memory/{uuid4()}",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+class _CountingLayer(MemoryLayer):
+    def __init__(self, scope: MemoryScope, layer: str) -> None:
+        self.scope = scope
+        self._layer = layer
+        self.read_count = 0
+        self.fail_next = False
+
+    async def read(
+        self,
+        *,
+        query: str,
+        tenant_id: UUID | None = None,
+        user_id: UUID | None = None,
+        time_scales: tuple[Literal["short_term", "long_term", "semantic"], ...] = ("long_term",),
+        max_hints: int = 10,
+        trace_context: TraceContext | None = None,
+    ) -> list[MemoryHint]:
+        self.read_count += 1
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("db down")
+        return [_hint(self._layer)]
+
+    async def write(self, **kwargs: object) -> UUID:
+        return uuid4()
+
+    async def evict(self, **kwargs: object) -> None:
+        return None
+
+    async def resolve(self, hint: MemoryHint, **kwargs: object) -> str:
+        return ""
+
+
+@pytest.fixture
+def layers() -> dict[str, _CountingLayer]:
+    return {
+        "user": _CountingLayer(MemoryScope.USER, "user"),
+        "tenant": _CountingLayer(MemoryScope.TENANT, "tenant"),
+    }
+
+
+async def test_repeated_reads_are_served_from_the_snapshot(
+    layers: dict[str, _CountingLayer],
+) -> None:
+    snapshot = MemorySnapshot(MemoryRetrieval(layers=dict(layers)))
+    tenant_id, user_id = uuid4(), uuid4()
+
+    for _ in range(3):
+        await snapshot.search(query="q", tenant_id=tenant_id, user_id=user_id)
+        await snapshot.profile(tenant_id=tenant_id, user_id=user_id)
+    await snapshot.search(query="other", tenant_id=tenant_id, user_id=user_id)
+
+    assert layers["tenant"].read_count == 2  # "q" once + "other" once
+    assert layers["user"].read_count == 3  # + one profile() read
+    assert (snapshot.stats.hits, snapshot.stats.misses) == (4, 3)
+
+
+async def test_write_invalidates_only_reads_of_that_scope(
+    layers: dict[str, _CountingLayer],
+) -> None:
+    snapshot = MemorySnapshot(MemoryRetrieval(layers=dict(layers)))
+    watched = snapshot.watch(dict(layers))
+    tenant_id, user_id = uuid4(), uuid4()
+    await snapshot.search(query="q", tenant_id=tenant_id, scopes=("tenant",))
+    await snapshot.profile(tenant_id=tenant_id, user_id=user_id)
+
+    await watched["user"].write(content="prefers dark mode", tenant_id=tenant_id)
+    await snapshot.search(query="q", tenant_id=tenant_id, scopes=("tenant",))
+    await snapshot.profile(tenant_id=tenant_id, user_id=user_id)
+
+    assert layers["tenant"].read_count == 1  # tenant-only search survived
+    assert layers["user"].read_count == 2  # profile re-read after the user write
+    assert watched["user"].scope is MemoryScope.USER
+    assert snapshot.stats.invalidations == 1
+
+
+async def test_failed_read_is_not_cached(layers: dict[str, _CountingLayer]) -> None:
+    snapshot = MemorySnapshot(MemoryRetrieval(layers=dict(layers)))
+    layers["user"].fail_next = True
+    tenant_id, user_id = uuid4(), uuid4()
+
+    with pytest.raises(RuntimeError):
+        await snapshot.profile(tenant_id=tenant_id, user_id=user_id)
+    assert len(await snapshot.profile(tenant_id=tenant_id, user_id=user_id)) == 1
+    assert layers["user"].read_count == 2
+
+
+async def test_builder_reads_through_snapshot_across_turns(
+    layers: dict[str, _CountingLayer],
+) -> None:
+    retrieval = MemoryRetrieval(layers=dict(layers))
+    snapshot = MemorySnapshot(retrieval)
+    builder = DefaultPromptBuilder(
+        memory_retrieval=retrieval,
+        cache_manager=InMemoryCacheManager(),
+        token_counter=GenericApproxCounter(),
+        memory_snapshot=snapshot,
+    )
+    tenant_id, user_id = uuid4(), uuid4()
+    state = make_state(messages=[msg("user", "deploy status?")], tenant_id=tenant_id)
+
+    first = await builder.build(state=state, tenant_id=tenant_id, user_id=user_id)
+    second = await builder.build(state=state, tenant_id=tenant_id, user_id=user_id)
+
+    assert first.messages == second.messages
+    assert first.layer_metadata["memory_snapshot"] == {
+        "memory_snapshot_hits": 0,
+        "memory_snapshot_misses": 3,  # search + profile + recent_sessions
+    }
+    assert second.layer_metadata["memory_snapshot"] == {
+        "memory_snapshot_hits": 3,
+        "memory_snapshot_misses": 0,
+    }
+    assert layers["user"].read_count == 2  # turn 1 only (search + profile)
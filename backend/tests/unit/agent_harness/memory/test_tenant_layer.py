@@ -106,3 +106,22 @@ async def test_write_requires_tenant() -> None:
     layer = TenantLayer(_build_factory([]))
     with pytest.raises(ValueError, match="tenant_id"):
         await layer.write(content="x", tenant_id=None)
+
+
+@pytest.mark.asyncio
+async def test_read_fulltext_uses_match_score_as_relevance() -> None:
+    from sqlalchemy.dialects import postgresql
+
+    tenant = uuid4()
+    row = _make_row(tenant_id=tenant, content="our refund policy is generous")
+    factory = _build_factory([])
+    factory._mock_session.execute.return_value.all.return_value = [(row, 0.9)]
+    layer = TenantLayer(factory, fulltext=True)
+
+    hints = await layer.read(query="refund policy", tenant_id=tenant)
+
+    assert [h.relevance_score for h in hints] == [0.9]
+    stmt = factory._mock_session.execute.call_args.args[0]
+    sql = str(stmt.compile(dialect=postgresql.dialect()))
+    assert "memory_tenant.search_tsv @@ websearch_to_tsquery" in sql
+    assert "word_similarity(" in sql
@@ -31,6 +31,8 @@ from infrastructure.db.models.memory import MemoryOp, MemoryUser
 class _FakeVectorIndex:
     """Stand-in MemoryVectorIndex: returns preset hits + records the search call."""
 
+    write_through = False
+
     def __init__(self, hits: list[MemoryVectorHit]) -> None:
         self._hits = hits
         self.calls: list[tuple[Any, Any, list[str], str, int]] = []
@@ -157,6 +159,8 @@ async def test_read_semantic_fail_soft_on_index_error() -> None:
     """Any embed/Qdrant error → semantic degrades to [] (recall never breaks)."""
 
     class _BoomIndex:
+        write_through = False
+
         async def search(self, **kwargs: Any) -> list[MemoryVectorHit]:
             raise RuntimeError("qdrant unreachable")
 
@@ -315,3 +319,104 @@ def test_dedup_key_normalizes_whitespace_and_case() -> None:
 
 def test_dedup_key_distinguishes_different_content() -> None:
     assert _dedup_key("Chris works on Aurora") != _dedup_key("Chris works on Borealis")
+
+
+def _compiled(stmt: Any) -> str:
+    from sqlalchemy.dialects import postgresql
+
+    return str(stmt.compile(dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}))
+
+
+@pytest.mark.asyncio
+async def test_read_fulltext_ranks_with_index_served_match() -> None:
+    """fulltext=True: tsvector @@ / escaped trigram ILIKE predicate, score → relevance_score."""
+    tenant, user = uuid4(), uuid4()
+    row = _make_row(tenant_id=tenant, user_id=user)
+    factory = _build_factory([])
+    factory._mock_session.execute.return_value.all.return_value = [(row, 0.42)]
+    layer = UserLayer(factory, fulltext=True)
+
+    hints = await layer.read(query="100% detailed", tenant_id=tenant, user_id=user)
+
+    assert [h.relevance_score for h in hints] == [0.42]
+    sql = _compiled(factory._mock_session.execute.call_args.args[0])
+    assert "memory_user.search_tsv @@ websearch_to_tsquery('simple'::regconfig" in sql
+    assert "ILIKE '%%100\\%% detailed%%' ESCAPE" in sql  # % escaped, not a wildcard
+    assert "ORDER BY greatest(ts_rank_cd(" in sql
+
+
+@pytest.mark.asyncio
+async def test_read_fulltext_empty_query_keeps_confidence_path() -> None:
+    """An empty query (profile read) has nothing to rank → the unranked path."""
+    tenant, user = uuid4(), uuid4()
+    layer = UserLayer(_build_factory([_make_row(tenant_id=tenant, user_id=user)]), fulltext=True)
+    hints = await layer.read(query="", tenant_id=tenant, user_id=user)
+    assert [h.relevance_score for h in hints] == [0.8]
+
+
+class _FakeWriteThroughIndex:
+    """Records write-through calls; recall() returns preset hits."""
+
+    write_through = True
+
+    def __init__(self, hits: list[MemoryVectorHit]) -> None:
+        self._hits = hits
+        self.upserts: list[Any] = []
+        self.deletes: list[Any] = []
+        self.reconciles = 0
+
+    def enqueue_upsert(self, *, tenant_id: Any, user_id: Any, row: Any) -> None:
+        self.upserts.append((tenant_id, user_id, row))
+
+    def enqueue_delete(self, *, tenant_id: Any, user_id: Any, dedup_key: str) -> None:
+        self.deletes.append((tenant_id, user_id, dedup_key))
+
+    def schedule_reconcile(self, **kwargs: Any) -> bool:
+        self.reconciles += 1
+        return True
+
+    async def recall(
+        self, *, tenant_id: Any, user_id: Any, query: str, top_k: int
+    ) -> list[MemoryVectorHit]:
+        return self._hits
+
+
+@pytest.mark.asyncio
+async def test_write_and_evict_enqueue_write_through_ops() -> None:
+    tenant, user = uuid4(), uuid4()
+    index = _FakeWriteThroughIndex([])
+    factory = _build_factory([], scalar_one_value=uuid4())
+    factory._mock_session.execute.return_value.first.return_value = ("Likes tea.", user)
+    layer = UserLayer(factory, vector_index=cast(Any, index))
+
+    await layer.write(content="Likes  TEA.", tenant_id=tenant, user_id=user, confidence=0.7)
+    await layer.evict(entry_id=uuid4(), tenant_id=tenant)
+
+    ((_, _, row),) = index.upserts
+    assert (row.dedup_key, row.content, row.confidence) == (
+        _dedup_key("likes tea."),
+        "Likes  TEA.",
+        0.7,
+    )
+    assert index.deletes == [(tenant, user, _dedup_key("Likes tea."))]
+
+
+@pytest.mark.asyncio
+async def test_write_through_semantic_read_fetches_only_hit_rows() -> None:
+    tenant, user = uuid4(), uuid4()
+    row = _make_row(tenant_id=tenant, user_id=user, content="prefers dark mode")
+    row.dedup_key = "dk1"
+    hits = [
+        MemoryVectorHit(dedup_key="dk1", content="prefers dark mode", confidence=0.85, score=0.91),
+        MemoryVectorHit(dedup_key="gone", content="evicted", confidence=0.5, score=0.8),
+    ]
+    index = _FakeWriteThroughIndex(hits)
+    factory = _build_factory([row])
+    layer = UserLayer(factory, vector_index=cast(Any, index))
+
+    out = await layer.read(query="theme", tenant_id=tenant, user_id=user, time_scales=("semantic",))
+
+    assert [(h.hint_id, h.relevance_score) for h in out] == [(row.id, 0.91)]  # "gone" dropped
+    assert index.reconciles == 1
+    stmt = factory._mock_session.execute.call_args.args[0]
+    assert "dedup_key IN" in str(stmt)
@@ -11,13 +11,17 @@ Description:
     - run() SELF-LOADS the prior ledger and prepends it to the LLM request (the
       fix: turn 2 now sees turn 1's conversation);
     - message_store=None is the single-turn baseline (no load / no persist).
+    - a semantic compaction that drops a ledger prefix records a checkpoint
+      (summary + the sequence_num it covers) on the store.
 
 Modification History (newest-first):
+    - 2026-10-16: compaction checkpoint tests (_ledger_checkpoint + save_checkpoint wiring)
     - 2026-06-16: Initial creation (Sprint 57.127)
 """
 
 from __future__ import annotations
 
+from dataclasses import replace
 from typing import Any, AsyncIterator, Literal
 from unittest.mock import MagicMock
 from uuid import UUID, uuid4
@@ -30,18 +34,22 @@ from adapters._base.types import ModelInfo, StopReason, StreamEvent
 from agent_harness._contracts import (
     CacheBreakpoint,
     ChatRequest,
+    CompactionResult,
+    CompactionStrategy,
     ChatResponse,
     ExecutionContext,
     LoopEvent,
+    LoopState,
     Message,
     TokenUsage,
     ToolCall,
     ToolSpec,
     TraceContext,
 )
-from agent_harness.orchestrator_loop.loop import AgentLoopImpl
+from agent_harness.context_mgmt import Compactor
+from agent_harness.orchestrator_loop.loop import AgentLoopImpl, _ledger_checkpoint
 from agent_harness.output_parser import OutputParserImpl
-from agent_harness.state_mgmt import MessageStore
+from agent_harness.state_mgmt import LEDGER_SEQ_KEY, MessageStore
 from agent_harness.tools import ToolExecutorImpl, ToolRegistryImpl
 
 pytestmark = pytest.mark.asyncio
@@ -129,6 +137,7 @@ class FakeMessageStore(MessageStore):
         # Sprint 57.129: record each append() as its own batch so a test can assert
         # the tool round-trip arrives as ONE atomic call (dangling-free evidence).
         self.append_calls: list[list[Message]] = []
+        self.checkpoints: list[tuple[Message, int]] = []
 
     async def load(self) -> list[Message]:
         return list(self._prior)
@@ -137,6 +146,9 @@ class FakeMessageStore(MessageStore):
         self.appended.extend(messages)
         self.append_calls.append(list(messages))
 
+    async def save_checkpoint(self, summary: Message, *, through_sequence_num: int) -> None:
+        self.checkpoints.append((summary, through_sequence_num))
+
 
 def _one_turn_chat() -> CapturingChatClient:
     """A single FINAL turn — no tools."""
@@ -334,3 +346,95 @@ async def test_prior_tool_round_trip_rehydrated() -> None:
     assert any(m.role == "assistant" and m.tool_calls for m in first_request)
     # ...and the new user turn last.
     assert str(first_request[-1].content) == "what was the exact number?"
+
+
+def _seq(msg: Message, seq: int) -> Message:
+    msg.metadata[LEDGER_SEQ_KEY] = seq
+    return msg
+
+
+class _SummarizePrefixCompactor(Compactor):
+    """Always triggers: replaces every message before the last user turn with one
+    tagged summary (the SemanticCompactor output shape), keeping system first."""
+
+    async def compact_if_needed(
+        self, state: LoopState, *, trace_context: TraceContext | None = None
+    ) -> CompactionResult:
+        messages = list(state.transient.messages)
+        last_user = max(i for i, m in enumerate(messages) if m.role == "user")
+        system = [m for m in messages[:last_user] if m.role == "system"]
+        summary = Message(
+            role="assistant", content="summary", metadata={"compacted_summary": True}
+        )
+        compacted = [*system, summary, *messages[last_user:]]
+        return CompactionResult(
+            triggered=True,
+            strategy_used=CompactionStrategy.SEMANTIC,
+            tokens_before=10,
+            tokens_after=5,
+            messages_compacted=len(messages) - len(compacted),
+            duration_ms=0.0,
+            compacted_state=replace(
+                state, transient=replace(state.transient, messages=compacted)
+            ),
+        )
+
+
+async def test_ledger_checkpoint_covers_dropped_prefix() -> None:
+    """The summary covers up to (not incl.) the oldest ledger message kept."""
+    before = [
+        Message(role="system", content="sys"),
+        _seq(Message(role="user", content="q1"), 1),
+        _seq(Message(role="assistant", content="a1"), 2),
+        _seq(Message(role="user", content="q2"), 3),
+    ]
+    summary = Message(role="assistant", content="s", metadata={"compacted_summary": True})
+    after = [before[0], summary, replace(before[3], content="q2 (trimmed)")]
+
+    assert _ledger_checkpoint(before, after) == (summary, 2)
+
+
+async def test_ledger_checkpoint_none_without_new_summary() -> None:
+    """A structural-only compaction (or a carried-over prior summary) is no checkpoint."""
+    prior_summary = _seq(
+        Message(role="assistant", content="old", metadata={"compacted_summary": True}), 4
+    )
+    before = [prior_summary, _seq(Message(role="tool", content="x" * 50), 5)]
+    after = [prior_summary, replace(before[1], content="[truncated]")]
+
+    assert _ledger_checkpoint(before, after) is None
+    # Untagged messages (resume buffers / injections) never yield a checkpoint either.
+    untagged = [Message(role="user", content="q")]
+    summary = Message(role="assistant", content="s", metadata={"compacted_summary": True})
+    assert _ledger_checkpoint(untagged, [summary]) is None
+
+
+async def test_semantic_compaction_records_store_checkpoint() -> None:
+    """A compaction that summarizes rehydrated ledger rows saves a checkpoint
+    covering them, so the next send's load() can start from the summary."""
+    chat = _one_turn_chat()
+    store = FakeMessageStore(
+        prior=[
+            _seq(Message(role="user", content="capital of France?"), 1),
+            _seq(Message(role="assistant", content="Paris"), 2),
+        ]
+    )
+    registry = ToolRegistryImpl()
+    loop = AgentLoopImpl(
+        chat_client=chat,
+        output_parser=OutputParserImpl(),
+        tool_executor=ToolExecutorImpl(registry=registry, handlers={}),
+        tool_registry=registry,
+        tenant_id=_TENANT_ID,
+        message_store=store,
+        compactor=_SummarizePrefixCompactor(),
+    )
+
+    await _run(loop, user_input="its population?")
+
+    assert len(store.checkpoints) == 1
+    summary, through_seq = store.checkpoints[0]
+    assert summary.content == "summary"
+    assert through_seq == 2
+    # The LLM saw the summary in place of the covered rows.
+    assert _texts(chat.requests[0])[-2:] == ["summary", "its population?"]
@@ -0,0 +1,261 @@
+"""
+File: backend/tests/unit/agent_harness/orchestrator_loop/test_loop_parallel_tools.py
+Purpose: Unit tests — AgentLoopImpl parallel tool calls (ConcurrencyPolicy groups).
+Category: Tests / 範疇 1 (Orchestrator Loop) + 範疇 2 (Tools)
+
+Description:
+    Validates the `parallel_tool_calls` dispatch of one TOOL_USE turn:
+    - consecutive READ_ONLY_PARALLEL / ALL_PARALLEL calls execute concurrently
+      (turn cost ≈ slowest call), yet events + tool messages land in call order;
+    - a SEQUENTIAL tool is a barrier (never overlaps its neighbours);
+    - parallel_tool_calls=False (default) keeps the one-after-another baseline;
+    - a Cat 9 guardrail block inside a parallel group still yields the blocked
+      error result in order (batch guardrail check threaded to the per-call check).
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation (parallel tool calls)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+
+from adapters._testing.mock_clients import MockChatClient
+from agent_harness._contracts import (
+    ChatResponse,
+    ConcurrencyPolicy,
+    ExecutionContext,
+    GuardrailTriggered,
+    LoopEvent,
+    StopReason,
+    ToolCall,
+    ToolCallExecuted,
+    ToolCallRequested,
+    ToolResult,
+    ToolSpec,
+    TraceContext,
+)
+from agent_harness.guardrails import (
+    Guardrail,
+    GuardrailAction,
+    GuardrailEngine,
+    GuardrailResult,
+    GuardrailType,
+)
+from agent_harness.orchestrator_loop import AgentLoopImpl
+from agent_harness.output_parser import OutputParserImpl
+from agent_harness.tools import ToolExecutor, ToolRegistryImpl
+
+pytestmark = pytest.mark.asyncio
+
+
+def _spec(name: str, policy: ConcurrencyPolicy) -> ToolSpec:
+    return ToolSpec(
+        name=name,
+        description=name,
+        input_schema={"type": "object", "properties": {}},
+        concurrency_policy=policy,
+    )
+
+
+class _TimedExecutor(ToolExecutor):
+    """Sleeps per call and records start/finish order + the in-flight peak."""
+
+    def __init__(self, delays: dict[str, float]) -> None:
+        self._delays = delays
+        self.started: list[str] = []
+        self.finished: list[str] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+
+    async def execute(
+        self,
+        call: ToolCall,
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> ToolResult:
+        self.started.append(call.id)
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays.get(call.name, 0.0))
+        finally:
+            self.in_flight -= 1
+        self.finished.append(call.id)
+        return ToolResult(
+            tool_call_id=call.id,
+            tool_name=call.name,
+            success=True,
+            content=f"result:{call.id}",
+        )
+
+    async def execute_batch(
+        self,
+        calls: list[ToolCall],
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> list[ToolResult]:
+        return [await self.execute(c, trace_context=trace_context, context=context) for c in calls]
+
+
+def _make_loop(
+    *,
+    tool_calls: list[ToolCall],
+    executor: ToolExecutor,
+    specs: list[ToolSpec],
+    parallel: bool,
+    guardrail_engine: GuardrailEngine | None = None,
+) -> tuple[AgentLoopImpl, MockChatClient]:
+    registry = ToolRegistryImpl()
+    for spec in specs:
+        registry.register(spec)
+    chat = MockChatClient(
+        responses=[
+            ChatResponse(
+                model="m", content="", tool_calls=tool_calls, stop_reason=StopReason.TOOL_USE
+            ),
+            ChatResponse(model="m", content="done", stop_reason=StopReason.END_TURN),
+        ]
+    )
+    loop = AgentLoopImpl(
+        chat_client=chat,
+        output_parser=OutputParserImpl(),
+        tool_executor=executor,
+        tool_registry=registry,
+        guardrail_engine=guardrail_engine,
+        parallel_tool_calls=parallel,
+    )
+    return loop, chat
+
+
+async def _run(loop: AgentLoopImpl) -> list[LoopEvent]:
+    return [ev async for ev in loop.run(session_id=uuid4(), user_input="go")]
+
+
+def _ids(events: list[LoopEvent], kind: type[Any]) -> list[str]:
+    return [ev.tool_call_id for ev in events if isinstance(ev, kind)]
+
+
+async def test_parallel_group_runs_concurrently_in_call_order() -> None:
+    calls = [
+        ToolCall(id="c1", name="slow", arguments={}),
+        ToolCall(id="c2", name="fast", arguments={}),
+        ToolCall(id="c3", name="slow", arguments={}),
+    ]
+    executor = _TimedExecutor({"slow": 0.2, "fast": 0.01})
+    loop, chat = _make_loop(
+        tool_calls=calls,
+        executor=executor,
+        specs=[
+            _spec("slow", ConcurrencyPolicy.READ_ONLY_PARALLEL),
+            _spec("fast", ConcurrencyPolicy.ALL_PARALLEL),
+        ],
+        parallel=True,
+    )
+    t0 = asyncio.get_running_loop().time()
+    events = await _run(loop)
+    elapsed = asyncio.get_running_loop().time() - t0
+
+    assert executor.peak_in_flight == 3
+    assert executor.finished[0] == "c2"  # the fast call really overlapped
+    assert elapsed < 0.35  # ≈ max(0.2, 0.01, 0.2), not the 0.41 sum
+    # Wire + buffer order is the call order regardless of completion order.
+    assert _ids(events, ToolCallRequested) == ["c1", "c2", "c3"]
+    assert _ids(events, ToolCallExecuted) == ["c1", "c2", "c3"]
+    assert chat.last_request is not None
+    tool_msgs = [m for m in chat.last_request.messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_msgs] == ["c1", "c2", "c3"]
+    assert [m.content for m in tool_msgs] == ["result:c1", "result:c2", "result:c3"]
+
+
+async def test_sequential_tool_is_a_barrier() -> None:
+    calls = [
+        ToolCall(id="p1", name="read", arguments={}),
+        ToolCall(id="s1", name="write", arguments={}),
+        ToolCall(id="p2", name="read", arguments={}),
+        ToolCall(id="p3", name="read", arguments={}),
+    ]
+    executor = _TimedExecutor({"read": 0.05, "write": 0.05})
+    loop, _ = _make_loop(
+        tool_calls=calls,
+        executor=executor,
+        specs=[
+            _spec("read", ConcurrencyPolicy.READ_ONLY_PARALLEL),
+            _spec("write", ConcurrencyPolicy.SEQUENTIAL),
+        ],
+        parallel=True,
+    )
+    events = await _run(loop)
+
+    # s1 starts only after p1 finished; p2/p3 only after s1 finished.
+    assert executor.started.index("s1") > executor.finished.index("p1")
+    assert executor.finished.index("s1") < executor.started.index("p2")
+    assert executor.peak_in_flight == 2  # the trailing p2 + p3 group
+    assert _ids(events, ToolCallExecuted) == ["p1", "s1", "p2", "p3"]
+
+
+async def test_parallel_disabled_keeps_sequential_baseline() -> None:
+    calls = [ToolCall(id=f"c{i}", name="read", arguments={}) for i in range(3)]
+    executor = _TimedExecutor({"read": 0.02})
+    loop, _ = _make_loop(
+        tool_calls=calls,
+        executor=executor,
+        specs=[_spec("read", ConcurrencyPolicy.READ_ONLY_PARALLEL)],
+        parallel=False,
+    )
+    events = await _run(loop)
+
+    assert executor.peak_in_flight == 1
+    assert _ids(events, ToolCallExecuted) == ["c0", "c1", "c2"]
+
+
+class _BlockNamedCall(Guardrail):
+    """Tool guardrail that BLOCKs one tool_call id and counts its invocations."""
+
+    guardrail_type = GuardrailType.TOOL
+
+    def __init__(self, blocked_id: str) -> None:
+        self._blocked_id = blocked_id
+        self.calls = 0
+
+    async def check(
+        self,
+        *,
+        content: Any,
+        trace_context: TraceContext | None = None,
+    ) -> GuardrailResult:
+        self.calls += 1
+        if isinstance(content, ToolCall) and content.id == self._blocked_id:
+            return GuardrailResult(action=GuardrailAction.BLOCK, reason="nope")
+        return GuardrailResult(action=GuardrailAction.PASS)
+
+
+async def test_guardrail_block_inside_parallel_group() -> None:
+    calls = [ToolCall(id=f"c{i}", name="read", arguments={}) for i in range(3)]
+    executor = _TimedExecutor({"read": 0.01})
+    guard = _BlockNamedCall("c1")
+    engine = GuardrailEngine()
+    engine.register(guard)
+    loop, chat = _make_loop(
+        tool_calls=calls,
+        executor=executor,
+        specs=[_spec("read", ConcurrencyPolicy.READ_ONLY_PARALLEL)],
+        parallel=True,
+        guardrail_engine=engine,
+    )
+    events = await _run(loop)
+
+    assert guard.calls == 3  # one batched verdict per call, not re-evaluated
+    assert sorted(executor.started) == ["c0", "c2"]  # the blocked call never ran
+    assert [ev.reason for ev in events if isinstance(ev, GuardrailTriggered)] == ["nope"]
+    assert _ids(events, ToolCallExecuted) == ["c0", "c1", "c2"]
+    assert chat.last_request is not None
+    tool_msgs = [m for m in chat.last_request.messages if m.role == "tool"]
+    assert [m.tool_call_id for m in tool_msgs] == ["c0", "c1", "c2"]
+    assert tool_msgs[1].content == "tool blocked by guardrail: nope"
@@ -0,0 +1,238 @@
+"""
+File: backend/tests/unit/agent_harness/orchestrator_loop/test_loop_speculative_tools.py
+Purpose: Unit tests — AgentLoopImpl speculative tool calls (dispatch while the stream is open).
+Category: Tests / 範疇 1 (Orchestrator Loop) + 範疇 2 (Tools) + 範疇 9 (Guardrails)
+
+Description:
+    With stream_llm + speculative_tool_calls, a READ_ONLY_PARALLEL tool call whose
+    arguments JSON has closed runs BEFORE the completion finishes streaming:
+    - the speculative result is adopted (executor runs once, events unchanged);
+    - SEQUENTIAL tools, Cat 9 non-PASS verdicts and a disabled flag never speculate;
+    - a final parse that disagrees with the speculated call discards the early run
+      and executes the finalized call normally.
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation (speculative tool calls)
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+from adapters._base.types import StreamEvent
+from adapters._testing.mock_clients import MockChatClient
+from agent_harness._contracts import (
+    CacheBreakpoint,
+    ChatRequest,
+    ConcurrencyPolicy,
+    ExecutionContext,
+    GuardrailTriggered,
+    LoopEvent,
+    StopReason,
+    ToolCall,
+    ToolCallExecuted,
+    ToolResult,
+    ToolSpec,
+    TraceContext,
+)
+from agent_harness.guardrails import (
+    Guardrail,
+    GuardrailAction,
+    GuardrailEngine,
+    GuardrailResult,
+    GuardrailType,
+)
+from agent_harness.orchestrator_loop import AgentLoopImpl
+from agent_harness.output_parser import OutputParserImpl
+from agent_harness.tools import ToolExecutor, ToolRegistryImpl
+
+pytestmark = pytest.mark.asyncio
+
+
+class _SlowStreamClient(MockChatClient):
+    """Replays one scripted stream per call, sleeping between events; logs stream end."""
+
+    def __init__(self, scripts: list[list[StreamEvent]], log: list[str]) -> None:
+        super().__init__()
+        self._scripts = list(scripts)
+        self._log = log
+
+    def stream(
+        self,
+        request: ChatRequest,
+        *,
+        cache_breakpoints: list[CacheBreakpoint] | None = None,
+        trace_context: TraceContext | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        self.stream_call_count += 1
+        return self._replay(self._scripts.pop(0))
+
+    async def _replay(self, events: list[StreamEvent]) -> AsyncIterator[StreamEvent]:
+        for ev in events:
+            yield ev
+            await asyncio.sleep(0.01)
+        self._log.append("stream_end")
+
+
+class _LoggingExecutor(ToolExecutor):
+    def __init__(self, log: list[str]) -> None:
+        self._log = log
+        self.calls: list[ToolCall] = []
+
+    async def execute(
+        self,
+        call: ToolCall,
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> ToolResult:
+        self._log.append(f"exec:{call.id}")
+        self.calls.append(call)
+        return ToolResult(
+            tool_call_id=call.id,
+            tool_name=call.name,
+            success=True,
+            content=f"args={sorted(call.arguments.items())}",
+        )
+
+    async def execute_batch(
+        self,
+        calls: list[ToolCall],
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> list[ToolResult]:
+        return [await self.execute(c, trace_context=trace_context, context=context) for c in calls]
+
+
+class _BlockAll(Guardrail):
+    guardrail_type = GuardrailType.TOOL
+
+    async def check(
+        self, *, content: Any, trace_context: TraceContext | None = None
+    ) -> GuardrailResult:
+        return GuardrailResult(action=GuardrailAction.BLOCK, reason="denied")
+
+
+def _tool_turn(name: str, *arg_fragments: str) -> list[StreamEvent]:
+    events = [
+        StreamEvent(
+            event_type="tool_call_delta",
+            payload={"index": 0, "id": "c1", "name": name, "arguments_delta": ""},
+        )
+    ]
+    events += [
+        StreamEvent(event_type="tool_call_delta", payload={"index": 0, "arguments_delta": frag})
+        for frag in arg_fragments
+    ]
+    # Trailing content keeps the stream open well after the arguments closed.
+    events += [
+        StreamEvent(event_type="content_delta", payload={"text": "checking"}) for _ in range(3)
+    ]
+    events.append(StreamEvent(event_type="stop", payload={"stop_reason": "tool_use"}))
+    return events
+
+
+def _final_turn() -> list[StreamEvent]:
+    return [
+        StreamEvent(event_type="content_delta", payload={"text": "done"}),
+        StreamEvent(event_type="stop", payload={"stop_reason": StopReason.END_TURN.value}),
+    ]
+
+
+def _make_loop(
+    script: list[StreamEvent],
+    log: list[str],
+    *,
+    policy: ConcurrencyPolicy = ConcurrencyPolicy.READ_ONLY_PARALLEL,
+    speculative: bool = True,
+    guardrail_engine: GuardrailEngine | None = None,
+) -> tuple[AgentLoopImpl, _LoggingExecutor]:
+    registry = ToolRegistryImpl()
+    registry.register(
+        ToolSpec(
+            name="lookup",
+            description="lookup",
+            input_schema={"type": "object", "properties": {"q": {"type": "string"}}},
+            concurrency_policy=policy,
+        )
+    )
+    executor = _LoggingExecutor(log)
+    loop = AgentLoopImpl(
+        chat_client=_SlowStreamClient([script, _final_turn()], log),
+        output_parser=OutputParserImpl(),
+        tool_executor=executor,
+        tool_registry=registry,
+        guardrail_engine=guardrail_engine,
+        stream_llm=True,
+        speculative_tool_calls=speculative,
+    )
+    return loop, executor
+
+
+async def _run(loop: AgentLoopImpl) -> list[LoopEvent]:
+    return [ev async for ev in loop.run(session_id=uuid4(), user_input="hi")]
+
+
+def _executed(events: list[LoopEvent]) -> list[tuple[str, str]]:
+    return [
+        (ev.tool_call_id, ev.result_content) for ev in events if isinstance(ev, ToolCallExecuted)
+    ]
+
+
+async def test_closed_read_only_call_runs_before_stream_ends_and_is_adopted() -> None:
+    log: list[str] = []
+    loop, executor = _make_loop(_tool_turn("lookup", '{"q": ', '"a"}'), log)
+    events = await _run(loop)
+
+    assert log.index("exec:c1") < log.index("stream_end")
+    assert len(executor.calls) == 1  # adopted, not re-executed
+    assert _executed(events) == [("c1", "args=[('q', 'a')]")]
+
+
+async def test_sequential_tool_is_not_speculated() -> None:
+    log: list[str] = []
+    loop, executor = _make_loop(
+        _tool_turn("lookup", '{"q": "a"}'), log, policy=ConcurrencyPolicy.SEQUENTIAL
+    )
+    await _run(loop)
+
+    assert log.index("exec:c1") > log.index("stream_end")
+    assert len(executor.calls) == 1
+
+
+async def test_speculation_disabled_waits_for_stream_end() -> None:
+    log: list[str] = []
+    loop, _ = _make_loop(_tool_turn("lookup", '{"q": "a"}'), log, speculative=False)
+    await _run(loop)
+
+    assert log.index("exec:c1") > log.index("stream_end")
+
+
+async def test_guardrail_block_prevents_speculation() -> None:
+    log: list[str] = []
+    engine = GuardrailEngine()
+    engine.register(_BlockAll())
+    loop, executor = _make_loop(_tool_turn("lookup", '{"q": "a"}'), log, guardrail_engine=engine)
+    events = await _run(loop)
+
+    assert executor.calls == []
+    assert [ev.reason for ev in events if isinstance(ev, GuardrailTriggered)] == ["denied"]
+
+
+async def test_disagreeing_final_parse_discards_speculation() -> None:
+    log: list[str] = []
+    # The arguments close after '{"q": "a"}' (speculated), then more argument text
+    # arrives — the finalized call no longer equals the speculated one.
+    loop, executor = _make_loop(_tool_turn("lookup", '{"q": "a"}', '{"x": 1}'), log)
+    events = await _run(loop)
+
+    assert [c.arguments for c in executor.calls] == [
+        {"q": "a"},
+        {"_raw": '{"q": "a"}{"x": 1}'},
+    ]
+    assert _executed(events) == [("c1", 'args=[(\'_raw\', \'{"q": "a"}{"x": 1}\')]')]
@@ -0,0 +1,241 @@
+"""
+File: backend/tests/unit/agent_harness/orchestrator_loop/test_loop_streaming.py
+Purpose: Unit tests — AgentLoopImpl token streaming (stream_llm consumes ChatClient.stream()).
+Category: Tests / 範疇 1 (Orchestrator Loop)
+
+Description:
+    Validates the stream_llm LLM-call path:
+    - each content_delta yields an LLMTextDelta (in order) BEFORE the turn's
+      LLMResponded, which carries the full assembled content;
+    - tool_call_delta fragments assemble into ToolCalls (grouped by index, id-less
+      continuation deltas, JSON arguments split across chunks) and drive the
+      normal TOOL_USE branch;
+    - streamed usage feeds LoopCompleted token totals; a stream without usage
+      falls back to a count_tokens() estimate;
+    - stream_llm=False (default) never calls stream().
+
+Modification History (newest-first):
+    - 2026-10-16: Initial creation (token streaming)
+"""
+
+from __future__ import annotations
+
+from typing import AsyncIterator
+from uuid import uuid4
+
+import pytest
+
+from adapters._base.types import StreamEvent
+from adapters._testing.mock_clients import MockChatClient
+from agent_harness._contracts import (
+    CacheBreakpoint,
+    ChatRequest,
+    ChatResponse,
+    ExecutionContext,
+    LLMResponded,
+    LLMTextDelta,
+    LoopCompleted,
+    LoopEvent,
+    StopReason,
+    ToolCall,
+    ToolCallExecuted,
+    ToolResult,
+    ToolSpec,
+    TraceContext,
+)
+from agent_harness.orchestrator_loop import AgentLoopImpl
+from agent_harness.output_parser import OutputParserImpl
+from agent_harness.tools import ToolExecutor, ToolRegistryImpl
+
+pytestmark = pytest.mark.asyncio
+
+
+class _ScriptedStreamClient(MockChatClient):
+    """MockChatClient whose stream() replays one scripted event list per call."""
+
+    def __init__(self, scripts: list[list[StreamEvent]], *, token_count: int = 0) -> None:
+        super().__init__(token_count=token_count)
+        self._scripts = list(scripts)
+
+    def stream(
+        self,
+        request: ChatRequest,
+        *,
+        cache_breakpoints: list[CacheBreakpoint] | None = None,
+        trace_context: TraceContext | None = None,
+    ) -> AsyncIterator[StreamEvent]:
+        self.stream_call_count += 1
+        self.last_request = request
+        return self._replay(self._scripts.pop(0))
+
+    async def _replay(self, events: list[StreamEvent]) -> AsyncIterator[StreamEvent]:
+        for ev in events:
+            yield ev
+
+
+class _RecordingExecutor(ToolExecutor):
+    def __init__(self) -> None:
+        self.calls: list[ToolCall] = []
+
+    async def execute(
+        self,
+        call: ToolCall,
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> ToolResult:
+        self.calls.append(call)
+        return ToolResult(tool_call_id=call.id, tool_name=call.name, success=True, content="ok")
+
+    async def execute_batch(
+        self,
+        calls: list[ToolCall],
+        *,
+        trace_context: TraceContext | None = None,
+        context: ExecutionContext | None = None,
+    ) -> list[ToolResult]:
+        return [await self.execute(c, trace_context=trace_context, context=context) for c in calls]
+
+
+def _text(t: str) -> StreamEvent:
+    return StreamEvent(event_type="content_delta", payload={"text": t})
+
+
+def _stop(reason: StopReason) -> StreamEvent:
+    return StreamEvent(event_type="stop", payload={"stop_reason": reason.value})
+
+
+def _usage(prompt: int, completion: int) -> StreamEvent:
+    return StreamEvent(
+        event_type="usage",
+        payload={
+            "prompt_tokens": prompt,
+            "completion_tokens": completion,
+            "total_tokens": prompt + completion,
+        },
+    )
+
+
+def _make_loop(
+    client: MockChatClient, executor: ToolExecutor | None = None, *, stream_llm: bool = True
+) -> AgentLoopImpl:
+    registry = ToolRegistryImpl()
+    registry.register(
+        ToolSpec(
+            name="lookup",
+            description="lookup",
+            input_schema={"type": "object", "properties": {"q": {"type": "string"}}},
+        )
+    )
+    return AgentLoopImpl(
+        chat_client=client,
+        output_parser=OutputParserImpl(),
+        tool_executor=executor or _RecordingExecutor(),
+        tool_registry=registry,
+        stream_llm=stream_llm,
+    )
+
+
+async def _run(loop: AgentLoopImpl) -> list[LoopEvent]:
+    return [ev async for ev in loop.run(session_id=uuid4(), user_input="hi")]
+
+
+async def test_text_deltas_precede_assembled_llm_responded() -> None:
+    client = _ScriptedStreamClient(
+        [[_text("Hel"), _text("lo "), _text("world"), _stop(StopReason.END_TURN), _usage(7, 3)]]
+    )
+    events = await _run(_make_loop(client))
+
+    deltas = [ev.text for ev in events if isinstance(ev, LLMTextDelta)]
+    assert deltas == ["Hel", "lo ", "world"]
+    responded = [ev for ev in events if isinstance(ev, LLMResponded)]
+    assert len(responded) == 1
+    assert responded[0].content == "Hello world"
+    assert responded[0].input_tokens == 7
+    assert responded[0].output_tokens == 3
+    last_delta = max(i for i, ev in enumerate(events) if isinstance(ev, LLMTextDelta))
+    assert last_delta < events.index(responded[0])
+    completed = [ev for ev in events if isinstance(ev, LoopCompleted)]
+    assert completed[-1].stop_reason == "end_turn"
+    assert completed[-1].total_tokens == 10
+    assert client.stream_call_count == 1
+    assert client.chat_call_count == 0
+    assert client.last_request is not None and client.last_request.stream is True
+
+
+async def test_tool_call_deltas_assemble_and_execute() -> None:
+    client = _ScriptedStreamClient(
+        [
+            [
+                # Two interleaved parallel calls; only each call's first delta has an id.
+                StreamEvent(
+                    event_type="tool_call_delta",
+                    payload={"index": 0, "id": "c1", "name": "lookup", "arguments_delta": '{"q"'},
+                ),
+                StreamEvent(
+                    event_type="tool_call_delta",
+                    payload={"index": 1, "id": "c2", "name": "lookup", "arguments_delta": ""},
+                ),
+                StreamEvent(
+                    event_type="tool_call_delta",
+                    payload={"index": 0, "id": None, "name": None, "arguments_delta": ': "a"}'},
+                ),
+                StreamEvent(
+                    event_type="tool_call_delta",
+                    payload={"index": 1, "id": None, "name": None, "arguments_delta": '{"q": "b"}'},
+                ),
+                _stop(StopReason.TOOL_USE),
+            ],
+            [_text("done"), _stop(StopReason.END_TURN)],
+        ]
+    )
+    executor = _RecordingExecutor()
+    events = await _run(_make_loop(client, executor))
+
+    assert [(c.id, c.arguments) for c in executor.calls] == [("c1", {"q": "a"}), ("c2", {"q": "b"})]
+    assert [ev.tool_call_id for ev in events if isinstance(ev, ToolCallExecuted)] == ["c1", "c2"]
+    responded = [ev for ev in events if isinstance(ev, LLMResponded)]
+    assert [tc.id for tc in responded[0].tool_calls] == ["c1", "c2"]
+    assert responded[-1].content == "done"
+
+
+async def test_id_only_deltas_without_index_continue_last_call() -> None:
+    client = _ScriptedStreamClient(
+        [
+            [
+                StreamEvent(
+                    event_type="tool_call_delta",
+                    payload={"id": "c1", "name": "lookup", "arguments_delta": '{"q": '},
+                ),
+                StreamEvent(event_type="tool_call_delta", payload={"arguments_delta": '"x"}'}),
+                _stop(StopReason.TOOL_USE),
+            ],
+            [_text("ok"), _stop(StopReason.END_TURN)],
+        ]
+    )
+    executor = _RecordingExecutor()
+    await _run(_make_loop(client, executor))
+
+    assert [(c.id, c.arguments) for c in executor.calls] == [("c1", {"q": "x"})]
+
+
+async def test_stream_without_usage_estimates_via_count_tokens() -> None:
+    client = _ScriptedStreamClient([[_text("hi"), _stop(StopReason.END_TURN)]], token_count=5)
+    events = await _run(_make_loop(client))
+
+    responded = [ev for ev in events if isinstance(ev, LLMResponded)]
+    assert responded[0].input_tokens == 5
+    assert responded[0].output_tokens == 5
+    completed = [ev for ev in events if isinstance(ev, LoopCompleted)]
+    assert completed[-1].total_tokens == 10
+
+
+async def test_stream_llm_disabled_uses_chat() -> None:
+    client = MockChatClient(
+        responses=[ChatResponse(model="m", content="plain", stop_reason=StopReason.END_TURN)]
+    )
+    events = await _run(_make_loop(client, stream_llm=False))
+
+    assert not [ev for ev in events if isinstance(ev, LLMTextDelta)]
+    assert client.chat_call_count == 1
+    assert client.stream_call_count == 0
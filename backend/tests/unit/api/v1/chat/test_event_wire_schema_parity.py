@@ -14,10 +14,10 @@ Description:
     Drift in EITHER direction (serializer adds/removes a field, or registry
     drifts) fails this test. Also asserts the 2 unwired classes still raise
     NotImplementedError, that Thinking still serializes to None, and that the
-    registry has exactly 26 entries.
+    registry has exactly 27 entries.
 
 Created: 2026-06-02 (Sprint 57.67)
-Last Modified: 2026-06-24 (Sprint 57.140 — wire todos_updated; 25→26)
+Last Modified: 2026-10-16 (wire llm_text_delta — token streaming; 26→27)
 """
 
 from __future__ import annotations
@@ -35,6 +35,7 @@ from agent_harness._contracts import (
     GuardrailTriggered,
     LLMRequested,
     LLMResponded,
+    LLMTextDelta,
     LoopCompleted,
     LoopEvent,
     LoopStarted,
@@ -136,6 +137,8 @@ WIRED_EVENT_INSTANCES: list[LoopEvent] = [
     LoopTerminated(reason="max_retries_exhausted", detail="tool failed 3×", last_state_version=2),
     # Sprint 57.140 (Cat 1 → 12): the whole todo list after a write_todos call.
     TodosUpdated(todos=(Todo(id="1", title="research", status="in_progress"),)),
+    # Token streaming (Cat 1 stream_llm): one incremental text chunk.
+    LLMTextDelta(text="Hel"),
 ]
 
 # Cat 8/12 events with no serializer branch (must raise NotImplementedError).
@@ -146,8 +149,8 @@ UNWIRED_EVENT_INSTANCES: list[LoopEvent] = [
 
 
 class TestWireSchemaParity:
-    def test_wire_schema_has_26_entries(self) -> None:
-        assert len(WIRE_SCHEMA) == 26
+    def test_wire_schema_has_27_entries(self) -> None:
+        assert len(WIRE_SCHEMA) == 27
 
     def test_base_fields_only_trace_id(self) -> None:
         # trace_id is the universal field injected by serialize_loop_event;
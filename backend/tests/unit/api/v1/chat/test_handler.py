@@ -162,6 +162,33 @@ def test_build_chat_memory_extractor_returns_context_on_cheap_tier(
     assert client.config.deployment_name == "cheap-deploy"
 
 
+def test_response_cache_wrapper_receives_request_tracer(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """LLM_RESPONSE_CACHE on → the cheap-tier wrapper records hit/miss on the given tracer."""
+    from types import SimpleNamespace
+
+    from adapters._base.response_cache_wrapper import ResponseCacheWrapper
+    from agent_harness.observability import NoOpTracer
+    from api.v1.chat import handler
+
+    monkeypatch.setattr(
+        handler,
+        "get_settings",
+        lambda: SimpleNamespace(
+            llm_response_cache=True,
+            llm_response_cache_ttl_sec=60,
+            llm_response_cache_max_entries=8,
+            llm_response_cache_store="memory",
+        ),
+    )
+    monkeypatch.setattr(handler, "_llm_response_cache_store", lambda: None)
+    tracer = NoOpTracer()
+    wrapped = handler._with_response_cache(object(), tracer=tracer)  # type: ignore[arg-type]
+    assert isinstance(wrapped, ResponseCacheWrapper)
+    assert wrapped._tracer is tracer  # type: ignore[attr-defined]
+
+
 def test_build_real_llm_routes_cheap_to_verifier_action_to_loop(
     monkeypatch: pytest.MonkeyPatch,
 ) -> None:
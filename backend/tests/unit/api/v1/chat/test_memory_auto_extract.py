@@ -9,7 +9,7 @@ Category: Tests / 範疇 3 + chat wiring
 Scope: Sprint 57.149 (created) / Sprint 57.152 (former shape)
 
 Created: 2026-06-28
-Last Modified: 2026-06-30
+Last Modified: 2026-10-16 (formation queue job propagates failures)
 """
 
 from __future__ import annotations
@@ -21,8 +21,9 @@ from uuid import uuid4
 import pytest
 
 from agent_harness._contracts import Message, TraceContext
+from agent_harness.memory.session_summary_store import SummaryState
 from api.v1.chat.handler import ChatMemoryExtractContext
-from api.v1.chat.router import _maybe_auto_extract
+from api.v1.chat.router import _maybe_auto_extract, _post_send_formation
 
 
 class _StubFormer:
@@ -56,10 +57,23 @@ class _StubRetrieval:
 class _StubMessageStore:
     def __init__(self, messages: tuple[Message, ...] = ()) -> None:
         self._messages = list(messages)
+        self.since_calls: list[int] = []
 
     async def load(self) -> list[Message]:
         return list(self._messages)
 
+    async def load_since(self, after_sequence_num: int) -> tuple[list[Message], int]:
+        self.since_calls.append(after_sequence_num)
+        return self._messages[after_sequence_num:], max(len(self._messages), after_sequence_num)
+
+
+class _StubSummaryStore:
+    def __init__(self, state: SummaryState | None) -> None:
+        self._state = state
+
+    async def load_state(self, session_id: Any) -> SummaryState | None:
+        return self._state
+
 
 def _ctx(former: Any, retrieval: Any, store: Any) -> ChatMemoryExtractContext:
     return ChatMemoryExtractContext(
@@ -171,3 +185,168 @@ async def test_swallows_former_failure() -> None:
         trace_context=_trace(uuid4()),
     )
     assert len(former.calls) == 1  # attempted, then swallowed (no raise)
+
+
+def _ledger(n: int) -> tuple[Message, ...]:
+    return tuple(Message(role="user", content=f"m{i}") for i in range(1, n + 1))
+
+
+async def _form_incremental(
+    monkeypatch: pytest.MonkeyPatch,
+    state: SummaryState | None,
+    ledger: tuple[Message, ...],
+    *,
+    full_every: int = 0,
+) -> tuple[dict[str, Any], _StubMessageStore]:
+    from core.config import get_settings
+
+    monkeypatch.setenv("CHAT_SESSION_SUMMARY_INCREMENTAL", "true")
+    monkeypatch.setenv("CHAT_SESSION_SUMMARY_FULL_EVERY", str(full_every))
+    get_settings.cache_clear()
+    former, store = _StubFormer(wants_user_facts=False), _StubMessageStore(ledger)
+    ctx = ChatMemoryExtractContext(
+        former=former,  # type: ignore[arg-type]
+        retrieval=_StubRetrieval(),  # type: ignore[arg-type]
+        message_store=store,  # type: ignore[arg-type]
+        summary_store=_StubSummaryStore(state),  # type: ignore[arg-type]
+    )
+    try:
+        await _maybe_auto_extract(
+            memory_extract_ctx=ctx,
+            tenant_id=uuid4(),
+            session_id=uuid4(),
+            trace_context=_trace(uuid4()),
+        )
+    finally:
+        get_settings.cache_clear()
+    return (former.calls[0] if former.calls else {}), store
+
+
+@pytest.mark.asyncio
+async def test_incremental_forms_only_the_tail_after_the_watermark(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = SummaryState("so far", [], [], last_summarized_seq=3)
+    call, store = await _form_incremental(monkeypatch, state, _ledger(5))
+    assert [m.content for m in call["messages"]] == ["m4", "m5"]
+    assert call["previous_summary"] is state
+    assert call["last_summarized_seq"] == 5
+    assert store.since_calls == [3]
+
+
+@pytest.mark.asyncio
+async def test_incremental_without_summary_does_full_pass_with_watermark(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    call, _ = await _form_incremental(monkeypatch, None, _ledger(3))
+    assert len(call["messages"]) == 3
+    assert call["previous_summary"] is None
+    assert call["last_summarized_seq"] == 3
+
+
+@pytest.mark.asyncio
+async def test_incremental_nothing_new_skips_formation(monkeypatch: pytest.MonkeyPatch) -> None:
+    call, _ = await _form_incremental(monkeypatch, SummaryState("s", [], [], 4), _ledger(4))
+    assert call == {}
+
+
+@pytest.mark.asyncio
+async def test_incremental_full_every_boundary_reloads_whole_ledger(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    state = SummaryState("so far", [], [], last_summarized_seq=9)
+    call, store = await _form_incremental(monkeypatch, state, _ledger(11), full_every=10)
+    assert len(call["messages"]) == 11  # crossed seq 10 → full re-summary
+    assert call["previous_summary"] is None
+    assert call["last_summarized_seq"] == 11
+    assert store.since_calls == [9, 0]
+
+
+@pytest.mark.asyncio
+async def test_post_send_enqueues_one_coalesced_job_when_queue_on(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """CHAT_MEMORY_FORMATION_QUEUE=memory → two sends queue ONE job; nothing forms inline."""
+    from api.v1.chat import formation_queue
+    from core.config import get_settings
+
+    monkeypatch.setenv("CHAT_MEMORY_FORMATION_QUEUE", "memory")
+    get_settings.cache_clear()
+    formation_queue.reset_formation_queue()
+    former = _StubFormer()
+    ctx = _ctx(former, _StubRetrieval(), _StubMessageStore((Message(role="user", content="hi"),)))
+    tenant_id, session_id = uuid4(), uuid4()
+    try:
+        for _ in range(2):
+            await _post_send_formation(
+                memory_extract_ctx=ctx,
+                tenant_id=tenant_id,
+                session_id=session_id,
+                trace_context=_trace(uuid4()),
+            )
+        queue = formation_queue.get_formation_queue()
+        assert queue is not None
+        [job] = await queue.list_pending()
+        assert job.coalesce_key == f"{tenant_id}:{session_id}"
+        assert job.payload == {"session_id": str(session_id)}
+        assert job.not_before is not None and job.not_before > job.enqueued_at  # debounced
+        assert former.calls == []
+    finally:
+        formation_queue.reset_formation_queue()
+        get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_post_send_forms_inline_when_enqueue_fails(monkeypatch: pytest.MonkeyPatch) -> None:
+    """A queue outage must not drop formation — the hook falls back to the inline body."""
+    import importlib
+
+    router_module = importlib.import_module("api.v1.chat.router")
+
+    async def _broken_enqueue(**kwargs: Any) -> bool:
+        raise RuntimeError("queue down")
+
+    monkeypatch.setattr(router_module, "enqueue_formation", _broken_enqueue)
+    former = _StubFormer(wants_user_facts=False)
+    ctx = _ctx(former, _StubRetrieval(), _StubMessageStore((Message(role="user", content="hi"),)))
+    await _post_send_formation(
+        memory_extract_ctx=ctx,
+        tenant_id=uuid4(),
+        session_id=uuid4(),
+        trace_context=_trace(uuid4()),
+    )
+    assert len(former.calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_formation_job_raises_so_the_queue_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The worker-pool job is NOT best-effort: a failed form() must reach complete(error=...)."""
+    from contextlib import asynccontextmanager
+
+    from api.v1.chat import formation_queue, handler
+    from infrastructure.db import engine
+    from platform_layer.billing import model_policy
+    from runtime.workers import TaskEnvelope
+
+    former = _StubFormer(raises=True)
+    ctx = _ctx(former, _StubRetrieval(), _StubMessageStore((Message(role="user", content="hi"),)))
+
+    @asynccontextmanager
+    async def _session() -> Any:
+        yield object()
+
+    async def _policy(db: Any, tenant_id: Any) -> None:
+        return None
+
+    monkeypatch.setattr(engine, "get_session_factory", lambda: _session)
+    monkeypatch.setattr(model_policy, "resolve_tenant_model_policy", _policy)
+    monkeypatch.setattr(handler, "build_chat_memory_extractor", lambda *args, **kwargs: ctx)
+    envelope = TaskEnvelope.new(
+        tenant_id=str(uuid4()),
+        payload={"session_id": str(uuid4())},
+        trace_id="t",
+        coalesce_key="k",
+    )
+    with pytest.raises(RuntimeError, match="former boom"):
+        await formation_queue.run_formation_job(envelope)
+    assert len(former.calls) == 1
@@ -55,3 +55,72 @@ def test_flag_on_configured_builds_and_memoizes(monkeypatch: pytest.MonkeyPatch)
     idx = get_memory_vector_index()  # ctors are lazy → no real Azure/Qdrant connection
     assert isinstance(idx, MemoryVectorIndex)
     assert get_memory_vector_index() is idx  # memoized (built once)
+
+
+def test_embedding_cache_shares_one_coalescing_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    from adapters._base.coalescing_embedding_client import CoalescingEmbeddingClient
+    from api.v1.chat.embedding_client import reset_embedding_client
+    from api.v1.chat.knowledge_index import (
+        get_knowledge_vector_index,
+        reset_knowledge_vector_index,
+    )
+
+    monkeypatch.setenv("MEMORY_VECTOR_ENABLED", "true")
+    monkeypatch.setenv("KNOWLEDGE_VECTOR_ENABLED", "true")
+    monkeypatch.setenv("EMBEDDING_CACHE", "true")
+    monkeypatch.setattr(_IS_CONFIGURED, lambda self: True)
+    get_settings.cache_clear()
+    reset_embedding_client()
+    reset_knowledge_vector_index()
+    try:
+        memory_idx = get_memory_vector_index()
+        knowledge_idx = get_knowledge_vector_index()
+        assert memory_idx is not None and knowledge_idx is not None
+        assert isinstance(memory_idx._embedder, CoalescingEmbeddingClient)
+        assert knowledge_idx._embedder is memory_idx._embedder  # one cache, one coalescer
+    finally:
+        reset_embedding_client()
+        reset_knowledge_vector_index()
+
+
+def test_local_backend_shares_one_store_without_qdrant(monkeypatch: pytest.MonkeyPatch) -> None:
+    from api.v1.chat.knowledge_index import (
+        get_knowledge_vector_index,
+        reset_knowledge_vector_index,
+    )
+    from api.v1.chat.vector_store import reset_vector_store
+    from infrastructure.vector.local_store import LocalVectorStore
+
+    monkeypatch.setenv("MEMORY_VECTOR_ENABLED", "true")
+    monkeypatch.setenv("KNOWLEDGE_VECTOR_ENABLED", "true")
+    monkeypatch.setenv("VECTOR_STORE_BACKEND", "local")
+    monkeypatch.setenv("QDRANT_URL", "")  # not needed by the local backend
+    monkeypatch.setattr(_IS_CONFIGURED, lambda self: True)
+    get_settings.cache_clear()
+    reset_vector_store()
+    reset_knowledge_vector_index()
+    try:
+        memory_idx = get_memory_vector_index()
+        knowledge_idx = get_knowledge_vector_index()
+        assert memory_idx is not None and knowledge_idx is not None
+        assert isinstance(memory_idx._store, LocalVectorStore)
+        assert knowledge_idx._store is memory_idx._store  # one process-wide store
+    finally:
+        reset_vector_store()
+        reset_knowledge_vector_index()
+
+
+async def test_async_qdrant_store_is_shared_and_closed(monkeypatch: pytest.MonkeyPatch) -> None:
+    from api.v1.chat.vector_store import close_vector_store, get_vector_store, reset_vector_store
+    from infrastructure.vector.qdrant_client import AsyncQdrantVectorStore
+
+    monkeypatch.setenv("QDRANT_ASYNC_CLIENT", "true")
+    get_settings.cache_clear()
+    reset_vector_store()
+    try:
+        store = get_vector_store()
+        assert isinstance(store, AsyncQdrantVectorStore)
+        assert get_vector_store() is store  # one pool for both indexes
+        await close_vector_store()  # never connected → no-op
+    finally:
+        reset_vector_store()
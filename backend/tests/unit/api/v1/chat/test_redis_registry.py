@@ -0,0 +1,168 @@
+"""
+File: backend/tests/unit/api/v1/chat/test_redis_registry.py
+Purpose: Unit tests for the Redis-backed chat registries — two workers over one
+    fakeredis server: cross-worker status, cancel and inject delivery, tenant
+    isolation, ownership heartbeat / expiry, and fail-open on a Redis outage.
+Category: Tests / api/v1/chat
+Scope: Phase 57 / multi-worker chat pods
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from dataclasses import dataclass, field
+from uuid import UUID, uuid4
+
+import pytest
+from fakeredis import FakeServer
+from fakeredis.aioredis import FakeRedis
+
+from agent_harness._contracts import Message
+from api.v1.chat import injection_registry, redis_registry, session_registry
+from api.v1.chat.redis_registry import RedisInjectionRegistry, RedisSessionRegistry, RegistryBus
+
+
+@dataclass
+class _Worker:
+    bus: RegistryBus
+    sessions: RedisSessionRegistry
+    inject: RedisInjectionRegistry
+    cancelled: list[tuple[UUID, UUID]] = field(default_factory=list)
+
+
+def _worker(server: FakeServer, *, owner_ttl_sec: int = 30) -> _Worker:
+    bus = RegistryBus(FakeRedis(server=server), owner_ttl_sec=owner_ttl_sec, heartbeat_sec=60)
+    cancelled: list[tuple[UUID, UUID]] = []
+    sessions = RedisSessionRegistry(
+        bus, finished_ttl_sec=600, on_cancel=lambda t, s: cancelled.append((t, s))
+    )
+    return _Worker(bus, sessions, RedisInjectionRegistry(bus), cancelled)
+
+
+@pytest.fixture
+async def workers() -> AsyncIterator[tuple[_Worker, _Worker]]:
+    server = FakeServer()
+    owner, other = _worker(server), _worker(server)
+    await owner.bus.start()
+    await other.bus.start()
+    yield owner, other
+    await owner.bus.stop()
+    await other.bus.stop()
+
+
+async def _until(predicate: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_status_is_readable_from_another_worker(workers: tuple[_Worker, _Worker]) -> None:
+    owner, other = workers
+    tid, sid = uuid4(), uuid4()
+    entry = await owner.sessions.register(tid, sid)
+    seen = await other.sessions.get(tid, sid)
+    assert seen is not None and seen.status == "running"
+    assert seen.started_at == entry.started_at
+    await owner.sessions.mark_completed(tid, sid)
+    seen = await other.sessions.get(tid, sid)
+    assert seen is not None and seen.status == "completed"
+
+
+@pytest.mark.asyncio
+async def test_cancel_reaches_the_owning_worker(workers: tuple[_Worker, _Worker]) -> None:
+    owner, other = workers
+    tid, sid = uuid4(), uuid4()
+    entry = await owner.sessions.register(tid, sid)
+    assert await other.sessions.cancel(tid, sid) is True
+    await _until(entry.cancel_event.is_set)
+    assert entry.status == "cancelled"
+    assert owner.cancelled == [(tid, sid)]
+    assert other.cancelled == []  # only the owner runs the hook
+    seen = await other.sessions.get(tid, sid)
+    assert seen is not None and seen.status == "cancelled"
+
+
+@pytest.mark.asyncio
+async def test_inject_reaches_the_owning_workers_queue(workers: tuple[_Worker, _Worker]) -> None:
+    owner, other = workers
+    tid, sid = uuid4(), uuid4()
+    await owner.inject.register(tid, sid)
+    assert await other.inject.put(tid, sid, Message(role="user", content="also check logs"))
+    drained: list[Message] = []
+    for _ in range(200):
+        drained.extend(await owner.inject.drain(tid, sid))
+        if drained:
+            break
+        await asyncio.sleep(0.01)
+    assert [(m.role, m.content) for m in drained] == [("user", "also check logs")]
+    assert other.inject.live_count() == 0  # queues stay on the owner
+
+    await owner.inject.unregister(tid, sid)
+    assert await other.inject.put(tid, sid, Message(role="user", content="late")) is False
+
+
+@pytest.mark.asyncio
+async def test_cross_tenant_lookups_miss(workers: tuple[_Worker, _Worker]) -> None:
+    owner, other = workers
+    tid, sid = uuid4(), uuid4()
+    await owner.sessions.register(tid, sid)
+    await owner.inject.register(tid, sid)
+    stranger = uuid4()
+    assert await other.sessions.get(stranger, sid) is None
+    assert await other.sessions.cancel(stranger, sid) is False
+    assert await other.inject.put(stranger, sid, Message(role="user", content="x")) is False
+
+
+@pytest.mark.asyncio
+async def test_dead_owner_ages_out_and_heartbeat_keeps_live_keys() -> None:
+    server = FakeServer()
+    owner, other = _worker(server, owner_ttl_sec=1), _worker(server)
+    tid, live, orphan = uuid4(), uuid4(), uuid4()
+    await owner.sessions.register(tid, live)
+    await owner.sessions.register(tid, orphan)
+    owner.bus.disown(f"chat:registry:session:{tid}:{orphan}")  # as if its worker died
+    await asyncio.sleep(0.6)
+    await owner.bus.beat()
+    await asyncio.sleep(0.6)
+    assert await other.sessions.get(tid, live) is not None
+    assert await other.sessions.get(tid, orphan) is None
+
+
+@pytest.mark.asyncio
+async def test_redis_outage_fails_open_to_local_state() -> None:
+    server = FakeServer()
+    server.connected = False
+    worker = _worker(server)
+    tid, sid = uuid4(), uuid4()
+    entry = await worker.sessions.register(tid, sid)
+    await worker.inject.register(tid, sid)
+    assert await worker.sessions.get(tid, sid) is entry
+    assert await worker.sessions.get(tid, uuid4()) is None
+    assert await worker.inject.put(tid, sid, Message(role="user", content="x")) is True
+    assert await worker.inject.put(tid, uuid4(), Message(role="user", content="x")) is False
+
+
+@pytest.mark.asyncio
+async def test_start_and_stop_swap_the_default_singletons() -> None:
+    bus = await redis_registry.start_redis_registries(
+        FakeRedis(server=FakeServer()), owner_ttl_sec=30, heartbeat_sec=60, finished_ttl_sec=60
+    )
+    try:
+        assert isinstance(session_registry.get_default_registry(), RedisSessionRegistry)
+        assert isinstance(
+            injection_registry.get_default_injection_registry(), RedisInjectionRegistry
+        )
+    finally:
+        await redis_registry.stop_redis_registries()
+    assert bus.worker_id
+    assert type(session_registry.get_default_registry()) is session_registry.SessionRegistry
+    assert (
+        type(injection_registry.get_default_injection_registry())
+        is injection_registry.InjectionRegistry
+    )
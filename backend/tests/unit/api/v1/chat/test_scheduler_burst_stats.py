@@ -179,7 +179,7 @@ async def test_final_loop_end_payload_total_turns_is_aggregate(
 
     captured: list[tuple[str, dict[str, Any]]] = []
 
-    def _capture(msg_type: str, data: dict[str, Any]) -> bytes:
+    def _capture(msg_type: str, data: dict[str, Any], event_id: int | None = None) -> bytes:
         captured.append((msg_type, data))
         return b"x"
 
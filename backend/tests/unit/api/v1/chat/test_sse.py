@@ -5,11 +5,14 @@ Category: tests
 Scope: Phase 50 / Sprint 50.2 (Day 1.3)
 
 Created: 2026-04-30
+Last Modified: 2026-10-16 (dispatch-table subclass fallback + encoder datetime/tuple)
 """
 
 from __future__ import annotations
 
 import json
+from dataclasses import dataclass
+from datetime import UTC, datetime
 from uuid import uuid4
 
 import pytest
@@ -223,6 +226,15 @@ class TestSerializeLoopEvent:
         assert out["type"] == "message_injected"
         assert out["data"]["text"] == "also check the db pool"
 
+    def test_llm_text_delta(self) -> None:
+        """Token streaming: LLMTextDelta → llm_text_delta wire frame (chunk text only)."""
+        from agent_harness._contracts import LLMTextDelta
+
+        out = serialize_loop_event(LLMTextDelta(text="Hel"))
+        assert out is not None
+        assert out["type"] == "llm_text_delta"
+        assert out["data"] == {"text": "Hel", "trace_id": None}
+
     def test_approval_received_approved(self) -> None:
         """Sprint 53.5 US-2: wait_for_decision returns → ApprovalReceived → SSE."""
         from agent_harness._contracts import ApprovalReceived
@@ -416,6 +428,18 @@ class TestSerializeLoopEvent:
         with pytest.raises(NotImplementedError, match="Sprint 50.2"):
             serialize_loop_event(ev)
 
+    def test_subclass_of_wired_event_resolves_to_base_serializer(self) -> None:
+        # The dispatch table is keyed by exact class; a subclass falls back to its
+        # nearest wired base via the MRO (isinstance semantics preserved).
+        @dataclass(frozen=True)
+        class _Turn(TurnStarted):
+            pass
+
+        out = serialize_loop_event(_Turn(turn_num=4))
+        assert out is not None
+        assert out["type"] == "turn_start"
+        assert out["data"]["turn_num"] == 4
+
 
 class TestFormatSseMessage:
     def test_basic_frame(self) -> None:
@@ -430,7 +454,7 @@ class TestFormatSseMessage:
     def test_uuid_serializable(self) -> None:
         sid = uuid4()
         frame = format_sse_message("loop_start", {"session_id": sid})
-        # UUID coerced to string by _jsonable
+        # UUID encoded as its canonical string
         body = frame.decode("utf-8")
         assert str(sid) in body
         # Verify it parses as JSON
@@ -438,6 +462,14 @@ class TestFormatSseMessage:
         parsed = json.loads(data_line[len("data: ") :])
         assert parsed["session_id"] == str(sid)
 
+    def test_datetime_and_tuple_serializable(self) -> None:
+        ts = datetime(2026, 1, 2, 3, 4, 5, tzinfo=UTC)
+        frame = format_sse_message("x", {"at": ts, "pair": (1, 2)})
+        body = frame.decode("utf-8")
+        data_line = [line for line in body.split("\n") if line.startswith("data: ")][0]
+        parsed = json.loads(data_line[len("data: ") :])
+        assert parsed == {"at": ts.isoformat(), "pair": [1, 2]}
+
     def test_prompt_built_round_trip_wire_frame(self) -> None:
         """Sprint 57.66 (A-5a+): a new diagnostic event round-trips to a wire frame."""
         ev = PromptBuilt(
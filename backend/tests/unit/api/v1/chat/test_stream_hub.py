@@ -0,0 +1,169 @@
+"""
+File: backend/tests/unit/api/v1/chat/test_stream_hub.py
+Purpose: Unit tests for the resumable-stream fan-out — ring backlog + live frames,
+    Last-Event-ID de-duplication, gap detection (410), lag drop, close / cancel,
+    tenant isolation, and the router's producer + originating-response wrapper.
+Category: Tests / api/v1/chat
+Scope: Phase 57 / resumable SSE streams
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib
+from collections.abc import AsyncIterator
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from api.v1.chat import stream_hub
+from api.v1.chat.sse import format_sse_message
+from api.v1.chat.stream_hub import StreamFrame, StreamHub, frame_event_id, frames_after
+
+# api.v1.chat.__init__ re-exports `router` (the APIRouter), shadowing the submodule.
+chat_router = importlib.import_module("api.v1.chat.router")
+
+
+def _frame(event_id: int | None, after_seq: int) -> StreamFrame:
+    return StreamFrame(f"{event_id}/{after_seq}".encode(), event_id, after_seq)
+
+
+async def _collect(frames: AsyncIterator[bytes]) -> list[bytes]:
+    return [frame async for frame in frames]
+
+
+@pytest.mark.asyncio
+async def test_subscriber_gets_ring_backlog_then_live_frames_until_close() -> None:
+    hub, tenant, session = StreamHub(), uuid4(), uuid4()
+    hub.open(tenant, session, ring_size=2)
+    for seq in (1, 2, 3):
+        hub.publish(tenant, session, _frame(seq, seq))
+    sub = hub.subscribe(tenant, session)
+    assert sub is not None
+    hub.publish(tenant, session, _frame(4, 4))
+    hub.close(tenant, session)
+    assert [f.event_id async for f in sub] == [2, 3, 4]  # ring kept the last 2
+
+
+@pytest.mark.asyncio
+async def test_frames_after_skips_what_the_client_already_has() -> None:
+    async def _frames() -> AsyncIterator[StreamFrame]:
+        for frame in (_frame(3, 3), _frame(None, 3), _frame(4, 4), _frame(None, 4)):
+            yield frame
+
+    assert await _collect(frames_after(_frames(), 3)) == [b"None/3", b"4/4", b"None/4"]
+    assert await _collect(frames_after(_frames(), 4)) == [b"None/4"]
+
+
+@pytest.mark.asyncio
+async def test_frames_after_ends_at_a_sequence_gap() -> None:
+    async def _frames() -> AsyncIterator[StreamFrame]:
+        for frame in (_frame(None, 5), _frame(6, 6), _frame(7, 7)):
+            yield frame
+
+    # The client holds up to 3; 4-5 are in neither the replay nor the ring.
+    assert await _collect(frames_after(_frames(), 3)) == [b"None/5"]
+    assert await _collect(frames_after(_frames(), 5)) == [b"None/5", b"6/6", b"7/7"]
+
+
+@pytest.mark.asyncio
+async def test_reconnect_is_410_when_rolled_out_frames_are_uncommitted(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    hub, tenant, session = StreamHub(), uuid4(), uuid4()
+    monkeypatch.setattr(chat_router, "get_default_stream_hub", lambda: hub)
+    hub.open(tenant, session, ring_size=2)
+    for seq in (11, 12, 13, 14):  # ring keeps 13, 14
+        hub.publish(tenant, session, _frame(seq, seq))
+    committed = 10  # inline mode: this run's rows are not committed yet
+
+    async def _committed(tenant_id: object, session_id: object) -> int:
+        return committed
+
+    monkeypatch.setattr(chat_router, "_committed_main_seq", _committed)
+    with pytest.raises(HTTPException) as exc_info:
+        await chat_router.reconnect_session_stream(session, "10", tenant)
+    assert exc_info.value.status_code == 410
+    assert "11-12" in str(exc_info.value.detail)
+
+    committed = 12  # background flush got there: resumable again
+    response = await chat_router.reconnect_session_stream(session, "10", tenant)
+    assert response.status_code == 200
+    # Cursor already adjacent to the ring: no transcript lookup at all.
+    committed = 0
+    response = await chat_router.reconnect_session_stream(session, "12", tenant)
+    assert response.status_code == 200
+    hub.close(tenant, session)
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_is_dropped_but_unbounded_one_is_not() -> None:
+    hub, tenant, session = StreamHub(max_queued=2), uuid4(), uuid4()
+    hub.open(tenant, session)
+    slow = hub.subscribe(tenant, session)
+    origin = hub.subscribe(tenant, session, bounded=False)
+    assert slow is not None and origin is not None
+    for seq in range(1, 5):
+        hub.publish(tenant, session, _frame(seq, seq))
+    hub.close(tenant, session)
+    assert slow.dropped
+    assert [f.event_id async for f in slow] == [1, 2]
+    assert [f.event_id async for f in origin] == [1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_tenant_scoped_and_cancel_stops_producer() -> None:
+    hub, tenant, session = StreamHub(), uuid4(), uuid4()
+    hub.open(tenant, session)
+    assert hub.subscribe(uuid4(), session) is None  # other tenant: no channel
+    producer = asyncio.create_task(asyncio.sleep(60))
+    hub.attach_producer(tenant, session, producer)
+    assert hub.cancel(uuid4(), session) is False
+    assert hub.cancel(tenant, session) is True
+    with pytest.raises(asyncio.CancelledError):
+        await producer
+
+
+def test_frame_event_id_reads_the_id_line() -> None:
+    assert frame_event_id(format_sse_message("turn_start", {"a": 1}, event_id=7)) == 7
+    assert frame_event_id(format_sse_message("llm_text_delta", {"text": "x"})) is None
+
+
+@pytest.mark.asyncio
+async def test_resumable_stream_survives_subscriber_disconnect(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """The originating response yields every frame; closing it early leaves the run
+    going, and the finally waits for the producer before returning."""
+    hub = StreamHub()
+    monkeypatch.setattr(chat_router, "get_default_stream_hub", lambda: hub)
+    tenant, session = uuid4(), uuid4()
+    produced: list[int] = []
+    gate = asyncio.Event()
+
+    async def _run() -> AsyncIterator[bytes]:
+        for seq in (1, 2, 3):
+            produced.append(seq)
+            yield format_sse_message("turn_start", {"turn_num": seq}, event_id=seq)
+            if seq == 1:
+                await gate.wait()
+
+    body = chat_router._resumable_stream(_run(), tenant, session, ring_size=8)
+    first = await body.__anext__()
+    assert frame_event_id(first) == 1
+    # Client disconnects; the run continues once unblocked and aclose() waits for it.
+    closing = asyncio.create_task(body.aclose())
+    await asyncio.sleep(0)
+    gate.set()
+    await closing
+    assert produced == [1, 2, 3]
+    assert not hub.is_live(tenant, session)
+
+
+def test_reset_stream_hub_replaces_singleton() -> None:
+    before = stream_hub.get_default_stream_hub()
+    stream_hub.reset_stream_hub()
+    assert stream_hub.get_default_stream_hub() is not before
@@ -0,0 +1,148 @@
+"""
+File: backend/tests/unit/api/v1/chat/test_transcript_writer.py
+Purpose: Unit tests for the buffered message_events transcript writer —
+    multi-row batching by size / age, add order across rows + ops, best-effort
+    failure, the disabled (db None) writer and the own-session background mode.
+Category: Tests / api/v1/chat
+Scope: Phase 57 / batched transcript persistence
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from api.v1.chat.transcript_writer import TranscriptWriter
+
+
+class _Nested:
+    async def __aenter__(self) -> None:
+        return None
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+
+class _FakeDb:
+    """Records executed statements; an INSERT's row count is read off its params."""
+
+    def __init__(self, *, fail: bool = False) -> None:
+        self.calls: list[Any] = []
+        self.commits = 0
+        self._fail = fail
+
+    def begin_nested(self) -> _Nested:
+        return _Nested()
+
+    async def execute(self, stmt: Any, params: Any = None) -> None:
+        if self._fail:
+            raise RuntimeError("db down")
+        self.calls.append(stmt)
+
+    async def commit(self) -> None:
+        self.commits += 1
+
+    async def __aenter__(self) -> _FakeDb:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def inserts(self) -> list[list[int]]:
+        """sequence_nums per multi-row INSERT (set_config SELECTs skipped)."""
+        out = []
+        for stmt in self.calls:
+            if getattr(stmt, "is_insert", False):
+                rows = stmt.compile().params
+                out.append(sorted(v for k, v in rows.items() if k.startswith("sequence_num")))
+        return out
+
+
+def _payload(i: int) -> dict[str, Any]:
+    return {"type": "llm_response", "data": {"content": f"c{i}"}}
+
+
+def _add(writer: TranscriptWriter, n: int, start: int = 1) -> None:
+    session_id = uuid4()
+    for i in range(start, start + n):
+        writer.add_event(session_id=session_id, payload=_payload(i), sequence_num=i)
+
+
+@pytest.mark.asyncio
+async def test_inline_batches_rows_into_one_insert_per_threshold() -> None:
+    db = _FakeDb()
+    writer = TranscriptWriter(
+        tenant_id=uuid4(),
+        db=db,  # type: ignore[arg-type]
+        max_rows=3,
+        max_delay_sec=60,
+    )
+    _add(writer, 2)
+    await writer.pump()
+    assert db.calls == []  # neither full nor old → no round trip
+    _add(writer, 1, start=3)
+    await writer.pump()
+    _add(writer, 1, start=4)
+    await writer.aclose()
+    assert db.inserts() == [[1, 2, 3], [4]]
+
+
+@pytest.mark.asyncio
+async def test_ops_run_between_the_rows_around_them() -> None:
+    db = _FakeDb()
+    order: list[str] = []
+
+    async def _op(session: AsyncSession) -> None:
+        order.append(f"op after {len(db.calls)} insert(s)")
+
+    writer = TranscriptWriter(tenant_id=uuid4(), db=db, max_rows=100)  # type: ignore[arg-type]
+    _add(writer, 2)
+    writer.add_op(_op)
+    _add(writer, 1, start=3)
+    await writer.aclose()
+    assert order == ["op after 1 insert(s)"]
+    assert db.inserts() == [[1, 2], [3]]
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_swallowed() -> None:
+    writer = TranscriptWriter(tenant_id=uuid4(), db=_FakeDb(fail=True))  # type: ignore[arg-type]
+    _add(writer, 2)
+    await writer.aclose()  # logged, never raised
+
+
+@pytest.mark.asyncio
+async def test_disabled_writer_drops_everything() -> None:
+    writer = TranscriptWriter(tenant_id=uuid4())
+    _add(writer, 2)
+    await writer.pump()
+    await writer.aclose()
+    assert not writer.enabled
+
+
+@pytest.mark.asyncio
+async def test_background_mode_flushes_on_own_session_without_pump() -> None:
+    request_db, own = _FakeDb(), _FakeDb()
+    writer = TranscriptWriter(
+        tenant_id=uuid4(),
+        db=request_db,  # type: ignore[arg-type]
+        session_factory=lambda: own,  # type: ignore[arg-type]
+        max_rows=2,
+        max_delay_sec=60,
+    )
+    _add(writer, 2)
+    await writer.pump()  # no-op in background mode
+    for _ in range(5):
+        await asyncio.sleep(0)
+    assert own.inserts() == [[1, 2]]
+    _add(writer, 1, start=3)
+    await writer.aclose()
+    assert own.inserts() == [[1, 2], [3]]
+    assert own.commits == 2
+    assert request_db.calls == []
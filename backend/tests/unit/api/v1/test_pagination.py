@@ -0,0 +1,78 @@
+"""
+File: backend/tests/unit/api/v1/test_pagination.py
+Purpose: Unit tests for the shared keyset cursor + NDJSON helpers.
+Category: Tests / api/v1
+Scope: Phase 57 / listing APIs at tenant scale
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import json
+from collections.abc import AsyncIterator
+from datetime import UTC, datetime
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import HTTPException
+from pydantic import BaseModel
+from sqlalchemy import Column, DateTime, Integer, MetaData, Table
+from sqlalchemy.dialects import postgresql
+
+from api.v1.pagination import (
+    NDJSON_MEDIA_TYPE,
+    decode_cursor,
+    encode_cursor,
+    keyset_after,
+    ndjson_response,
+)
+
+
+def test_cursor_round_trips_datetime_uuid_and_int() -> None:
+    at, row_id = datetime(2026, 10, 16, 9, 30, tzinfo=UTC), uuid4()
+    assert decode_cursor(encode_cursor(at, row_id), datetime, UUID) == (at, row_id)
+    assert decode_cursor(encode_cursor(row_id, 42), UUID, int) == (row_id, 42)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-base64-json!",
+        encode_cursor(1),  # wrong arity
+        encode_cursor(uuid4(), uuid4()),  # str where an int is expected
+    ],
+)
+def test_malformed_cursor_is_400(cursor: str) -> None:
+    with pytest.raises(HTTPException) as exc_info:
+        decode_cursor(cursor, UUID, int)
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "invalid cursor"
+
+
+def test_keyset_after_is_a_row_value_comparison() -> None:
+    table = Table(
+        "t", MetaData(), Column("created_at", DateTime(timezone=True)), Column("id", Integer)
+    )
+    cols = (table.c.created_at, table.c.id)
+    older = keyset_after(cols, (datetime.now(UTC), 7), descending=True)
+    newer = keyset_after(cols, (datetime.now(UTC), 7), descending=False)
+    dialect = postgresql.dialect()  # type: ignore[no-untyped-call]
+    assert "(t.created_at, t.id) <" in str(older.compile(dialect=dialect))
+    assert "(t.created_at, t.id) >" in str(newer.compile(dialect=dialect))
+
+
+class _Item(BaseModel):
+    n: int
+
+
+@pytest.mark.asyncio
+async def test_ndjson_response_writes_one_object_per_line() -> None:
+    async def _items() -> AsyncIterator[_Item]:
+        for n in range(3):
+            yield _Item(n=n)
+
+    response = ndjson_response(_items())
+    assert response.media_type == NDJSON_MEDIA_TYPE
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[misc]
+    assert [json.loads(line) for line in body.splitlines()] == [{"n": 0}, {"n": 1}, {"n": 2}]
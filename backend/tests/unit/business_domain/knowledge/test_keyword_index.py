@@ -0,0 +1,110 @@
+"""
+File: backend/tests/unit/business_domain/knowledge/test_keyword_index.py
+Purpose: Unit tests for DocsKeywordIndex (BM25 inverted index for keyword knowledge_search).
+Category: Tests
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from agent_harness._contracts import ExecutionContext, ToolCall
+from business_domain.knowledge import (
+    DocsKeywordIndex,
+    LocalDocsConnector,
+    get_docs_keyword_index,
+    make_knowledge_search_handler,
+)
+from business_domain.knowledge.keyword_index import reset_docs_keyword_indexes, tokenize
+
+
+def _write(root: Path, rel: str, content: str) -> Path:
+    p = root / rel
+    p.parent.mkdir(parents=True, exist_ok=True)
+    p.write_text(content, encoding="utf-8")
+    return p
+
+
+def _index(root: Path) -> DocsKeywordIndex:
+    return DocsKeywordIndex(root, refresh_interval_sec=0.0)  # re-stat on every search
+
+
+def test_tokenize_words_and_cjk_bigrams() -> None:
+    assert tokenize("Anti-Pattern 反模式") == ["anti", "pattern", "反模", "模式"]
+    assert tokenize("  ") == []
+
+
+def test_returns_best_section_per_source(tmp_path: Path) -> None:
+    _write(
+        tmp_path,
+        "runbook.md",
+        "# Runbook\nintro\n\n## Disk full\nClear the disk cache.\n\n## Redis failover\n"
+        "Promote the redis replica, then repoint redis clients.\n",
+    )
+    _write(tmp_path, "other.md", "# Other\nnothing relevant here\n")
+
+    hits = _index(tmp_path).search("redis failover", top_k=5)
+
+    assert [h.source for h in hits] == ["runbook.md"]
+    assert hits[0].snippet.startswith("## Redis failover")  # precomputed section body
+    assert hits[0].score > 0
+
+
+def test_ranking_prefers_filename_then_heading_then_body(tmp_path: Path) -> None:
+    _write(tmp_path, "zeta.md", "# Notes\nunrelated text body\n")
+    _write(tmp_path, "h.md", "# Topic\n\n## Zeta overview\nunrelated text body\n")
+    _write(tmp_path, "c.md", "# Misc\nplain body mentioning zeta once\n")
+    _write(tmp_path, "filler.md", "# Filler\nnothing to see\n")
+
+    sources = [h.source for h in _index(tmp_path).search("zeta", top_k=5)]
+
+    assert sources == ["zeta.md", "h.md", "c.md"]
+
+
+def test_incremental_refresh_by_mtime_and_size(tmp_path: Path) -> None:
+    doc = _write(tmp_path, "a.md", "# A\nalpha content\n")
+    _write(tmp_path, "b.md", "# B\nbeta content\n")
+    index = _index(tmp_path)
+    assert index.refresh() == (2, 0)
+    assert index.refresh() == (0, 0)  # unchanged → nothing re-read
+
+    doc.write_text("# A\ngamma content now\n", encoding="utf-8")
+    os.utime(doc, ns=(1, 1))  # force a distinct mtime even on coarse clocks
+    (tmp_path / "b.md").unlink()
+
+    assert index.search("alpha") == []
+    assert [h.source for h in index.search("gamma")] == ["a.md"]
+    assert index.search("beta") == []
+    assert index.section_count == 1
+
+
+def test_process_wide_index_per_root(tmp_path: Path) -> None:
+    reset_docs_keyword_indexes()
+    try:
+        index = get_docs_keyword_index(tmp_path)
+        assert get_docs_keyword_index(str(tmp_path)) is index
+        with pytest.raises(ValueError):
+            get_docs_keyword_index(tmp_path / "missing")
+    finally:
+        reset_docs_keyword_indexes()
+
+
+async def test_handler_uses_keyword_index(tmp_path: Path) -> None:
+    _write(tmp_path, "deploy.md", "# Deploy\n\n## Rollback\nRun the rollback playbook.\n")
+    connector = LocalDocsConnector(tmp_path)
+    handler = make_knowledge_search_handler(connector, keyword_index=_index(tmp_path))
+
+    raw = await handler(
+        ToolCall(id="c1", name="knowledge_search", arguments={"query": "rollback"}),
+        ExecutionContext(),
+    )
+
+    payload = json.loads(raw)
+    assert payload["count"] == 1
+    assert payload["hits"][0]["source"] == "deploy.md"
+    assert "rollback playbook" in payload["hits"][0]["snippet"]
@@ -289,3 +289,143 @@ async def test_tenant_id_none_uses_shared_collection() -> None:
         index = _index(root, store)
         assert await index.ingest() == 1  # tenant_id omitted → None
         assert "knowledge_local_docs" in store.collections
+
+
+# --- incremental (manifest) ingest ---------------------------------------------
+
+
+class _ManifestFakeStore(_PerCollectionFakeStore):
+    """Adds id-keyed upsert + delete_points + scroll_payloads (the manifest's store surface)."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.upserted: list[int] = []
+        self.deleted: list[int] = []
+
+    async def upsert(
+        self, name: str, points: list[tuple[int, list[float], dict[str, Any]]]
+    ) -> None:
+        new_ids = {pid for pid, _, _ in points}
+        kept = [p for p in self.collections.get(name, []) if p[0] not in new_ids]
+        self.collections[name] = kept + list(points)
+        self.upserted.extend(new_ids)
+
+    async def delete_points(self, name: str, ids: list[int]) -> None:
+        drop = set(ids)
+        self.collections[name] = [p for p in self.collections.get(name, []) if p[0] not in drop]
+        self.deleted.extend(ids)
+
+    async def scroll_payloads(
+        self, name: str, fields: list[str]
+    ) -> list[tuple[int, dict[str, Any]]]:
+        return [
+            (pid, {k: v for k, v in payload.items() if k in fields})
+            for pid, _, payload in self.collections.get(name, [])
+        ]
+
+
+def _incremental(
+    root: Path, store: Any, embedder: Any, refresh_interval_sec: float = 0.0
+) -> KnowledgeVectorIndex:
+    return KnowledgeVectorIndex(
+        cast(Any, embedder),
+        cast(Any, store),
+        root,
+        incremental=True,
+        refresh_interval_sec=refresh_interval_sec,
+    )
+
+
+async def test_incremental_ingest_embeds_only_the_diff() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        _write(root, "a.md", "## A1\nalpha one\n## A2\nalpha two\n")
+        _write(root, "b.md", "## B\nbeta\n")
+        store = _ManifestFakeStore()
+        embedder = _CountingEmbedder()
+        index = _incremental(root, store, embedder)
+        assert await index.ingest() == 3
+        assert index.manifest_version() == 1
+        assert await index.ingest() == 3  # nothing changed → no embed, no version bump
+        assert embedder.batch_sizes == [3]
+        assert index.manifest_version() == 1
+
+        # Same section count, one section edited: the count check never saw this.
+        _write(root, "a.md", "## A1\nalpha one\n## A2\nalpha two EDITED longer\n")
+        (root / "b.md").unlink()
+        _write(root, "c.md", "## C\ngamma\n")
+        assert await index.ingest() == 3
+
+        assert embedder.batch_sizes == [3, 2]  # edited A2 + new C only
+        assert len(store.deleted) == 2  # old A2 + removed b.md
+        snippets = sorted(p[2]["snippet"] for p in store.collections["knowledge_local_docs"])
+        assert snippets == ["## A1\nalpha one", "## A2\nalpha two EDITED longer", "## C\ngamma"]
+        assert index.manifest_version() == 2
+
+
+async def test_incremental_search_skips_disk_between_refreshes() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        _write(root, "doc.md", "## Alpha\nalpha body content\n")
+        store = _ManifestFakeStore()
+        embedder = _CountingEmbedder()
+        index = _incremental(root, store, embedder, refresh_interval_sec=3600.0)
+
+        await index.search("alpha", tenant_id=None)
+        (root / "doc.md").unlink()  # not noticed until the refresh interval elapses
+        hits = await index.search("## Alpha\nalpha body content")
+
+        assert [h.source for h in hits] == ["doc.md"]
+        assert embedder.batch_sizes == [1, 1, 1]  # 1 section + 2 queries, no re-ingest
+        assert await index.ingest() == 0  # explicit ingest always re-checks the corpus
+
+
+async def test_incremental_cold_start_rebuilds_manifest_from_payloads() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        _write(root, "doc.md", "## A\nbody a\n## B\nbody b\n")
+        store = _ManifestFakeStore()
+        await _incremental(root, store, _CountingEmbedder()).ingest()
+
+        restarted = _CountingEmbedder()  # a new process, same collection
+        assert await _incremental(root, store, restarted).ingest() == 2
+        assert restarted.batch_sizes == []  # every section already in the collection
+        assert store.deleted == []
+
+
+async def test_incremental_model_change_reembeds_into_clean_collection() -> None:
+    class _OtherModel(_CountingEmbedder):
+        def model_name(self) -> str:
+            return "other"
+
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        _write(root, "doc.md", "## A\nbody a\n")
+        store = _ManifestFakeStore()
+        await _incremental(root, store, _CountingEmbedder()).ingest()
+
+        other = _OtherModel(dim=8)
+        assert await _incremental(root, store, other).ingest() == 1
+        assert other.batch_sizes == [1]
+        points = store.collections["knowledge_local_docs"]
+        assert [(len(vec), p["embed_model"]) for _, vec, p in points] == [(8, "other")]
+
+
+async def test_incremental_orphans_keep_current_model_sections() -> None:
+    with tempfile.TemporaryDirectory() as d:
+        root = Path(d)
+        _write(root, "a.md", "## A\nbody a\n")
+        _write(root, "b.md", "## B\nbody b\n")
+        store = _ManifestFakeStore()
+        await _incremental(root, store, _CountingEmbedder()).ingest()
+        # One leftover point from an older embedding model next to the current ones.
+        await store.upsert(
+            "knowledge_local_docs", [(999, [0.0] * 4, {"source": "a.md", "embed_model": "old"})]
+        )
+
+        restarted = _CountingEmbedder()
+        assert await _incremental(root, store, restarted).ingest() == 2
+        assert restarted.batch_sizes == [2]  # the recreated collection gets every section
+        points = store.collections["knowledge_local_docs"]
+        assert sorted(p["source"] for _, _, p in points) == ["a.md", "b.md"]
+        assert all(p["embed_model"] == "counting" for _, _, p in points)
@@ -0,0 +1,106 @@
+"""
+File: backend/tests/unit/infrastructure/vector/test_local_store.py
+Purpose: Unit tests for LocalVectorStore (embedded NumPy VectorStore backend).
+Category: Tests
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from infrastructure.vector.local_store import LocalVectorStore
+
+
+def _filter(**terms: str) -> dict[str, object]:
+    return {"must": [{"key": k, "match": {"value": v}} for k, v in terms.items()]}
+
+
+async def _seeded(store: LocalVectorStore) -> LocalVectorStore:
+    await store.ensure_collection("c", 3)
+    await store.upsert(
+        "c",
+        [
+            (1, [1.0, 0.0, 0.0], {"tenant_id": "t1", "user_id": "u1", "text": "x"}),
+            (2, [0.0, 1.0, 0.0], {"tenant_id": "t1", "user_id": "u2", "text": "y"}),
+            (3, [0.7, 0.7, 0.0], {"tenant_id": "t2", "user_id": "u1", "text": "xy"}),
+        ],
+    )
+    return store
+
+
+async def test_search_ranks_by_cosine() -> None:
+    store = await _seeded(LocalVectorStore())
+    hits = await store.search("c", [2.0, 0.1, 0.0], top_k=2)  # query need not be unit-length
+    assert [h.payload["text"] for h in hits] == ["x", "xy"]
+    assert hits[0].score == pytest.approx(0.99875, abs=1e-4)
+    assert hits[0].score >= hits[1].score
+
+
+async def test_payload_filter_restricts_before_top_k() -> None:
+    store = await _seeded(LocalVectorStore())
+    hits = await store.search("c", [1.0, 0.0, 0.0], top_k=5, payload_filter=_filter(user_id="u1"))
+    assert {h.payload["text"] for h in hits} == {"x", "xy"}
+    only = await store.search("c", [1.0, 0.0, 0.0], 5, _filter(tenant_id="t1", user_id="u2"))
+    assert [h.payload["text"] for h in only] == ["y"]
+    assert await store.count("c", _filter(tenant_id="t1")) == 2
+
+
+async def test_upsert_same_id_replaces_in_place() -> None:
+    store = await _seeded(LocalVectorStore())
+    await store.upsert("c", [(2, [1.0, 0.0, 0.0], {"tenant_id": "t1", "text": "y2"})])
+    assert await store.count("c") == 3
+    hits = await store.search("c", [1.0, 0.0, 0.0], top_k=2, payload_filter=_filter(tenant_id="t1"))
+    assert [h.score for h in hits] == pytest.approx([1.0, 1.0])
+    assert {h.payload["text"] for h in hits} == {"x", "y2"}
+
+
+async def test_delete_scroll_and_count() -> None:
+    store = await _seeded(LocalVectorStore())
+    await store.delete_points("c", [1, 99])
+    assert await store.count("c") == 2
+    rows = await store.scroll_payloads("c", ["text"], payload_filter=_filter(user_id="u1"))
+    assert rows == [(3, {"text": "xy"})]
+    assert await store.count("missing") == 0
+    assert await store.search("missing", [1.0, 0.0, 0.0], 3) == []
+    assert await store.scroll_payloads("missing", ["text"]) == []
+
+
+async def test_quantized_store_keeps_ranking() -> None:
+    store = await _seeded(LocalVectorStore(quantize=True))
+    hits = await store.search("c", [1.0, 0.05, 0.0], top_k=3)
+    assert [h.payload["text"] for h in hits] == ["x", "xy", "y"]
+    assert hits[0].score == pytest.approx(1.0, abs=2e-2)
+
+
+async def test_persists_and_reloads_from_disk(tmp_path: Path) -> None:
+    await _seeded(LocalVectorStore(tmp_path))
+    reopened = LocalVectorStore(tmp_path)  # a new process sees the same collection
+    assert await reopened.count("c") == 3
+    hits = await reopened.search("c", [0.0, 1.0, 0.0], top_k=1)
+    assert hits[0].payload["text"] == "y"
+    await reopened.upsert("c", [(4, [0.0, 0.0, 1.0], {"text": "z"})])  # writes past the mmap
+    assert await LocalVectorStore(tmp_path).count("c") == 4
+    await reopened.recreate_collection("c", 3)
+    assert await LocalVectorStore(tmp_path).count("c") == 0
+
+
+async def test_dim_mismatch_and_missing_collection_raise() -> None:
+    store = await _seeded(LocalVectorStore())
+    with pytest.raises(ValueError):
+        await store.upsert("c", [(5, [1.0, 0.0], {})])
+    with pytest.raises(ValueError):
+        await store.search("c", [1.0, 0.0], top_k=1)
+    with pytest.raises(ValueError):
+        await store.upsert("missing", [(1, [1.0, 0.0, 0.0], {})])
+
+
+async def test_search_batch_answers_each_query_in_order() -> None:
+    store = await _seeded(LocalVectorStore())
+    results = await store.search_batch(
+        "c", [([0.0, 1.0, 0.0], 1, None), ([0.0, 1.0, 0.0], 1, _filter(user_id="u1"))]
+    )
+    assert [[h.payload["text"] for h in hits] for hits in results] == [["y"], ["xy"]]
+    assert await store.search_batch("missing", [([1.0, 0.0, 0.0], 1, None)]) == [[]]
@@ -3,7 +3,7 @@ File: backend/tests/unit/infrastructure/vector/test_qdrant_client.py
 Purpose: Unit tests for QdrantVectorStore (Sprint 57.146 — QdrantClient mocked, no live Qdrant).
 Category: Tests
 Created: 2026-06-27
-Last Modified: 2026-07-01 (Sprint 57.155 — count() payload_filter both arities)
+Last Modified: 2026-10-16 (AsyncQdrantVectorStore + search_batch)
 """
 
 from __future__ import annotations
@@ -12,7 +12,14 @@ import math
 from types import SimpleNamespace
 from typing import Any, cast
 
-from infrastructure.vector.qdrant_client import QdrantVectorStore
+import httpx
+from qdrant_client.http.exceptions import UnexpectedResponse
+
+from infrastructure.vector.qdrant_client import (
+    AsyncQdrantVectorStore,
+    QdrantVectorStore,
+    _to_filter,
+)
 
 
 def _cos(a: list[float], b: list[float]) -> float:
@@ -74,6 +81,98 @@ class _FakeQdrant:
         ]
         return SimpleNamespace(points=pts)
 
+    def query_batch_points(self, collection_name: str, requests: list[Any]) -> list[Any]:
+        results = []
+        for req in requests:
+            items = self.collections.get(collection_name, [])
+            if req.filter is not None:
+                items = [it for it in items if _match_filter(req.filter, it[2])]
+            ranked = sorted(items, key=lambda it: _cos(req.query, it[1]), reverse=True)
+            pts = [
+                SimpleNamespace(id=pid, score=_cos(req.query, vec), payload=payload)
+                for (pid, vec, payload) in ranked[: req.limit]
+            ]
+            results.append(SimpleNamespace(points=pts))
+        return results
+
+
+class _FakeAsyncQdrant:
+    """Async stand-in for AsyncQdrantClient over _FakeQdrant; records every call."""
+
+    def __init__(self) -> None:
+        self.sync = _FakeQdrant()
+        self.calls: list[str] = []
+        self.indexes: list[tuple[str, str]] = []
+        self.closed = False
+
+    async def get_collection(self, name: str) -> Any:
+        self.calls.append("get_collection")
+        if name not in self.sync.collections:
+            raise UnexpectedResponse(404, "Not Found", b"", httpx.Headers())
+        size = dict(self.sync.created)[name]
+        return SimpleNamespace(
+            config=SimpleNamespace(params=SimpleNamespace(vectors=SimpleNamespace(size=size)))
+        )
+
+    async def create_collection(self, collection_name: str, vectors_config: Any) -> None:
+        self.calls.append("create_collection")
+        self.sync.create_collection(collection_name, vectors_config)
+
+    async def create_payload_index(
+        self, collection_name: str, field_name: str, field_schema: Any
+    ) -> None:
+        self.indexes.append((collection_name, field_name))
+
+    async def delete_collection(self, name: str) -> None:
+        self.sync.delete_collection(name)
+
+    async def count(self, collection_name: str, count_filter: Any = None) -> Any:
+        self.calls.append("count")
+        return self.sync.count(collection_name, count_filter)
+
+    async def upsert(self, collection_name: str, points: list[Any]) -> None:
+        self.sync.upsert(collection_name, points)
+
+    async def query_points(self, collection_name: str, **kwargs: Any) -> Any:
+        self.calls.append("query_points")
+        if collection_name not in self.sync.collections:
+            raise UnexpectedResponse(404, "Not Found", b"", httpx.Headers())
+        return self.sync.query_points(collection_name, **kwargs)
+
+    async def query_batch_points(self, collection_name: str, requests: list[Any]) -> list[Any]:
+        self.calls.append("query_batch_points")
+        return self.sync.query_batch_points(collection_name, requests)
+
+    async def scroll(self, collection_name: str, **kwargs: Any) -> Any:
+        self.calls.append("scroll")
+        if collection_name not in self.sync.collections:
+            raise UnexpectedResponse(404, "Not Found", b"", httpx.Headers())
+        return [], None
+
+    async def delete(self, collection_name: str, points_selector: Any) -> None:
+        self.calls.append("delete")
+        if collection_name not in self.sync.collections:
+            raise UnexpectedResponse(404, "Not Found", b"", httpx.Headers())
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _async_store_with_fake() -> tuple[AsyncQdrantVectorStore, _FakeAsyncQdrant]:
+    store = AsyncQdrantVectorStore(url="http://fake:6333")
+    fake = _FakeAsyncQdrant()
+    store._client = cast(Any, fake)
+    return store, fake
+
+
+def _user_filter(user_id: str) -> dict[str, Any]:
+    return {
+        "must": [
+            {"key": "tenant_id", "match": {"value": "t"}},
+            {"key": "user_id", "match": {"value": user_id}},
+        ]
+    }
+
 
 def _store_with_fake() -> tuple[QdrantVectorStore, _FakeQdrant]:
     store = QdrantVectorStore(url="http://fake:6333")
@@ -140,3 +239,92 @@ async def test_recreate_drops_then_creates() -> None:
     await store.recreate_collection("c", 3)
     assert await store.count("c") == 0  # dropped + recreated empty
     assert ("c", 3) in fake.created
+
+
+async def test_sync_search_batch_one_call_per_batch() -> None:
+    store, _ = _store_with_fake()
+    await store.ensure_collection("c", 2)
+    await store.upsert(
+        "c",
+        [
+            (0, [1.0, 0.0], {"tenant_id": "t", "user_id": "a"}),
+            (1, [0.0, 1.0], {"tenant_id": "t", "user_id": "b"}),
+        ],
+    )
+    results = await store.search_batch(
+        "c", [([1.0, 0.0], 1, None), ([1.0, 0.0], 5, _user_filter("b"))]
+    )
+    assert [[h.payload["user_id"] for h in hits] for hits in results] == [["a"], ["b"]]
+    assert await store.search_batch("missing", [([1.0, 0.0], 1, None)]) == [[]]
+
+
+async def test_async_store_caches_collection_and_indexes_payload_keys() -> None:
+    store, fake = _async_store_with_fake()
+    await store.ensure_collection("c", 2)
+    await store.ensure_collection("c", 2)  # known → no round trip
+    await store.upsert("c", [(0, [1.0, 0.0], {"tenant_id": "t", "user_id": "a"})])
+    fake.calls.clear()
+    assert await store.count("c", payload_filter=_user_filter("a")) == 1
+    hits = await store.search("c", [1.0, 0.0], top_k=3)
+    assert [h.payload["user_id"] for h in hits] == ["a"]
+    assert fake.calls == ["count", "query_points"]  # no collection_exists probes
+    assert fake.sync.created == [("c", 2)]
+    assert fake.indexes == [("c", "tenant_id"), ("c", "user_id")]
+
+
+async def test_async_store_probes_an_unknown_collection_once() -> None:
+    store, fake = _async_store_with_fake()
+    fake.sync.create_collection("c", SimpleNamespace(size=2))  # created by another process
+    assert await store.count("c") == 0
+    assert await store.count("c") == 0
+    assert fake.calls.count("get_collection") == 1
+    assert await store.search("missing", [1.0, 0.0], top_k=1) == []
+    await store.ensure_collection("c", 2)
+    assert "create_collection" not in fake.calls  # existing collection adopted
+
+
+async def test_async_store_search_batch_single_round_trip() -> None:
+    store, fake = _async_store_with_fake()
+    await store.ensure_collection("c", 2)
+    await store.upsert(
+        "c",
+        [
+            (0, [1.0, 0.0], {"tenant_id": "t", "user_id": "a"}),
+            (1, [0.0, 1.0], {"tenant_id": "t", "user_id": "b"}),
+        ],
+    )
+    fake.calls.clear()
+    results = await store.search_batch(
+        "c", [([0.0, 1.0], 2, _user_filter("a")), ([0.0, 1.0], 1, None)]
+    )
+    assert [[h.payload["user_id"] for h in hits] for hits in results] == [["a"], ["b"]]
+    assert fake.calls == ["query_batch_points"]
+
+
+async def test_async_store_evicts_a_collection_dropped_elsewhere() -> None:
+    store, fake = _async_store_with_fake()
+    await store.ensure_collection("c", 2)
+    fake.sync.delete_collection("c")  # dropped behind the cache
+    assert await store.search("c", [1.0, 0.0], top_k=1) == []
+    await store.ensure_collection("c", 2)
+    assert fake.sync.created == [("c", 2), ("c", 2)]  # re-created after eviction
+
+
+async def test_async_store_scroll_and_delete_tolerate_a_dropped_collection() -> None:
+    store, fake = _async_store_with_fake()
+    await store.ensure_collection("c", 2)
+    fake.sync.delete_collection("c")
+    assert await store.scroll_payloads("c", ["source"]) == []
+    assert "c" not in store._dims
+    await store.ensure_collection("c", 2)
+    fake.sync.delete_collection("c")
+    await store.delete_points("c", [1, 2])  # no-op, not an error
+    assert "c" not in store._dims
+
+
+async def test_async_store_aclose_and_filter_memo() -> None:
+    store, fake = _async_store_with_fake()
+    await store.aclose()
+    assert fake.closed and store._client is None
+    assert _to_filter(_user_filter("a")) is _to_filter(_user_filter("a"))
+    assert _to_filter(None) is None
@@ -0,0 +1,198 @@
+"""
+File: backend/tests/unit/platform_layer/identity/test_claims_cache.py
+Purpose: Unit tests for VerifiedClaimsCache + its use in TenantContextMiddleware —
+    hits skip the decode, entries never outlive `exp` or the TTL cap, the LRU
+    bound, rejected tokens never cached, logout invalidation, a custom
+    JWTManager never shares the process-wide cache, stats.
+Category: Tests / Unit / Platform layer
+Scope: Phase 57 / polling + SSE reconnect load
+
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi import FastAPI, Request
+from httpx import ASGITransport, AsyncClient
+
+from agent_harness.observability.tracer import NoOpTracer
+from api.v1.auth import _evict_cached_claims
+from platform_layer.identity import claims_cache
+from platform_layer.identity.claims_cache import VerifiedClaimsCache
+from platform_layer.identity.jwt import JWTClaims, JWTManager
+from platform_layer.middleware import TenantContextMiddleware
+
+_TEST_SECRET = "test-secret-do-not-use-in-prod"
+
+
+class _CountingJWTManager(JWTManager):
+    def __init__(self) -> None:
+        super().__init__(secret=_TEST_SECRET, algorithm="HS256", expires_minutes=60)
+        self.decodes = 0
+
+    def decode(self, token: str) -> JWTClaims:
+        self.decodes += 1
+        return super().decode(token)
+
+
+def _claims(*, exp: float, tenant_id: UUID | None = None, sub: str = "u") -> JWTClaims:
+    return JWTClaims(
+        sub=sub, tenant_id=tenant_id or uuid4(), roles=[], iat=int(time.time()), exp=int(exp)
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_default_cache() -> Iterator[None]:
+    yield
+    claims_cache.reset_default_claims_cache()
+
+
+def _app(mgr: JWTManager, cache: VerifiedClaimsCache | None) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TenantContextMiddleware, jwt_manager=mgr, claims_cache=cache)
+
+    @app.get("/whoami")
+    async def whoami(request: Request) -> dict[str, str | list[str]]:
+        return {"tenant_id": str(request.state.tenant_id), "roles": request.state.roles}
+
+    return app
+
+
+def test_hit_returns_claims_and_counts() -> None:
+    tracer = NoOpTracer()
+    cache = VerifiedClaimsCache(tracer=tracer)
+    claims = _claims(exp=time.time() + 600)
+    assert cache.get("tok") is None
+    cache.put("tok", claims)
+    assert cache.get("tok") is claims
+    assert cache.get("other") is None
+    assert (cache.stats.hits, cache.stats.misses) == (1, 2)
+    assert cache.stats.hit_rate == pytest.approx(1 / 3)
+    assert [m.labels["result"] for m in tracer.recorded_metrics] == ["miss", "hit", "miss"]
+    assert {m.metric_name for m in tracer.recorded_metrics} == {"jwt_claims_cache_total"}
+
+
+def test_entry_never_outlives_exp_or_ttl_cap(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = 1_000_000.0
+    monkeypatch.setattr(claims_cache.time, "time", lambda: now)
+    cache = VerifiedClaimsCache(ttl_seconds=300)
+    cache.put("short", _claims(exp=now + 10))  # exp before the TTL cap
+    cache.put("long", _claims(exp=now + 3600))  # TTL cap before exp
+    cache.put("dead", _claims(exp=now))  # already at exp — not stored
+    assert len(cache) == 2
+
+    now += 10
+    assert cache.get("short") is None
+    assert cache.get("long") is not None
+    now += 290
+    assert cache.get("long") is None
+    assert cache.stats.expired == 2
+    assert len(cache) == 0
+
+
+def test_lru_bound_evicts_least_recently_presented() -> None:
+    cache = VerifiedClaimsCache(max_entries=2)
+    exp = time.time() + 600
+    cache.put("a", _claims(exp=exp))
+    cache.put("b", _claims(exp=exp))
+    assert cache.get("a") is not None  # "b" is now the oldest
+    cache.put("c", _claims(exp=exp))
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats.evictions == 1
+
+
+def test_invalidate_token() -> None:
+    cache = VerifiedClaimsCache()
+    exp = time.time() + 600
+    cache.put("t1", _claims(exp=exp))
+    cache.put("t2", _claims(exp=exp))
+    assert cache.invalidate("t1") is True
+    assert cache.invalidate("t1") is False
+    assert cache.get("t2") is not None
+    assert cache.stats.invalidations == 1
+
+
+@pytest.mark.asyncio
+async def test_middleware_decodes_a_repeated_token_once() -> None:
+    mgr = _CountingJWTManager()
+    cache = VerifiedClaimsCache()
+    tid = uuid4()
+    token = mgr.encode(sub=str(uuid4()), tenant_id=tid, roles=["member"])
+    transport = ASGITransport(app=_app(mgr, cache))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(5):
+            r = await client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+            assert r.status_code == 200
+            assert r.json() == {"tenant_id": str(tid), "roles": ["member"]}
+        cache.invalidate(token)
+        r = await client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+        assert r.status_code == 200
+    assert mgr.decodes == 2
+    assert (cache.stats.hits, cache.stats.misses) == (4, 2)
+
+
+@pytest.mark.asyncio
+async def test_middleware_never_caches_rejected_tokens() -> None:
+    mgr = _CountingJWTManager()
+    cache = VerifiedClaimsCache()
+    expired = JWTManager(secret=_TEST_SECRET, algorithm="HS256", expires_minutes=-1).encode(
+        sub=str(uuid4()), tenant_id=uuid4()
+    )
+    transport = ASGITransport(app=_app(mgr, cache))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for token, error in [(expired, "token expired"), ("garbage.not.jwt", "token invalid")]:
+            for _ in range(2):
+                r = await client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+                assert r.status_code == 401
+                assert r.json() == {"error": error}
+    assert mgr.decodes == 4
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_default_off_uses_no_cache() -> None:
+    mgr = _CountingJWTManager()
+    token = mgr.encode(sub=str(uuid4()), tenant_id=uuid4())
+    transport = ASGITransport(app=_app(mgr, None))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(3):
+            r = await client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+            assert r.status_code == 200
+    assert claims_cache.get_default_claims_cache() is None
+    assert mgr.decodes == 3
+
+
+@pytest.mark.asyncio
+async def test_custom_jwt_manager_skips_the_process_wide_cache() -> None:
+    shared = VerifiedClaimsCache()
+    claims_cache.set_default_claims_cache(shared)
+    mgr = _CountingJWTManager()
+    token = mgr.encode(sub=str(uuid4()), tenant_id=uuid4())
+    transport = ASGITransport(app=_app(mgr, None))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        for _ in range(2):
+            r = await client.get("/whoami", headers={"Authorization": f"Bearer {token}"})
+            assert r.status_code == 200
+    assert mgr.decodes == 2
+    assert len(shared) == 0
+
+
+def test_logout_evicts_the_presented_token() -> None:
+    cache = VerifiedClaimsCache()
+    claims_cache.set_default_claims_cache(cache)
+    exp = time.time() + 600
+    cache.put("bearer-tok", _claims(exp=exp))
+    cache.put("cookie-tok", _claims(exp=exp))
+
+    def _request(headers: list[tuple[bytes, bytes]]) -> Request:
+        return Request({"type": "http", "method": "POST", "path": "/", "headers": headers})
+
+    _evict_cached_claims(_request([(b"authorization", b"Bearer bearer-tok")]))
+    _evict_cached_claims(_request([(b"cookie", b"v2_jwt=cookie-tok")]))
+    assert len(cache) == 0
@@ -0,0 +1,102 @@
+"""
+File: backend/tests/unit/runtime/workers/test_work_queue.py
+Purpose: Unit tests for InProcessWorkQueue (coalescing / debounce / per-key exclusion / retry).
+Category: Tests / Runtime
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from runtime.workers import InProcessWorkQueue, TaskEnvelope, TaskStatus
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = datetime(2026, 10, 16, tzinfo=timezone.utc)
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += timedelta(seconds=seconds)
+
+
+def _job(clock: _Clock, key: str | None, n: int, *, delay: float = 0.0) -> TaskEnvelope:
+    return TaskEnvelope(
+        task_id=f"t{n}",
+        tenant_id="tenant-a",
+        user_id=None,
+        payload={"n": n},
+        trace_id=f"trace-{n}",
+        enqueued_at=clock.now,
+        coalesce_key=key,
+        not_before=clock.now + timedelta(seconds=delay) if delay else None,
+    )
+
+
+async def test_latest_submit_supersedes_queued_job_for_same_key() -> None:
+    clock = _Clock()
+    queue = InProcessWorkQueue(clock=clock)
+    first = await queue.submit(_job(clock, "s1", 1))
+    assert await queue.submit(_job(clock, "s1", 2)) == first  # coalesced onto t1
+    await queue.submit(_job(clock, "s2", 3))
+    claimed = await queue.claim(limit=10)
+    assert [(e.task_id, e.payload["n"]) for e in claimed] == [("t1", 2), ("t3", 3)]
+
+
+async def test_debounce_defers_claim_and_resubmit_pushes_it_out() -> None:
+    clock = _Clock()
+    queue = InProcessWorkQueue(clock=clock)
+    await queue.submit(_job(clock, "s1", 1, delay=5))
+    clock.advance(4)
+    await queue.submit(_job(clock, "s1", 2, delay=5))  # due at t=9 now
+    clock.advance(2)
+    assert await queue.claim(limit=1) == []
+    clock.advance(3)
+    [job] = await queue.claim(limit=1)
+    assert job.payload == {"n": 2}
+
+
+async def test_running_key_is_not_claimed_twice() -> None:
+    clock = _Clock()
+    queue = InProcessWorkQueue(clock=clock)
+    await queue.submit(_job(clock, "s1", 1))
+    [running] = await queue.claim(limit=5)
+    await queue.submit(_job(clock, "s1", 2))  # queues behind the running job
+    assert await queue.claim(limit=5) == []
+    await queue.complete(running.task_id, result={"ok": True})
+    assert (await queue.poll("t1")).status is TaskStatus.COMPLETED
+    [follow_up] = await queue.claim(limit=5)
+    assert follow_up.task_id == "t2"
+
+
+async def test_failure_retries_with_backoff_unless_superseded() -> None:
+    clock = _Clock()
+    queue = InProcessWorkQueue(retry_backoff_sec=10, clock=clock)
+    await queue.submit(_job(clock, "s1", 1))
+    [job] = await queue.claim(limit=1)
+    await queue.complete(job.task_id, error="boom")
+    assert (await queue.poll("t1")).status is TaskStatus.PENDING
+    assert await queue.claim(limit=1) == []  # backing off
+    clock.advance(10)
+    [retry] = await queue.claim(limit=1)
+    assert retry.task_id == "t1"
+    await queue.submit(_job(clock, "s1", 2))  # newer send while the retry runs
+    await queue.complete(retry.task_id, error="boom again")
+    result = await queue.poll("t1")
+    assert result.status is TaskStatus.FAILED and result.retries == 1
+    assert [e.task_id for e in await queue.list_pending()] == ["t2"]
+
+
+async def test_cancel_drops_pending_job_only() -> None:
+    clock = _Clock()
+    queue = InProcessWorkQueue(clock=clock)
+    await queue.submit(_job(clock, "s1", 1))
+    await queue.submit(_job(clock, None, 2))
+    assert await queue.cancel("t1") is True
+    assert (await queue.poll("t1")).status is TaskStatus.CANCELLED
+    [running] = await queue.claim(limit=5)
+    assert await queue.cancel(running.task_id) is False
+    assert await queue.list_pending(tenant_id="tenant-b") == []
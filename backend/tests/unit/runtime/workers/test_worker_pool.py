@@ -0,0 +1,115 @@
+"""
+File: backend/tests/unit/runtime/workers/test_worker_pool.py
+Purpose: Unit tests for WorkerPool (concurrency bound, yielding to interactive load, retries).
+Category: Tests / Runtime
+Created: 2026-10-16
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from runtime.workers import (
+    InProcessWorkQueue,
+    TaskEnvelope,
+    TaskStatus,
+    WorkerPool,
+    WorkerPoolConfig,
+)
+
+
+def _job(key: str) -> TaskEnvelope:
+    return TaskEnvelope.new(
+        tenant_id="tenant-a", payload={"key": key}, trace_id="trace", coalesce_key=key
+    )
+
+
+class _GatedHandler:
+    """Blocks every job until release(); records the peak concurrency."""
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+        self.seen: list[str] = []
+        self.gate = asyncio.Event()
+
+    async def __call__(self, envelope: TaskEnvelope) -> dict[str, Any] | None:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        self.seen.append(envelope.payload["key"])
+        try:
+            await self.gate.wait()
+        finally:
+            self.active -= 1
+        return {"key": envelope.payload["key"]}
+
+
+async def test_pool_never_exceeds_its_concurrency() -> None:
+    queue = InProcessWorkQueue()
+    for n in range(5):
+        await queue.submit(_job(f"s{n}"))
+    handler = _GatedHandler()
+    pool = WorkerPool(queue, handler, WorkerPoolConfig(concurrency=2))
+    assert await pool.run_once() == 2
+    assert await pool.run_once() == 0  # no free slot
+    await asyncio.sleep(0)
+    assert handler.active == 2
+    handler.gate.set()
+    await pool.drain()
+    while await pool.run_once():
+        await pool.drain()
+    assert handler.peak == 2
+    assert sorted(handler.seen) == ["s0", "s1", "s2", "s3", "s4"]
+
+
+async def test_pool_yields_to_interactive_load() -> None:
+    queue = InProcessWorkQueue()
+    for n in range(3):
+        await queue.submit(_job(f"s{n}"))
+    busy = True
+    handler = _GatedHandler()
+    pool = WorkerPool(queue, handler, WorkerPoolConfig(concurrency=3), busy=lambda: busy)
+    assert await pool.run_once() == 1  # busy → one job at a time
+    busy = False
+    assert await pool.run_once() == 2
+    handler.gate.set()
+    await pool.drain()
+
+
+async def test_handler_failure_is_reported_to_the_backend_retry_policy() -> None:
+    queue = InProcessWorkQueue(retry_backoff_sec=0)
+    task_id = await queue.submit(_job("s1"))
+    calls = 0
+
+    async def _flaky(envelope: TaskEnvelope) -> dict[str, Any] | None:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            raise RuntimeError("transient")
+        return {"ok": True}
+
+    pool = WorkerPool(queue, _flaky)
+    await pool.run_once()
+    await pool.drain()
+    assert (await queue.poll(task_id)).status is TaskStatus.PENDING
+    await pool.run_once()
+    await pool.drain()
+    result = await queue.poll(task_id)
+    assert result.status is TaskStatus.COMPLETED and result.result == {"ok": True}
+
+
+async def test_started_pool_drains_queue_and_stops() -> None:
+    queue = InProcessWorkQueue()
+    done = asyncio.Event()
+
+    async def _handler(envelope: TaskEnvelope) -> dict[str, Any] | None:
+        done.set()
+        return None
+
+    pool = WorkerPool(queue, _handler, WorkerPoolConfig(poll_interval_sec=0.01))
+    pool.start()
+    await queue.submit(_job("s1"))
+    await asyncio.wait_for(done.wait(), timeout=2)
+    await pool.stop(timeout=1)
+    assert pool.in_flight == 0
@@ -0,0 +1,65 @@
+"""
+File: backend/tests/unit/scripts/test_benchmark_middleware_overhead.py
+Purpose: CI-safe coverage of the middleware-stack micro-benchmark — the BaseHTTPMiddleware
+         and pure ASGI stacks answer identically (parity), the SSE driver sees every
+         frame, and the report is well-formed.
+Category: Tests / Unit / platform_layer/middleware
+Scope: Phase 57 / request hot path
+
+Latency numbers are machine-dependent and NOT asserted; run
+scripts/benchmark_middleware_overhead.py on demand for the comparison.
+
+Related:
+    - backend/scripts/benchmark_middleware_overhead.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+# Load backend/scripts/benchmark_middleware_overhead.py via importlib — the plain
+# `from scripts.benchmark_middleware_overhead import ...` is shadowed by the
+# `tests.unit.scripts` package (same idiom as test_benchmark_sse_serialization.py).
+_ROOT = Path(__file__).resolve().parents[3]
+_BENCH_PATH = _ROOT / "scripts" / "benchmark_middleware_overhead.py"
+_spec = importlib.util.spec_from_file_location(
+    "_benchmark_middleware_overhead_under_test", _BENCH_PATH
+)
+assert _spec is not None and _spec.loader is not None
+_bench = importlib.util.module_from_spec(_spec)
+sys.modules["_benchmark_middleware_overhead_under_test"] = _bench
+_spec.loader.exec_module(_bench)
+
+
+@pytest.mark.asyncio
+async def test_both_stacks_answer_identically() -> None:
+    mgr = _bench.make_jwt_manager()
+    base_http = await _bench._responses(_bench.build_app("base_http", mgr), mgr)
+    asgi = await _bench._responses(_bench.build_app("asgi", mgr), mgr)
+    assert base_http == asgi
+    assert [status for status, _, _ in asgi] == [200, 401, 401, 200]
+
+
+@pytest.mark.asyncio
+async def test_sse_driver_times_every_frame() -> None:
+    mgr = _bench.make_jwt_manager()
+    app = _bench.build_app("asgi", mgr, frames=5)
+    seen: list[bytes] = []
+    status, headers, _ = await _bench.call(
+        app, _bench.SSE_PATH, _bench.bearer_headers(mgr), on_body=seen.append
+    )
+    assert status == 200
+    assert headers["content-type"].startswith("text/event-stream")
+    assert b"".join(seen).count(b"data: ") == 5
+
+
+def test_build_report_shape() -> None:
+    report = _bench.build_report(requests=5, frames=5)
+    assert report["parity"] is True
+    assert set(report["per_request_us"]) == {"none", "base_http", "asgi", "asgi_cached"}
+    assert set(report["middleware_overhead_us"]) == {"base_http", "asgi", "asgi_cached"}
+    assert set(report["sse_frame_latency_us"]["asgi"]) == {"p50", "p99"}
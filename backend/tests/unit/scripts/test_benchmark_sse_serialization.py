@@ -0,0 +1,55 @@
+"""
+File: backend/tests/unit/scripts/test_benchmark_sse_serialization.py
+Purpose: CI-safe coverage of the SSE serialization micro-benchmark — the busy-turn
+         corpus serializes end to end and the baseline / current paths emit the
+         same frames (parity), with a well-formed report.
+Category: Tests / Unit / api/v1/chat
+Scope: Phase 57 / SSE hot path
+
+Throughput numbers are machine-dependent and NOT asserted; run
+scripts/benchmark_sse_serialization.py on demand for frames/sec.
+
+Related:
+    - backend/scripts/benchmark_sse_serialization.py
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+# Load backend/scripts/benchmark_sse_serialization.py via importlib — the plain
+# `from scripts.benchmark_sse_serialization import ...` is shadowed by the
+# `tests.unit.scripts` package (same idiom as test_benchmark_sandbox_escape.py).
+_ROOT = Path(__file__).resolve().parents[3]
+_BENCH_PATH = _ROOT / "scripts" / "benchmark_sse_serialization.py"
+_spec = importlib.util.spec_from_file_location(
+    "_benchmark_sse_serialization_under_test", _BENCH_PATH
+)
+assert _spec is not None and _spec.loader is not None
+_bench = importlib.util.module_from_spec(_spec)
+sys.modules["_benchmark_sse_serialization_under_test"] = _bench
+_spec.loader.exec_module(_bench)
+
+
+def test_busy_turn_corpus_serializes_every_event() -> None:
+    events = _bench.busy_turn_events(n_spans=3, n_children=2)
+    assert len(events) == 3 + 3 * 4 + 2 + 3
+    assert all(_bench.current_frame(ev) is not None for ev in events)
+
+
+def test_baseline_and_current_frames_match() -> None:
+    for event in _bench.busy_turn_events(n_spans=2, n_children=2):
+        assert _bench._data(_bench.baseline_frame(event)) == _bench._data(
+            _bench.current_frame(event)
+        )
+
+
+def test_build_report_shape() -> None:
+    report = _bench.build_report(_bench.busy_turn_events(n_spans=1, n_children=1), repeat=2)
+    assert report["parity"] is True
+    assert report["repeat"] == 2
+    assert report["baseline_frames_per_sec"] > 0
+    assert report["current_frames_per_sec"] > 0
+    assert report["encoder"] in {"orjson", "json"}
@@ -14,6 +14,10 @@
  *   whose `handoffParentId` is non-null renders a small `.route-pill` chain
  *   badge (`↳ {agentRole}`). Empty list → a plain "No sessions yet" line.
  *
+ *   GET /sessions is keyset-paged: the mount load fetches the newest page, and a
+ *   "Load more" button (shown while chatStore.sessionsCursor is set) appends the
+ *   next older page via loadMoreSessions.
+ *
  *   Mockup CSS classes consumed verbatim (styles-mockup.css):
  *     - .chat-list (L693-697) — left rail wrapper with border + bg + overflow
  *     - .session-item (L726-737) — session row card; data-active drives highlight
@@ -31,9 +35,10 @@
  *   - <SessionList />: top-level export; consumes chatStore.sessions (real data)
  *
  * Created: 2026-05-17 (Sprint 57.21 Day 3 §3.1)
- * Last Modified: 2026-06-12
+ * Last Modified: 2026-10-16
  *
  * Modification History:
+ *   - 2026-10-16: "Load more" button pages older sessions (sessionsCursor / loadMoreSessions)
  *   - 2026-07-15: "New session" → newSession() (was reset()) — keep sidebar list (AD-Chat-New-Session-Wipes-Sidebar)
  *   - 2026-06-16: Sprint 57.126 — session click → loadSessionHistory (replay) replaces setActiveSessionId
  *   - 2026-06-12: Sprint 57.107 B3 — real GET /sessions via loadSessions; drop fixture + DEMO banner; +handoff-chain badge + empty state
@@ -50,7 +55,7 @@
  *   - docs/rules-on-demand/frontend-mockup-fidelity.md (verbatim re-point method)
  */
 
-import { useEffect } from "react";
+import { useEffect, useState } from "react";
 import { Filter, Plus } from "lucide-react";
 import { useTranslation } from "react-i18next";
 
@@ -129,6 +134,18 @@ export function SessionList(): JSX.Element {
   const newSession = useChatStore((s) => s.newSession);
   const sessions = useChatStore((s) => s.sessions);
   const loadSessions = useChatStore((s) => s.loadSessions);
+  const sessionsCursor = useChatStore((s) => s.sessionsCursor);
+  const loadMoreSessions = useChatStore((s) => s.loadMoreSessions);
+  const [loadingMore, setLoadingMore] = useState(false);
+
+  const onLoadMore = async (): Promise<void> => {
+    setLoadingMore(true);
+    try {
+      await loadMoreSessions();
+    } finally {
+      setLoadingMore(false);
+    }
+  };
 
   // Sprint 57.107 B3: load the real session list on mount.
   useEffect(() => {
@@ -214,6 +231,20 @@ export function SessionList(): JSX.Element {
       ) : (
         sessions.map((s) => <SessionItem key={s.id} session={s} />)
       )}
+      {sessionsCursor && (
+        <div style={{ padding: "8px 12px" }}>
+          <button
+            type="button"
+            className="btn ghost"
+            data-size="sm"
+            data-testid="session-list-load-more"
+            disabled={loadingMore}
+            onClick={() => void onLoadMore()}
+          >
+            {t("chat.session.loadMore")}
+          </button>
+        </div>
+      )}
     </div>
   );
 }
@@ -275,6 +275,14 @@ export interface TodosUpdatedEvent {
   };
 }
 
+export interface LLMTextDeltaEvent {
+  type: "llm_text_delta";
+  data: {
+    trace_id?: string | null;
+    text: string;
+  };
+}
+
 export type LoopEvent =
   | LoopStartEvent
   | TurnStartEvent
@@ -301,7 +309,8 @@ export type LoopEvent =
   | MemoryAccessedEvent
   | MessageInjectedEvent
   | LoopTerminatedEvent
-  | TodosUpdatedEvent;
+  | TodosUpdatedEvent
+  | LLMTextDeltaEvent;
 
 export const KNOWN_LOOP_EVENT_TYPES = new Set<string>([
   "loop_start",
@@ -330,4 +339,5 @@ export const KNOWN_LOOP_EVENT_TYPES = new Set<string>([
   "message_injected",
   "loop_terminated",
   "todos_updated",
+  "llm_text_delta",
 ]);
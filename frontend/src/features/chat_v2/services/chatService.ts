@@ -31,9 +31,10 @@
  *   `consumeSSEStream` reader/parser (extracted to avoid duplication).
  *
  * Created: 2026-04-30 (Sprint 50.2 Day 3.4)
- * Last Modified: 2026-06-14
+ * Last Modified: 2026-10-16
  *
  * Modification History (newest-first):
+ *   - 2026-10-16: listSessions(cursor) returns ONE keyset page + next_cursor (SessionList loads more on demand)
  *   - 2026-06-16: Sprint 57.126 — +fetchSessionEvents (GET /sessions/{id}/events; history replay)
  *   - 2026-06-14: Sprint 57.115 — +force_load_skill on ChatRequestBody + fetchChatSkills (picker list)
  *   - 2026-06-12: Sprint 57.107 B3 — +listSessions (GET /sessions; real SessionList data)
@@ -102,22 +103,27 @@ export type SessionListApiItem = {
 
 export type SessionListResponse = {
   sessions: SessionListApiItem[];
+  next_cursor?: string | null; // null / absent → no older sessions
 };
 
 /**
  * Sprint 57.107 (B3): list the caller's chat sessions (tenant + user from the
  * auth JWT via fetchWithAuth). Returns the raw snake_case items; chatStore
  * maps them to the camelCase `Session` UI shape. A non-2xx throws so the caller
- * can surface it.
+ * can surface it. GET /sessions is keyset-paged: this fetches ONE page (the
+ * backend default size), newest-first — pass the previous page's `next_cursor`
+ * to fetch the next, older page.
  */
-export async function listSessions(): Promise<SessionListApiItem[]> {
-  const response = await fetchWithAuth("/api/v1/sessions", { method: "GET" });
+export async function listSessions(cursor?: string | null): Promise<SessionListResponse> {
+  const url = cursor
+    ? `/api/v1/sessions?${new URLSearchParams({ cursor }).toString()}`
+    : "/api/v1/sessions";
+  const response = await fetchWithAuth(url, { method: "GET" });
   if (!response.ok) {
     const text = await response.text();
     throw new Error(`HTTP ${response.status}: ${text}`);
   }
-  const body = (await response.json()) as SessionListResponse;
-  return body.sessions;
+  return (await response.json()) as SessionListResponse;
 }
 
 // === Sprint 57.126: session history replay ===============================
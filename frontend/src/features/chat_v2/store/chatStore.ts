@@ -37,6 +37,8 @@
  * Last Modified: 2026-06-16
  *
  * Modification History:
+ *   - 2026-10-16: loadSessions loads the first GET /sessions page; +sessionsCursor / loadMoreSessions
+ *   - 2026-10-16: llm_text_delta grows a streaming AnswerBlock; llm_response replaces it
  *   - 2026-07-15: +newSession() conversation-only reset — preserve sidebar list (AD-Chat-New-Session-Wipes-Sidebar; "New session" no longer blanks the session list)
  *   - 2026-07-07: Sprint 57.159 — context_compacted pushes a CompactionMarkerTurn (was rawEvents-only; Cat 4 L2→L3)
  *   - 2026-06-16: Sprint 57.131 — llm_request stamps per-turn model on the AgentTurn (Inspector model row)
@@ -165,6 +167,8 @@ type ChatStoreState = {
 
   // Sprint 57.21: SessionList sidebar state (Day 3 populates from fixture)
   sessions: Session[];
+  // next_cursor of the last loaded GET /sessions page (null → no older sessions).
+  sessionsCursor: string | null;
   activeSessionId: string | null;
 
   // Preserved cross-cutting slices (Sprint 57.x components still use these)
@@ -187,6 +191,8 @@ type ChatStoreState = {
   setError: (msg: string | null) => void;
   setSessions: (sessions: Session[]) => void;
   loadSessions: () => Promise<void>;
+  // Append the next (older) GET /sessions page; no-op when sessionsCursor is null.
+  loadMoreSessions: () => Promise<void>;
   setActiveSessionId: (id: string | null) => void;
   // Sprint 57.126: fetch a clicked session's persisted transcript + replay it
   // (conversation-only reset → mergeEvent each event → render historical turns).
@@ -218,6 +224,7 @@ const _initial = (): Pick<
   | "handoffBanner"
   | "turns"
   | "sessions"
+  | "sessionsCursor"
   | "activeSessionId"
   | "rawEvents"
   | "approvals"
@@ -236,6 +243,7 @@ const _initial = (): Pick<
   handoffBanner: null,
   turns: [],
   sessions: [],
+  sessionsCursor: null,
   activeSessionId: null,
   rawEvents: [],
   approvals: {},
@@ -381,16 +389,38 @@ export const useChatStore = create<ChatStoreState>((set, get) => ({
   // map them into the camelCase Session[] shape. On error, leave the existing
   // list untouched (the SessionList renders an empty state when none loaded) —
   // a transient fetch failure should not blank an already-populated sidebar.
+  // GET /sessions is keyset-paged: this loads the first (newest) page only and
+  // keeps its next_cursor for loadMoreSessions.
   loadSessions: async () => {
     try {
-      const items = await listSessions();
-      set({ sessions: items.map(sessionFromApi) });
+      const page = await listSessions();
+      set({
+        sessions: page.sessions.map(sessionFromApi),
+        sessionsCursor: page.next_cursor ?? null,
+      });
     } catch {
       // Swallow — keep whatever is already in `sessions`. The empty-state line
       // covers the never-loaded case; this avoids flicker on a transient 5xx.
     }
   },
 
+  // SessionList "Load more": fetch the page after sessionsCursor and append it.
+  // Errors are swallowed like loadSessions (the cursor is kept, so a retry works).
+  loadMoreSessions: async () => {
+    const cursor = get().sessionsCursor;
+    if (!cursor) return;
+    try {
+      const page = await listSessions(cursor);
+      if (get().sessionsCursor !== cursor) return; // a reload replaced the list meanwhile
+      set((s) => ({
+        sessions: [...s.sessions, ...page.sessions.map(sessionFromApi)],
+        sessionsCursor: page.next_cursor ?? null,
+      }));
+    } catch {
+      // Swallow — keep the loaded pages.
+    }
+  },
+
   setActiveSessionId: (id) => set({ activeSessionId: id }),
 
   // Sprint 57.126: replay a historical session's conversation. Fetches the
@@ -615,14 +645,43 @@ export const useChatStore = create<ChatStoreState>((set, get) => ({
           };
         }
 
+        case "llm_text_delta": {
+          // Token streaming: grow the in-flight answer block chunk by chunk. Not
+          // recorded in rawEvents (one entry per token chunk would flood the
+          // Inspector log; the llm_response that follows is the canonical record).
+          return {
+            ...s,
+            turns: updateLastAgentTurn(s.turns, (t) => {
+              const last = t.blocks[t.blocks.length - 1];
+              if (last?.type === "answer" && last.streaming) {
+                return {
+                  ...t,
+                  blocks: [
+                    ...t.blocks.slice(0, -1),
+                    { ...last, text: last.text + ev.data.text },
+                  ],
+                };
+              }
+              return {
+                ...t,
+                blocks: [...t.blocks, { type: "answer", text: ev.data.text, streaming: true }],
+              };
+            }),
+          };
+        }
+
         case "llm_response": {
           // Append ThinkingBlock (if thinking) + AnswerBlock (if final content)
           // + ToolBlock per tool_call. Visual order: thinking → answer → tools.
+          // Token streaming: the in-flight streamed answer block (if any) is
+          // dropped first — the final content below supersedes it.
           return {
             ...s,
             rawEvents,
             turns: updateLastAgentTurn(s.turns, (t) => {
-              const newBlocks: Block[] = [...t.blocks];
+              const newBlocks: Block[] = t.blocks.filter(
+                (b) => !(b.type === "answer" && b.streaming),
+              );
               if (ev.data.thinking) {
                 newBlocks.push({ type: "thinking", text: ev.data.thinking });
               }
@@ -1183,7 +1242,7 @@ export const useChatStore = create<ChatStoreState>((set, get) => ({
   // Pick, so the partial set() merge leaves it untouched).
   newSession: () => {
     _turnCounter = 0;
-    set((s) => ({ ..._initial(), sessions: s.sessions }));
+    set((s) => ({ ..._initial(), sessions: s.sessions, sessionsCursor: s.sessionsCursor }));
   },
 
   reset: () => {
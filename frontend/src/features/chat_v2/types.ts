@@ -25,6 +25,7 @@
  * Last Modified: 2026-06-16
  *
  * Modification History:
+ *   - 2026-10-16: AnswerBlock +streaming? (llm_text_delta in-flight answer; replaced by llm_response)
  *   - 2026-07-07: Sprint 57.159 — +CompactionMarkerTurn in the Turn union (context_compacted timeline marker; Cat 4 L2→L3)
  *   - 2026-06-16: Sprint 57.131 — AgentTurn +model (per-turn LLM model for the Inspector Turn row)
  *   - 2026-06-16: Sprint 57.130 — AgentTurn +terminated? (LoopTerminated wire surface)
@@ -103,6 +104,9 @@ export type ThinkingBlock = {
 export type AnswerBlock = {
   type: "answer";
   text: string;
+  // Token streaming: true while the block is being grown from llm_text_delta
+  // frames; the turn's llm_response replaces it with the final content.
+  streaming?: boolean;
 };
 
 export type ToolBlock = {
@@ -0,0 +1,78 @@
+/**
+ * File: frontend/tests/unit/chat_v2/chatService.listSessions.test.ts
+ * Purpose: Vitest coverage for listSessions paging over GET /api/v1/sessions.
+ * Category: Frontend / tests / unit / chat_v2
+ * Scope: Phase 57 / listing APIs at tenant scale
+ *
+ * Description:
+ *   GET /sessions is keyset-paged (limit + next_cursor). listSessions fetches
+ *   ONE page — the first without a cursor, an older one with the previous
+ *   page's next_cursor — and returns it with its next_cursor; a non-2xx throws.
+ *
+ * Modification History:
+ *   - 2026-10-16: one page per call (was: followed every next_cursor)
+ *   - 2026-10-16: Initial creation
+ */
+
+import { afterEach, describe, expect, test, vi } from "vitest";
+
+vi.mock("@/features/auth/services/authService", () => ({
+  fetchWithAuth: vi.fn(),
+}));
+
+import { fetchWithAuth } from "@/features/auth/services/authService";
+import { listSessions } from "@/features/chat_v2/services/chatService";
+
+const mockFetch = vi.mocked(fetchWithAuth);
+
+afterEach(() => vi.restoreAllMocks());
+
+function item(id: string) {
+  return {
+    id,
+    title: null,
+    status: "completed",
+    agent_role: null,
+    handoff_parent_id: null,
+    started_at_ms: 1000,
+    total_turns: 1,
+  };
+}
+
+describe("listSessions", () => {
+  test("fetches the first page and returns its next_cursor", async () => {
+    mockFetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ sessions: [item("s3"), item("s2")], next_cursor: "c1" }),
+    } as Response);
+
+    const page = await listSessions();
+
+    expect(page.sessions.map((s) => s.id)).toEqual(["s3", "s2"]);
+    expect(page.next_cursor).toBe("c1");
+    expect(mockFetch).toHaveBeenCalledTimes(1);
+    expect(mockFetch).toHaveBeenCalledWith("/api/v1/sessions", { method: "GET" });
+  });
+
+  test("passes the cursor for an older page", async () => {
+    mockFetch.mockResolvedValueOnce({
+      ok: true,
+      json: async () => ({ sessions: [item("s1")], next_cursor: null }),
+    } as Response);
+
+    const page = await listSessions("c1");
+
+    expect(page.next_cursor).toBeNull();
+    expect(mockFetch).toHaveBeenCalledWith("/api/v1/sessions?cursor=c1", { method: "GET" });
+  });
+
+  test("throws on a non-2xx response", async () => {
+    mockFetch.mockResolvedValue({
+      ok: false,
+      status: 500,
+      text: async () => "boom",
+    } as Response);
+
+    await expect(listSessions()).rejects.toThrow(/HTTP 500/);
+  });
+});
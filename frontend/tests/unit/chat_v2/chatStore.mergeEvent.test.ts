@@ -15,6 +15,7 @@
  * Created: 2026-05-17 (Sprint 57.21 Day 1)
  *
  * Modification History:
+ *   - 2026-10-16: llm_text_delta streaming AnswerBlock → replaced by llm_response coverage
  *   - 2026-07-07: Sprint 57.159 — context_compacted → CompactionMarkerTurn timeline coverage
  *   - 2026-06-17: Sprint 57.131 — llm_request stamps per-turn model + turn_start model-null coverage
  *   - 2026-06-16: Sprint 57.130 — loop_terminated → flip pending tool + terminated record coverage
@@ -30,6 +31,7 @@ import { afterEach, beforeEach, describe, expect, test } from "vitest";
 import { useChatStore } from "@/features/chat_v2/store/chatStore";
 import type {
   AgentTurn,
+  AnswerBlock,
   HITLTurn,
   LoopEvent,
   Session,
@@ -396,6 +398,28 @@ describe("chatStore.mergeEvent Turn block sequence (Sprint 57.21 Day 1)", () =>
     expect(lastAgentTurn(useChatStore.getState().turns).model).toBe("claude-haiku-4-5");
   });
 
+  // --- llm_text_delta → streaming AnswerBlock ----------------------------
+
+  test("llm_text_delta grows one streaming AnswerBlock; llm_response replaces it", () => {
+    useChatStore.getState().mergeEvent(turnStart());
+    for (const text of ["Hel", "lo"]) {
+      useChatStore.getState().mergeEvent({ type: "llm_text_delta", data: { text } });
+    }
+    let t = lastAgentTurn(useChatStore.getState().turns);
+    expect(t.blocks).toHaveLength(1);
+    expect(t.blocks[0]).toEqual({ type: "answer", text: "Hello", streaming: true });
+    // Deltas are a live-only feed — not recorded in the rawEvents audit log.
+    expect(
+      useChatStore.getState().rawEvents.filter((e) => e.type === "llm_text_delta"),
+    ).toHaveLength(0);
+
+    useChatStore.getState().mergeEvent(llmResponse({ content: "Hello!" }));
+    t = lastAgentTurn(useChatStore.getState().turns);
+    expect(t.blocks).toHaveLength(1);
+    expect((t.blocks[0] as AnswerBlock).text).toBe("Hello!");
+    expect((t.blocks[0] as AnswerBlock).streaming).toBeUndefined();
+  });
+
   // --- llm_response → blocks ---------------------------------------------
 
   test("llm_response with thinking only appends ThinkingBlock", () => {
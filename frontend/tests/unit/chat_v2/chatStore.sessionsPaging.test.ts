@@ -0,0 +1,65 @@
+/**
+ * File: frontend/tests/unit/chat_v2/chatStore.sessionsPaging.test.ts
+ * Purpose: Vitest coverage for chatStore.loadSessions / loadMoreSessions keyset paging.
+ * Category: Frontend / tests / unit / chat_v2
+ * Scope: Phase 57 / listing APIs at tenant scale
+ *
+ * Description:
+ *   loadSessions loads only the newest GET /sessions page and keeps its
+ *   next_cursor; loadMoreSessions appends the next page and advances the cursor;
+ *   with no cursor left it makes no request.
+ *
+ * Modification History:
+ *   - 2026-10-16: Initial creation
+ */
+
+import { afterEach, beforeEach, describe, expect, test, vi } from "vitest";
+
+vi.mock("@/features/chat_v2/services/chatService", () => ({
+  fetchSessionEvents: vi.fn(),
+  listSessions: vi.fn(),
+}));
+
+import { listSessions } from "@/features/chat_v2/services/chatService";
+import { useChatStore } from "@/features/chat_v2/store/chatStore";
+
+const mockList = vi.mocked(listSessions);
+
+function item(id: string) {
+  return {
+    id,
+    title: id,
+    status: "completed",
+    agent_role: null,
+    handoff_parent_id: null,
+    started_at_ms: 1000,
+    total_turns: 1,
+  };
+}
+
+describe("chatStore session paging", () => {
+  beforeEach(() => useChatStore.getState().reset());
+  afterEach(() => {
+    useChatStore.getState().reset();
+    vi.restoreAllMocks();
+  });
+
+  test("loadSessions loads one page; loadMoreSessions appends the next", async () => {
+    mockList
+      .mockResolvedValueOnce({ sessions: [item("s3"), item("s2")], next_cursor: "c1" })
+      .mockResolvedValueOnce({ sessions: [item("s1")], next_cursor: null });
+
+    await useChatStore.getState().loadSessions();
+    expect(useChatStore.getState().sessions.map((s) => s.id)).toEqual(["s3", "s2"]);
+    expect(useChatStore.getState().sessionsCursor).toBe("c1");
+    expect(mockList).toHaveBeenCalledTimes(1);
+
+    await useChatStore.getState().loadMoreSessions();
+    expect(mockList).toHaveBeenLastCalledWith("c1");
+    expect(useChatStore.getState().sessions.map((s) => s.id)).toEqual(["s3", "s2", "s1"]);
+    expect(useChatStore.getState().sessionsCursor).toBeNull();
+
+    await useChatStore.getState().loadMoreSessions(); // no cursor → no request
+    expect(mockList).toHaveBeenCalledTimes(2);
+  });
+});
@@ -7,6 +7,7 @@
  * Created: 2026-05-17 (Sprint 57.21 Day 3 §3.1)
  *
  * Modification History:
+ *   - 2026-10-16: "Load more" button shown only while sessionsCursor is set; click → loadMoreSessions
  *   - 2026-07-23: Sprint 57.167 — Filter control honest-disable + tooltip (de-Potemkin 2)
  *   - 2026-06-16: Sprint 57.126 — click now calls loadSessionHistory (mock fetchSessionEvents) + new trigger test
  *   - 2026-06-12: Sprint 57.107 B3 — converted fixture assertions to mock the store (real session data + loadSessions); +empty state + chain badge + no-DEMO-banner cases
@@ -191,6 +192,20 @@ describe("SessionList (Sprint 57.107 B3 — real backend data)", () => {
     expect(done.querySelector("[aria-label='running']")).toBeNull();
   });
 
+  test("'Load more' appears only with a cursor and calls loadMoreSessions", async () => {
+    seedSessions(SESSIONS);
+    const { unmount } = render(<SessionList />);
+    expect(screen.queryByTestId("session-list-load-more")).toBeNull();
+    unmount();
+
+    const loadMoreSessions = vi.fn().mockResolvedValue(undefined);
+    useChatStore.setState({ sessionsCursor: "c1", loadMoreSessions });
+    const user = userEvent.setup();
+    render(<SessionList />);
+    await user.click(screen.getByTestId("session-list-load-more"));
+    expect(loadMoreSessions).toHaveBeenCalledTimes(1);
+  });
+
   test("session count matches store length", () => {
     seedSessions(SESSIONS);
     render(<SessionList />);
@@ -15,7 +15,7 @@
  *   span_started / span_ended / memory_accessed events (Sprint 57.75 A-5).
  *
  * Created: 2026-06-02 (Sprint 57.67)
- * Modified: 2026-06-24 (Sprint 57.140 — +todos_updated; 25→26)
+ * Modified: 2026-10-16 (+llm_text_delta token streaming; 26→27)
  */
 
 import { describe, expect, test } from "vitest";
@@ -23,8 +23,12 @@ import { describe, expect, test } from "vitest";
 import { KNOWN_LOOP_EVENT_TYPES } from "@/features/chat_v2/types";
 
 describe("generated SSE event schema (re-exported via chat_v2/types)", () => {
-  test("KNOWN_LOOP_EVENT_TYPES has exactly 26 wire-types", () => {
-    expect(KNOWN_LOOP_EVENT_TYPES.size).toBe(26);
+  test("KNOWN_LOOP_EVENT_TYPES has exactly 27 wire-types", () => {
+    expect(KNOWN_LOOP_EVENT_TYPES.size).toBe(27);
+  });
+
+  test("recognizes the llm_text_delta event (token streaming)", () => {
+    expect(KNOWN_LOOP_EVENT_TYPES.has("llm_text_delta")).toBe(true);
   });
 
   test("recognizes the loop_terminated event (Sprint 57.130)", () => {
@@ -46,6 +46,7 @@ Created: 2026-06-02 (Sprint 57.67)
 Last Modified: 2026-06-03
 
 Modification History (newest-first):
+    - 2026-10-16: map llm_text_delta → LLMTextDeltaEvent (token streaming)
     - 2026-06-09: Sprint 57.96 — map subagent_child → SubagentChildEvent (Cat 11 Scope B)
     - 2026-06-03: Sprint 57.75 A-5c — map span_started/span_ended/memory_accessed → *Event types
     - 2026-06-02: Sprint 57.68 A-3b — map agent_handoff → AgentHandoffEvent (Cat 11 HANDOFF)
@@ -111,6 +112,7 @@ WIRE_TYPE_TO_INTERFACE: dict[str, str] = {
     "message_injected": "MessageInjectedEvent",
     "loop_terminated": "LoopTerminatedEvent",
     "todos_updated": "TodosUpdatedEvent",
+    "llm_text_delta": "LLMTextDeltaEvent",
 }
 
 